@@ -0,0 +1,17 @@
+// Создано scripts/export_docs.py — не редактировать вручную
+(function(){
+  var base=(document.currentScript&&document.currentScript.src||'').replace(/[^/]*$/,'');
+  var parts={};
+  function getJSON(name){return fetch(base+name).then(function(r){
+    if(!r.ok)throw new Error(name+': '+r.status);return r.json();});}
+  function once(key,load){
+    if(!parts[key])parts[key]=load().catch(function(e){delete parts[key];throw e;});
+    return parts[key];}
+  window.loadBPManifest=function(){return once('manifest',function(){return getJSON('manifest.json');});};
+  window.loadBPEx=function(){return once('ex',function(){
+    return window.loadBPManifest().then(function(m){return getJSON(m.ex);});});};
+  window.loadBP=function(id){return once('bp-'+id,function(){
+    return window.loadBPManifest().then(function(m){
+      var p=m.processes.find(function(x){return x.id===id;});
+      if(!p)throw new Error('BP-'+id+' не найден');return getJSON(p.file);});});};
+})();
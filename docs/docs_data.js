@@ -1 +1 @@
-const DOCS={"01": "<h2 class=\"doch1\">BP-01: Обработка заявки на тур (Lead-to-Cash)</h2>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-01</td></tr><tr><td>Название</td><td>Обработка заявки на тур (Lead-to-Cash)</td></tr><tr><td>Владелец</td><td>Преображенская Т.В. (Операционный департамент)</td></tr><tr><td>Критичность</td><td>КРИТИЧЕСКИЙ</td></tr><tr><td>Влияние на выручку</td><td>85% всей выручки компании</td></tr><tr><td>Частота выполнения</td><td>~200-500 заявок/день (зависит от сезона)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Границы процесса</h3>\n<p class=\"docp\">Триггер (вход): - Поступление запроса от клиента через: - Сайт компании (онлайн-бронирование) - Телефонный звонок - Email - Мессенджеры (WhatsApp, Telegram) - Агентский кабинет</p>\n<p class=\"docp\">Результат (выход): - Исполненная заявка - Оплаченные услуги (отель, авиа, трансфер) - Выданные документы (ваучеры, билеты) - Удовлетворённый клиент/агент</p>\n<h3 class=\"doch2\">3. Участники процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Роль</th><th>Подразделение</th><th>Ответственность</th></tr></thead><tbody><tr><td>Менеджер по продажам</td><td>Отдел продаж</td><td>Приём запроса, формирование КП, закрытие сделки</td></tr><tr><td>Менеджер по бронированию</td><td>Отдел бронирования</td><td>Бронирование услуг, контроль подтверждений</td></tr><tr><td>Менеджер VIP</td><td>VIP-отдел</td><td>Обработка премиум-запросов</td></tr><tr><td>Специалист по авиа</td><td>Транспортный отдел</td><td>Выписка авиабилетов</td></tr><tr><td>Специалист по визам</td><td>Группа визового сопровождения</td><td>Оформление виз</td></tr><tr><td>Бухгалтер</td><td>Бухгалтерия</td><td>Контроль оплат, выставление счетов</td></tr><tr><td>Оператор поддержки</td><td>Клиентская поддержка</td><td>Маршрутизация входящих обращений</td></tr><tr><td>ИТОГО</td><td>7 подразделений</td><td>—</td></tr></tbody></table>\n<h3 class=\"doch2\">4. Этапы процесса</h3>\n<h4 class=\"doch3\">4.1. Приём и регистрация запроса</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел клиентской поддержки / Call-центр</td></tr><tr><td>Системы</td><td>Битрикс24, Телефония</td></tr><tr><td>SLA</td><td>5 минут</td></tr><tr><td>Точка передачи</td><td>Отдел продаж</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: - Приём входящего обращения (звонок/email/чат) - Регистрация в CRM (Битрикс24) - Первичная классификация запроса - Маршрутизация на ответственного менеджера</h4>\n<h4 class=\"doch3\">Проблемы: - Высокая загрузка менеджеров в пик сезона - Заявки не всегда фиксируются в CRM - 28 направлений маршрутизации — сложная логика</h4>\n<h4 class=\"doch3\">4.2. Первичный контакт и уточнение потребностей</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Менеджер по продажам</td></tr><tr><td>Системы</td><td>Битрикс24, Email, Мессенджеры</td></tr><tr><td>SLA</td><td>2 часа</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: - Связь с клиентом/агентом - Уточнение параметров поездки (даты, направление, категория, бюджет) - Выявление дополнительных потребностей (визы, трансферы, страховка) - Фиксация требований в CRM</h4>\n<h4 class=\"doch3\">4.3. Анализ запроса и подбор вариантов</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Менеджер по продажам</td></tr><tr><td>Системы</td><td>САМО-тур, Битрикс24, Сайт</td></tr><tr><td>SLA</td><td>4 часа</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: - Поиск подходящих вариантов в САМО-тур - Проверка наличия и цен - Консультация с продуктологами (при необходимости) - Подготовка нескольких вариантов</h4>\n<h4 class=\"doch3\">4.4. Запрос предложений у поставщиков/DMC</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Менеджер по продажам / Отдел продукта</td></tr><tr><td>Системы</td><td>Email, Системы поставщиков</td></tr><tr><td>SLA</td><td>24 часа</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: - Формирование запроса поставщику (отель, DMC) - Отправка запроса - Ожидание и отслеживание ответа - Анализ полученных предложений</h4>\n<h4 class=\"doch3\">Проблемы: - УЗКОЕ МЕСТО: Ожидание ответов от DMC (разные часовые пояса) - Множество чатов с поставщиками — сложно отслеживать - Нет единого SLA с партнёрами</h4>\n<h4 class=\"doch3\">4.5. Формирование коммерческого предложения</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Менеджер по продажам</td></tr><tr><td>Системы</td><td>Excel, САМО-тур</td></tr><tr><td>SLA</td><td>2 часа</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: - Расчёт стоимости тура (проживание + авиа + трансфер + допуслуги) - Формирование КП в Excel или САМО-тур - Добавление описания и фотографий - Отправка клиенту/агенту</h4>\n<h4 class=\"doch3\">Проблемы: - УЗКОЕ МЕСТО: Ручные расчёты в Excel - Частые пересчёты при изменении условий - Нет стандартного шаблона КП</h4>\n<h4 class=\"doch3\">4.6. Согласование и бронирование</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел бронирования</td></tr><tr><td>Системы</td><td>САМО-тур, Системы поставщиков</td></tr><tr><td>SLA</td><td>24 часа</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: - Получение согласия клиента - Бронирование в САМО-тур - Отправка брони поставщику - Получение подтверждения - Фиксация тайм-лимитов и условий</h4>\n<h4 class=\"doch3\">4.7. Оформление авиабилетов</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Транспортный отдел</td></tr><tr><td>Системы</td><td>GDS (Amadeus, Galileo), САМО-тур, Сайты авиакомпаний</td></tr><tr><td>SLA</td><td>По тайм-лимиту билета</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: - Поиск оптимальных вариантов перелёта - Бронирование в GDS - Контроль тайм-лимита - Выписка билетов после оплаты - Прикрепление к заявке в САМО-тур</h4>\n<h4 class=\"doch3\">Проблемы: - КРИТИЧЕСКОЕ: Короткие тайм-лимиты — риск потери брони - КРИТИЧЕСКОЕ: Ошибки в данных пассажиров - Ручная выписка для некоторых авиакомпаний (FlyDubai) - Билеты не всегда прикрепляются к заказу</h4>\n<h4 class=\"doch3\">4.8. Оплата и финансовое оформление</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Бухгалтерия / Финансовый отдел</td></tr><tr><td>Системы</td><td>1С, САМО-тур, Клиент-банк</td></tr><tr><td>SLA</td><td>24 часа после получения оплаты</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: - Выставление счёта клиенту/агенту - Контроль поступления оплаты - Разнесение платежа в САМО-тур - Оплата поставщикам - Фиксация в 1С</h4>\n<h4 class=\"doch3\">4.9. Выдача документов</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел бронирования</td></tr><tr><td>Системы</td><td>САМО-тур, Email</td></tr><tr><td>SLA</td><td>2 часа после полной оплаты</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: - Проверка полноты документов (ваучер, билеты, страховка) - Формирование пакета документов - Отправка клиенту/агенту - Подтверждение получения</h4>\n<h3 class=\"doch2\">5. Поток процесса</h3>\n<p class=\"docp\">Процесс начинается с поступления обращения от клиента или агента, которое принимается отделом поддержки (SLA 5 минут) и передаётся в отдел продаж. Менеджер по продажам уточняет потребности клиента (2-4 часа), формирует запросы поставщикам и DMC (ожидание до 24 часов), после чего готовит коммерческое предложение (2 часа). При необходимости выполняется пересчёт.</p>\n<p class=\"docp\">После согласования с клиентом заявка передаётся в отдел бронирования (24 часа на подтверждение). Параллельно транспортный отдел оформляет авиабилеты (в рамках тайм-лимита), а группа визового сопровождения — визы (при необходимости).</p>\n<p class=\"docp\">После получения оплаты (контроль 24 часа) формируется пакет документов (2 часа) и передаётся клиенту/агенту — процесс завершён.</p>\n<h3 class=\"doch2\">6. Системы и интеграции</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль в процессе</th><th>Интеграции</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Основная система бронирования</td><td>1С, GDS, Сайт</td></tr><tr><td>Битрикс24</td><td>CRM, управление сделками</td><td>Телефония, Email</td></tr><tr><td>GDS (Amadeus, Galileo)</td><td>Бронирование авиа</td><td>САМО-тур</td></tr><tr><td>1С</td><td>Финансовый учёт</td><td>САМО-тур, Клиент-банк</td></tr><tr><td>Клиент-банк</td><td>Платежи</td><td>1С</td></tr><tr><td>Excel</td><td>Расчёты, КП</td><td>Ручной ввод</td></tr></tbody></table>\n<h3 class=\"doch2\">7. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Время от запроса до КП</td><td>8 часов</td><td>~24 часа</td><td>САМО-тур</td></tr><tr><td>Время от КП до оплаты</td><td>3 дня</td><td>5-7 дней</td><td>САМО-тур</td></tr><tr><td>Конверсия запрос-бронь</td><td>30%</td><td>~20%</td><td>Битрикс24</td></tr><tr><td>Просроченные тайм-лимиты</td><td>5%</td><td>~15%</td><td>Ручной подсчёт</td></tr><tr><td>Ошибки в билетах</td><td>1%</td><td>~5%</td><td>Претензии</td></tr></tbody></table>\n<h3 class=\"doch2\">8. Риски и проблемы</h3>\n<p class=\"docp\">Критические (требуют немедленного внимания):</p>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Просроченные тайм-лимиты</td><td>Нет автоматических напоминаний</td><td>Потеря брони, штрафы</td></tr><tr><td>Билеты не прикреплены к заказу</td><td>Ручной процесс</td><td>Паника перед вылетом</td></tr><tr><td>Ошибки в данных пассажиров</td><td>Нет автоматической сверки</td><td>Переоформление, штрафы</td></tr></tbody></table>\n<p class=\"docp\">Высокие:</p>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Долгие КП и расчёты</td><td>Ручная работа в Excel</td><td>Потеря клиента</td></tr><tr><td>Ожидание ответов от DMC</td><td>Разные часовые пояса, нет SLA</td><td>Затягивание сделки</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-01</td><td>Напоминания о тайм-лимитах</td><td>Автоуведомления за 24ч, 4ч, 1ч до дедлайна</td><td>-80% просроченных</td><td>CRITICAL</td></tr><tr><td>AUTO-02</td><td>Контроль полноты документов</td><td>Автопроверка наличия билетов после оплаты</td><td>Исключение пропусков</td><td>CRITICAL</td></tr><tr><td>AUTO-03</td><td>Сверка данных пассажиров</td><td>Автосравнение САМО - GDS</td><td>-90% ошибок в билетах</td><td>HIGH</td></tr><tr><td>AUTO-04</td><td>Маршрутизация заявок</td><td>Автораспределение по загрузке</td><td>-40% время реакции</td><td>HIGH</td></tr><tr><td>AUTO-05</td><td>Шаблоны КП</td><td>Автогенерация КП из САМО</td><td>-50% время подготовки</td><td>MEDIUM</td></tr></tbody></table>", "02": "<h2 class=\"doch1\">BP-02: Маркетинговая кампания</h2>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-02</td></tr><tr><td>Название</td><td>Маркетинговая кампания</td></tr><tr><td>Владелец</td><td>Директор Департамента маркетинга (ВАКАНСИЯ)</td></tr><tr><td>Фактическое управление</td><td>Колдаева А.В. (Отдел рекламы), Седых (Контент), Четверик (Маркетинг)</td></tr><tr><td>Критичность</td><td>ВЫСОКИЙ</td></tr><tr><td>Влияние</td><td>Лидогенерация, узнаваемость бренда, партнёрские бюджеты</td></tr><tr><td>Частота</td><td>10-20 кампаний/месяц (различного масштаба)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Границы процесса</h3>\n<h4 class=\"doch3\">Триггер (вход)</h4>\n<p class=\"docp\">Запрос партнёра на совместное мероприятие/рекламу</p>\n<p class=\"docp\">Запрос от Отдела продукта на продвижение направления</p>\n<p class=\"docp\">Плановая маркетинговая активность (из годового плана)</p>\n<p class=\"docp\">Запуск нового продукта или направления</p>\n<h4 class=\"doch3\">Результат (выход)</h4>\n<p class=\"docp\">Проведённая кампания/мероприятие</p>\n<p class=\"docp\">Привлечённые лиды (для B2C) или охват агентов (для B2B)</p>\n<p class=\"docp\">Измеренный ROI (при наличии аналитики)</p>\n<p class=\"docp\">Отчёт для партнёра (при партнёрской кампании)</p>\n<h3 class=\"doch2\">3. Участники процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Роль</th><th>Подразделение</th><th>Ответственность</th></tr></thead><tbody><tr><td>Менеджер по рекламе</td><td>Отдел рекламы</td><td>Организация мероприятий, работа с партнёрами, СМИ</td></tr><tr><td>Контент-менеджер</td><td>Отдел контент-маркетинга</td><td>Тексты, дизайн, email-рассылки, вебинары</td></tr><tr><td>Маркетолог</td><td>Отдел маркетинга</td><td>Аналитика, B2C-реклама, RoiStat</td></tr><tr><td>КАМ</td><td>Отдел по работе с ключевыми клиентами</td><td>Набор агентов на мероприятия</td></tr><tr><td>Региональный менеджер</td><td>Региональные офисы</td><td>Мероприятия в регионах</td></tr><tr><td>Продуктолог</td><td>Отдел продукта</td><td>Информация о направлении</td></tr><tr><td>ИТОГО</td><td>6 подразделений</td><td>—</td></tr></tbody></table>\n<h3 class=\"doch2\">4. Типы маркетинговых кампаний</h3>\n<h4 class=\"doch3\">4.1. Мероприятия с партнёрами (B2B)</h4>\n<h4 class=\"doch3\">Описание: Бизнес-завтраки, презентации отелей/направлений для агентств.</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Частота</td><td>2-4 мероприятия/месяц</td></tr><tr><td>Бюджет</td><td>Партнёрский + собственный</td></tr><tr><td>Участники</td><td>30-100 агентов</td></tr><tr><td>Города</td><td>Москва, СПб, регионы</td></tr></tbody></table>\n<h4 class=\"doch3\">4.2. Маркетинговые соглашения с партнёрами</h4>\n<h4 class=\"doch3\">Описание: Комплекс активностей (рассылки, баннеры, вебинары) за партнёрский бюджет.</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Частота</td><td>5-10 соглашений/месяц</td></tr><tr><td>Бюджет</td><td>100% партнёрский</td></tr><tr><td>Каналы</td><td>Email, сайт, соцсети</td></tr></tbody></table>\n<h4 class=\"doch3\">4.3. B2C-реклама</h4>\n<h4 class=\"doch3\">Описание: Привлечение конечных туристов через digital-каналы.</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Частота</td><td>Постоянно</td></tr><tr><td>Бюджет</td><td>Собственный</td></tr><tr><td>Каналы</td><td>Контекст, SMM, SEO</td></tr></tbody></table>\n<h4 class=\"doch3\">4.4. Вебинары для агентов</h4>\n<h4 class=\"doch3\">Описание: Онлайн-презентации направлений и продуктов.</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Частота</td><td>4-8 вебинаров/месяц</td></tr><tr><td>Платформа</td><td>МТС Линк</td></tr><tr><td>Участники</td><td>50-200 агентов</td></tr></tbody></table>\n<h3 class=\"doch2\">5. Этапы процесса (на примере мероприятия с партнёром)</h3>\n<h4 class=\"doch3\">Этап 1: Инициация кампании</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы</td></tr><tr><td>SLA</td><td>1-2 дня</td></tr><tr><td>Точка передачи</td><td>Внутреннее согласование</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Получение запроса (от партнёра / руководства / плана) 2. Оценка возможностей и ресурсов 3. Подбор даты и формата 4. Предварительное согласование с КАМ/регионами</h4>\n<h4 class=\"doch3\">Этап 2: Планирование и поиск подрядчиков</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы</td></tr><tr><td>SLA</td><td>3-5 дней</td></tr><tr><td>Точка передачи</td><td>Финансовый департамент (счета)</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Поиск площадки для мероприятия 2. Подбор подрядчиков (фото, звук, ведущий, кейтеринг) 3. Формирование сметы 4. Согласование бюджета с партнёром</h4>\n<h4 class=\"doch3\">Проблемы: - Несвоевременные ответы от подрядчиков - Накладки по датам</h4>\n<h4 class=\"doch3\">Этап 3: Документооборот и согласование</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы, Юрист, Финансовый департамент</td></tr><tr><td>SLA</td><td>3-5 дней</td></tr><tr><td>Точка передачи</td><td>Отдел контент-маркетинга</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Выставление счёта партнёру (через Финансовый департамент) 2. Согласование договора с подрядчиками (через Юриста) 3. Контроль подписания документов 4. Получение оплаты от партнёра</h4>\n<h4 class=\"doch3\">Проблемы: - Задержки согласования договоров - Несвоевременные ответы от партнёров</h4>\n<h4 class=\"doch3\">Этап 4: Набор участников</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>КАМ / Региональные офисы</td></tr><tr><td>SLA</td><td>1-3 недели</td></tr><tr><td>Точка передачи</td><td>Отдел рекламы (списки)</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Постановка задачи в Битрикс24 2. Рассылка приглашений агентам 3. Регистрация участников 4. Напоминания и подтверждение явки</h4>\n<h4 class=\"doch3\">Проблемы: - Низкий отклик на приглашения - No-show (неявка зарегистрированных)</h4>\n<h4 class=\"doch3\">Этап 5: Подготовка контента</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел контент-маркетинга</td></tr><tr><td>SLA</td><td>5-7 дней</td></tr><tr><td>Точка передачи</td><td>Партнёр (согласование)</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Создание брендированных материалов (фотозона, меню, полиграфия) 2. Подготовка презентации 3. Согласование всех материалов с партнёром 4. Печать и доставка материалов</h4>\n<h4 class=\"doch3\">Проблемы: - Высокая загрузка дизайнера (1 человек) - Задержки согласования с партнёром</h4>\n<h4 class=\"doch3\">Этап 6: Проведение мероприятия</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы, КАМ, Отдел продукта</td></tr><tr><td>SLA</td><td>День мероприятия</td></tr><tr><td>Точка передачи</td><td>—</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Контроль площадки и подрядчиков (Отдел рекламы) 2. Встреча и регистрация агентов (КАМ) 3. Презентация направления (Отдел продукта) 4. Нетворкинг и фотосессия</h4>\n<h4 class=\"doch3\">Проблемы: - Форс-мажоры (технические сбои, неявка спикера)</h4>\n<h4 class=\"doch3\">Этап 7: Отчётность и анализ</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы, Контент-маркетинг</td></tr><tr><td>SLA</td><td>3-5 дней после мероприятия</td></tr><tr><td>Точка передачи</td><td>Партнёр, Руководство</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Сбор фотоотчёта от фотографа 2. Получение списков участников от КАМ 3. Сбор обратной связи от партнёра 4. Публикация отчёта в соцсетях 5. Формирование итогового отчёта с KPI 6. Закрывающие документы в бухгалтерию</h4>\n<h3 class=\"doch2\">6. Поток процесса</h3>\n<p class=\"docp\">Процесс начинается с запроса (от партнёра, по плану или от отдела продукта), который поступает в отдел рекламы. На этапе инициации (SLA 2 дня) оцениваются возможности и подбирается формат. Далее в течение 5 дней происходит планирование: поиск площадки, подрядчиков, формирование сметы.</p>\n<p class=\"docp\">Параллельно запускаются три направления работы: финансы (выставление счетов партнёру), юрист (согласование договоров с подрядчиками), КАМ (набор участников на мероприятие — 1-3 недели).</p>\n<p class=\"docp\">После согласования документов отдел контент-маркетинга готовит материалы (7 дней) и согласовывает их с партнёром. В день мероприятия проводится само мероприятие, а в течение 5 дней после — формируется отчёт для партнёра и руководства.</p>\n<h3 class=\"doch2\">7. Системы и инструменты</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль в процессе</th></tr></thead><tbody><tr><td>Битрикс24</td><td>Постановка задач, коммуникации</td></tr><tr><td>Email</td><td>Коммуникация с партнёрами</td></tr><tr><td>Invoice Tracker</td><td>Контроль счетов партнёрам</td></tr><tr><td>МТС Линк</td><td>Платформа для вебинаров</td></tr><tr><td>Google Таблицы</td><td>Списки участников, планирование</td></tr><tr><td>Соцсети (TG, VK)</td><td>Публикация отчётов</td></tr><tr><td>RoiStat</td><td>Сквозная аналитика (в процессе внедрения)</td></tr></tbody></table>\n<h3 class=\"doch2\">8. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Количество мероприятий/месяц</td><td>≥4</td><td>3-4</td><td>Подсчёт</td></tr><tr><td>Средняя явка на мероприятие</td><td>≥70%</td><td>~50%</td><td>Регистрация vs факт</td></tr><tr><td>Посещаемость вебинаров</td><td>≥100 чел</td><td>~80</td><td>МТС Линк</td></tr><tr><td>Партнёрские бюджеты/год</td><td>Рост 20%</td><td>Нет данных</td><td>Invoice Tracker</td></tr><tr><td>ROI рекламных кампаний</td><td>≥300%</td><td>Нет данных</td><td>RoiStat (после внедрения)</td></tr><tr><td>Open Rate email-рассылок</td><td>≥25%</td><td>~18%</td><td>Email-платформа</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Вакансия директора</td><td>Нет руководителя L1</td><td>Отсутствие единой стратегии</td></tr><tr><td>Нет сквозной аналитики</td><td>RoiStat не внедрён</td><td>Невозможно измерить ROI</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Устаревшие цены в рассылках</td><td>Ручной сбор от продуктологов</td><td>Некорректная информация</td></tr><tr><td>Высокая загрузка дизайнера</td><td>1 специалист на все задачи</td><td>Задержки креативов</td></tr><tr><td>Низкая посещаемость вебинаров</td><td>Слабый отклик, технические проблемы</td><td>Низкий охват</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-MKT-01</td><td>Интеграция САМО→Email</td><td>Автоматическое обновление цен и ссылок</td><td>-50% ошибок в рассылках</td><td>HIGH</td></tr><tr><td>AUTO-MKT-02</td><td>RoiStat</td><td>Полная сквозная аналитика</td><td>ROI-дашборды в реалтайме</td><td>HIGH</td></tr><tr><td>AUTO-MKT-03</td><td>ИИ для дизайна</td><td>Генерация базовых визуалов</td><td>+20% скорость креативов</td><td>MEDIUM</td></tr><tr><td>AUTO-MKT-04</td><td>Шаблоны задач Битрикс</td><td>Стандартизация процесса мероприятий</td><td>-30% время планирования</td><td>MEDIUM</td></tr><tr><td>AUTO-MKT-05</td><td>Авторассылка напоминаний</td><td>Напоминания участникам о мероприятиях</td><td>+15% явка</td><td>MEDIUM</td></tr></tbody></table>", "03": "<h2 class=\"doch1\">BP-03: MICE и корпоративное обслуживание</h2>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-03</td></tr><tr><td>Название</td><td>MICE и корпоративное обслуживание</td></tr><tr><td>Владелец</td><td>Питуркин С.А. (Департамент MICE и корпоративного обслуживания)</td></tr><tr><td>Критичность</td><td>ВЫСОКИЙ</td></tr><tr><td>Влияние на выручку</td><td>~10% выручки</td></tr><tr><td>Стратегическая важность</td><td>Растущий сегмент B2B</td></tr><tr><td>Частота</td><td>20-50 запросов/месяц</td></tr></tbody></table>\n<h3 class=\"doch2\">2. MICE</h3>\n<p class=\"docp\">Дополнительно департамент занимается: - Бизнес-тревел — командировки сотрудников компаний-клиентов - Въездной туризм — приём иностранных групп в России - Групповое бронирование — корпоративные группы от 10 человек</p>\n<h3 class=\"doch2\">3. Границы процесса</h3>\n<h4 class=\"doch3\">Триггер (вход)</h4>\n<p class=\"docp\">Входящий запрос от корпоративного клиента</p>\n<p class=\"docp\">Запрос от агентства на групповое бронирование</p>\n<p class=\"docp\">Участие в тендере на госплощадках</p>\n<p class=\"docp\">Запрос на организацию мероприятия</p>\n<h4 class=\"doch3\">Результат (выход)</h4>\n<p class=\"docp\">Проведённое мероприятие / поездка</p>\n<p class=\"docp\">Оплаченные услуги</p>\n<p class=\"docp\">Закрывающие документы</p>\n<p class=\"docp\">Удовлетворённый корпоративный клиент</p>\n<h3 class=\"doch2\">4. Участники процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Роль</th><th>Подразделение</th><th>Ответственность</th></tr></thead><tbody><tr><td>Менеджер группового бронирования</td><td>Отдел группового бронирования</td><td>Обработка запросов, формирование смет</td></tr><tr><td>Менеджер бизнес-тревел</td><td>Отдел бизнес-тревел</td><td>Корпоративные командировки</td></tr><tr><td>Менеджер въездного туризма</td><td>Отдел въездного туризма</td><td>Приём иностранных групп</td></tr><tr><td>Бухгалтер</td><td>Бухгалтерия</td><td>Счета, закрывающие документы</td></tr><tr><td>Юрист</td><td>Юридический отдел</td><td>Договоры с поставщиками</td></tr><tr><td>ИТОГО</td><td>4 подразделения</td><td>—</td></tr></tbody></table>\n<h3 class=\"doch2\">5. Этапы процесса</h3>\n<h4 class=\"doch3\">Этап 1: Приём и анализ запроса</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования</td></tr><tr><td>Системы</td><td>Email, Битрикс24</td></tr><tr><td>SLA</td><td>2 часа (первичный ответ)</td></tr><tr><td>Точка передачи</td><td>Внутри отдела</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Получение запроса (email, телефон, форма на сайте) 2. Регистрация в CRM 3. Первичный контакт с клиентом 4. Уточнение деталей запроса: - Даты и продолжительность - Количество участников - Направление и категория размещения - Бюджет - Специальные требования (конференц-залы, кейтеринг, трансферы)</h4>\n<h4 class=\"doch3\">Этап 2: Запрос поставщиков</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования</td></tr><tr><td>Системы</td><td>Email, Сайты поставщиков (Броневик, Островок, Aviasales)</td></tr><tr><td>SLA</td><td>24-48 часов</td></tr><tr><td>Точка передачи</td><td>Ответы от поставщиков</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Формирование запросов в отели / DMC 2. Запрос перелёта для группы (Транспортный отдел) 3. Запрос дополнительных услуг (трансферы, экскурсии, кейтеринг) 4. Сбор и сравнение предложений</h4>\n<h4 class=\"doch3\">Проблемы: - УЗКОЕ МЕСТО: Сложные запросы с множеством переменных - Долгое ожидание ответов от зарубежных партнёров - Нет стандартизированных форм запросов</h4>\n<h4 class=\"doch3\">Этап 3: Формирование сметы и презентации</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования</td></tr><tr><td>Системы</td><td>Excel, PowerPoint</td></tr><tr><td>SLA</td><td>1-3 дня</td></tr><tr><td>Точка передачи</td><td>Клиент</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Расчёт стоимости по всем компонентам 2. Формирование нескольких вариантов (базовый / оптимальный / премиум) 3. Создание презентации с описанием программы 4. Расчёт маржинальности 5. Отправка клиенту</h4>\n<h4 class=\"doch3\">Проблемы: - УЗКОЕ МЕСТО: Полностью ручной процесс - Нет шаблонов смет - Долгое время подготовки сложных КП</h4>\n<h4 class=\"doch3\">Этап 4: Переговоры и согласование</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования</td></tr><tr><td>Системы</td><td>Email, Мессенджеры, Встречи</td></tr><tr><td>SLA</td><td>По ситуации (1-4 недели)</td></tr><tr><td>Точка передачи</td><td>Внутри этапа</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Получение обратной связи от клиента 2. Корректировка предложения 3. Дополнительные запросы поставщикам 4. Согласование финальных условий 5. Подготовка к бронированию</h4>\n<h4 class=\"doch3\">Проблемы: - Многократные итерации пересчёта - Изменение условий от поставщиков</h4>\n<h4 class=\"doch3\">Этап 5: Бронирование и договоры</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования, Юрист</td></tr><tr><td>Системы</td><td>САМО-тур, Email</td></tr><tr><td>SLA</td><td>2-5 дней</td></tr><tr><td>Точка передачи</td><td>Бухгалтерия (счета)</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Бронирование услуг у поставщиков 2. Заключение договоров с поставщиками (через Юриста) 3. Ввод заявки в САМО-тур 4. Согласование условий с клиентом 5. Подписание договора с клиентом</h4>\n<h4 class=\"doch3\">Этап 6: Оплата и документооборот</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Бухгалтерия, Отдел группового бронирования</td></tr><tr><td>Системы</td><td>1С, САМО-тур</td></tr><tr><td>SLA</td><td>По условиям договора</td></tr><tr><td>Точка передачи</td><td>Внутри этапа</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Заказ счёта в бухгалтерии 2. Отправка счёта клиенту 3. Контроль поступления оплаты 4. Оплата поставщикам 5. Формирование закрывающих документов</h4>\n<h4 class=\"doch3\">Этап 7: Исполнение и сопровождение</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования, Отдел круглосуточной работы с клиентами</td></tr><tr><td>Системы</td><td>Мессенджеры, Телефон, Битрикс24, САМО-тур</td></tr><tr><td>SLA</td><td>24/7 во время поездки</td></tr><tr><td>Точка передачи</td><td>Линия 24/7 (нерабочее время и экстренные ситуации)</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Выдача документов (ваучеры, билеты) 2. Курирование группы во время поездки 3. Оперативное решение проблем 4. Координация с принимающей стороной</h4>\n<p class=\"docp\">Маршрутизация MICE-обращений на линию 24/7</p>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел круглосуточной работы с клиентами</td></tr><tr><td>Триггер</td><td>Обращение MICE-клиента в нерабочее время / экстренная ситуация</td></tr><tr><td>SLA</td><td>Ответ ≤15 мин, решение ≤2 часа</td></tr><tr><td>Критичность</td><td>КРИТИЧНО для корпоративных клиентов</td></tr></tbody></table>\n<p class=\"docp\">Почему это критично: - Корпоративные клиенты (B2B) имеют высокие ожидания по уровню сервиса - MICE-мероприятия часто проходят в нестандартное время (ранние вылеты, вечерние мероприятия, выходные) - Потеря доверия корпоративного клиента = потеря долгосрочного контракта (средний чек в 5-10 раз выше B2C)</p>\n<p class=\"docp\">Типичные сценарии MICE: - Проблемы с групповым трансфером (задержка, неявка) - Изменение программы мероприятия (экстренно) - Проблемы с конференц-залом / оборудованием - Медицинские ситуации участников - Отмена рейса группы</p>\n<h4 class=\"doch3\">Этап 8: Закрытие и анализ</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования, Бухгалтерия</td></tr><tr><td>Системы</td><td>САМО-тур, 1С</td></tr><tr><td>SLA</td><td>5-10 дней после завершения</td></tr><tr><td>Точка передачи</td><td>Клиент (закрывающие)</td></tr></tbody></table>\n<h4 class=\"doch3\">Действия: 1. Сбор актов от поставщиков 2. Оформление закрывающих документов 3. Отправка клиенту 4. Сбор обратной связи 5. Анализ маржинальности</h4>\n<h3 class=\"doch2\">6. Поток процесса</h3>\n<p class=\"docp\">Процесс начинается с запроса от корпоративного клиента, который принимается отделом группового бронирования (SLA 2 часа на первичный ответ). После уточнения деталей запроса формируются запросы поставщикам и DMC (24-48 часов на сбор предложений).</p>\n<p class=\"docp\">На основе полученных данных готовится смета (1-3 дня) с несколькими вариантами ценообразования. После получения сметы клиент вступает в переговоры (1-4 недели), по итогам которых предложение корректируется.</p>\n<p class=\"docp\">Параллельно запускаются три направления: бронирование услуг (САМО-тур), работа юриста (договоры с поставщиками), бухгалтерия (счета клиенту). После получения оплаты начинается этап исполнения поездки с круглосуточной поддержкой 24/7.</p>\n<p class=\"docp\">В течение 10 дней после завершения поездки оформляются закрывающие документы и передаются клиенту вместе с запросом обратной связи.</p>\n<h3 class=\"doch2\">7. Системы и инструменты</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль в процессе</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Ведение заявок</td></tr><tr><td>Битрикс24</td><td>CRM, задачи</td></tr><tr><td>Excel</td><td>Расчёт смет</td></tr><tr><td>PowerPoint</td><td>Презентации</td></tr><tr><td>ETM</td><td>Платформа бизнес-тревел</td></tr><tr><td>Email</td><td>Основной канал коммуникации</td></tr><tr><td>Броневик, Островок</td><td>Поиск отелей</td></tr><tr><td>Aviasales</td><td>Поиск авиа</td></tr></tbody></table>\n<h3 class=\"doch2\">8. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Время первичного ответа</td><td>≤2 часа</td><td>~4 часа</td><td>CRM</td></tr><tr><td>Время подготовки КП</td><td>≤3 дня</td><td>5-7 дней</td><td>Ручной замер</td></tr><tr><td>Конверсия запрос→сделка</td><td>≥20%</td><td>~12%</td><td>САМО-тур</td></tr><tr><td>Средняя маржинальность</td><td>≥15%</td><td>~10%</td><td>Финансовый отчёт</td></tr><tr><td>NPS корп. клиентов</td><td>≥60</td><td>Нет данных</td><td>Опросы</td></tr><tr><td>Кол-во активных клиентов</td><td>Рост 30%/год</td><td>+15%</td><td>CRM</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Относительно новый сегмент</td><td>Нет отлаженных процессов</td><td>Всё строится с нуля</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Ручное формирование смет</td><td>Нет шаблонов, нет автоматизации</td><td>Долгое время КП</td></tr><tr><td>Нет регламентов</td><td>Относительно новое направление</td><td>Зависимость от ключевых людей</td></tr><tr><td>Сложные многокомпонентные запросы</td><td>Специфика MICE</td><td>Ошибки в расчётах</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-MICE-01</td><td>Шаблоны смет</td><td>Автоформирование смет на основе типовых услуг</td><td>-50% время КП</td><td>HIGH</td></tr><tr><td>AUTO-MICE-02</td><td>Канал MICE в Сервисе</td><td>Выделенная линия поддержки для MICE</td><td>Улучшение NPS</td><td>CRITICAL</td></tr><tr><td>AUTO-MICE-03</td><td>BI-аналитика</td><td>Дашборды по MICE-сегменту</td><td>Управленческие решения</td><td>MEDIUM</td></tr><tr><td>AUTO-MICE-04</td><td>Интеграция с тендерными площадками</td><td>Мониторинг и уведомления о тендерах</td><td>+20% новых клиентов</td><td>MEDIUM</td></tr><tr><td>AUTO-MICE-05</td><td>Автомаршрутизация MICE на 24/7</td><td>Автоматическое определение MICE-клиента по тегу в Битрикс</td><td>Гарантия 24/7 поддержки</td><td>CRITICAL</td></tr></tbody></table>\n<h3 class=\"doch2\">11. Воронка B2B-продаж MICE</h3>\n<table class=\"doctbl\"><thead><tr><th>Этап</th><th>Конверсия</th><th>Описание</th></tr></thead><tbody><tr><td>ЛИД (100%)</td><td>—</td><td>Получение запроса / контакта</td></tr><tr><td>КВАЛИФИКАЦИЯ</td><td>70%</td><td>Уточнение потребностей, бюджета</td></tr><tr><td>КОММЕРЧЕСКОЕ ПРЕДЛОЖЕНИЕ</td><td>40%</td><td>Смета, презентация</td></tr><tr><td>ПЕРЕГОВОРЫ</td><td>25%</td><td>Обсуждение условий, корректировки</td></tr><tr><td>ДОГОВОР / БРОНЬ</td><td>15%</td><td>Подписание, предоплата</td></tr><tr><td>ИСПОЛНЕНИЕ</td><td>12%</td><td>Проведение мероприятия / поездки</td></tr></tbody></table>\n<h3 class=\"doch2\">12. Рекомендации</h3>\n<h4 class=\"doch3\">Немедленные действия</h4>\n<p class=\"docp\">Создать выделенный канал в Клиентском сервисе для MICE-клиентов</p>\n<p class=\"docp\">Разработать стандартные шаблоны смет для типовых запросов</p>\n<p class=\"docp\">Формализовать регламенты взаимодействия с другими отделами</p>\n<h4 class=\"doch3\">Среднесрочные</h4>\n<p class=\"docp\">Внедрить CRM-воронку для MICE в Битрикс24</p>\n<p class=\"docp\">Аккредитоваться на тендерных площадках</p>\n<p class=\"docp\">Разработать программу лояльности для корпоративных клиентов</p>\n<p class=\"docp\">Создать систему сбора NPS после каждой поездки</p>\n<h4 class=\"doch3\">Долгосрочные</h4>\n<p class=\"docp\">Интеграция с ETM для автоматизации бизнес-тревел</p>\n<p class=\"docp\">Разработка собственного калькулятора MICE-услуг</p>\n<p class=\"docp\">Выход на рынок организации выставок и конференций</p>\n<h3 class=\"doch2\">13. Связь с другими процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Процесс</th><th>Тип взаимодействия</th><th>Точка передачи</th></tr></thead><tbody><tr><td>BP-06 (Клиентская поддержка)</td><td>Маршрутизация MICE-обращений на 24/7</td><td>Линия 24/7 в нерабочее время</td></tr><tr><td>BP-01 (Заявка)</td><td>Бронирование услуг через общую систему</td><td>САМО-тур</td></tr><tr><td>BP-04 (Финансы)</td><td>Счета, оплаты, закрывающие документы</td><td>1С, Бухгалтерия</td></tr></tbody></table>", "04": "<h2 class=\"doch1\">BP-04: Финансовый цикл</h2>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-04</td></tr><tr><td>Название</td><td>Финансовый цикл</td></tr><tr><td>Владелец</td><td>Назарикова М.В. (Финансовый департамент)</td></tr><tr><td>Критичность</td><td>КРИТИЧЕСКИЙ</td></tr><tr><td>Влияние</td><td>100% денежных потоков компании</td></tr><tr><td>Частота</td><td>Ежедневно (платежи), ежемесячно (отчётность)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Структура финансового департамента</h3>\n<table class=\"doctbl\"><thead><tr><th>Подразделение</th><th>Руководитель</th><th>Функции</th></tr></thead><tbody><tr><td>Финансовый отдел</td><td>Фомичев И.В.</td><td>Управленческий учёт, аналитика, CF-контроль</td></tr><tr><td>Бухгалтерия</td><td>Соколова</td><td>Бухучёт, налоги, документооборот</td></tr><tr><td>Банковская группа</td><td>Лебедева</td><td>Платежи, разнесение оплат</td></tr><tr><td>Группа расчётов с иностранными поставщиками</td><td>Мигунова</td><td>Валютные платежи, Travelluxe</td></tr><tr><td></td><td></td><td></td></tr></tbody></table>\n<h3 class=\"doch2\">3. Ключевые цели финансового департамента</h3>\n<p class=\"docp\">Финансовая устойчивость — обеспечение непрерывности бизнеса, предотвращение кассовых разрывов</p>\n<p class=\"docp\">Экономическая эффективность — контроль маржинальности, анализ прибыли по сегментам</p>\n<p class=\"docp\">Прозрачность и управляемость — достоверная отчётность, управление рисками</p>\n<h3 class=\"doch2\">4. Подпроцессы финансового цикла</h3>\n<h4 class=\"doch3\">4.1. Ежедневный цикл оплат</h4>\n<p class=\"docp\">Процесс начинается в 08:00 со сбора остатков на счетах (СВК-отчёт). В 09:00 выгружаются поступления из клиент-банков. В 10:00 запускается автоматическое разнесение платежей в САМО-тур. К 11:00 формируется реестр исходящих платежей. В 12:00 происходит согласование с Финансовым директором. В 14:00 проводятся платежи поставщикам. В 16:00 выгружается выписка в 1С. В 17:00 осуществляется контроль дебиторской задолженности.</p>\n<h4 class=\"doch3\">4.2. Ежемесячный цикл отчётности</h4>\n<p class=\"docp\">С 1 по 5 число собираются данные по операционной деятельности. С 5 по 8 число формируется ФОТ в бухгалтерии. С 8 по 10 число готовятся отчёт о расходах и отчёт о прибылях/убытках. С 10 по 15 число формируется ежемесячный отчёт для KPI. С 15 по 20 число закрывается период в 1С.</p>\n<h3 class=\"doch2\">5. Детализация подпроцессов</h3>\n<h4 class=\"doch3\">5.1. Разнесение входящих платежей</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Банковская группа</td></tr><tr><td>Системы</td><td>Клиент-банк → Сетевой диск → САМО-тур</td></tr><tr><td>Частота</td><td>Каждый час</td></tr><tr><td>SLA</td><td>1 час после поступления</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм: 1. Выгрузка файла из клиент-банка (xlsx, htm) 2. Сохранение на сетевой диск 3. Автоматическое разнесение скриптом IT 4. Проверка файла загрузки (приходит на почту) 5. Ручная коррекция неразнесённых платежей</p>\n<h4 class=\"doch3\">Проблемы: - Ошибки клиентов: неверные реквизиты, отсутствующий номер заявки - Оплата в другой день → несовпадение курса валют - Оплата на «старые» реквизиты</h4>\n<h4 class=\"doch3\">5.2. Реестр платежей поставщикам (Invoice Tracker)</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Все отделы → Финансовый отдел</td></tr><tr><td>Системы</td><td>Google Таблицы, 1С, Клиент-банк, САМО-тур</td></tr><tr><td>Частота</td><td>Ежедневно</td></tr><tr><td>SLA</td><td>По дате в трекере</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм: 1. Сотрудник заносит счёт в Invoice Tracker 2. Отправляет копию на buh@сайт компании 3. Формирование реестра на текущую дату 4. Согласование с Финансовым директором 5. Проверка наличия ДС на счетах 6. Формирование платёжных поручений 7. Проведение оплат 8. Внесение в 1С 9. Разнесение в САМО-тур (для туруслуг)</p>\n<h4 class=\"doch3\">Проблемы: - Одновременное редактирование Google Таблицы → сбои - Потеря счетов при некорректном занесении - Отсутствие копий счетов по почте</h4>\n<h4 class=\"doch3\">5.3. Управленческая отчётность</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Финансовый отдел</td></tr><tr><td>Системы</td><td>САМО-тур, 1С, Excel</td></tr><tr><td>Частота</td><td>Ежемесячно (8-10 число)</td></tr><tr><td>Получатели</td><td>Генеральный директор, Финансовый директор</td></tr></tbody></table>\n<p class=\"docp\">Формируемые отчёты: 1. Отчёт о расходах — все затраты по статьям 2. Отчёт о прибылях/убытках (P&amp;L) — финансовый результат 3. Отчёты для KPI — бонусы менеджерам, бронировщикам, КАМам</p>\n<p class=\"docp\">Алгоритм формирования P&amp;L: 1. Выгрузка операционных результатов из САМО-тур 2. Выгрузка курсов ЦБ, расчёт внутренней наценки 3. Перерасчёт в рублёвый эквивалент 4. Расчёт результатов по сотрудникам 5. Отправка в бухгалтерию для расчёта ФОТ 6. Сбор расходов из 1С по всем юрлицам 7. Категоризация расходов 8. Расчёт внереализационных доходов 9. Формирование итогового P&amp;L 10. Согласование и коррекция</p>\n<h4 class=\"doch3\">Проблемы: - Множество источников данных (САМО, 1С×5 юрлиц, касса, маркетинг) - Ручная категоризация расходов - Высокие трудозатраты (12 шагов) - Человеческий фактор при обработке</h4>\n<h4 class=\"doch3\">5.4. Валютные платежи (Travelluxe)</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Группа расчётов с иностранными поставщиками</td></tr><tr><td>Системы</td><td>Клиент-банк Travelluxe, 1С</td></tr><tr><td>Валюты</td><td>EUR, USD, AED</td></tr><tr><td>Частота</td><td>Ежедневно</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм: 1. Обзор запросов на платежи (Balance Payment) 2. Анализ наличия ДС для конвертации 3. Мониторинг курса, выбор «удачного» момента 4. Конвертация и отправка платежей 5. Перевод ДС на счета группы компаний 6. Отражение в 1С (аутсорсинг Казахстан)</p>\n<h4 class=\"doch3\">Проблемы: - Низкая скорость работы клиент-банка Travelluxe - Санкции, блокировки, смена схем оплат - Часовые пояса Казахстана</h4>\n<h4 class=\"doch3\">5.5. Контроль дебиторской задолженности</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Финансовый отдел</td></tr><tr><td>Системы</td><td>САМО-тур</td></tr><tr><td>Частота</td><td>Еженедельно</td></tr><tr><td>Результат</td><td>Получение оплаты / Аннуляция заявки</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм: 1. Выгрузка неоплаченных заявок с прошедшими датами 2. Направление отчёта ведущим менеджерам 3. Разбор комментариев 4. Принятие решения: аннуляция / ожидание / коррекция</p>\n<h4 class=\"doch3\">5.6. Официальная отчётность</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Финансовый отдел, Бухгалтерия</td></tr><tr><td>Системы</td><td>САМО-тур, 1С</td></tr><tr><td>Частота</td><td>По требованию / ежеквартально</td></tr></tbody></table>\n<p class=\"docp\">Типы отчётности: - Форма «Поездки_1» для ЦБ - Отчёты в Росстат - Отчёты для туристических органов - Запросы от банков и журналистов</p>\n<h3 class=\"doch2\">6. Поток процесса</h3>\n<p class=\"docp\">Входящие денежные потоки поступают от агентов (B2B), туристов (B2C) и партнёров (маркетинговые бюджеты) через клиент-банки (16 банков). Поступления автоматически разносятся скриптом IT в САМО-тур.</p>\n<p class=\"docp\">Исходящие потоки направляются на оплату отелям и DMC, авиакомпаниям (ИАТА и др.), а также на внутренние расходы (ФОТ, АХО). Все платежи отражаются в 1С (5 юридических лиц).</p>\n<p class=\"docp\">По итогам месяца формируется управленческая отчётность (P&amp;L), которая предоставляется руководству, а также официальная отчётность для ЦБ и Росстата.</p>\n<h3 class=\"doch2\">7. Системы и интеграции</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль</th><th>Интеграция</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Операционный учёт заявок</td><td>← Клиент-банк (скрипт)</td></tr><tr><td>1С Бухгалтерия (5 юрлиц)</td><td>Бухгалтерский учёт</td><td>← Клиент-банк</td></tr><tr><td>Клиент-банки (16 шт.)</td><td>Платежи</td><td>→ САМО, → 1С</td></tr><tr><td>Google Таблицы (Invoice Tracker)</td><td>Реестр счетов</td><td>Ручной ввод</td></tr><tr><td>Excel</td><td>Управленческая отчётность</td><td>Ручные выгрузки</td></tr></tbody></table>\n<h3 class=\"doch2\">8. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Закрытие периода</td><td>8-10 число</td><td>Соблюдается</td><td>Календарь</td></tr><tr><td>% автоматического разнесения платежей</td><td>≥95%</td><td>~85%</td><td>Отчёт загрузки</td></tr><tr><td>Дебиторская задолженность &gt;30 дней</td><td>≤5%</td><td>~8%</td><td>САМО-тур</td></tr><tr><td>Время формирования P&amp;L</td><td>≤3 дня</td><td>5-7 дней</td><td>Ручной замер</td></tr><tr><td>Ошибки в отчётности</td><td>0</td><td>~2/мес</td><td>Коррекции</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Отсутствие софта для CF-управления</td><td>Нет специализированной системы</td><td>Ручное планирование</td></tr><tr><td>Ручной учёт авиабилетов</td><td>Нет интеграции GDS → 1С</td><td>Риск убытков, задержка закрытия</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Множество источников данных</td><td>5 юрлиц × разные базы</td><td>Трудозатраты на P&amp;L</td></tr><tr><td>Ручная категоризация расходов</td><td>Нет автоматизации</td><td>Ошибки, время</td></tr><tr><td>Invoice Tracker на Google Таблицах</td><td>Нет нормальной системы</td><td>Сбои при коллективной работе</td></tr><tr><td>Ошибки клиентов в платёжках</td><td>Человеческий фактор</td><td>Ручное разнесение</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-FIN-01</td><td>Софт для CF-управления</td><td>Автоматизация платёжного календаря</td><td>Сокращение времени, снижение рисков</td><td>HIGH</td></tr><tr><td>AUTO-FIN-02</td><td>Сток-контроль авиабилетов</td><td>Автоматический учёт билетов в 1С</td><td>Исключение убытков</td><td>HIGH</td></tr><tr><td>AUTO-FIN-03</td><td>Power BI для отчётности</td><td>Автоматические дашборды</td><td>Real-time данные</td><td>MEDIUM</td></tr><tr><td>AUTO-FIN-04</td><td>Замена Invoice Tracker</td><td>Нормальная система учёта счетов</td><td>Устранение сбоев</td><td>MEDIUM</td></tr><tr><td>AUTO-FIN-05</td><td>Автокатегоризация расходов</td><td>Правила разнесения по статьям</td><td>-50% ручной работы</td><td>MEDIUM</td></tr></tbody></table>\n<h3 class=\"doch2\">11. Взаимодействие с другими процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Процесс</th><th>Тип взаимодействия</th><th>Точка передачи</th></tr></thead><tbody><tr><td>BP-01 (Заявка)</td><td>Оплата ← Клиент</td><td>Разнесение в САМО</td></tr><tr><td>BP-01 (Заявка)</td><td>Оплата → Поставщик</td><td>Invoice Tracker</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Счета партнёрам</td><td>Invoice Tracker</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Оплата подрядчикам</td><td>Invoice Tracker</td></tr><tr><td>BP-03 (MICE)</td><td>Счета корп. клиентам</td><td>1С</td></tr><tr><td>BP-03 (MICE)</td><td>Оплата поставщикам</td><td>Invoice Tracker</td></tr><tr><td>Все процессы</td><td>Контроль маржинальности</td><td>P&amp;L отчёт</td></tr></tbody></table>\n<h3 class=\"doch2\">12. Рекомендации</h3>\n<h4 class=\"doch3\">Немедленные действия</h4>\n<p class=\"docp\">Внедрить сток-контроль авиабилетов — критично для снижения убытков</p>\n<p class=\"docp\">Заменить Invoice Tracker на нормальную систему с контролем доступа</p>\n<p class=\"docp\">Автоматизировать категоризацию расходов через правила</p>\n<h4 class=\"doch3\">Среднесрочные</h4>\n<p class=\"docp\">Внедрить специализированный софт для Cash Flow управления</p>\n<p class=\"docp\">Создать дашборды в Power BI для оперативной аналитики</p>\n<p class=\"docp\">Унифицировать формат данных между юрлицами</p>\n<h4 class=\"doch3\">Долгосрочные</h4>\n<p class=\"docp\">Рассмотреть переход на единую ERP-систему</p>\n<p class=\"docp\">Интеграция всех клиент-банков через API</p>\n<p class=\"docp\">Автоматическое формирование P&amp;L без ручной обработки</p>\n<h3 class=\"doch2\">13. Контрольные точки финансового цикла</h3>\n<table class=\"doctbl\"><thead><tr><th>Дата</th><th>Действие</th><th>Ответственный</th></tr></thead><tbody><tr><td>Ежедневно, 08:00</td><td>Отчёт СВК об остатках</td><td>Банковская группа</td></tr><tr><td>Ежедневно, каждый час</td><td>Разнесение платежей</td><td>Банковская группа</td></tr><tr><td>Ежедневно, 14:00</td><td>Платежи поставщикам</td><td>Банковская группа</td></tr><tr><td>Еженедельно</td><td>Контроль дебиторки</td><td>Финансовый отдел</td></tr><tr><td>8-10 число</td><td>P&amp;L за месяц</td><td>Финансовый отдел</td></tr><tr><td>15-20 число</td><td>Закрытие периода в 1С</td><td>Бухгалтерия</td></tr><tr><td>Ежеквартально</td><td>Отчёт в ЦБ</td><td>Финансовый отдел</td></tr></tbody></table>", "05": "<h2 class=\"doch1\">BP-05: Формирование турпродукта</h2>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-05</td></tr><tr><td>Название</td><td>Формирование турпродукта</td></tr><tr><td>Владелец</td><td>Баландина О.А. (Департамент операционных доходов)</td></tr><tr><td>Критичность</td><td>КРИТИЧЕСКИЙ</td></tr><tr><td>Влияние</td><td>Основа всех продаж — без продукта нет выручки</td></tr><tr><td>Частота</td><td>Непрерывно (сезонные пики: март-апрель, сентябрь-октябрь)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Структура департамента</h3>\n<table class=\"doctbl\"><thead><tr><th>Подразделение</th><th>Руководитель</th><th>Функции</th></tr></thead><tbody><tr><td>Группы стран (5 групп)</td><td>Цехович, Андреева, Писцова, Черепова</td><td>Контрактинг, переговоры с DMC, продуктовый план</td></tr><tr><td>Группа тарификации</td><td>Ильясова Л.Е.</td><td>Расчёт и публикация цен, контроль ошибок</td></tr><tr><td>Чартерная группа</td><td>Зайцев</td><td>Блоки мест, чартерные программы</td></tr><tr><td></td><td></td><td></td></tr></tbody></table>\n<h3 class=\"doch2\">3. Ключевые цели процесса</h3>\n<p class=\"docp\">Формирование продуктового портфеля — создание конкурентных туров по всем направлениям</p>\n<p class=\"docp\">Обеспечение жизнедеятельности продукта — мониторинг конверсии, актуализация цен</p>\n<p class=\"docp\">Увеличение операционных доходов — работа с наценкой, incentives, kick-backs</p>\n<p class=\"docp\">Конкурентное ценообразование — поддержание цен на уровне или ниже конкурентов</p>\n<h3 class=\"doch2\">4. Основные подпроцессы</h3>\n<h4 class=\"doch3\">4.1. Формирование продуктового плана</h4>\n<p class=\"docp\">Процесс запускается по триггеру: стратегическая сессия, запрос рынка или появление нового поставщика. Группы стран собирают продуктовые возможности с учётом обратной связи от региональных офисов, проводят анализ рынка и ведут переговоры с DMC.</p>\n<p class=\"docp\">На выходе формируется продуктовый план, включающий направления, отели, сезонность и бюджет. План согласовывается с руководством.</p>\n<h4 class=\"doch3\">Проблемы: - Длительный сбор информации с региональных офисов (несистематизированные данные) - Коммуникационные разрывы между отделами - Опора на непроверенные данные регионов</h4>\n<h4 class=\"doch3\">4.2. Ценообразование (7 этапов)</h4>\n<p class=\"docp\">Процесс запускается задачей в Битрикс от группы стран.</p>\n<h4 class=\"doch3\">Этап 1: Постановка задачи — Группа стран передаёт задачу руководителю тарификации по шаблону с данными продукта.</h4>\n<h4 class=\"doch3\">Этап 2: Первичный анализ — Руководитель тарификации проверяет полноту данных. Если данных менее 80% — возврат на доработку.</h4>\n<h4 class=\"doch3\">Этап 3: Делегирование и оценка сроков — Менеджер анализирует задачу, уточняет детали.</h4>\n<h4 class=\"doch3\">Этап 4: Расчёт цен — Работа в Excel и САМО-тур. УЗКОЕ МЕСТО: 5 человек на ВСЕ цены компании.</h4>\n<h4 class=\"doch3\">Этап 5: Проверка публикации — Контроль корректности расчётов на сайте.</h4>\n<h4 class=\"doch3\">Этап 6: Уведомление продуктолога — Закрытие задачи в CRM.</h4>\n<h4 class=\"doch3\">Этап 7: Контроль отдела продукта — Может быть пропущен, ошибки не выявляются.</h4>\n<p class=\"docp\">Время выполнения: 2-5 дней (целевое), 2-5 недель (фактическое)</p>\n<h4 class=\"doch3\">4.3. Ценообразование чартерного продукта</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Чартерная группа + Группа тарификации</td></tr><tr><td>Системы</td><td>Excel, САМО-тур, Агрегаторы</td></tr><tr><td>Частота</td><td>Ежедневно (динамическая корректировка)</td></tr><tr><td>Критичность</td><td>КРИТИЧЕСКАЯ</td></tr></tbody></table>\n<p class=\"docp\">Процесс: 1. Мониторинг загрузки рейсов 2. Анализ конкурентов (автоматические отчёты) 3. Ручная корректировка цен 4. Публикация обновлённых цен</p>\n<h4 class=\"doch3\">Проблемы: - Полностью ручной процесс корректировки - Задержки в реакции на рынок - Риск «горения» мест (минимизация чистого горения)</h4>\n<h4 class=\"doch3\">4.4. Контроль жизнедеятельности продукта</h4>\n<p class=\"docp\">Процесс запускается ежеквартальным отчётом или по запросу руководителя.</p>\n<p class=\"docp\">Выгрузка данных по продукту (API компании): название тура, дата публикации, количество заявок</p>\n<p class=\"docp\">Фильтрация (туры старше 6 месяцев)</p>\n<p class=\"docp\">Ручная аналитика по странам/направлениям</p>\n<p class=\"docp\">Сводные таблицы и презентация</p>\n<p class=\"docp\">Презентация на собрании департамента</p>\n<p class=\"docp\">Решения от групп стран: корректировка/удаление (возможны задержки в принятии решений)</p>\n<h4 class=\"doch3\">4.5. Выявление и устранение ошибок</h4>\n<p class=\"docp\">Типы ошибок:</p>\n<table class=\"doctbl\"><thead><tr><th>Тип</th><th>Тип</th><th>Источник</th><th>Процесс устранения</th></tr></thead><tbody><tr><td>Тарификационная</td><td>Неоднозначные формулировки, ошибка в Excel</td><td>Неоднозначные формулировки, ошибка в Excel</td><td>Группа тарификации → исправление → анализ причин</td></tr><tr><td>Техническая</td><td>Ошибка САМО-софт, интеграции</td><td>Ошибка САМО-софт, интеграции</td><td>Группа тарификации → IT → САМО-софт</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм: 1. Поступление задачи (Битрикс/почта) с описанием ошибки 2. Определение типа ошибки 3. Исправление / делегирование в IT 4. Анализ затронутых бронирований 5. Минимизация финансовых потерь (подключение групп стран) 6. Отчёт руководителю</p>\n<h3 class=\"doch2\">5. Системы и интеграции</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль</th><th>Интеграция</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Основная база продуктов</td><td>← Excel (расчёты)</td></tr><tr><td>САМО-Incoming</td><td>Прямой контрактинг</td><td>← САМО-тур</td></tr><tr><td>Excel</td><td>Расчёт цен, чек-листы</td><td>→ САМО-тур</td></tr><tr><td>Битрикс24</td><td>Задачи, коммуникации</td><td>↔ САМО-тур</td></tr><tr><td>Сайт сайт компании</td><td>Публикация туров</td><td>← САМО-тур</td></tr></tbody></table>\n<h3 class=\"doch2\">6. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Время публикации продукта</td><td>≤5 дней</td><td>2-5 недель</td><td>Битрикс (задачи)</td></tr><tr><td>Конверсия новых туров</td><td>≥10%</td><td>Нет данных</td><td>Отчёт по API</td></tr><tr><td>Ошибки в расчётах</td><td>≤1%</td><td>~3-5%</td><td>Ручной подсчёт</td></tr><tr><td>Туры без конверсии (&gt;6 мес)</td><td>≤20%</td><td>~30%</td><td>Отчёт конверсии</td></tr><tr><td>Время устранения ошибок</td><td>≤4 часа</td><td>~1-2 дня</td><td>Битрикс</td></tr></tbody></table>\n<h3 class=\"doch2\">7. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Группа тарификации — узкое место</td><td>5 человек на ВСЕ цены компании</td><td>Задержки публикации 2-5 недель</td></tr><tr><td>Ручное ценообразование чартеров</td><td>Нет автоматизации</td><td>Потеря маржи, горение мест</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Длительный сбор информации</td><td>Несистематизированные данные регионов</td><td>Затягивание планирования</td></tr><tr><td>Троение гостиниц от динамических поставщиков</td><td>Нет автоматического сопоставления</td><td>Ручная обработка</td></tr><tr><td>Отсутствие учёта обращений</td><td>Обращения по почте, не в CRM</td><td>Нет данных о нагрузке</td></tr></tbody></table>\n<h3 class=\"doch2\">8. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-PROD-01</td><td>Динамическое ценообразование чартеров</td><td>Автоматическая корректировка цен на основе загрузки и конкурентов</td><td>Снижение горения на 30%, рост маржи</td><td>CRITICAL</td></tr><tr><td>AUTO-PROD-02</td><td>Автоматическая ревизия туров</td><td>Удаление туров без конверсии за период</td><td>-50% ручной работы, чистый каталог</td><td>HIGH</td></tr><tr><td>AUTO-PROD-03</td><td>Сопоставление гостиниц</td><td>Автоматический матчинг отелей от разных поставщиков</td><td>Устранение дубликатов</td><td>HIGH</td></tr><tr><td>AUTO-PROD-04</td><td>Мониторинг сроков цен</td><td>Автоуведомления о необходимости пролонгации</td><td>Предотвращение пустых сезонов</td><td>HIGH</td></tr><tr><td>AUTO-PROD-05</td><td>Парсинг обращений из почты</td><td>Автоматическое создание задач в Битрикс</td><td>Учёт нагрузки, метрики</td><td>MEDIUM</td></tr><tr><td>AUTO-PROD-06</td><td>Парсинг конкурентов</td><td>Расширение автоматического анализа</td><td>Быстрая реакция на рынок</td><td>MEDIUM</td></tr><tr><td>AUTO-PROD-07</td><td>Проверка ошибок роботом</td><td>Автоматический контроль расчётов</td><td>Снижение ошибок на 50%</td><td>MEDIUM</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Взаимодействие с другими процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Процесс</th><th>Тип взаимодействия</th><th>Точка передачи</th></tr></thead><tbody><tr><td>BP-01 (Заявка)</td><td>Опубликованный продукт используется для продаж</td><td>САМО-тур → Сайт</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Новые продукты требуют продвижения</td><td>Задача в Битрикс</td></tr><tr><td>BP-04 (Финансы)</td><td>Данные о прибыли по направлениям для анализа</td><td>Запрос в Финансы</td></tr><tr><td>BP-06 (Поддержка)</td><td>Ошибки на сайте поступают через поддержку</td><td>Задача/почта</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Рекомендации</h3>\n<h4 class=\"doch3\">Немедленные действия</h4>\n<p class=\"docp\">Внедрить динамическое ценообразование чартеров — критично для снижения убытков</p>\n<p class=\"docp\">Автоматизировать мониторинг сроков действия цен — предотвращение пустых сезонов</p>\n<p class=\"docp\">Настроить парсинг обращений из почты — получить метрики по нагрузке</p>\n<h4 class=\"doch3\">Среднесрочные</h4>\n<p class=\"docp\">Автоматическое сопоставление гостиниц от разных поставщиков</p>\n<p class=\"docp\">Робот для проверки ошибок в расчётах</p>\n<p class=\"docp\">Автоматическая ревизия туров без конверсии</p>\n<h4 class=\"doch3\">Долгосрочные</h4>\n<p class=\"docp\">Единая система управления продуктом с интеграцией всех поставщиков</p>\n<p class=\"docp\">Предиктивная аналитика спроса для планирования продукта</p>\n<p class=\"docp\">Автоматическое формирование продуктового плана на основе данных</p>", "06": "<h2 class=\"doch1\">BP-06: Клиентская поддержка и маршрутизация</h2>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-06</td></tr><tr><td>Название</td><td>Клиентская поддержка и маршрутизация</td></tr><tr><td>Владелец</td><td>Акопова А.В. (Управление клиентского сервиса)</td></tr><tr><td>Критичность</td><td>ВЫСОКИЙ</td></tr><tr><td>Влияние</td><td>Удержание клиентов, первое впечатление, снижение убытков</td></tr><tr><td>Частота</td><td>Непрерывно (24/7)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Структура управления</h3>\n<table class=\"doctbl\"><thead><tr><th>Подразделение</th><th>Руководитель</th><th>Режим работы</th></tr></thead><tbody><tr><td>Отдел клиентской поддержки</td><td>Фролова А.Г.</td><td>Рабочие дни 09:00-18:00</td></tr><tr><td>Отдел круглосуточной работы с клиентами</td><td>Акопова А.В.</td><td>24/7/365</td></tr><tr><td></td><td></td><td></td></tr></tbody></table>\n<h3 class=\"doch2\">3. Ключевые цели процесса</h3>\n<p class=\"docp\">Клиентоориентированный сервис — высокое качество обслуживания (консультации, поддержка)</p>\n<p class=\"docp\">Оперативность — минимальное время отклика и решения обращений</p>\n<p class=\"docp\">Лояльность клиентов — сохранение долгосрочного сотрудничества</p>\n<p class=\"docp\">Минимизация убытков — быстрое решение проблем в поездке</p>\n<h3 class=\"doch2\">4. Основные подпроцессы</h3>\n<h4 class=\"doch3\">4.1. Обработка входящих звонков</h4>\n<p class=\"docp\">Процесс начинается с входящего звонка на телефонную линию компании. Сотрудник определяет причину звонка и принимает решение: либо решает вопрос самостоятельно (простые вопросы), либо маршрутизирует звонок в соответствующий отдел.</p>\n<p class=\"docp\">Маршрутизация включает 28 потенциальных направлений: отдел продаж, ВИП отдел, транспортный отдел, групповое бронирование, 8 региональных офисов, въездной туризм, бронирование.</p>\n<p class=\"docp\">SLA: Приём звонка ≤30 секунд</p>\n<h4 class=\"doch3\">Проблемы: - Ошибки в определении городов (Вологда/Волгоград, Дзержинск/Дзержинский) - До Отдела продаж затруднительно дозвониться - Пропуск других вызовов при ожидании соединения</h4>\n<h4 class=\"doch3\">4.2. Обработка обращений по e-mail / CRM</h4>\n<p class=\"docp\">Обращения поступают на email sales@сайт компании или через форму на сайте. На первом этапе определяется причина обращения и производится категоризация: запрос на расчёт, информационный запрос или жалоба.</p>\n<p class=\"docp\">Простые вопросы решаются самостоятельно по шаблонам. Сложные обращения передаются в один из 28 отделов: HR, IT, Реклама, Контент, Продукт, Тарификация, Чартер, Продажи, ВИП, Транспорт, Финансы, Бухгалтерия, КАМы, 8 региональных офисов.</p>\n<p class=\"docp\">SLA: Первый ответ ≤1 час</p>\n<p class=\"docp\">Проблема: Не все почты подключены к Битрикс, что замедляет обработку в пиковые часы.</p>\n<h4 class=\"doch3\">4.3. Обработка запросов на расчёт (сделки)</h4>\n<p class=\"docp\">При поступлении запроса на расчёт тура определяется тип запроса и курирующий офис/отдел. Затем выбирается ответственный сотрудник, оформляется сделка в Битрикс и отправляется ответ клиенту о передаче запроса в работу.</p>\n<p class=\"docp\">SLA: Маршрутизация ≤15 минут</p>\n<h4 class=\"doch3\">Проблемы: - Не все агенты есть в САМО/Битрикс — приходится искать в интернете - Отсутствия сотрудников ведутся в разных системах (Битрикс, Google Таблица, «Моя команда») - Устаревшие списки направлений</h4>\n<h4 class=\"doch3\">4.4. Круглосуточная поддержка (24/7)</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел круглосуточной работы с клиентами</td></tr><tr><td>Системы</td><td>Телефон, WhatsApp, САМО-тур, Битрикс24</td></tr><tr><td>Режим</td><td>24/7/365</td></tr><tr><td>Цель</td><td>Минимизация убытков компании, решение проблем в поездке</td></tr></tbody></table>\n<p class=\"docp\">Основные сценарии:</p>\n<table class=\"doctbl\"><thead><tr><th>Сценарий</th><th>Процесс</th></tr></thead><tbody><tr><td>Проблема с трансфером</td><td>Связь с DMC → Поиск решения → Контроль встречи</td></tr><tr><td>Проблема с отелем</td><td>Связь с отелем/DMC → Эскалация при необходимости</td></tr><tr><td>Запрос данных от DMC</td><td>Поиск в САМО → Уточнение у агента → Передача DMC</td></tr><tr><td>Неявка туристов</td><td>Фиксация в САМО → Уведомление менеджера по заявке</td></tr><tr><td>MICE-обращение</td><td>Идентификация по тегу → Приоритетная обработка → Передача в Отдел группового бронирования (утро)</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм работы:</p>\n<p class=\"docp\">Приём обращения, уведомление клиента</p>\n<p class=\"docp\">Создание сделки в Битрикс «Контроль поездки» (номер заявки, тема, суть проблемы, контакты)</p>\n<p class=\"docp\">Связь с партнёром (WhatsApp / телефон)</p>\n<p class=\"docp\">Согласование решения (при необходимости подключение руководителей направлений, финансов)</p>\n<p class=\"docp\">Информирование клиента о ходе решения</p>\n<p class=\"docp\">Закрытие сделки / Передача следующей смене</p>\n<h4 class=\"doch3\">4.5. Специальные процессы</h4>\n<p class=\"docp\">Регистрация нового агента (6 этапов)</p>\n<p class=\"docp\">Получение отбивки от САМО на sales@ о новой регистрации</p>\n<p class=\"docp\">Определение региона агентства (если регион — передача КАМу и завершение)</p>\n<p class=\"docp\">Приведение карточки САМО к единому виду</p>\n<p class=\"docp\">Отправка пароля</p>\n<p class=\"docp\">Отправка приветственного письма</p>\n<p class=\"docp\">Заполнение реестра договоров и карточки в Битрикс</p>\n<p class=\"docp\">Проблема: Ручной перенос данных между САМО и Битрикс.</p>\n<p class=\"docp\">Обработка гарантийных писем (ГП)</p>\n<p class=\"docp\">Проверка типовой формы заявления</p>\n<p class=\"docp\">Проверка заявки-гаранта</p>\n<p class=\"docp\">Подтверждение / Отказ + подключение КАМа</p>\n<p class=\"docp\">Проблема: КАМы иногда согласовывают ГП напрямую → двойная работа.</p>\n<p class=\"docp\">Обработка заявлений на перенос и возврат</p>\n<p class=\"docp\">Проверка данных в САМО-туре</p>\n<p class=\"docp\">Проверка в инвойс-трекере</p>\n<p class=\"docp\">Внесение в инвойс-трекер (СЗ или СБ)</p>\n<p class=\"docp\">Передача в бухгалтерию</p>\n<h4 class=\"doch3\">4.6. Поддержка MICE-клиентов (корпоративный сегмент)</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел круглосуточной работы с клиентами</td></tr><tr><td>Связанный процесс</td><td>BP-03 (MICE и корпоративное обслуживание)</td></tr><tr><td>Режим</td><td>24/7 (в нерабочее время Отдела группового бронирования)</td></tr><tr><td>Критичность</td><td>КРИТИЧНО для удержания корпоративных клиентов</td></tr></tbody></table>\n<p class=\"docp\">Почему это критично: - Корпоративные клиенты (B2B) составляют ~10% выручки и имеют высокие ожидания по уровню сервиса - MICE-мероприятия часто проходят в нестандартное время - Потеря доверия корпоративного клиента = потеря долгосрочного контракта (средний чек в 5-10 раз выше B2C)</p>\n<p class=\"docp\">Алгоритм обработки MICE-обращений:</p>\n<p class=\"docp\">Идентификация MICE-клиента (проверка тега в Битрикс, тип заявки в САМО)</p>\n<p class=\"docp\">Создание сделки «MICE-поддержка 24/7» в Битрикс</p>\n<p class=\"docp\">Приоритетная обработка (SLA: ответ ≤15 мин, решение ≤2 часа)</p>\n<p class=\"docp\">Передача в Отдел группового бронирования (утром следующего рабочего дня)</p>\n<p class=\"docp\">Типичные сценарии MICE:</p>\n<table class=\"doctbl\"><thead><tr><th>Сценарий</th><th>Действия</th></tr></thead><tbody><tr><td>Проблемы с групповым трансфером</td><td>Связь с DMC → Организация замены → Контроль прибытия</td></tr><tr><td>Изменение программы мероприятия</td><td>Согласование с партнёром → Информирование клиента</td></tr><tr><td>Проблемы с конференц-залом</td><td>Связь с отелем → Поиск альтернативы</td></tr><tr><td>Медицинские ситуации участников</td><td>Координация медпомощи → Информирование организатора</td></tr><tr><td>Отмена рейса группы</td><td>Поиск альтернативного рейса → Координация трансферов</td></tr></tbody></table>\n<p class=\"docp\">SLA для MICE-клиентов:</p>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th></tr></thead><tbody><tr><td>Время первого ответа</td><td>≤15 минут</td></tr><tr><td>Время решения проблемы</td><td>≤2 часа</td></tr><tr><td>Информирование клиента о статусе</td><td>Каждые 30 минут</td></tr></tbody></table>\n<h3 class=\"doch2\">5. Системы и интеграции</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль</th><th>Интеграция</th></tr></thead><tbody><tr><td>UIS (телефония)</td><td>Приём звонков</td><td>→ Битрикс</td></tr><tr><td>Битрикс24</td><td>CRM, сделки, чаты</td><td>↔ САМО-тур</td></tr><tr><td>САМО-тур</td><td>Данные по заявкам, агентам</td><td>↔ Битрикс</td></tr><tr><td>Outlook</td><td>Почта sales@</td><td>→ Битрикс (частично)</td></tr><tr><td>WhatsApp</td><td>Связь с DMC, клиентами</td><td>Ручной режим</td></tr><tr><td>Google Таблицы</td><td>Реестр договоров, график работы</td><td>Ручной режим</td></tr><tr><td>Моя команда</td><td>Учёт отсутствий</td><td>Ручной режим</td></tr></tbody></table>\n<h3 class=\"doch2\">6. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Время приёма звонка</td><td>≤30 сек</td><td>~30 сек</td><td>UIS</td></tr><tr><td>Время первого ответа (email)</td><td>≤1 час</td><td>~1-2 часа</td><td>Ручной замер</td></tr><tr><td>Время маршрутизации</td><td>≤5 мин</td><td>~15 мин</td><td>Ручной замер</td></tr><tr><td>Пропущенные звонки</td><td>≤5%</td><td>~8-10%</td><td>UIS</td></tr><tr><td>Время решения проблемы (24/7)</td><td>≤2 часа</td><td>Варьируется</td><td>Битрикс</td></tr><tr><td>Ошибки маршрутизации</td><td>≤2%</td><td>~5%</td><td>Обратная связь</td></tr></tbody></table>\n<h3 class=\"doch2\">7. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>28 направлений маршрутизации вручную</td><td>Нет автоматической маршрутизации</td><td>Задержки, ошибки</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Долгое ожидание ответа Отдела продаж</td><td>Высокая загрузка</td><td>Пропуск звонков</td></tr><tr><td>Отсутствия сотрудников в разных системах</td><td>Нет единой платформы</td><td>Задержки маршрутизации</td></tr><tr><td>Не все агенты в САМО/Битрикс</td><td>Неполные данные</td><td>Поиск в интернете</td></tr><tr><td>Устаревшие списки направлений</td><td>Не обновляются</td><td>Неверная маршрутизация</td></tr><tr><td>Ручной перенос данных САМО → Битрикс</td><td>Нет интеграции</td><td>Дублирование работы</td></tr></tbody></table>\n<h4 class=\"doch3\">Средние</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Функционал ГП, заявлений не по профилю</td><td>Исторически сложилось</td><td>Отвлечение от основных задач</td></tr><tr><td>Большое время на прослушку звонков</td><td>Ручной контроль качества</td><td>Нехватка времени руководителя</td></tr></tbody></table>\n<h3 class=\"doch2\">8. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-SUP-01</td><td>Автоматическая маршрутизация по региону</td><td>Привязка к ФО → автораспределение сделок</td><td>-50% времени маршрутизации</td><td>CRITICAL</td></tr><tr><td>AUTO-SUP-02</td><td>Переадресация регионов по номеру телефона</td><td>Автопереключение на региональные офисы</td><td>Разгрузка отдела</td><td>HIGH</td></tr><tr><td>AUTO-SUP-03</td><td>ИИ-анализ качества звонков</td><td>Робот прослушивает и анализирует звонки</td><td>Экономия времени руководителя</td><td>HIGH</td></tr><tr><td>AUTO-SUP-04</td><td>Единая платформа учёта отсутствий</td><td>Все отсутствия в одной системе</td><td>Ускорение выбора сотрудника</td><td>HIGH</td></tr><tr><td>AUTO-SUP-05</td><td>Синхронизация САМО → Битрикс</td><td>Автоматическое создание карточек</td><td>Устранение дублирования</td><td>MEDIUM</td></tr><tr><td>AUTO-SUP-06</td><td>Шаблоны ответов в Outlook</td><td>Быстрые ответы по шаблонам</td><td>Ускорение ответов</td><td>MEDIUM</td></tr><tr><td>AUTO-SUP-07</td><td>Авто-отправка договоров из САМО</td><td>САМО отправляет договоры и приветствия</td><td>Разгрузка отдела</td><td>MEDIUM</td></tr><tr><td>AUTO-SUP-08</td><td>Автоопределение федерального округа</td><td>В сообщении о регистрации — город + ФО</td><td>Ускорение маршрутизации</td><td>LOW</td></tr><tr><td>AUTO-SUP-09</td><td>Автомаршрутизация MICE на 24/7</td><td>Автоматическое определение MICE-клиента по тегу</td><td>Гарантия 24/7 поддержки</td><td>CRITICAL</td></tr></tbody></table>\n<h3 class=\"doch2\">9. ИИ-анализ качества звонков (AUTO-SUP-03)</h3>\n<h4 class=\"doch3\">Критерии оценки качества звонков</h4>\n<table class=\"doctbl\"><thead><tr><th>Критерий</th><th>Вес</th><th>Описание</th><th>Целевой показатель</th></tr></thead><tbody><tr><td>1. Приветствие</td><td>10%</td><td>Корректное приветствие по стандарту</td><td>100% соблюдение</td></tr><tr><td>2. Выявление потребности</td><td>25%</td><td>Уточняющие вопросы, активное слушание</td><td>≥4 из 5 баллов</td></tr><tr><td>3. Компетентность</td><td>25%</td><td>Знание продукта, владение системами</td><td>≥4 из 5 баллов</td></tr><tr><td>4. Решение вопроса</td><td>20%</td><td>Полнота ответа, FCR</td><td>FCR ≥70%</td></tr><tr><td>5. Завершение разговора</td><td>10%</td><td>Подведение итогов, прощание</td><td>100% соблюдение</td></tr><tr><td>6. Время разговора</td><td>10%</td><td>Соответствие нормативам</td><td>≤норматива</td></tr></tbody></table>\n<h4 class=\"doch3\">Дополнительные параметры анализа</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Описание</th><th>Красные флаги</th></tr></thead><tbody><tr><td>Тон и эмоции</td><td>Анализ эмоциональной окраски</td><td>Раздражение, повышение голоса</td></tr><tr><td>Скорость речи</td><td>Темп и внятность речи</td><td>Слишком быстро / нечётко</td></tr><tr><td>Запрещённые фразы</td><td>«Я не знаю», «Это не ко мне»</td><td>Любое использование</td></tr><tr><td>Перебивание клиента</td><td>Прерывание клиента на полуслове</td><td>&gt;2 раз за звонок</td></tr></tbody></table>\n<h4 class=\"doch3\">Ожидаемый эффект</h4>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>До интеграции</th><th>После интеграции</th></tr></thead><tbody><tr><td>Время руководителя на контроль</td><td>8-10 ч/неделю</td><td>1-2 ч/неделю</td></tr><tr><td>Охват анализа звонков</td><td>~5%</td><td>100%</td></tr><tr><td>Время выявления проблем</td><td>2-4 недели</td><td>1 неделя</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Взаимодействие с другими процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Процесс</th><th>Тип взаимодействия</th><th>Точка передачи</th></tr></thead><tbody><tr><td>BP-01 (Заявка)</td><td>Маршрутизация запросов на расчёт → Продажи</td><td>Сделка в Битрикс</td></tr><tr><td>BP-01 (Заявка)</td><td>Проблемы в поездке → 24/7 поддержка</td><td>Звонок/мессенджер</td></tr><tr><td>BP-03 (MICE)</td><td>Поддержка MICE-клиентов 24/7</td><td>Сделка «MICE-поддержка 24/7»</td></tr><tr><td>BP-04 (Финансы)</td><td>Заявления на перенос/возврат → Бухгалтерия</td><td>Инвойс-трекер</td></tr><tr><td>BP-05 (Продукт)</td><td>Ошибки на сайте → Тарификация/IT</td><td>Задача/почта</td></tr><tr><td>BP-07 (HR)</td><td>Данные качества звонков → Обучение</td><td>Еженедельный отчёт</td></tr></tbody></table>\n<h3 class=\"doch2\">11. Рекомендации</h3>\n<h4 class=\"doch3\">Немедленные действия</h4>\n<p class=\"docp\">Обновить списки направлений и сотрудников — актуализировать маршрутизацию</p>\n<p class=\"docp\">Внедрить единую платформу учёта отсутствий — все в одном месте</p>\n<h4 class=\"doch3\">Среднесрочные</h4>\n<p class=\"docp\">Автоматическая маршрутизация по региону (привязка к ФО)</p>\n<p class=\"docp\">Переадресация звонков регионов по номеру телефона</p>\n<p class=\"docp\">ИИ-анализ качества звонков</p>\n<h4 class=\"doch3\">Долгосрочные</h4>\n<p class=\"docp\">Полная интеграция САМО ↔ Битрикс (карточки, сделки)</p>\n<p class=\"docp\">Омниканальная платформа для всех обращений</p>\n<p class=\"docp\">Чат-бот для первичной классификации обращений</p>\n<h3 class=\"doch2\">12. Контрольные точки процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Время</th><th>Канал</th><th>SLA</th><th>Ответственный</th></tr></thead><tbody><tr><td>24/7</td><td>Телефон</td><td>Приём ≤30 сек</td><td>Клиентская поддержка / 24/7</td></tr><tr><td>Рабочее время</td><td>Email</td><td>Ответ ≤1 час</td><td>Клиентская поддержка</td></tr><tr><td>24/7</td><td>Мессенджеры</td><td>Ответ ≤15 мин</td><td>24/7</td></tr><tr><td>При проблеме в туре</td><td>Любой</td><td>Решение ≤2-4 часа</td><td>24/7</td></tr></tbody></table>", "07": "<h2 class=\"doch1\">BP-07: Управление персоналом (HR)</h2>\n<p class=\"docp\">Тип процесса: Поддерживающий (Supporting)</p>\n<p class=\"docp\">Код: BP-07 Владелец: Жигалина Юлия Александровна (L1-04)</p>\n<p class=\"docp\">Критичность: ВЫСОКИЙ</p>\n<h3 class=\"doch2\">Резюме</h3>\n<p class=\"docp\">Процесс управления персоналом обеспечивает все основные процессы компании квалифицированными кадрами. От качества работы HR зависит укомплектованность штата, скорость адаптации новичков, вовлечённость сотрудников и развитие компетенций.</p>\n<p class=\"docp\">Влияние на основные процессы: - BP-01 (Заявки): Качество менеджеров продаж и бронирования - BP-02 (Маркетинг): Наличие специалистов по маркетингу - BP-03 (MICE): Квалификация MICE-менеджеров - BP-05 (Продукт): Компетенции продуктологов и тарификаторов - BP-06 (Поддержка): Качество операторов поддержки</p>\n<h3 class=\"doch2\">Цель процесса</h3>\n<p class=\"docp\">Обеспечить укомплектованность персоналом в соответствии с потребностями бизнеса, снизить текучесть персонала, повысить вовлечённость и развить компетенции сотрудников.</p>\n<h3 class=\"doch2\">Подпроцессы</h3>\n<h4 class=\"doch3\">7.1 Планирование и подбор персонала</h4>\n<p class=\"docp\">Критичность: Высокая Сотрудников задействовано: 2 Регламент: Есть</p>\n<p class=\"docp\">Процесс начинается с заявки от руководителя, затем заполняется бриф на вакансию, проводится поиск кандидатов, интервью и отбор, после чего формируется оффер и происходит найм.</p>\n<h4 class=\"doch3\">Проблемы: - Высокая зависимость от скорости реакции руководителей - Ошибки в заполнении брифа, нежелание его заполнять - Растягивание сроков заполнения</h4>\n<p class=\"docp\">Точки автоматизации: Автоматизация уже есть</p>\n<h4 class=\"doch3\">7.2 Адаптация новых сотрудников</h4>\n<p class=\"docp\">Критичность: Высокая Сотрудников задействовано: 3 Регламент: Есть</p>\n<p class=\"docp\">Процесс включает: выход на работу, Welcome-встреча, обучение по плану, встречи с руководителем, завершение испытательного срока.</p>\n<h4 class=\"doch3\">Проблемы: - Руководители несвоевременно проводят встречи с новичками - Иногда пропускают встречи с новичками - Зависимость от вовлечённости руководителей</h4>\n<p class=\"docp\">Точки автоматизации: Автоматизация уже есть</p>\n<h4 class=\"doch3\">7.3 Управление вовлечённостью и eNPS</h4>\n<p class=\"docp\">Критичность: Средне-высокая Сотрудников задействовано: 5 (весь HR) Регламент: Отсутствует единый план</p>\n<p class=\"docp\">Процесс включает: проведение опросов, сбор данных, анализ результатов, формирование планов улучшений, реализация и контроль.</p>\n<h4 class=\"doch3\">Проблемы: - Сложность анализа данных (разные источники) - Ручной сбор и обработка данных - Трудности с реализацией планов улучшений</h4>\n<p class=\"docp\">Точки автоматизации: Требуется</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-HR-01</td><td>Единая платформа опросов</td><td>Автоматический сбор и анализ данных</td><td>Управляемость, динамика</td></tr></tbody></table>\n<h4 class=\"doch3\">7.4 Внутренние коммуникации и корпоративная культура</h4>\n<p class=\"docp\">Критичность: Средняя Сотрудников задействовано: HR + все руководители Регламент: Нет</p>\n<p class=\"docp\">Процесс включает: формирование контента, публикация по каналам, сбор обратной связи, корректировка.</p>\n<h4 class=\"doch3\">Проблемы: - Разрозненные каналы коммуникаций - Недостаточная информированность сотрудников - Слабая управляемость корпоративной культуры - Высокая доля ручной работы</h4>\n<p class=\"docp\">Точки автоматизации: Не требуется (опросы автоматизированы)</p>\n<h4 class=\"doch3\">7.5 Обучение и развитие персонала</h4>\n<p class=\"docp\">Критичность: Средне-высокая Сотрудников задействовано: Бизнес-тренер + все сотрудники Регламент: Нет</p>\n<p class=\"docp\">Процесс включает: анализ потребностей, формирование программы, проведение обучения, оценка эффективности, коррекция ИПР.</p>\n<h4 class=\"doch3\">Проблемы: - Сложность оценки эффективности обучения - Ручной учёт и аналитика - Отсутствие данных о реальном качестве работы сотрудников</h4>\n<p class=\"docp\">Точки автоматизации: Требуется</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-HR-02</td><td>LMS-система</td><td>Автоматический учёт обучения</td><td>Прозрачность, оценка ROI</td></tr><tr><td>AUTO-HR-03</td><td>Интеграция данных качества звонков</td><td>Приём отчётов из AUTO-SUP-03</td><td>Целевое обучение, измеримость</td></tr></tbody></table>\n<h4 class=\"doch3\">7.5.1 Интеграция с контролем качества звонков (AUTO-HR-03)</h4>\n<p class=\"docp\">Источник данных: AUTO-SUP-03 (ИИ-анализ качества звонков из BP-06)</p>\n<p class=\"docp\">Входящие данные от BP-06 (Клиентская поддержка)</p>\n<table class=\"doctbl\"><thead><tr><th>Тип данных</th><th>Периодичность</th><th>Содержание</th></tr></thead><tbody><tr><td>Еженедельный отчёт</td><td>Каждый понедельник</td><td>Сводка оценок по 6 критериям качества</td></tr><tr><td>Рейтинг сотрудников</td><td>Еженедельно</td><td>Оценки каждого оператора с динамикой</td></tr><tr><td>ТОП-3 проблемы</td><td>Еженедельно</td><td>Наиболее частые нарушения стандартов</td></tr><tr><td>Красные флаги</td><td>Немедленно</td><td>Сотрудники с критически низкими оценками (&lt;50%)</td></tr><tr><td>Лучшие практики</td><td>Еженедельно</td><td>Примеры отличных звонков для обучения</td></tr></tbody></table>\n<p class=\"docp\">Критерии оценки звонков (из AUTO-SUP-03)</p>\n<table class=\"doctbl\"><thead><tr><th>Критерий</th><th>Вес</th><th>Фокус обучения при низкой оценке</th></tr></thead><tbody><tr><td>1. Приветствие</td><td>10%</td><td>Скрипты, стандарты коммуникации</td></tr><tr><td>2. Выявление потребности</td><td>25%</td><td>Техники задавания вопросов, активное слушание</td></tr><tr><td>3. Компетентность</td><td>25%</td><td>Знание продукта, работа в системах</td></tr><tr><td>4. Решение вопроса</td><td>20%</td><td>Принятие решений, эскалация</td></tr><tr><td>5. Завершение разговора</td><td>10%</td><td>Стандарты завершения, кросс-продажи</td></tr><tr><td>6. Время разговора</td><td>10%</td><td>Тайм-менеджмент, эффективность</td></tr></tbody></table>\n<p class=\"docp\">Процесс использования данных</p>\n<p class=\"docp\">Цикл обучения на основе данных качества состоит из четырёх этапов:</p>\n<p class=\"docp\">Приём и анализ — загрузка еженедельного отчёта, сравнение с прошлым периодом, выявление тенденций.</p>\n<p class=\"docp\">Планирование обучения — определение групп по проблемам, формирование ИПР для сотрудников с низкими оценками, подготовка материалов.</p>\n<p class=\"docp\">Проведение обучения — групповые тренинги, индивидуальные сессии, разбор лучших практик.</p>\n<p class=\"docp\">Измерение эффективности — сравнение оценок до/после, отчёт руководству, корректировка программы.</p>\n<p class=\"docp\">Форматы обучения по типам проблем</p>\n<table class=\"doctbl\"><thead><tr><th>Проблема (по критерию)</th><th>Формат обучения</th><th>Периодичность</th></tr></thead><tbody><tr><td>Приветствие / Завершение</td><td>Групповой тренинг «Стандарты коммуникации»</td><td>1 раз / квартал</td></tr><tr><td>Выявление потребности</td><td>Ролевые игры, разбор кейсов</td><td>2 раза / месяц</td></tr><tr><td>Компетентность</td><td>Продуктовое обучение, тест</td><td>По необходимости</td></tr><tr><td>Решение вопроса</td><td>Мастер-класс «Принятие решений»</td><td>1 раз / месяц</td></tr><tr><td>Время разговора</td><td>Индивидуальный коучинг</td><td>По необходимости</td></tr></tbody></table>\n<p class=\"docp\">Ожидаемый эффект интеграции</p>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>До интеграции</th><th>После интеграции</th></tr></thead><tbody><tr><td>Время планирования обучения</td><td>2-3 дня</td><td>2-4 часа</td></tr><tr><td>Точность определения потребностей</td><td>Субъективная</td><td>На основе данных</td></tr><tr><td>Измеримость эффективности обучения</td><td>Нет</td><td>Есть (до/после)</td></tr><tr><td>Охват проблемных сотрудников</td><td>~30%</td><td>100%</td></tr><tr><td>Скорость реакции на проблемы</td><td>2-4 недели</td><td>1 неделя</td></tr></tbody></table>\n<h3 class=\"doch2\">KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Цель</th><th>Текущее</th><th>Статус</th></tr></thead><tbody><tr><td>Срок закрытия вакансии</td><td>≤30 дней</td><td>~45 дней</td><td>Требует внимания</td></tr><tr><td>Текучесть общая</td><td>≤15%</td><td>~20%</td><td>Требует внимания</td></tr><tr><td>Текучесть на испыт. сроке</td><td>≤10%</td><td>~15%</td><td>Требует внимания</td></tr><tr><td>eNPS</td><td>≥+30</td><td>Нет данных</td><td>Нет данных</td></tr><tr><td>Охват обучением</td><td>≥80%</td><td>~60%</td><td>Требует внимания</td></tr></tbody></table>\n<h3 class=\"doch2\">Связь с основными процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Основной процесс</th><th>Как влияет HR</th><th>Интеграция данных</th></tr></thead><tbody><tr><td>BP-01 (Заявки)</td><td>Качество менеджеров → конверсия, ошибки</td><td>—</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Наличие маркетологов → темп кампаний</td><td>—</td></tr><tr><td>BP-03 (MICE)</td><td>Квалификация MICE-менеджеров → конверсия</td><td>—</td></tr><tr><td>BP-05 (Продукт)</td><td>Компетенции тарификаторов → скорость публикации</td><td>—</td></tr><tr><td>BP-06 (Поддержка)</td><td>Качество операторов → FCR, CSAT</td><td>AUTO-SUP-03 → AUTO-HR-03</td></tr></tbody></table>\n<h3 class=\"doch2\">Точки автоматизации (сводка)</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Подпроцесс</th><th>Точка</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-HR-01</td><td>Вовлечённость</td><td>Единая платформа опросов</td><td>Средний</td></tr><tr><td>AUTO-HR-02</td><td>Обучение</td><td>LMS-система</td><td>Средний</td></tr><tr><td>AUTO-HR-03</td><td>Обучение</td><td>Интеграция данных качества звонков</td><td>Средний</td></tr></tbody></table>\n<h3 class=\"doch2\">Рекомендации</h3>\n<table class=\"doctbl\"><thead><tr><th>Приоритет</th><th>Рекомендация</th><th>Эффект</th></tr></thead><tbody><tr><td>Высокий</td><td>Внедрить регламент планов улучшений по eNPS</td><td>Управляемость культуры</td></tr><tr><td></td><td></td><td></td></tr><tr><td>Средний</td><td>Внедрить LMS для отслеживания обучения</td><td>Прозрачность ROI</td></tr><tr><td>Средний</td><td>Настроить интеграцию с AUTO-SUP-03</td><td>Целевое обучение на основе данных</td></tr><tr><td>Низкий</td><td>Унифицировать каналы коммуникаций с сотрудниками</td><td>Информированность</td></tr></tbody></table>", "08": "<h2 class=\"doch1\">BP-08: IT-обеспечение</h2>\n<p class=\"docp\">Тип процесса: Поддерживающий (Supporting)</p>\n<p class=\"docp\">Код: BP-08</p>\n<p class=\"docp\">Владелец: Логвинов Григорий Анатольевич (L1-07)</p>\n<p class=\"docp\">Критичность: КРИТИЧЕСКИЙ</p>\n<h3 class=\"doch2\">Резюме</h3>\n<p class=\"docp\">Процесс IT-обеспечения является инфраструктурным фундаментом для всех бизнес-процессов компании. IT отвечает за стабильность систем (САМО-тур, Битрикс24, 1С), безопасность данных, внедрение новых решений и поддержку пользователей. Сбой IT = остановка бизнеса.</p>\n<p class=\"docp\">Влияние на основные процессы: - BP-01 (Заявки): Работоспособность САМО-тур, Битрикс24 - BP-02 (Маркетинг): Сайт, CRM, аналитика - BP-03 (MICE): ETM-платформа, интеграции - BP-04 (Финансы): 1С, банк-клиент, Invoice Tracker - BP-05 (Продукт): САМО-тур, публикация на сайте - BP-06 (Поддержка): Телефония, CRM, базы знаний</p>\n<h3 class=\"doch2\">Цели процесса</h3>\n<p class=\"docp\">Обеспечить бесперебойную работу IT-систем при росте нагрузки в 1,5 раза</p>\n<p class=\"docp\">Свести к нулю финансовые потери от простоев и кибератак</p>\n<p class=\"docp\">Доступность ключевых систем: 99,9%</p>\n<p class=\"docp\">Сократить время подключения нового партнёра на 50%</p>\n<p class=\"docp\">Удовлетворённость внутренних клиентов: 85%</p>\n<h3 class=\"doch2\">Подпроцессы</h3>\n<h4 class=\"doch3\">8.1 Внедрение аппаратно-программного комплекса</h4>\n<p class=\"docp\">Критичность: Высокая Сотрудников задействовано: 1-7 Регламент: Есть блок-схема</p>\n<p class=\"docp\">Процесс включает: поступление заявки, анализ и согласование, закупка/поставка, настройка, тестирование, ввод в эксплуатацию.</p>\n<h4 class=\"doch3\">Проблемы: - Проблемы коммуникации и согласования - Задержки при реализации - Зависимость от поставщиков - Нехватка сотрудников</h4>\n<p class=\"docp\">Точки автоматизации: Приоритет 2</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-IT-01</td><td>Автоматизация согласований</td><td>Workflow в Битрикс24</td><td>Ускорение на 30%</td></tr><tr><td>AUTO-IT-02</td><td>Автоматизация тестирования</td><td>Автотесты для типовых сценариев</td><td>Снижение ошибок</td></tr></tbody></table>\n<h4 class=\"doch3\">8.2 Модернизация систем</h4>\n<p class=\"docp\">Критичность: Высокая Сотрудников задействовано: 1-7 Регламент: Есть блок-схема</p>\n<p class=\"docp\">Процесс включает: выявление потребности, подбор альтернатив, согласование и закупка, тестирование, внедрение.</p>\n<h4 class=\"doch3\">Проблемы: - Недопонимание требований - Задержки согласований - Отсутствие времени на тестирование - Зависимость от других отделов</h4>\n<p class=\"docp\">Точки автоматизации: Приоритет 2 (аналогично 8.1)</p>\n<h4 class=\"doch3\">8.3 Внедрение интеграций</h4>\n<p class=\"docp\">Критичность: Высокая Сотрудников задействовано: 1-7 Регламент: Есть блок-схема</p>\n<p class=\"docp\">Процесс включает: запрос от партнёра, анализ требований, разработка/настройка, тестирование с партнёром, запуск.</p>\n<h4 class=\"doch3\">Проблемы: - Недопонимание, нехватка информации - Непонимание конечного результата - Зависимость от САМО-софт и поставщиков - Несогласованность действий партнёров</h4>\n<p class=\"docp\">Текущий срок подключения партнёра: ~60 дней Целевой срок: 30 дней (-50%)</p>\n<p class=\"docp\">Точки автоматизации: Приоритет 3</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-IT-03</td><td>Шаблоны интеграций</td><td>Готовые коннекторы для типовых партнёров</td><td>Ускорение подключения</td></tr></tbody></table>\n<h4 class=\"doch3\">8.4 Поддержка пользователей (Service Desk)</h4>\n<p class=\"docp\">Критичность: Высокая Сотрудников задействовано: 1-7 Регламент: Есть наброски</p>\n<p class=\"docp\">Процесс включает: обращение пользователя, классификация, решение (1-3 линия), закрытие тикета, сбор обратной связи.</p>\n<h4 class=\"doch3\">Проблемы: - Сотрудники не понимают системы и процессы - Не придерживаются регламентов - Проблемы в работе систем поставщиков - Ручная работа, технические проблемы</h4>\n<p class=\"docp\">Точки автоматизации: ПРИОРИТЕТ 1</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-IT-04</td><td>AI-помощник / чат-бот</td><td>Автоматические ответы на типовые вопросы</td><td>Снижение нагрузки на 40%</td></tr><tr><td>AUTO-IT-05</td><td>База знаний с поиском</td><td>Самообслуживание пользователей</td><td>Сокращение тикетов на 30%</td></tr></tbody></table>\n<h4 class=\"doch3\">8.5 Управление доступами (приём/увольнение)</h4>\n<p class=\"docp\">Критичность: Высокая Сотрудников задействовано: 2-3 Регламент: Есть</p>\n<p class=\"docp\">Процесс включает: заявка от HR, создание/деактивация учётных записей, настройка доступов, выдача оборудования.</p>\n<h4 class=\"doch3\">Проблемы: - Сотрудник выходит завтра — сообщили сегодня вечером - Ошибки в написании ФИО, должности, подразделения - Оборудование может отсутствовать в наличии - Отсутствие предварительной коммуникации</h4>\n<p class=\"docp\">Точки автоматизации: Приоритет 2</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-IT-06</td><td>Автоматическое создание УЗ</td><td>Интеграция с HR-системой</td><td>Сокращение ошибок</td></tr></tbody></table>\n<h3 class=\"doch2\">KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Цель</th><th>Текущее</th><th>Статус</th></tr></thead><tbody><tr><td>Доступность ключевых систем</td><td>≥99,9%</td><td>~99,5%</td><td>Требует внимания</td></tr><tr><td>Критические инциденты</td><td>-60%</td><td>Базовый уровень</td><td>Нет данных</td></tr><tr><td>Время восстановления</td><td>-50%</td><td>~4 часа</td><td>Требует внимания</td></tr><tr><td>Срок подключения партнёра</td><td>≤30 дней</td><td>~60 дней</td><td>Критично</td></tr><tr><td>Удовлетворённость пользователей</td><td>≥85%</td><td>~70%</td><td>Требует внимания</td></tr><tr><td>Время решения тикета (среднее)</td><td>≤4 часа</td><td>~8 часов</td><td>Требует внимания</td></tr></tbody></table>\n<h3 class=\"doch2\">Связь с основными процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Основной процесс</th><th>Системы IT</th><th>Влияние сбоя</th></tr></thead><tbody><tr><td>BP-01 (Заявки)</td><td>САМО-тур, Битрикс24, Outlook</td><td>Остановка продаж</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Сайт, CRM, RoiStat</td><td>Потеря лидов</td></tr><tr><td>BP-03 (MICE)</td><td>ETM, интеграции</td><td>Задержки КП</td></tr><tr><td>BP-04 (Финансы)</td><td>1С, банк-клиент</td><td>Остановка платежей</td></tr><tr><td>BP-05 (Продукт)</td><td>САМО-тур, сайт</td><td>Нет публикации цен</td></tr><tr><td>BP-06 (Поддержка)</td><td>Телефония, CRM</td><td>Нет связи с клиентами</td></tr></tbody></table>\n<h3 class=\"doch2\">Точки автоматизации (сводка)</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Подпроцесс</th><th>Точка</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-IT-04</td><td>Поддержка</td><td>AI-помощник / чат-бот</td><td>Критический</td></tr><tr><td>AUTO-IT-05</td><td>Поддержка</td><td>База знаний с поиском</td><td>Критический</td></tr><tr><td>AUTO-IT-01</td><td>Внедрение</td><td>Автоматизация согласований</td><td>Средний</td></tr><tr><td>AUTO-IT-02</td><td>Внедрение</td><td>Автоматизация тестирования</td><td>Средний</td></tr><tr><td>AUTO-IT-03</td><td>Интеграции</td><td>Шаблоны интеграций</td><td>Низкий</td></tr><tr><td>AUTO-IT-06</td><td>Доступы</td><td>Автосоздание УЗ</td><td>Средний</td></tr></tbody></table>\n<h3 class=\"doch2\">Критические системы компании</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Назначение</th><th>Критичность</th><th>Владелец</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Бронирование, заявки</td><td>Критическая</td><td>IT + САМО-софт</td></tr><tr><td>Битрикс24</td><td>CRM, задачи, коммуникации</td><td>Критическая</td><td>IT</td></tr><tr><td>1С</td><td>Бухгалтерия, финансы</td><td>Критическая</td><td>IT + Финансы</td></tr><tr><td>Outlook</td><td>Почта, календарь</td><td>Высокая</td><td>IT</td></tr><tr><td>ETM</td><td>Бизнес-тревел</td><td>Высокая</td><td>IT + MICE</td></tr><tr><td>Телефония</td><td>Связь с клиентами</td><td>Критическая</td><td>IT</td></tr><tr><td>Сайт</td><td>Витрина, бронирование</td><td>Критическая</td><td>IT + Маркетинг</td></tr></tbody></table>\n<h3 class=\"doch2\">Рекомендации</h3>\n<table class=\"doctbl\"><thead><tr><th>Приоритет</th><th>Рекомендация</th><th>Эффект</th></tr></thead><tbody><tr><td>Критический</td><td>Внедрить AI-помощник для типовых вопросов</td><td>Снижение нагрузки на 40%</td></tr><tr><td>Критический</td><td>Создать базу знаний с умным поиском</td><td>Самообслуживание, -30% тикетов</td></tr><tr><td>Критический</td><td>Система приоритизации задач</td><td>Фокус на критичных для выручки</td></tr><tr><td>Высокий</td><td>Автоматизация согласований через Битрикс24</td><td>Ускорение внедрений на 30%</td></tr><tr><td>Высокий</td><td>Интеграция с HR для автосоздания УЗ</td><td>Снижение ошибок и задержек</td></tr><tr><td>Средний</td><td>Шаблоны интеграций для типовых партнёров</td><td>Ускорение подключения</td></tr></tbody></table>\n<h3 class=\"doch2\">Риски</h3>\n<table class=\"doctbl\"><thead><tr><th>Риск</th><th>Вероятность</th><th>Влияние</th><th>Митигация</th></tr></thead><tbody><tr><td>Уход ключевого сотрудника</td><td>Средняя</td><td>Критическое</td><td>Документирование, дублирование</td></tr><tr><td>Сбой САМО-тур</td><td>Низкая</td><td>Критическое</td><td>SLA с САМО-софт</td></tr><tr><td>Кибератака</td><td>Низкая</td><td>Критическое</td><td>Аудиты безопасности</td></tr><tr><td>Перегрузка IT</td><td>Высокая</td><td>Высокое</td><td>Приоритизация, подрядчики</td></tr></tbody></table>"};
+const DOCS={"01":"<h2 class=\"doch1\">BP-01: Обработка заявки на тур (Lead-to-Cash)</h2>\n<p class=\"docp\">Версия: 1.0</p>\n<p class=\"docp\">Дата: 2026-02-17</p>\n<p class=\"docp\">Статус: Описан</p>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-01</td></tr><tr><td>Название</td><td>Обработка заявки на тур (Lead-to-Cash)</td></tr><tr><td>Владелец</td><td>Преображенская Т.В. (Операционный департамент)</td></tr><tr><td>Критичность</td><td>КРИТИЧЕСКИЙ</td></tr><tr><td>Влияние на выручку</td><td>85% всей выручки компании</td></tr><tr><td>Частота выполнения</td><td>~200-500 заявок/день (зависит от сезона)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Границы процесса</h3>\n<h4 class=\"doch3\">Триггер (вход)</h4>\n<p class=\"docp\">• Поступление запроса от клиента через:</p>\n<p class=\"docp\">    ◦ Сайт компании (онлайн-бронирование)</p>\n<p class=\"docp\">    ◦ Телефонный звонок</p>\n<p class=\"docp\">    ◦ Email</p>\n<p class=\"docp\">    ◦ Мессенджеры (WhatsApp, Telegram)</p>\n<p class=\"docp\">    ◦ Агентский кабинет</p>\n<h4 class=\"doch3\">Результат (выход)</h4>\n<p class=\"docp\">• Исполненная заявка</p>\n<p class=\"docp\">• Оплаченные услуги (отель, авиа, трансфер)</p>\n<p class=\"docp\">• Выданные документы (ваучеры, билеты)</p>\n<p class=\"docp\">• Удовлетворённый клиент/агент</p>\n<h3 class=\"doch2\">3. Участники процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Роль</th><th>Подразделение</th><th>Кол-во</th><th>Ответственность</th></tr></thead><tbody><tr><td>Менеджер по продажам</td><td>Отдел продаж</td><td>15</td><td>Приём запроса, формирование КП, закрытие сделки</td></tr><tr><td>Менеджер по бронированию</td><td>Отдел бронирования</td><td>12</td><td>Бронирование услуг, контроль подтверждений</td></tr><tr><td>Менеджер VIP</td><td>VIP-отдел</td><td>4</td><td>Обработка премиум-запросов</td></tr><tr><td>Специалист по авиа</td><td>Транспортный отдел</td><td>8</td><td>Выписка авиабилетов</td></tr><tr><td>Специалист по визам</td><td>Группа визового сопровождения</td><td>3</td><td>Оформление виз</td></tr><tr><td>Бухгалтер</td><td>Бухгалтерия</td><td>5</td><td>Контроль оплат, выставление счетов</td></tr><tr><td>Оператор поддержки</td><td>Клиентская поддержка</td><td>3</td><td>Маршрутизация входящих обращений</td></tr><tr><td>ИТОГО</td><td>7 подразделений</td><td>50</td><td>—</td></tr></tbody></table>\n<h3 class=\"doch2\">4. Этапы процесса</h3>\n<h4 class=\"doch3\">4.1. Приём и регистрация запроса</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел клиентской поддержки / Call-центр</td></tr><tr><td>Системы</td><td>Битрикс24, Телефония</td></tr><tr><td>SLA</td><td>5 минут</td></tr><tr><td>Точка передачи</td><td>→ Отдел продаж</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Приём входящего обращения (звонок/email/чат)</p>\n<p class=\"docp\">2. Регистрация в CRM (Битрикс24)</p>\n<p class=\"docp\">3. Первичная классификация запроса</p>\n<p class=\"docp\">4. Маршрутизация на ответственного менеджера</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Высокая загрузка менеджеров в пик сезона</p>\n<p class=\"docp\">• Заявки не всегда фиксируются в CRM</p>\n<p class=\"docp\">• 28 направлений маршрутизации — сложная логика</p>\n<h4 class=\"doch3\">4.2. Первичный контакт и уточнение потребностей</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Менеджер по продажам</td></tr><tr><td>Системы</td><td>Битрикс24, Email, Мессенджеры</td></tr><tr><td>SLA</td><td>2 часа</td></tr><tr><td>Точка передачи</td><td>Внутри этапа</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Связь с клиентом/агентом</p>\n<p class=\"docp\">2. Уточнение параметров поездки (даты, направление, категория, бюджет)</p>\n<p class=\"docp\">3. Выявление дополнительных потребностей (визы, трансферы, страховка)</p>\n<p class=\"docp\">4. Фиксация требований в CRM</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Неполное выявление потребностей → пересчёты</p>\n<p class=\"docp\">• Долгое ожидание обратной связи от клиента</p>\n<h4 class=\"doch3\">4.3. Анализ запроса и подбор вариантов</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Менеджер по продажам</td></tr><tr><td>Системы</td><td>САМО-тур, Битрикс24, Сайт</td></tr><tr><td>SLA</td><td>4 часа</td></tr><tr><td>Точка передачи</td><td>Внутри этапа / → Отдел продукта (при сложных запросах)</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Поиск подходящих вариантов в САМО-тур</p>\n<p class=\"docp\">2. Проверка наличия и цен</p>\n<p class=\"docp\">3. Консультация с продуктологами (при необходимости)</p>\n<p class=\"docp\">4. Подготовка нескольких вариантов</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Цены могут быть неактуальны (задержка публикации)</p>\n<p class=\"docp\">• Сложные запросы требуют ручного подбора</p>\n<h4 class=\"doch3\">4.4. Запрос предложений у поставщиков/DMC</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Менеджер по продажам / Отдел продукта</td></tr><tr><td>Системы</td><td>Email, Системы поставщиков</td></tr><tr><td>SLA</td><td>24 часа</td></tr><tr><td>Точка передачи</td><td>← Получение ответа от поставщика</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Формирование запроса поставщику (отель, DMC)</p>\n<p class=\"docp\">2. Отправка запроса</p>\n<p class=\"docp\">3. Ожидание и отслеживание ответа</p>\n<p class=\"docp\">4. Анализ полученных предложений</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• УЗКОЕ МЕСТО: Ожидание ответов от DMC (разные часовые пояса)</p>\n<p class=\"docp\">• Множество чатов с поставщиками — сложно отслеживать</p>\n<p class=\"docp\">• Нет единого SLA с партнёрами</p>\n<h4 class=\"doch3\">4.5. Формирование коммерческого предложения</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Менеджер по продажам</td></tr><tr><td>Системы</td><td>Excel, САМО-тур</td></tr><tr><td>SLA</td><td>2 часа</td></tr><tr><td>Точка передачи</td><td>→ Клиент/агент</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Расчёт стоимости тура (проживание + авиа + трансфер + допуслуги)</p>\n<p class=\"docp\">2. Формирование КП в Excel или САМО-тур</p>\n<p class=\"docp\">3. Добавление описания и фотографий</p>\n<p class=\"docp\">4. Отправка клиенту/агенту</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• УЗКОЕ МЕСТО: Ручные расчёты в Excel</p>\n<p class=\"docp\">• Частые пересчёты при изменении условий</p>\n<p class=\"docp\">• Нет стандартного шаблона КП</p>\n<h4 class=\"doch3\">4.6. Согласование и бронирование</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел бронирования</td></tr><tr><td>Системы</td><td>САМО-тур, Системы поставщиков</td></tr><tr><td>SLA</td><td>24 часа</td></tr><tr><td>Точка передачи</td><td>← Подтверждение от поставщика</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Получение согласия клиента</p>\n<p class=\"docp\">2. Бронирование в САМО-тур</p>\n<p class=\"docp\">3. Отправка брони поставщику</p>\n<p class=\"docp\">4. Получение подтверждения</p>\n<p class=\"docp\">5. Фиксация тайм-лимитов и условий</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Ожидание подтверждения от поставщика</p>\n<p class=\"docp\">• Изменение условий после бронирования</p>\n<h4 class=\"doch3\">4.7. Оформление авиабилетов</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Транспортный отдел</td></tr><tr><td>Системы</td><td>GDS (Amadeus, Galileo), САМО-тур, Сайты авиакомпаний</td></tr><tr><td>SLA</td><td>По тайм-лимиту билета</td></tr><tr><td>Точка передачи</td><td>→ Привязка к заявке в САМО</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Поиск оптимальных вариантов перелёта</p>\n<p class=\"docp\">2. Бронирование в GDS</p>\n<p class=\"docp\">3. Контроль тайм-лимита</p>\n<p class=\"docp\">4. Выписка билетов после оплаты</p>\n<p class=\"docp\">5. Прикрепление к заявке в САМО-тур</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• КРИТИЧЕСКОЕ: Короткие тайм-лимиты — риск потери брони</p>\n<p class=\"docp\">• КРИТИЧЕСКОЕ: Ошибки в данных пассажиров</p>\n<p class=\"docp\">• Ручная выписка для некоторых авиакомпаний (FlyDubai)</p>\n<p class=\"docp\">• Билеты не всегда прикрепляются к заказу</p>\n<h4 class=\"doch3\">4.8. Оплата и финансовое оформление</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Бухгалтерия / Финансовый отдел</td></tr><tr><td>Системы</td><td>1С, САМО-тур, Клиент-банк</td></tr><tr><td>SLA</td><td>24 часа после получения оплаты</td></tr><tr><td>Точка передачи</td><td>→ Отдел бронирования (статус «Оплачено»)</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Выставление счёта клиенту/агенту</p>\n<p class=\"docp\">2. Контроль поступления оплаты</p>\n<p class=\"docp\">3. Разнесение платежа в САМО-тур</p>\n<p class=\"docp\">4. Оплата поставщикам</p>\n<p class=\"docp\">5. Фиксация в 1С</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Ошибки в назначении платежа от клиентов</p>\n<p class=\"docp\">• Ручное разнесение при ошибках в платёжке</p>\n<h4 class=\"doch3\">4.9. Выдача документов</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел бронирования</td></tr><tr><td>Системы</td><td>САМО-тур, Email</td></tr><tr><td>SLA</td><td>2 часа после полной оплаты</td></tr><tr><td>Точка передачи</td><td>→ Клиент/агент (ЗАВЕРШЕНИЕ)</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Проверка полноты документов (ваучер, билеты, страховка)</p>\n<p class=\"docp\">2. Формирование пакета документов</p>\n<p class=\"docp\">3. Отправка клиенту/агенту</p>\n<p class=\"docp\">4. Подтверждение получения</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Отсутствие автоматического контроля полноты документов</p>\n<h3 class=\"doch2\">5. Диаграмма процесса</h3>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса</td></tr><tr><td>────►</td><td>Направление потока</td></tr><tr><td>◄────</td><td>Обратная связь / возврат</td></tr><tr><td>(время)</td><td>SLA или длительность этапа</td></tr><tr><td></td><td>Завершение процесса</td></tr></tbody></table>\n<pre class=\"docp\">    ┌───────────────┐     ┌───────────────┐     ┌───────────────┐\n    │    КЛИЕНТ     │────►│   ПОДДЕРЖКА   │────►│    ПРОДАЖИ    │\n    │    /АГЕНТ     │     │    (5 мин)    │     │   (2-4 час)   │\n    └───────────────┘     └───────────────┘     └───────┬───────┘\n                                                        │\n                          ┌─────────────────────────────┘\n                          ▼\n                  ┌───────────────┐\n                  │  ПОСТАВЩИКИ   │◄────┐\n                  │   (24 час)    │     │\n                  └───────┬───────┘     │\n                          │             │\n                          ▼             │\n                  ┌───────────────┐     │\n                  │      КП       │─────┘ (пересчёт)\n                  │    (2 час)    │\n                  └───────┬───────┘\n                          │\n                          ▼\n    ┌───────────────┐     ┌───────────────┐     ┌───────────────┐\n    │ БРОНИРОВАНИЕ  │◄────│  СОГЛАСОВАНИЕ │◄────│    КЛИЕНТ     │\n    │   (24 час)    │     │               │     │               │\n    └───────┬───────┘     └───────────────┘     └───────────────┘\n            │\n            ├─────────────────────────┐\n            ▼                         ▼\n    ┌───────────────┐         ┌───────────────┐\n    │     АВИА      │         │     ВИЗЫ      │\n    │ (тайм-лимит)  │         │  (опционно)   │\n    └───────┬───────┘         └───────┬───────┘\n            │                         │\n            └────────────┬────────────┘\n                         ▼\n                 ┌───────────────┐\n                 │    ОПЛАТА     │\n                 │   (24 час)    │\n                 └───────┬───────┘\n                         │\n                         ▼\n                 ┌───────────────┐\n                 │   ДОКУМЕНТЫ   │────► КЛИЕНТ ✓\n                 │    (2 час)    │\n                 └───────────────┘</pre>\n<h3 class=\"doch2\">6. Системы и интеграции</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль в процессе</th><th>Интеграции</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Основная система бронирования</td><td>← 1С, → GDS, → Сайт</td></tr><tr><td>Битрикс24</td><td>CRM, управление сделками</td><td>← Телефония, ← Email</td></tr><tr><td>GDS (Amadeus, Galileo)</td><td>Бронирование авиа</td><td>→ САМО-тур</td></tr><tr><td>1С</td><td>Финансовый учёт</td><td>← САМО-тур, ← Клиент-банк</td></tr><tr><td>Клиент-банк</td><td>Платежи</td><td>→ 1С</td></tr><tr><td>Excel</td><td>Расчёты, КП</td><td>Ручной ввод</td></tr></tbody></table>\n<h3 class=\"doch2\">7. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее*</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Время от запроса до КП</td><td>≤8 часов</td><td>~24 часа</td><td>САМО-тур (создание заявки)</td></tr><tr><td>Время от КП до оплаты</td><td>≤3 дней</td><td>5-7 дней</td><td>САМО-тур (статус оплаты)</td></tr><tr><td>Конверсия запрос→бронь</td><td>≥30%</td><td>~20%</td><td>Битрикс24 (воронка)</td></tr><tr><td>% просроченных тайм-лимитов</td><td>≤5%</td><td>~15%</td><td>Ручной подсчёт</td></tr><tr><td>Ошибки в билетах</td><td>≤1%</td><td>~5%</td><td>Претензии</td></tr><tr><td>NPS клиентов</td><td>≥70</td><td>Нет данных</td><td>Опросы</td></tr></tbody></table>\n<p class=\"docp\">*Текущие значения — оценка на основе анкет руководителей</p>\n<h3 class=\"doch2\">8. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические (требуют немедленного внимания)</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th><th>Приоритет автоматизации</th></tr></thead><tbody><tr><td>Просроченные тайм-лимиты</td><td>Нет автоматических напоминаний</td><td>Потеря брони, штрафы</td><td>КРИТИЧЕСКИЙ</td></tr><tr><td>Билеты не прикреплены к заказу</td><td>Ручной процесс</td><td>Паника перед вылетом</td><td>КРИТИЧЕСКИЙ</td></tr><tr><td>Ошибки в данных пассажиров</td><td>Нет автоматической сверки</td><td>Переоформление, штрафы</td><td>КРИТИЧЕСКИЙ</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Долгие КП и расчёты</td><td>Ручная работа в Excel</td><td>Потеря клиента</td></tr><tr><td>Ожидание ответов от DMC</td><td>Разные часовые пояса, нет SLA</td><td>Затягивание сделки</td></tr><tr><td>Несоблюдение временных нормативов</td><td>Нет последствий за нарушение</td><td>Долго «висящие» сделки</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-01</td><td>Напоминания о тайм-лимитах</td><td>Автоуведомления за 24ч, 4ч, 1ч до дедлайна</td><td>-80% просроченных</td><td>CRITICAL</td></tr><tr><td>AUTO-02</td><td>Контроль полноты документов</td><td>Автопроверка наличия билетов после оплаты</td><td>Исключение пропусков</td><td>CRITICAL</td></tr><tr><td>AUTO-03</td><td>Сверка данных пассажиров</td><td>Автосравнение САМО ↔ GDS</td><td>-90% ошибок в билетах</td><td>HIGH</td></tr><tr><td>AUTO-04</td><td>Маршрутизация заявок</td><td>Автораспределение по загрузке</td><td>-40% время реакции</td><td>HIGH</td></tr><tr><td>AUTO-05</td><td>Шаблоны КП</td><td>Автогенерация КП из САМО</td><td>-50% время подготовки</td><td>MEDIUM</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Связанные документы</h3>\n<p class=\"docp\">• docs/2.2_critical_business_processes.json — Исходные данные (BP-001)</p>\n<p class=\"docp\">• docs/2.1_department_interactions.json — Взаимодействия подразделений</p>\n<p class=\"docp\">• L1_json/Преображенская_Операционный_департамент.json — Анкета владельца процесса</p>\n<p class=\"docp\">• L2_json/31._Преображенская_Отдел_продаж.json — Анкета отдела продаж</p>\n<p class=\"docp\">• L2_json/30._Загородняя_Отдел_бронирования.json — Анкета отдела бронирования</p>\n<p class=\"docp\">• L2_json/29._Боканова_Транспортный_отдел.json — Анкета транспортного отдела</p>","02":"<h2 class=\"doch1\">BP-02: Маркетинговая кампания</h2>\n<p class=\"docp\">Версия: 1.0</p>\n<p class=\"docp\">Дата: 2026-02-17</p>\n<p class=\"docp\">Статус: Описан</p>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-02</td></tr><tr><td>Название</td><td>Маркетинговая кампания</td></tr><tr><td>Владелец</td><td>Директор Департамента маркетинга (ВАКАНСИЯ)</td></tr><tr><td>Фактическое управление</td><td>Колдаева А.В. (Отдел рекламы), Седых (Контент), Четверик (Маркетинг)</td></tr><tr><td>Критичность</td><td>ВЫСОКИЙ</td></tr><tr><td>Влияние</td><td>Лидогенерация, узнаваемость бренда, партнёрские бюджеты</td></tr><tr><td>Частота</td><td>10-20 кампаний/месяц (различного масштаба)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Границы процесса</h3>\n<h4 class=\"doch3\">Триггер (вход)</h4>\n<p class=\"docp\">• Запрос партнёра на совместное мероприятие/рекламу</p>\n<p class=\"docp\">• Запрос от Отдела продукта на продвижение направления</p>\n<p class=\"docp\">• Плановая маркетинговая активность (из годового плана)</p>\n<p class=\"docp\">• Запуск нового продукта или направления</p>\n<h4 class=\"doch3\">Результат (выход)</h4>\n<p class=\"docp\">• Проведённая кампания/мероприятие</p>\n<p class=\"docp\">• Привлечённые лиды (для B2C) или охват агентов (для B2B)</p>\n<p class=\"docp\">• Измеренный ROI (при наличии аналитики)</p>\n<p class=\"docp\">• Отчёт для партнёра (при партнёрской кампании)</p>\n<h3 class=\"doch2\">3. Участники процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Роль</th><th>Подразделение</th><th>Кол-во</th><th>Ответственность</th></tr></thead><tbody><tr><td>Менеджер по рекламе</td><td>Отдел рекламы</td><td>6</td><td>Организация мероприятий, работа с партнёрами, СМИ</td></tr><tr><td>Контент-менеджер</td><td>Отдел контент-маркетинга</td><td>8</td><td>Тексты, дизайн, email-рассылки, вебинары</td></tr><tr><td>Маркетолог</td><td>Отдел маркетинга</td><td>4</td><td>Аналитика, B2C-реклама, RoiStat</td></tr><tr><td>КАМ</td><td>Отдел по работе с ключевыми клиентами</td><td>—</td><td>Набор агентов на мероприятия</td></tr><tr><td>Региональный менеджер</td><td>Региональные офисы</td><td>—</td><td>Мероприятия в регионах</td></tr><tr><td>Продуктолог</td><td>Отдел продукта</td><td>—</td><td>Информация о направлении</td></tr><tr><td>ИТОГО</td><td>6 подразделений</td><td>18</td><td>—</td></tr></tbody></table>\n<h3 class=\"doch2\">4. Типы маркетинговых кампаний</h3>\n<h4 class=\"doch3\">4.1. Мероприятия с партнёрами (B2B)</h4>\n<p class=\"docp\">Описание: Бизнес-завтраки, презентации отелей/направлений для агентств.</p>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Частота</td><td>2-4 мероприятия/месяц</td></tr><tr><td>Бюджет</td><td>Партнёрский + собственный</td></tr><tr><td>Участники</td><td>30-100 агентов</td></tr><tr><td>Города</td><td>Москва, СПб, регионы</td></tr></tbody></table>\n<h4 class=\"doch3\">4.2. Маркетинговые соглашения с партнёрами</h4>\n<p class=\"docp\">Описание: Комплекс активностей (рассылки, баннеры, вебинары) за партнёрский бюджет.</p>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Частота</td><td>5-10 соглашений/месяц</td></tr><tr><td>Бюджет</td><td>100% партнёрский</td></tr><tr><td>Каналы</td><td>Email, сайт, соцсети</td></tr></tbody></table>\n<h4 class=\"doch3\">4.3. B2C-реклама</h4>\n<p class=\"docp\">Описание: Привлечение конечных туристов через digital-каналы.</p>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Частота</td><td>Постоянно</td></tr><tr><td>Бюджет</td><td>Собственный</td></tr><tr><td>Каналы</td><td>Контекст, SMM, SEO</td></tr></tbody></table>\n<h4 class=\"doch3\">4.4. Вебинары для агентов</h4>\n<p class=\"docp\">Описание: Онлайн-презентации направлений и продуктов.</p>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Частота</td><td>4-8 вебинаров/месяц</td></tr><tr><td>Платформа</td><td>МТС Линк</td></tr><tr><td>Участники</td><td>50-200 агентов</td></tr></tbody></table>\n<h3 class=\"doch2\">5. Этапы процесса (на примере мероприятия с партнёром)</h3>\n<h4 class=\"doch3\">Этап 1: Инициация кампании</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы</td></tr><tr><td>SLA</td><td>1-2 дня</td></tr><tr><td>Точка передачи</td><td>Внутреннее согласование</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Получение запроса (от партнёра / руководства / плана)</p>\n<p class=\"docp\">2. Оценка возможностей и ресурсов</p>\n<p class=\"docp\">3. Подбор даты и формата</p>\n<p class=\"docp\">4. Предварительное согласование с КАМ/регионами</p>\n<h4 class=\"doch3\">Этап 2: Планирование и поиск подрядчиков</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы</td></tr><tr><td>SLA</td><td>3-5 дней</td></tr><tr><td>Точка передачи</td><td>→ Финансовый департамент (счета)</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Поиск площадки для мероприятия</p>\n<p class=\"docp\">2. Подбор подрядчиков (фото, звук, ведущий, кейтеринг)</p>\n<p class=\"docp\">3. Формирование сметы</p>\n<p class=\"docp\">4. Согласование бюджета с партнёром</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Несвоевременные ответы от подрядчиков</p>\n<p class=\"docp\">• Накладки по датам</p>\n<h4 class=\"doch3\">Этап 3: Документооборот и согласование</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы, Юрист, Финансовый департамент</td></tr><tr><td>SLA</td><td>3-5 дней</td></tr><tr><td>Точка передачи</td><td>→ Отдел контент-маркетинга</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Выставление счёта партнёру (через Финансовый департамент)</p>\n<p class=\"docp\">2. Согласование договора с подрядчиками (через Юриста)</p>\n<p class=\"docp\">3. Контроль подписания документов</p>\n<p class=\"docp\">4. Получение оплаты от партнёра</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Задержки согласования договоров</p>\n<p class=\"docp\">• Несвоевременные ответы от партнёров</p>\n<h4 class=\"doch3\">Этап 4: Набор участников</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>КАМ / Региональные офисы</td></tr><tr><td>SLA</td><td>1-3 недели</td></tr><tr><td>Точка передачи</td><td>→ Отдел рекламы (списки)</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Постановка задачи в Битрикс24</p>\n<p class=\"docp\">2. Рассылка приглашений агентам</p>\n<p class=\"docp\">3. Регистрация участников</p>\n<p class=\"docp\">4. Напоминания и подтверждение явки</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Низкий отклик на приглашения</p>\n<p class=\"docp\">• No-show (неявка зарегистрированных)</p>\n<h4 class=\"doch3\">Этап 5: Подготовка контента</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел контент-маркетинга</td></tr><tr><td>SLA</td><td>5-7 дней</td></tr><tr><td>Точка передачи</td><td>→ Партнёр (согласование)</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Создание брендированных материалов (фотозона, меню, полиграфия)</p>\n<p class=\"docp\">2. Подготовка презентации</p>\n<p class=\"docp\">3. Согласование всех материалов с партнёром</p>\n<p class=\"docp\">4. Печать и доставка материалов</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Высокая загрузка дизайнера (1 человек)</p>\n<p class=\"docp\">• Задержки согласования с партнёром</p>\n<h4 class=\"doch3\">Этап 6: Проведение мероприятия</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы, КАМ, Отдел продукта</td></tr><tr><td>SLA</td><td>День мероприятия</td></tr><tr><td>Точка передачи</td><td>—</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Контроль площадки и подрядчиков (Отдел рекламы)</p>\n<p class=\"docp\">2. Встреча и регистрация агентов (КАМ)</p>\n<p class=\"docp\">3. Презентация направления (Отдел продукта)</p>\n<p class=\"docp\">4. Нетворкинг и фотосессия</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Форс-мажоры (технические сбои, неявка спикера)</p>\n<h4 class=\"doch3\">Этап 7: Отчётность и анализ</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел рекламы, Контент-маркетинг</td></tr><tr><td>SLA</td><td>3-5 дней после мероприятия</td></tr><tr><td>Точка передачи</td><td>→ Партнёр, → Руководство</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Сбор фотоотчёта от фотографа</p>\n<p class=\"docp\">2. Получение списков участников от КАМ</p>\n<p class=\"docp\">3. Сбор обратной связи от партнёра</p>\n<p class=\"docp\">4. Публикация отчёта в соцсетях</p>\n<p class=\"docp\">5. Формирование итогового отчёта с KPI</p>\n<p class=\"docp\">6. Закрывающие документы в бухгалтерию</p>\n<h3 class=\"doch2\">6. Диаграмма процесса</h3>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса</td></tr><tr><td>────►</td><td>Направление потока</td></tr><tr><td>(время)</td><td>SLA или длительность этапа</td></tr><tr><td></td><td>Завершение процесса</td></tr></tbody></table>\n<pre class=\"docp\">                 ┌───────────────┐\n                 │    ЗАПРОС     │\n                 │  (партнёр /   │\n                 │ план / продукт)│\n                 └───────┬───────┘\n                         │\n                         ▼\n    ┌───────────────┐     ┌───────────────┐\n    │   ИНИЦИАЦИЯ   │────►│ ПЛАНИРОВАНИЕ  │\n    │    (2 дня)    │     │   (5 дней)    │\n    └───────────────┘     └───────┬───────┘\n                                  │\n            ┌─────────────────────┼─────────────────────┐\n            ▼                     ▼                     ▼\n    ┌───────────────┐     ┌───────────────┐     ┌───────────────┐\n    │    ФИНАНСЫ    │     │     ЮРИСТ     │     │      КАМ      │\n    │    (счета)    │     │  (договоры)   │     │    (набор)    │\n    └───────┬───────┘     └───────┬───────┘     └───────┬───────┘\n            │                     │                     │\n            └─────────────────────┼─────────────────────┘\n                                  │\n                                  ▼\n                          ┌───────────────┐\n                          │    КОНТЕНТ    │────► Партнёр\n                          │   (7 дней)    │      (согласование)\n                          └───────┬───────┘\n                                  │\n                                  ▼\n                          ┌───────────────┐\n                          │  МЕРОПРИЯТИЕ  │\n                          │   (1 день)    │\n                          └───────┬───────┘\n                                  │\n                                  ▼\n                          ┌───────────────┐\n                          │     ОТЧЁТ     │────► Партнёр ✓\n                          │   (5 дней)    │────► Руководство ✓\n                          └───────────────┘</pre>\n<h3 class=\"doch2\">7. Системы и инструменты</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль в процессе</th></tr></thead><tbody><tr><td>Битрикс24</td><td>Постановка задач, коммуникации</td></tr><tr><td>Email</td><td>Коммуникация с партнёрами</td></tr><tr><td>Invoice Tracker</td><td>Контроль счетов партнёрам</td></tr><tr><td>МТС Линк</td><td>Платформа для вебинаров</td></tr><tr><td>Google Таблицы</td><td>Списки участников, планирование</td></tr><tr><td>Соцсети (TG, VK)</td><td>Публикация отчётов</td></tr><tr><td>RoiStat</td><td>Сквозная аналитика (в процессе внедрения)</td></tr></tbody></table>\n<h3 class=\"doch2\">8. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Количество мероприятий/месяц</td><td>≥4</td><td>3-4</td><td>Подсчёт</td></tr><tr><td>Средняя явка на мероприятие</td><td>≥70%</td><td>~50%</td><td>Регистрация vs факт</td></tr><tr><td>Посещаемость вебинаров</td><td>≥100 чел</td><td>~80</td><td>МТС Линк</td></tr><tr><td>Партнёрские бюджеты/год</td><td>Рост 20%</td><td>Нет данных</td><td>Invoice Tracker</td></tr><tr><td>ROI рекламных кампаний</td><td>≥300%</td><td>Нет данных</td><td>RoiStat (после внедрения)</td></tr><tr><td>Open Rate email-рассылок</td><td>≥25%</td><td>~18%</td><td>Email-платформа</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Вакансия директора</td><td>Нет руководителя L1</td><td>Отсутствие единой стратегии</td></tr><tr><td>Нет сквозной аналитики</td><td>RoiStat не внедрён</td><td>Невозможно измерить ROI</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Устаревшие цены в рассылках</td><td>Ручной сбор от продуктологов</td><td>Некорректная информация</td></tr><tr><td>Высокая загрузка дизайнера</td><td>1 специалист на все задачи</td><td>Задержки креативов</td></tr><tr><td>Низкая посещаемость вебинаров</td><td>Слабый отклик, технические проблемы</td><td>Низкий охват</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-MKT-01</td><td>Интеграция САМО→Email</td><td>Автоматическое обновление цен и ссылок</td><td>-50% ошибок в рассылках</td><td>HIGH</td></tr><tr><td>AUTO-MKT-02</td><td>RoiStat</td><td>Полная сквозная аналитика</td><td>ROI-дашборды в реалтайме</td><td>HIGH</td></tr><tr><td>AUTO-MKT-03</td><td>ИИ для дизайна</td><td>Генерация базовых визуалов</td><td>+20% скорость креативов</td><td>MEDIUM</td></tr><tr><td>AUTO-MKT-04</td><td>Шаблоны задач Битрикс</td><td>Стандартизация процесса мероприятий</td><td>-30% время планирования</td><td>MEDIUM</td></tr><tr><td>AUTO-MKT-05</td><td>Авторассылка напоминаний</td><td>Напоминания участникам о мероприятиях</td><td>+15% явка</td><td>MEDIUM</td></tr></tbody></table>\n<h3 class=\"doch2\">11. Рекомендации</h3>\n<h4 class=\"doch3\">Немедленные действия</h4>\n<p class=\"docp\">1. Закрыть вакансию директора по маркетингу — критически важно для единой стратегии</p>\n<p class=\"docp\">2. Завершить внедрение RoiStat — необходимо для измерения эффективности</p>\n<p class=\"docp\">3. Создать интеграцию САМО→Email — для актуальных цен в рассылках</p>\n<h4 class=\"doch3\">Среднесрочные</h4>\n<p class=\"docp\">1. Разработать единую маркетинговую стратегию на год</p>\n<p class=\"docp\">2. Внедрить систему управления партнёрскими бюджетами</p>\n<p class=\"docp\">3. Автоматизировать процесс набора участников на мероприятия</p>\n<h3 class=\"doch2\">12. Связанные документы</h3>\n<p class=\"docp\">• L1_json/MKT_Департамент_маркетинга_MODELED.json — Смоделированная анкета L1</p>\n<p class=\"docp\">• L2_json/36._Колдаева_Отдел_рекламы.json — Анкета отдела рекламы</p>\n<p class=\"docp\">• L2_json/37._Седых_Отдел_контент-маркетинга.json — Анкета контент-маркетинга</p>\n<p class=\"docp\">• L2_json/38._Четверик_Отдел_маркетинга.json — Анкета отдела маркетинга</p>\n<p class=\"docp\">• docs/2.1_department_interactions.json — Взаимодействия подразделений</p>","03":"<h2 class=\"doch1\">BP-03: MICE и корпоративное обслуживание</h2>\n<p class=\"docp\">Версия: 1.0</p>\n<p class=\"docp\">Дата: 2026-02-17</p>\n<p class=\"docp\">Статус: Описан</p>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-03</td></tr><tr><td>Название</td><td>MICE и корпоративное обслуживание</td></tr><tr><td>Владелец</td><td>Питуркин С.А. (Департамент MICE и корпоративного обслуживания)</td></tr><tr><td>Критичность</td><td>ВЫСОКИЙ</td></tr><tr><td>Влияние на выручку</td><td>~10% выручки</td></tr><tr><td>Стратегическая важность</td><td>Растущий сегмент B2B</td></tr><tr><td>Частота</td><td>20-50 запросов/месяц</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Что такое MICE</h3>\n<p class=\"docp\">MICE — аббревиатура для сегмента корпоративного туризма:</p>\n<p class=\"docp\">• Meetings — деловые встречи</p>\n<p class=\"docp\">• Incentives — поощрительные поездки</p>\n<p class=\"docp\">• Conferences — конференции</p>\n<p class=\"docp\">• Exhibitions — выставки</p>\n<p class=\"docp\">Дополнительно департамент занимается:</p>\n<p class=\"docp\">• Бизнес-тревел — командировки сотрудников компаний-клиентов</p>\n<p class=\"docp\">• Въездной туризм — приём иностранных групп в России</p>\n<p class=\"docp\">• Групповое бронирование — корпоративные группы от 10 человек</p>\n<h3 class=\"doch2\">3. Границы процесса</h3>\n<h4 class=\"doch3\">Триггер (вход)</h4>\n<p class=\"docp\">• Входящий запрос от корпоративного клиента</p>\n<p class=\"docp\">• Запрос от агентства на групповое бронирование</p>\n<p class=\"docp\">• Участие в тендере на госплощадках</p>\n<p class=\"docp\">• Запрос на организацию мероприятия</p>\n<h4 class=\"doch3\">Результат (выход)</h4>\n<p class=\"docp\">• Проведённое мероприятие / поездка</p>\n<p class=\"docp\">• Оплаченные услуги</p>\n<p class=\"docp\">• Закрывающие документы</p>\n<p class=\"docp\">• Удовлетворённый корпоративный клиент</p>\n<h3 class=\"doch2\">4. Участники процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Роль</th><th>Подразделение</th><th>Кол-во</th><th>Ответственность</th></tr></thead><tbody><tr><td>Менеджер группового бронирования</td><td>Отдел группового бронирования</td><td>4</td><td>Обработка запросов, формирование смет</td></tr><tr><td>Менеджер бизнес-тревел</td><td>Отдел бизнес-тревел</td><td>1</td><td>Корпоративные командировки</td></tr><tr><td>Менеджер въездного туризма</td><td>Отдел въездного туризма</td><td>1</td><td>Приём иностранных групп</td></tr><tr><td>Бухгалтер</td><td>Бухгалтерия</td><td>—</td><td>Счета, закрывающие документы</td></tr><tr><td>Юрист</td><td>Юридический отдел</td><td>—</td><td>Договоры с поставщиками</td></tr><tr><td>ИТОГО</td><td>4 подразделения</td><td>6</td><td>—</td></tr></tbody></table>\n<h3 class=\"doch2\">5. Этапы процесса</h3>\n<h4 class=\"doch3\">Этап 1: Приём и анализ запроса</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования</td></tr><tr><td>Системы</td><td>Email, Битрикс24</td></tr><tr><td>SLA</td><td>2 часа (первичный ответ)</td></tr><tr><td>Точка передачи</td><td>Внутри отдела</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Получение запроса (email, телефон, форма на сайте)</p>\n<p class=\"docp\">2. Регистрация в CRM</p>\n<p class=\"docp\">3. Первичный контакт с клиентом</p>\n<p class=\"docp\">4. Уточнение деталей запроса:</p>\n<p class=\"docp\">    ◦ Даты и продолжительность</p>\n<p class=\"docp\">    ◦ Количество участников</p>\n<p class=\"docp\">    ◦ Направление и категория размещения</p>\n<p class=\"docp\">    ◦ Бюджет</p>\n<p class=\"docp\">    ◦ Специальные требования (конференц-залы, кейтеринг, трансферы)</p>\n<h4 class=\"doch3\">Этап 2: Запрос поставщиков</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования</td></tr><tr><td>Системы</td><td>Email, Сайты поставщиков (Броневик, Островок, Aviasales)</td></tr><tr><td>SLA</td><td>24-48 часов</td></tr><tr><td>Точка передачи</td><td>← Ответы от поставщиков</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Формирование запросов в отели / DMC</p>\n<p class=\"docp\">2. Запрос перелёта для группы (→ Транспортный отдел)</p>\n<p class=\"docp\">3. Запрос дополнительных услуг (трансферы, экскурсии, кейтеринг)</p>\n<p class=\"docp\">4. Сбор и сравнение предложений</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• УЗКОЕ МЕСТО: Сложные запросы с множеством переменных</p>\n<p class=\"docp\">• Долгое ожидание ответов от зарубежных партнёров</p>\n<p class=\"docp\">• Нет стандартизированных форм запросов</p>\n<h4 class=\"doch3\">Этап 3: Формирование сметы и презентации</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования</td></tr><tr><td>Системы</td><td>Excel, PowerPoint</td></tr><tr><td>SLA</td><td>1-3 дня</td></tr><tr><td>Точка передачи</td><td>→ Клиент</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Расчёт стоимости по всем компонентам</p>\n<p class=\"docp\">2. Формирование нескольких вариантов (базовый / оптимальный / премиум)</p>\n<p class=\"docp\">3. Создание презентации с описанием программы</p>\n<p class=\"docp\">4. Расчёт маржинальности</p>\n<p class=\"docp\">5. Отправка клиенту</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• УЗКОЕ МЕСТО: Полностью ручной процесс</p>\n<p class=\"docp\">• Нет шаблонов смет</p>\n<p class=\"docp\">• Долгое время подготовки сложных КП</p>\n<h4 class=\"doch3\">Этап 4: Переговоры и согласование</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования</td></tr><tr><td>Системы</td><td>Email, Мессенджеры, Встречи</td></tr><tr><td>SLA</td><td>По ситуации (1-4 недели)</td></tr><tr><td>Точка передачи</td><td>Внутри этапа</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Получение обратной связи от клиента</p>\n<p class=\"docp\">2. Корректировка предложения</p>\n<p class=\"docp\">3. Дополнительные запросы поставщикам</p>\n<p class=\"docp\">4. Согласование финальных условий</p>\n<p class=\"docp\">5. Подготовка к бронированию</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Многократные итерации пересчёта</p>\n<p class=\"docp\">• Изменение условий от поставщиков</p>\n<h4 class=\"doch3\">Этап 5: Бронирование и договоры</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования, Юрист</td></tr><tr><td>Системы</td><td>САМО-тур, Email</td></tr><tr><td>SLA</td><td>2-5 дней</td></tr><tr><td>Точка передачи</td><td>→ Бухгалтерия (счета)</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Бронирование услуг у поставщиков</p>\n<p class=\"docp\">2. Заключение договоров с поставщиками (через Юриста)</p>\n<p class=\"docp\">3. Ввод заявки в САМО-тур</p>\n<p class=\"docp\">4. Согласование условий с клиентом</p>\n<p class=\"docp\">5. Подписание договора с клиентом</p>\n<h4 class=\"doch3\">Этап 6: Оплата и документооборот</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Бухгалтерия, Отдел группового бронирования</td></tr><tr><td>Системы</td><td>1С, САМО-тур</td></tr><tr><td>SLA</td><td>По условиям договора</td></tr><tr><td>Точка передачи</td><td>Внутри этапа</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Заказ счёта в бухгалтерии</p>\n<p class=\"docp\">2. Отправка счёта клиенту</p>\n<p class=\"docp\">3. Контроль поступления оплаты</p>\n<p class=\"docp\">4. Оплата поставщикам</p>\n<p class=\"docp\">5. Формирование закрывающих документов</p>\n<h4 class=\"doch3\">Этап 7: Исполнение и сопровождение</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования, Отдел круглосуточной работы с клиентами</td></tr><tr><td>Системы</td><td>Мессенджеры, Телефон, Битрикс24, САМО-тур</td></tr><tr><td>SLA</td><td>24/7 во время поездки</td></tr><tr><td>Точка передачи</td><td>→ Линия 24/7 (нерабочее время и экстренные ситуации)</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Выдача документов (ваучеры, билеты)</p>\n<p class=\"docp\">2. Курирование группы во время поездки</p>\n<p class=\"docp\">3. Оперативное решение проблем</p>\n<p class=\"docp\">4. Координация с принимающей стороной</p>\n<h4 class=\"doch3\">7.1 Маршрутизация MICE-обращений на линию 24/7</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел круглосуточной работы с клиентами</td></tr><tr><td>Триггер</td><td>Обращение MICE-клиента в нерабочее время / экстренная ситуация</td></tr><tr><td>SLA</td><td>Ответ ≤15 мин, решение ≤2 часа</td></tr><tr><td>Критичность</td><td>КРИТИЧНО для корпоративных клиентов</td></tr></tbody></table>\n<p class=\"docp\">Почему это критично:</p>\n<p class=\"docp\">• Корпоративные клиенты (B2B) имеют высокие ожидания по уровню сервиса</p>\n<p class=\"docp\">• MICE-мероприятия часто проходят в нестандартное время (ранние вылеты, вечерние мероприятия, выходные)</p>\n<p class=\"docp\">• Потеря доверия корпоративного клиента = потеря долгосрочного контракта (средний чек в 5-10 раз выше B2C)</p>\n<p class=\"docp\">• Отсутствие 24/7 поддержки — конкурентный недостаток на рынке MICE</p>\n<p class=\"docp\">Алгоритм маршрутизации:</p>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса / блок действий</td></tr><tr><td>────►</td><td>Направление потока</td></tr><tr><td>├────</td><td>Условное ветвление</td></tr></tbody></table>\n<pre class=\"docp\">    MICE-клиент обращается (телефон / мессенджер / email)\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │         Определение времени обращения               │\n    └─────────────────────────────────────────────────────┘\n                         │\n                         ├──── Рабочее время ────► Отдел группового бронирования\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │       НЕРАБОЧЕЕ ВРЕМЯ / ЭКСТРЕННАЯ СИТУАЦИЯ         │\n    │       Маршрутизация на линию 24/7                   │\n    └─────────────────────────────────────────────────────┘\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  1. Идентификация как MICE-клиент (тег в Битрикс)   │\n    │  2. Создание сделки «MICE-поддержка 24/7»           │\n    │  3. Связь с DMC / партнёром                         │\n    │  4. Решение проблемы / эскалация                    │\n    │  5. Передача в Отдел группового бронирования (утро) │\n    └─────────────────────────────────────────────────────┘</pre>\n<p class=\"docp\">Типичные сценарии MICE:</p>\n<p class=\"docp\">• Проблемы с групповым трансфером (задержка, неявка)</p>\n<p class=\"docp\">• Изменение программы мероприятия (экстренно)</p>\n<p class=\"docp\">• Проблемы с конференц-залом / оборудованием</p>\n<p class=\"docp\">• Медицинские ситуации участников</p>\n<p class=\"docp\">• Отмена рейса группы</p>\n<h4 class=\"doch3\">Этап 8: Закрытие и анализ</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел группового бронирования, Бухгалтерия</td></tr><tr><td>Системы</td><td>САМО-тур, 1С</td></tr><tr><td>SLA</td><td>5-10 дней после завершения</td></tr><tr><td>Точка передачи</td><td>→ Клиент (закрывающие)</td></tr></tbody></table>\n<p class=\"docp\">Действия:</p>\n<p class=\"docp\">1. Сбор актов от поставщиков</p>\n<p class=\"docp\">2. Оформление закрывающих документов</p>\n<p class=\"docp\">3. Отправка клиенту</p>\n<p class=\"docp\">4. Сбор обратной связи</p>\n<p class=\"docp\">5. Анализ маржинальности</p>\n<h3 class=\"doch2\">6. Диаграмма процесса</h3>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса</td></tr><tr><td>────►</td><td>Направление потока</td></tr><tr><td>◄───►</td><td>Двунаправленное взаимодействие</td></tr><tr><td>◄──</td><td>Параллельная поддержка</td></tr><tr><td>(время)</td><td>SLA или длительность этапа</td></tr><tr><td></td><td>Завершение процесса</td></tr></tbody></table>\n<pre class=\"docp\">                 ┌───────────────┐\n                 │    ЗАПРОС     │\n                 │ (корп. клиент)│\n                 └───────┬───────┘\n                         │\n                         ▼\n    ┌───────────────┐     ┌───────────────┐\n    │    АНАЛИЗ     │────►│  ПОСТАВЩИКИ   │\n    │   (2 часа)    │     │  (24-48 ч)    │\n    └───────────────┘     └───────┬───────┘\n                                  │\n                                  ▼\n                          ┌───────────────┐\n                          │     СМЕТА     │────► Клиент\n                          │  (1-3 дня)    │\n                          └───────┬───────┘\n                                  │\n                                  ▼\n                          ┌───────────────┐\n                          │  ПЕРЕГОВОРЫ   │◄───► Клиент\n                          │  (1-4 нед)    │      (итерации)\n                          └───────┬───────┘\n                                  │\n            ┌─────────────────────┼─────────────────────┐\n            ▼                     ▼                     ▼\n    ┌───────────────┐     ┌───────────────┐     ┌───────────────┐\n    │ БРОНИРОВАНИЕ  │     │     ЮРИСТ     │     │  БУХГАЛТЕРИЯ  │\n    │    (САМО)     │     │  (договоры)   │     │    (счета)    │\n    └───────┬───────┘     └───────┬───────┘     └───────┬───────┘\n            │                     │                     │\n            └─────────────────────┼─────────────────────┘\n                                  │\n                                  ▼\n                          ┌───────────────┐\n                          │    ОПЛАТА     │\n                          │               │\n                          └───────┬───────┘\n                                  │\n                                  ▼\n                          ┌───────────────┐\n                          │  ИСПОЛНЕНИЕ   │◄── Курирование 24/7\n                          │   (поездка)   │\n                          └───────┬───────┘\n                                  │\n                                  ▼\n                          ┌───────────────┐\n                          │   ЗАКРЫТИЕ    │────► Клиент ✓\n                          │  (10 дней)    │      (акты, отзыв)\n                          └───────────────┘</pre>\n<h3 class=\"doch2\">7. Системы и инструменты</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль в процессе</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Ведение заявок</td></tr><tr><td>Битрикс24</td><td>CRM, задачи</td></tr><tr><td>Excel</td><td>Расчёт смет</td></tr><tr><td>PowerPoint</td><td>Презентации</td></tr><tr><td>ETM</td><td>Платформа бизнес-тревел</td></tr><tr><td>Email</td><td>Основной канал коммуникации</td></tr><tr><td>Броневик, Островок</td><td>Поиск отелей</td></tr><tr><td>Aviasales</td><td>Поиск авиа</td></tr></tbody></table>\n<h3 class=\"doch2\">8. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Время первичного ответа</td><td>≤2 часа</td><td>~4 часа</td><td>CRM</td></tr><tr><td>Время подготовки КП</td><td>≤3 дня</td><td>5-7 дней</td><td>Ручной замер</td></tr><tr><td>Конверсия запрос→сделка</td><td>≥20%</td><td>~12%</td><td>САМО-тур</td></tr><tr><td>Средняя маржинальность</td><td>≥15%</td><td>~10%</td><td>Финансовый отчёт</td></tr><tr><td>NPS корп. клиентов</td><td>≥60</td><td>Нет данных</td><td>Опросы</td></tr><tr><td>Кол-во активных клиентов</td><td>Рост 30%/год</td><td>+15%</td><td>CRM</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th><th>Статус</th></tr></thead><tbody><tr><td>Связь с Клиентским сервисом</td><td>Ранее: разрыв коммуникаций</td><td>MICE-клиенты не получали 24/7 поддержку</td><td>РЕШАЕТСЯ (см. Этап 7.1)</td></tr><tr><td>Относительно новый сегмент</td><td>Нет отлаженных процессов</td><td>Всё строится с нуля</td><td>ОТКРЫТО</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Ручное формирование смет</td><td>Нет шаблонов, нет автоматизации</td><td>Долгое время КП</td></tr><tr><td>Нет регламентов</td><td>Относительно новое направление</td><td>Зависимость от ключевых людей</td></tr><tr><td>Сложные многокомпонентные запросы</td><td>Специфика MICE</td><td>Ошибки в расчётах</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-MICE-01</td><td>Шаблоны смет</td><td>Автоформирование смет на основе типовых услуг</td><td>-50% время КП</td><td>HIGH</td></tr><tr><td>AUTO-MICE-02</td><td>Канал MICE в Сервисе</td><td>Выделенная линия поддержки для MICE</td><td>Улучшение NPS</td><td>CRITICAL</td></tr><tr><td>AUTO-MICE-03</td><td>BI-аналитика</td><td>Дашборды по MICE-сегменту</td><td>Управленческие решения</td><td>MEDIUM</td></tr><tr><td>AUTO-MICE-04</td><td>Интеграция с тендерными площадками</td><td>Мониторинг и уведомления о тендерах</td><td>+20% новых клиентов</td><td>MEDIUM</td></tr><tr><td>AUTO-MICE-05</td><td>Автомаршрутизация MICE на 24/7</td><td>Автоматическое определение MICE-клиента по тегу в Битрикс и маршрутизация на линию 24/7 в нерабочее время</td><td>Гарантия 24/7 поддержки корп. клиентов</td><td>CRITICAL</td></tr></tbody></table>\n<h3 class=\"doch2\">11. Воронка B2B-продаж MICE</h3>\n<h4 class=\"doch3\">Легенда воронки</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап воронки</td></tr><tr><td>(XX%)</td><td>Конверсия на этап</td></tr><tr><td>────►</td><td>Переход на следующий этап</td></tr></tbody></table>\n<pre class=\"docp\">    ┌─────────────────────────────────────────────────┐\n    │                   ЛИД (100%)                    │\n    │         Получение запроса / контакта            │\n    └─────────────────────────┬───────────────────────┘\n                              │\n                              ▼ (70%)\n    ┌─────────────────────────────────────────────────┐\n    │                 КВАЛИФИКАЦИЯ                    │\n    │        Уточнение потребностей, бюджета          │\n    └─────────────────────────┬───────────────────────┘\n                              │\n                              ▼ (40%)\n    ┌─────────────────────────────────────────────────┐\n    │           КОММЕРЧЕСКОЕ ПРЕДЛОЖЕНИЕ              │\n    │               Смета, презентация                │\n    └─────────────────────────┬───────────────────────┘\n                              │\n                              ▼ (25%)\n    ┌─────────────────────────────────────────────────┐\n    │                  ПЕРЕГОВОРЫ                     │\n    │        Обсуждение условий, корректировки        │\n    └─────────────────────────┬───────────────────────┘\n                              │\n                              ▼ (15%)\n    ┌─────────────────────────────────────────────────┐\n    │               ДОГОВОР / БРОНЬ                   │\n    │             Подписание, предоплата              │\n    └─────────────────────────┬───────────────────────┘\n                              │\n                              ▼ (12%)\n    ┌─────────────────────────────────────────────────┐\n    │                  ИСПОЛНЕНИЕ                     │\n    │      Проведение мероприятия / поездки           │\n    └─────────────────────────────────────────────────┘</pre>\n<h3 class=\"doch2\">12. Рекомендации</h3>\n<h4 class=\"doch3\">Немедленные действия</h4>\n<p class=\"docp\">1. Создать выделенный канал в Клиентском сервисе для MICE-клиентов</p>\n<p class=\"docp\">2. Разработать стандартные шаблоны смет для типовых запросов</p>\n<p class=\"docp\">3. Формализовать регламенты взаимодействия с другими отделами</p>\n<h4 class=\"doch3\">Среднесрочные</h4>\n<p class=\"docp\">1. Внедрить CRM-воронку для MICE в Битрикс24</p>\n<p class=\"docp\">2. Аккредитоваться на тендерных площадках</p>\n<p class=\"docp\">3. Разработать программу лояльности для корпоративных клиентов</p>\n<p class=\"docp\">4. Создать систему сбора NPS после каждой поездки</p>\n<h4 class=\"doch3\">Долгосрочные</h4>\n<p class=\"docp\">1. Интеграция с ETM для автоматизации бизнес-тревел</p>\n<p class=\"docp\">2. Разработка собственного калькулятора MICE-услуг</p>\n<p class=\"docp\">3. Выход на рынок организации выставок и конференций</p>\n<h3 class=\"doch2\">13. Связь с другими процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Процесс</th><th>Тип взаимодействия</th><th>Точка передачи</th></tr></thead><tbody><tr><td>BP-06 (Клиентская поддержка)</td><td>Маршрутизация MICE-обращений на 24/7</td><td>Линия 24/7 в нерабочее время</td></tr><tr><td>BP-01 (Заявка)</td><td>Бронирование услуг через общую систему</td><td>САМО-тур</td></tr><tr><td>BP-04 (Финансы)</td><td>Счета, оплаты, закрывающие документы</td><td>1С, Бухгалтерия</td></tr></tbody></table>\n<h3 class=\"doch2\">14. Связанные документы</h3>\n<p class=\"docp\">• L1_json/Питуркин_Департамент_MICE_и_корпоративного_обслуживания.json — Анкета владельца</p>\n<p class=\"docp\">• L2_json/22._Коломина_Отдел_группового_бронирования.json — Анкета группового бронирования</p>\n<p class=\"docp\">• L2_json/23._Пашин_Отдел_бизнес-тревел_.json — Анкета бизнес-тревел</p>\n<p class=\"docp\">• L2_json/MICE_Отдел_MODELED.json — Смоделированные данные</p>\n<p class=\"docp\">• docs/2.2_critical_business_processes.json — Данные BP-005</p>\n<p class=\"docp\">• docs/2.1_department_interactions.json — Разрыв коммуникаций MICE ↔ Сервис</p>\n<p class=\"docp\">• processes/BP_06_Customer_Support.md — Процесс клиентской поддержки (связь 24/7)</p>","04":"<h2 class=\"doch1\">BP-04: Финансовый цикл</h2>\n<p class=\"docp\">Версия: 1.0</p>\n<p class=\"docp\">Дата: 2026-02-17</p>\n<p class=\"docp\">Статус: Описан</p>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-04</td></tr><tr><td>Название</td><td>Финансовый цикл</td></tr><tr><td>Владелец</td><td>Назарикова М.В. (Финансовый департамент)</td></tr><tr><td>Критичность</td><td>КРИТИЧЕСКИЙ</td></tr><tr><td>Влияние</td><td>100% денежных потоков компании</td></tr><tr><td>Частота</td><td>Ежедневно (платежи), ежемесячно (отчётность)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Структура финансового департамента</h3>\n<table class=\"doctbl\"><thead><tr><th>Подразделение</th><th>Руководитель</th><th>Штат</th><th>Функции</th></tr></thead><tbody><tr><td>Финансовый отдел</td><td>Фомичев И.В.</td><td>5</td><td>Управленческий учёт, аналитика, CF-контроль</td></tr><tr><td>Бухгалтерия</td><td>Соколова</td><td>15</td><td>Бухучёт, налоги, документооборот</td></tr><tr><td>Банковская группа</td><td>Лебедева</td><td>3</td><td>Платежи, разнесение оплат</td></tr><tr><td>Группа расчётов с иностранными поставщиками</td><td>Мигунова</td><td>2</td><td>Валютные платежи, Travelluxe</td></tr><tr><td>ИТОГО</td><td>—</td><td>20</td><td>—</td></tr></tbody></table>\n<h3 class=\"doch2\">3. Ключевые цели финансового департамента</h3>\n<p class=\"docp\">1. Финансовая устойчивость — обеспечение непрерывности бизнеса, предотвращение кассовых разрывов</p>\n<p class=\"docp\">2. Экономическая эффективность — контроль маржинальности, анализ прибыли по сегментам</p>\n<p class=\"docp\">3. Прозрачность и управляемость — достоверная отчётность, управление рисками</p>\n<h3 class=\"doch2\">4. Подпроцессы финансового цикла</h3>\n<h4 class=\"doch3\">4.1. Ежедневный цикл оплат</h4>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>HH:MM</td><td>Время выполнения</td></tr><tr><td>────►</td><td>Направление потока</td></tr><tr><td>│</td><td>Последовательность этапов</td></tr></tbody></table>\n<pre class=\"docp\">    08:00 ────► Сбор остатков на счетах (СВК-отчёт)\n                │\n    09:00 ────► Выгрузка поступлений из клиент-банков\n                │\n    10:00 ────► Автоматическое разнесение платежей в САМО-тур\n                │\n    11:00 ────► Формирование реестра исходящих платежей\n                │\n    12:00 ────► Согласование с Финансовым директором\n                │\n    14:00 ────► Проведение платежей поставщикам\n                │\n    16:00 ────► Выгрузка выписки в 1С\n                │\n    17:00 ────► Контроль дебиторской задолженности</pre>\n<h4 class=\"doch3\">4.2. Ежемесячный цикл отчётности</h4>\n<pre class=\"docp\">    1-5 число  ────► Сбор данных по операционной деятельности\n                     │\n    5-8 число  ────► Формирование ФОТ в бухгалтерии\n                     │\n    8-10 число ────► Отчёт о расходах\n                     │\n    8-10 число ────► Отчёт о прибылях/убытках\n                     │\n    10-15 число ───► Ежемесячный отчёт для KPI\n                     │\n    15-20 число ───► Закрытие периода в 1С</pre>\n<h3 class=\"doch2\">5. Детализация подпроцессов</h3>\n<h4 class=\"doch3\">5.1. Разнесение входящих платежей</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Банковская группа</td></tr><tr><td>Системы</td><td>Клиент-банк → Сетевой диск → САМО-тур</td></tr><tr><td>Частота</td><td>Каждый час</td></tr><tr><td>SLA</td><td>1 час после поступления</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм:</p>\n<p class=\"docp\">1. Выгрузка файла из клиент-банка (xlsx, htm)</p>\n<p class=\"docp\">2. Сохранение на сетевой диск</p>\n<p class=\"docp\">3. Автоматическое разнесение скриптом IT</p>\n<p class=\"docp\">4. Проверка файла загрузки (приходит на почту)</p>\n<p class=\"docp\">5. Ручная коррекция неразнесённых платежей</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Ошибки клиентов: неверные реквизиты, отсутствующий номер заявки</p>\n<p class=\"docp\">• Оплата в другой день → несовпадение курса валют</p>\n<p class=\"docp\">• Оплата на «старые» реквизиты</p>\n<h4 class=\"doch3\">5.2. Реестр платежей поставщикам (Invoice Tracker)</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Все отделы → Финансовый отдел</td></tr><tr><td>Системы</td><td>Google Таблицы, 1С, Клиент-банк, САМО-тур</td></tr><tr><td>Частота</td><td>Ежедневно</td></tr><tr><td>SLA</td><td>По дате в трекере</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм:</p>\n<p class=\"docp\">1. Сотрудник заносит счёт в Invoice Tracker</p>\n<p class=\"docp\">2. Отправляет копию на buh@spacetravel.ru</p>\n<p class=\"docp\">3. Формирование реестра на текущую дату</p>\n<p class=\"docp\">4. Согласование с Финансовым директором</p>\n<p class=\"docp\">5. Проверка наличия ДС на счетах</p>\n<p class=\"docp\">6. Формирование платёжных поручений</p>\n<p class=\"docp\">7. Проведение оплат</p>\n<p class=\"docp\">8. Внесение в 1С</p>\n<p class=\"docp\">9. Разнесение в САМО-тур (для туруслуг)</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Одновременное редактирование Google Таблицы → сбои</p>\n<p class=\"docp\">• Потеря счетов при некорректном занесении</p>\n<p class=\"docp\">• Отсутствие копий счетов по почте</p>\n<h4 class=\"doch3\">5.3. Управленческая отчётность</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Финансовый отдел</td></tr><tr><td>Системы</td><td>САМО-тур, 1С, Excel</td></tr><tr><td>Частота</td><td>Ежемесячно (8-10 число)</td></tr><tr><td>Получатели</td><td>Генеральный директор, Финансовый директор</td></tr></tbody></table>\n<p class=\"docp\">Формируемые отчёты:</p>\n<p class=\"docp\">1. Отчёт о расходах — все затраты по статьям</p>\n<p class=\"docp\">2. Отчёт о прибылях/убытках (P&amp;L) — финансовый результат</p>\n<p class=\"docp\">3. Отчёты для KPI — бонусы менеджерам, бронировщикам, КАМам</p>\n<p class=\"docp\">Алгоритм формирования P&amp;L:</p>\n<p class=\"docp\">1. Выгрузка операционных результатов из САМО-тур</p>\n<p class=\"docp\">2. Выгрузка курсов ЦБ, расчёт внутренней наценки</p>\n<p class=\"docp\">3. Перерасчёт в рублёвый эквивалент</p>\n<p class=\"docp\">4. Расчёт результатов по сотрудникам</p>\n<p class=\"docp\">5. Отправка в бухгалтерию для расчёта ФОТ</p>\n<p class=\"docp\">6. Сбор расходов из 1С по всем юрлицам</p>\n<p class=\"docp\">7. Категоризация расходов</p>\n<p class=\"docp\">8. Расчёт внереализационных доходов</p>\n<p class=\"docp\">9. Формирование итогового P&amp;L</p>\n<p class=\"docp\">10. Согласование и коррекция</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Множество источников данных (САМО, 1С×5 юрлиц, касса, маркетинг)</p>\n<p class=\"docp\">• Ручная категоризация расходов</p>\n<p class=\"docp\">• Высокие трудозатраты (12 шагов)</p>\n<p class=\"docp\">• Человеческий фактор при обработке</p>\n<h4 class=\"doch3\">5.4. Валютные платежи (Travelluxe)</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Группа расчётов с иностранными поставщиками</td></tr><tr><td>Системы</td><td>Клиент-банк Travelluxe, 1С</td></tr><tr><td>Валюты</td><td>EUR, USD, AED</td></tr><tr><td>Частота</td><td>Ежедневно</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм:</p>\n<p class=\"docp\">1. Обзор запросов на платежи (Balance Payment)</p>\n<p class=\"docp\">2. Анализ наличия ДС для конвертации</p>\n<p class=\"docp\">3. Мониторинг курса, выбор «удачного» момента</p>\n<p class=\"docp\">4. Конвертация и отправка платежей</p>\n<p class=\"docp\">5. Перевод ДС на счета группы компаний</p>\n<p class=\"docp\">6. Отражение в 1С (аутсорсинг Казахстан)</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Низкая скорость работы клиент-банка Travelluxe</p>\n<p class=\"docp\">• Санкции, блокировки, смена схем оплат</p>\n<p class=\"docp\">• Часовые пояса Казахстана</p>\n<h4 class=\"doch3\">5.5. Контроль дебиторской задолженности</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Финансовый отдел</td></tr><tr><td>Системы</td><td>САМО-тур</td></tr><tr><td>Частота</td><td>Еженедельно</td></tr><tr><td>Результат</td><td>Получение оплаты / Аннуляция заявки</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм:</p>\n<p class=\"docp\">1. Выгрузка неоплаченных заявок с прошедшими датами</p>\n<p class=\"docp\">2. Направление отчёта ведущим менеджерам</p>\n<p class=\"docp\">3. Разбор комментариев</p>\n<p class=\"docp\">4. Принятие решения: аннуляция / ожидание / коррекция</p>\n<h4 class=\"doch3\">5.6. Официальная отчётность</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Финансовый отдел, Бухгалтерия</td></tr><tr><td>Системы</td><td>САМО-тур, 1С</td></tr><tr><td>Частота</td><td>По требованию / ежеквартально</td></tr></tbody></table>\n<p class=\"docp\">Типы отчётности:</p>\n<p class=\"docp\">• Форма «Поездки_1» для ЦБ</p>\n<p class=\"docp\">• Отчёты в Росстат</p>\n<p class=\"docp\">• Отчёты для туристических органов</p>\n<p class=\"docp\">• Запросы от банков и журналистов</p>\n<h3 class=\"doch2\">6. Диаграмма финансового цикла</h3>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса / система</td></tr><tr><td>────►</td><td>Направление потока</td></tr><tr><td>◄──</td><td>Автоматическая обработка</td></tr><tr><td></td><td>Завершение / получатель</td></tr></tbody></table>\n<pre class=\"docp\">    ┌─────────────────────────────────────────────────────┐\n    │                  ВХОДЯЩИЕ ПОТОКИ                    │\n    └─────────────────────────────────────────────────────┘\n            │                   │                   │\n            ▼                   ▼                   ▼\n    ┌───────────────┐   ┌───────────────┐   ┌───────────────┐\n    │    АГЕНТЫ     │   │    ТУРИСТЫ    │   │   ПАРТНЁРЫ    │\n    │     (B2B)     │   │     (B2C)     │   │  (маркетинг)  │\n    └───────┬───────┘   └───────┬───────┘   └───────┬───────┘\n            │                   │                   │\n            └───────────────────┼───────────────────┘\n                                │\n                                ▼\n                        ┌───────────────┐\n                        │  КЛИЕНТ-БАНК  │\n                        │  (16 банков)  │\n                        └───────┬───────┘\n                                │\n                                ▼\n                        ┌───────────────┐\n                        │   САМО-ТУР    │◄── Автоскрипт IT\n                        │  (разнесение) │\n                        └───────┬───────┘\n                                │\n                                ▼\n    ┌─────────────────────────────────────────────────────┐\n    │                  ИСХОДЯЩИЕ ПОТОКИ                   │\n    └─────────────────────────────────────────────────────┘\n            │                   │                   │\n            ▼                   ▼                   ▼\n    ┌───────────────┐   ┌───────────────┐   ┌───────────────┐\n    │     ОТЕЛИ     │   │     АВИА      │   │    РАСХОДЫ    │\n    │      DMC      │   │  (ИАТА и др)  │   │  (ФОТ, АХО)   │\n    └───────────────┘   └───────────────┘   └───────────────┘\n            │                   │                   │\n            └───────────────────┼───────────────────┘\n                                │\n                                ▼\n                        ┌───────────────┐\n                        │      1С       │\n                        │   (5 юрлиц)   │\n                        └───────┬───────┘\n                                │\n                                ▼\n                        ┌───────────────┐\n                        │  ОТЧЁТНОСТЬ   │────► Руководство\n                        │     (P&amp;L)     │────► ЦБ, Росстат\n                        └───────────────┘</pre>\n<h3 class=\"doch2\">7. Системы и интеграции</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль</th><th>Интеграция</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Операционный учёт заявок</td><td>← Клиент-банк (скрипт)</td></tr><tr><td>1С Бухгалтерия (5 юрлиц)</td><td>Бухгалтерский учёт</td><td>← Клиент-банк</td></tr><tr><td>Клиент-банки (16 шт.)</td><td>Платежи</td><td>→ САМО, → 1С</td></tr><tr><td>Google Таблицы (Invoice Tracker)</td><td>Реестр счетов</td><td>Ручной ввод</td></tr><tr><td>Excel</td><td>Управленческая отчётность</td><td>Ручные выгрузки</td></tr></tbody></table>\n<h3 class=\"doch2\">8. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Закрытие периода</td><td>8-10 число</td><td>Соблюдается</td><td>Календарь</td></tr><tr><td>% автоматического разнесения платежей</td><td>≥95%</td><td>~85%</td><td>Отчёт загрузки</td></tr><tr><td>Дебиторская задолженность &gt;30 дней</td><td>≤5%</td><td>~8%</td><td>САМО-тур</td></tr><tr><td>Время формирования P&amp;L</td><td>≤3 дня</td><td>5-7 дней</td><td>Ручной замер</td></tr><tr><td>Ошибки в отчётности</td><td>0</td><td>~2/мес</td><td>Коррекции</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Отсутствие софта для CF-управления</td><td>Нет специализированной системы</td><td>Ручное планирование</td></tr><tr><td>Ручной учёт авиабилетов</td><td>Нет интеграции GDS → 1С</td><td>Риск убытков, задержка закрытия</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Множество источников данных</td><td>5 юрлиц × разные базы</td><td>Трудозатраты на P&amp;L</td></tr><tr><td>Ручная категоризация расходов</td><td>Нет автоматизации</td><td>Ошибки, время</td></tr><tr><td>Invoice Tracker на Google Таблицах</td><td>Нет нормальной системы</td><td>Сбои при коллективной работе</td></tr><tr><td>Ошибки клиентов в платёжках</td><td>Человеческий фактор</td><td>Ручное разнесение</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-FIN-01</td><td>Софт для CF-управления</td><td>Автоматизация платёжного календаря</td><td>Сокращение времени, снижение рисков</td><td>HIGH</td></tr><tr><td>AUTO-FIN-02</td><td>Сток-контроль авиабилетов</td><td>Автоматический учёт билетов в 1С</td><td>Исключение убытков</td><td>HIGH</td></tr><tr><td>AUTO-FIN-03</td><td>Power BI для отчётности</td><td>Автоматические дашборды</td><td>Real-time данные</td><td>MEDIUM</td></tr><tr><td>AUTO-FIN-04</td><td>Замена Invoice Tracker</td><td>Нормальная система учёта счетов</td><td>Устранение сбоев</td><td>MEDIUM</td></tr><tr><td>AUTO-FIN-05</td><td>Автокатегоризация расходов</td><td>Правила разнесения по статьям</td><td>-50% ручной работы</td><td>MEDIUM</td></tr></tbody></table>\n<h3 class=\"doch2\">11. Взаимодействие с другими процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Процесс</th><th>Тип взаимодействия</th><th>Точка передачи</th></tr></thead><tbody><tr><td>BP-01 (Заявка)</td><td>Оплата ← Клиент</td><td>Разнесение в САМО</td></tr><tr><td>BP-01 (Заявка)</td><td>Оплата → Поставщик</td><td>Invoice Tracker</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Счета партнёрам</td><td>Invoice Tracker</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Оплата подрядчикам</td><td>Invoice Tracker</td></tr><tr><td>BP-03 (MICE)</td><td>Счета корп. клиентам</td><td>1С</td></tr><tr><td>BP-03 (MICE)</td><td>Оплата поставщикам</td><td>Invoice Tracker</td></tr><tr><td>Все процессы</td><td>Контроль маржинальности</td><td>P&amp;L отчёт</td></tr></tbody></table>\n<h3 class=\"doch2\">12. Рекомендации</h3>\n<h4 class=\"doch3\">Немедленные действия</h4>\n<p class=\"docp\">1. Внедрить сток-контроль авиабилетов — критично для снижения убытков</p>\n<p class=\"docp\">2. Заменить Invoice Tracker на нормальную систему с контролем доступа</p>\n<p class=\"docp\">3. Автоматизировать категоризацию расходов через правила</p>\n<h4 class=\"doch3\">Среднесрочные</h4>\n<p class=\"docp\">1. Внедрить специализированный софт для Cash Flow управления</p>\n<p class=\"docp\">2. Создать дашборды в Power BI для оперативной аналитики</p>\n<p class=\"docp\">3. Унифицировать формат данных между юрлицами</p>\n<h4 class=\"doch3\">Долгосрочные</h4>\n<p class=\"docp\">1. Рассмотреть переход на единую ERP-систему</p>\n<p class=\"docp\">2. Интеграция всех клиент-банков через API</p>\n<p class=\"docp\">3. Автоматическое формирование P&amp;L без ручной обработки</p>\n<h3 class=\"doch2\">13. Контрольные точки финансового цикла</h3>\n<table class=\"doctbl\"><thead><tr><th>Дата</th><th>Действие</th><th>Ответственный</th></tr></thead><tbody><tr><td>Ежедневно, 08:00</td><td>Отчёт СВК об остатках</td><td>Банковская группа</td></tr><tr><td>Ежедневно, каждый час</td><td>Разнесение платежей</td><td>Банковская группа</td></tr><tr><td>Ежедневно, 14:00</td><td>Платежи поставщикам</td><td>Банковская группа</td></tr><tr><td>Еженедельно</td><td>Контроль дебиторки</td><td>Финансовый отдел</td></tr><tr><td>8-10 число</td><td>P&amp;L за месяц</td><td>Финансовый отдел</td></tr><tr><td>15-20 число</td><td>Закрытие периода в 1С</td><td>Бухгалтерия</td></tr><tr><td>Ежеквартально</td><td>Отчёт в ЦБ</td><td>Финансовый отдел</td></tr></tbody></table>\n<h3 class=\"doch2\">14. Связанные документы</h3>\n<p class=\"docp\">• L1_json/Назарикова_Финансовый_департамент.json — Анкета владельца</p>\n<p class=\"docp\">• L2_json/42._Фомичев_Финансовый_отдел.json — Анкета финансового отдела</p>\n<p class=\"docp\">• L2_json/45._Соколова_Бухгалтерия_.json — Анкета бухгалтерии</p>\n<p class=\"docp\">• L2_json/43._Лебедева_Финансовый_отдел_Банковская_группа.json — Анкета банковской группы</p>\n<p class=\"docp\">• L2_json/44._Мигунова_Финансовый_отдел_Группа_по_расчетам_с_иностранными_поставщиками.json — Анкета валютных платежей</p>\n<p class=\"docp\">• docs/2.1_department_interactions.json — Взаимодействия с Финансами</p>","05":"<h2 class=\"doch1\">BP-05: Формирование турпродукта</h2>\n<p class=\"docp\">Версия: 1.0</p>\n<p class=\"docp\">Дата: 2026-02-17</p>\n<p class=\"docp\">Статус: Описан</p>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-05</td></tr><tr><td>Название</td><td>Формирование турпродукта</td></tr><tr><td>Владелец</td><td>Баландина О.А. (Департамент операционных доходов)</td></tr><tr><td>Критичность</td><td>КРИТИЧЕСКИЙ</td></tr><tr><td>Влияние</td><td>Основа всех продаж — без продукта нет выручки</td></tr><tr><td>Частота</td><td>Непрерывно (сезонные пики: март-апрель, сентябрь-октябрь)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Структура департамента</h3>\n<table class=\"doctbl\"><thead><tr><th>Подразделение</th><th>Руководитель</th><th>Штат</th><th>Функции</th></tr></thead><tbody><tr><td>Группы стран (5 групп)</td><td>Цехович, Андреева, Писцова, Черепова</td><td>~12</td><td>Контрактинг, переговоры с DMC, продуктовый план</td></tr><tr><td>Группа тарификации</td><td>Ильясова Л.Е.</td><td>5</td><td>Расчёт и публикация цен, контроль ошибок</td></tr><tr><td>Чартерная группа</td><td>Зайцев</td><td>4</td><td>Блоки мест, чартерные программы</td></tr><tr><td>ИТОГО</td><td>—</td><td>21</td><td>—</td></tr></tbody></table>\n<h3 class=\"doch2\">3. Ключевые цели процесса</h3>\n<p class=\"docp\">1. Формирование продуктового портфеля — создание конкурентных туров по всем направлениям</p>\n<p class=\"docp\">2. Обеспечение жизнедеятельности продукта — мониторинг конверсии, актуализация цен</p>\n<p class=\"docp\">3. Увеличение операционных доходов — работа с наценкой, incentives, kick-backs</p>\n<p class=\"docp\">4. Конкурентное ценообразование — поддержание цен на уровне или ниже конкурентов</p>\n<h3 class=\"doch2\">4. Основные подпроцессы</h3>\n<h4 class=\"doch3\">4.1. Формирование продуктового плана</h4>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса</td></tr><tr><td>────►</td><td>Направление потока</td></tr><tr><td>◄──</td><td>Входящая информация</td></tr></tbody></table>\n<pre class=\"docp\">    ТРИГГЕР: Стратегическая сессия / Запрос рынка / Новый поставщик\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │                   ГРУППЫ СТРАН                      │◄── Региональные офисы\n    │                                                     │    (обратная связь)\n    │  1. Сбор продуктовых возможностей                   │\n    │  2. Анализ рынка                                    │\n    │  3. Переговоры с DMC                                │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │                  ПРОДУКТОВЫЙ ПЛАН                   │\n    │  - Направления                                      │\n    │  - Отели                                            │\n    │  - Сезонность                                       │\n    │  - Бюджет                                           │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │              СОГЛАСОВАНИЕ С РУКОВОДСТВОМ            │\n    └─────────────────────────────────────────────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Длительный сбор информации с региональных офисов (несистематизированные данные)</p>\n<p class=\"docp\">• Коммуникационные разрывы между отделами</p>\n<p class=\"docp\">• Опора на непроверенные данные регионов</p>\n<h4 class=\"doch3\">4.2. Ценообразование (7 этапов)</h4>\n<pre class=\"docp\">    ТРИГГЕР: Задача в Битрикс от группы стран\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 1: Постановка задачи                          │\n    │  Группа стран - Руководитель тарификации            │\n    │  Формат: шаблон в Битрикс с данными продукта        │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 2: Первичный анализ                           │\n    │  Руководитель тарификации проверяет полноту данных  │\n    │  ! Если данных &lt;80% - возврат на доработку          │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 3: Делегирование и оценка сроков              │\n    │  Менеджер анализирует задачу, уточняет детали       │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 4: Расчёт цен                                 │\n    │  Excel - САМО-тур                                   │\n    │  ! УЗКОЕ МЕСТО: 5 человек на ВСЕ цены компании      │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 5: Проверка публикации                        │\n    │  Контроль корректности расчётов на сайте            │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 6: Уведомление продуктолога                   │\n    │  Закрытие задачи в CRM                              │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 7: Контроль отдела продукта                   │\n    │  ! Может быть пропущен - ошибки не выявляются       │\n    └─────────────────────────────────────────────────────┘</pre>\n<p class=\"docp\">Время выполнения: 2-5 дней (целевое), 2-5 недель (фактическое)</p>\n<h4 class=\"doch3\">4.3. Ценообразование чартерного продукта</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Чартерная группа + Группа тарификации</td></tr><tr><td>Системы</td><td>Excel, САМО-тур, Агрегаторы</td></tr><tr><td>Частота</td><td>Ежедневно (динамическая корректировка)</td></tr><tr><td>Критичность</td><td>КРИТИЧЕСКАЯ</td></tr></tbody></table>\n<p class=\"docp\">Процесс:</p>\n<p class=\"docp\">1. Мониторинг загрузки рейсов</p>\n<p class=\"docp\">2. Анализ конкурентов (автоматические отчёты)</p>\n<p class=\"docp\">3. Ручная корректировка цен</p>\n<p class=\"docp\">4. Публикация обновлённых цен</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Полностью ручной процесс корректировки</p>\n<p class=\"docp\">• Задержки в реакции на рынок</p>\n<p class=\"docp\">• Риск «горения» мест (минимизация чистого горения)</p>\n<h4 class=\"doch3\">4.4. Контроль жизнедеятельности продукта</h4>\n<pre class=\"docp\">    ТРИГГЕР: Ежеквартальный отчёт / Запрос руководителя\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  1. Выгрузка данных по продукту (API Space Travel)  │\n    │     - Название тура                                 │\n    │     - Дата публикации                               │\n    │     - Количество заявок                             │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  2. Фильтрация (туры старше 6 месяцев)              │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  3. Ручная аналитика по странам/направлениям        │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  4. Сводные таблицы и презентация                   │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  5. Презентация на собрании департамента            │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  6. Решения от групп стран: корректировка/удаление  │\n    │     ! Задержки в принятии решений                   │\n    └─────────────────────────────────────────────────────┘</pre>\n<h4 class=\"doch3\">4.5. Выявление и устранение ошибок</h4>\n<p class=\"docp\">Типы ошибок:</p>\n<table class=\"doctbl\"><thead><tr><th>Тип</th><th>Источник</th><th>Процесс устранения</th></tr></thead><tbody><tr><td>Тарификационная</td><td>Неоднозначные формулировки, ошибка в Excel</td><td>Группа тарификации → исправление → анализ причин</td></tr><tr><td>Техническая</td><td>Ошибка САМО-софт, интеграции</td><td>Группа тарификации → IT → САМО-софт</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм:</p>\n<p class=\"docp\">1. Поступление задачи (Битрикс/почта) с описанием ошибки</p>\n<p class=\"docp\">2. Определение типа ошибки</p>\n<p class=\"docp\">3. Исправление / делегирование в IT</p>\n<p class=\"docp\">4. Анализ затронутых бронирований</p>\n<p class=\"docp\">5. Минимизация финансовых потерь (подключение групп стран)</p>\n<p class=\"docp\">6. Отчёт руководителю</p>\n<h3 class=\"doch2\">5. Системы и интеграции</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль</th><th>Интеграция</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Основная база продуктов</td><td>← Excel (расчёты)</td></tr><tr><td>САМО-Incoming</td><td>Прямой контрактинг</td><td>← САМО-тур</td></tr><tr><td>Excel</td><td>Расчёт цен, чек-листы</td><td>→ САМО-тур</td></tr><tr><td>Битрикс24</td><td>Задачи, коммуникации</td><td>↔ САМО-тур</td></tr><tr><td>Сайт spacetravel.ru</td><td>Публикация туров</td><td>← САМО-тур</td></tr></tbody></table>\n<h3 class=\"doch2\">6. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Время публикации продукта</td><td>≤5 дней</td><td>2-5 недель</td><td>Битрикс (задачи)</td></tr><tr><td>Конверсия новых туров</td><td>≥10%</td><td>Нет данных</td><td>Отчёт по API</td></tr><tr><td>Ошибки в расчётах</td><td>≤1%</td><td>~3-5%</td><td>Ручной подсчёт</td></tr><tr><td>Туры без конверсии (&gt;6 мес)</td><td>≤20%</td><td>~30%</td><td>Отчёт конверсии</td></tr><tr><td>Время устранения ошибок</td><td>≤4 часа</td><td>~1-2 дня</td><td>Битрикс</td></tr></tbody></table>\n<h3 class=\"doch2\">7. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Группа тарификации — узкое место</td><td>5 человек на ВСЕ цены компании</td><td>Задержки публикации 2-5 недель</td></tr><tr><td>Ручное ценообразование чартеров</td><td>Нет автоматизации</td><td>Потеря маржи, горение мест</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Длительный сбор информации</td><td>Несистематизированные данные регионов</td><td>Затягивание планирования</td></tr><tr><td>Троение гостиниц от динамических поставщиков</td><td>Нет автоматического сопоставления</td><td>Ручная обработка</td></tr><tr><td>Отсутствие учёта обращений</td><td>Обращения по почте, не в CRM</td><td>Нет данных о нагрузке</td></tr></tbody></table>\n<h3 class=\"doch2\">8. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-PROD-01</td><td>Динамическое ценообразование чартеров</td><td>Автоматическая корректировка цен на основе загрузки и конкурентов</td><td>Снижение горения на 30%, рост маржи</td><td>CRITICAL</td></tr><tr><td>AUTO-PROD-02</td><td>Автоматическая ревизия туров</td><td>Удаление туров без конверсии за период</td><td>-50% ручной работы, чистый каталог</td><td>HIGH</td></tr><tr><td>AUTO-PROD-03</td><td>Сопоставление гостиниц</td><td>Автоматический матчинг отелей от разных поставщиков</td><td>Устранение дубликатов</td><td>HIGH</td></tr><tr><td>AUTO-PROD-04</td><td>Мониторинг сроков цен</td><td>Автоуведомления о необходимости пролонгации</td><td>Предотвращение пустых сезонов</td><td>HIGH</td></tr><tr><td>AUTO-PROD-05</td><td>Парсинг обращений из почты</td><td>Автоматическое создание задач в Битрикс</td><td>Учёт нагрузки, метрики</td><td>MEDIUM</td></tr><tr><td>AUTO-PROD-06</td><td>Парсинг конкурентов</td><td>Расширение автоматического анализа</td><td>Быстрая реакция на рынок</td><td>MEDIUM</td></tr><tr><td>AUTO-PROD-07</td><td>Проверка ошибок роботом</td><td>Автоматический контроль расчётов</td><td>Снижение ошибок на 50%</td><td>MEDIUM</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Взаимодействие с другими процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Процесс</th><th>Тип взаимодействия</th><th>Точка передачи</th></tr></thead><tbody><tr><td>BP-01 (Заявка)</td><td>Опубликованный продукт используется для продаж</td><td>САМО-тур → Сайт</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Новые продукты требуют продвижения</td><td>Задача в Битрикс</td></tr><tr><td>BP-04 (Финансы)</td><td>Данные о прибыли по направлениям для анализа</td><td>Запрос в Финансы</td></tr><tr><td>BP-06 (Поддержка)</td><td>Ошибки на сайте поступают через поддержку</td><td>Задача/почта</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Рекомендации</h3>\n<h4 class=\"doch3\">Немедленные действия</h4>\n<p class=\"docp\">1. Внедрить динамическое ценообразование чартеров — критично для снижения убытков</p>\n<p class=\"docp\">2. Автоматизировать мониторинг сроков действия цен — предотвращение пустых сезонов</p>\n<p class=\"docp\">3. Настроить парсинг обращений из почты — получить метрики по нагрузке</p>\n<h4 class=\"doch3\">Среднесрочные</h4>\n<p class=\"docp\">1. Автоматическое сопоставление гостиниц от разных поставщиков</p>\n<p class=\"docp\">2. Робот для проверки ошибок в расчётах</p>\n<p class=\"docp\">3. Автоматическая ревизия туров без конверсии</p>\n<h4 class=\"doch3\">Долгосрочные</h4>\n<p class=\"docp\">1. Единая система управления продуктом с интеграцией всех поставщиков</p>\n<p class=\"docp\">2. Предиктивная аналитика спроса для планирования продукта</p>\n<p class=\"docp\">3. Автоматическое формирование продуктового плана на основе данных</p>\n<h3 class=\"doch2\">11. Связанные документы</h3>\n<p class=\"docp\">• L1_json/Баландина_Департамент_по_операционным_доходам.json — Анкета владельца</p>\n<p class=\"docp\">• L2_json/18._Ильясова_Группа_тарификации.json — Анкета группы тарификации</p>\n<p class=\"docp\">• L2_json/19._Зайцев_Чартерная_группа.json — Анкета чартерной группы</p>\n<p class=\"docp\">• L2_json/15._Цехович_Отдел_продукта_группа_стран_Экзотика.json — Пример группы стран</p>\n<p class=\"docp\">• docs/2.2_critical_business_processes.json — Критические процессы</p>\n<p class=\"docp\">• processes/core_processes_list.md — Реестр сквозных процессов</p>","06":"<h2 class=\"doch1\">BP-06: Клиентская поддержка и маршрутизация</h2>\n<p class=\"docp\">Версия: 1.0</p>\n<p class=\"docp\">Дата: 2026-02-17</p>\n<p class=\"docp\">Статус: Описан</p>\n<h3 class=\"doch2\">1. Общая информация</h3>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>ID процесса</td><td>BP-06</td></tr><tr><td>Название</td><td>Клиентская поддержка и маршрутизация</td></tr><tr><td>Владелец</td><td>Акопова А.В. (Управление клиентского сервиса)</td></tr><tr><td>Критичность</td><td>ВЫСОКИЙ</td></tr><tr><td>Влияние</td><td>Удержание клиентов, первое впечатление, снижение убытков</td></tr><tr><td>Частота</td><td>Непрерывно (24/7)</td></tr></tbody></table>\n<h3 class=\"doch2\">2. Структура управления</h3>\n<table class=\"doctbl\"><thead><tr><th>Подразделение</th><th>Руководитель</th><th>Штат</th><th>Режим работы</th></tr></thead><tbody><tr><td>Отдел клиентской поддержки</td><td>Фролова А.Г.</td><td>9</td><td>Рабочие дни 09:00-18:00</td></tr><tr><td>Отдел круглосуточной работы с клиентами</td><td>Акопова А.В.</td><td>4 (в смену 1-2)</td><td>24/7/365</td></tr><tr><td>ИТОГО</td><td>—</td><td>13</td><td>—</td></tr></tbody></table>\n<h3 class=\"doch2\">3. Ключевые цели процесса</h3>\n<p class=\"docp\">1. Клиентоориентированный сервис — высокое качество обслуживания (консультации, поддержка)</p>\n<p class=\"docp\">2. Оперативность — минимальное время отклика и решения обращений</p>\n<p class=\"docp\">3. Лояльность клиентов — сохранение долгосрочного сотрудничества</p>\n<p class=\"docp\">4. Минимизация убытков — быстрое решение проблем в поездке</p>\n<h3 class=\"doch2\">4. Основные подпроцессы</h3>\n<h4 class=\"doch3\">4.1. Обработка входящих звонков</h4>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса</td></tr><tr><td>────►</td><td>Направление потока</td></tr><tr><td>├────</td><td>Условное ветвление</td></tr><tr><td>!</td><td>Проблема / предупреждение</td></tr></tbody></table>\n<pre class=\"docp\">    ТРИГГЕР: Входящий звонок на +7 (495) 989-20-00 / 8 (800) 777-32-64\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 1: Определение причины звонка                 │\n    │  Сотрудник выясняет, с чем обращается клиент/агент  │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n            ┌─────────────────┴─────────────────┐\n            ▼                                   ▼\n    ┌───────────────────┐       ┌───────────────────────────────┐\n    │ 2а. РЕШЕНИЕ       │       │ 2б. МАРШРУТИЗАЦИЯ             │\n    │ ВОПРОСА           │       │                               │\n    │ Простой вопрос    │       │ Определение отдела:           │\n    │ решается сразу    │       │ - Отдел продаж (28 направл.)  │\n    │                   │       │ - ВИП отдел                   │\n    │                   │       │ - Транспортный отдел          │\n    │                   │       │ - Групповое бронирование      │\n    │                   │       │ - Региональные офисы (8 гор.) │\n    │                   │       │ - Въездной туризм             │\n    │                   │       │ - Бронирование                │\n    └─────────┬─────────┘       └───────────────┬───────────────┘\n              │                                 │\n              └─────────────────┬───────────────┘\n                                ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 3: Передача вызова / Завершение               │\n    │  ! ПРОБЛЕМА: Долгое ожидание ответа Отдела продаж   │\n    │    - Пропуск других вызовов                         │\n    └─────────────────────────────────────────────────────┘</pre>\n<p class=\"docp\">SLA: Приём звонка ≤30 секунд</p>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Ошибки в определении городов (Вологда/Волгоград, Дзержинск/Дзержинский)</p>\n<p class=\"docp\">• До Отдела продаж затруднительно дозвониться</p>\n<p class=\"docp\">• Пропуск других вызовов при ожидании соединения</p>\n<h4 class=\"doch3\">4.2. Обработка обращений по e-mail / CRM</h4>\n<pre class=\"docp\">    ТРИГГЕР: Входящее письмо на sales@spacetravel.ru / форма на сайте\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 1: Определение причины обращения              │\n    │  Категоризация: запрос на расчёт / информация / жалоба│\n    └─────────────────────────┬───────────────────────────┘\n                              │\n            ┌─────────────────┴─────────────────┐\n            ▼                                   ▼\n    ┌───────────────────┐       ┌───────────────────────────────┐\n    │ 2а. РЕШЕНИЕ       │       │ 2б. ПЕРЕДАЧА                  │\n    │ САМОСТОЯТЕЛЬНО    │       │                               │\n    │ Простые вопросы   │       │ 28 потенциальных получателей: │\n    │ по шаблонам       │       │ - HR, IT, Реклама, Контент    │\n    │                   │       │ - Продукт, Тарификация, Чартер│\n    │                   │       │ - Продажи, ВИП, Транспорт     │\n    │                   │       │ - Финансы, Бухгалтерия, КАМы  │\n    │                   │       │ - 8 региональных офисов       │\n    │                   │       │ ! Не все почты в Битрикс      │\n    └─────────┬─────────┘       └───────────────┬───────────────┘\n              │                                 │\n              └─────────────────┬───────────────┘\n                                ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 3: Ответ на письмо                            │\n    │  Информация о передаче запроса в работу             │\n    │  ! ПРОБЛЕМА: Замедление в пиковые часы              │\n    └─────────────────────────────────────────────────────┘</pre>\n<p class=\"docp\">SLA: Первый ответ ≤1 час</p>\n<h4 class=\"doch3\">4.3. Обработка запросов на расчёт (сделки)</h4>\n<pre class=\"docp\">    ТРИГГЕР: Письмо на sales / форма на сайте с запросом расчёта\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 1: Определение типа запроса                   │\n    │  Расчёт тура / Информационный запрос                │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 2: Определение курирующего офиса/отдела       │\n    │  ! ПРОБЛЕМА: Не все почты есть в САМО/Битрикс       │\n    │    - Поиск в интернете / запрос ИНН                 │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  2а. Выбор сотрудника (для регионов/нерабочее)      │\n    │  ! ПРОБЛЕМА: Отсутствия в разных системах:          │\n    │    - Часть в Битрикс                                │\n    │    - Часть в Google Таблице                         │\n    │    - Часть только в «Моя команда»                   │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 3: Оформление сделки в Битрикс                │\n    │  ! ПРОБЛЕМА: Битрикс не всегда работает корректно   │\n    │  ! ПРОБЛЕМА: Устаревшие списки направлений          │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  ЭТАП 4: Ответ на письмо о передаче в работу        │\n    └─────────────────────────────────────────────────────┘</pre>\n<p class=\"docp\">SLA: Маршрутизация ≤15 минут</p>\n<h4 class=\"doch3\">4.4. Круглосуточная поддержка (24/7)</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел круглосуточной работы с клиентами</td></tr><tr><td>Системы</td><td>Телефон, WhatsApp, САМО-тур, Битрикс24</td></tr><tr><td>Режим</td><td>24/7/365</td></tr><tr><td>Цель</td><td>Минимизация убытков компании, решение проблем в поездке</td></tr></tbody></table>\n<p class=\"docp\">Основные сценарии:</p>\n<table class=\"doctbl\"><thead><tr><th>Сценарий</th><th>Процесс</th></tr></thead><tbody><tr><td>Проблема с трансфером</td><td>Связь с DMC → Поиск решения → Контроль встречи</td></tr><tr><td>Проблема с отелем</td><td>Связь с отелем/DMC → Эскалация при необходимости</td></tr><tr><td>Запрос данных от DMC</td><td>Поиск в САМО → Уточнение у агента → Передача DMC</td></tr><tr><td>Неявка туристов</td><td>Фиксация в САМО → Уведомление менеджера по заявке</td></tr><tr><td>MICE-обращение (корп. клиент)</td><td>Идентификация по тегу → Приоритетная обработка → Передача в Отдел группового бронирования (утро)</td></tr></tbody></table>\n<p class=\"docp\">Алгоритм работы с обращениями:</p>\n<pre class=\"docp\">    ТРИГГЕР: Обращение клиента (телефон/мессенджер/почта)\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  1. Приём обращения, уведомление клиента            │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  2. Создание сделки в Битрикс «Контроль поездки»    │\n    │  - Номер заявки САМО                                │\n    │  - Тема обращения                                   │\n    │  - Суть проблемы и действия                         │\n    │  - Контакты клиента                                 │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  3. Связь с партнёром (WhatsApp / телефон)          │\n    │  ! Задержки: разница во времени, скорость DMC       │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  4. Согласование решения (при необходимости)        │\n    │  Подключение: руководители направлений, финансы     │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  5. Информирование клиента о ходе решения           │\n    │  Постоянная связь до закрытия вопроса               │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  6. Закрытие сделки / Передача следующей смене      │\n    └─────────────────────────────────────────────────────┘</pre>\n<h4 class=\"doch3\">4.5. Специальные процессы</h4>\n<h4 class=\"doch3\">Регистрация нового агента (6 этапов)</h4>\n<pre class=\"docp\">    ТРИГГЕР: Отбивка от САМО на sales@ о новой регистрации\n                         │\n                         ▼\n    1. Определение региона агентства\n                         │\n                         ├──── Регион ────► Передача КАМу (завершён)\n                         │\n                         ▼\n    2. Приведение карточки САМО к единому виду\n                         │\n                         ▼\n    3. Отправка пароля\n                         │\n                         ▼\n    4. Отправка приветственного письма\n                         │\n                         ▼\n    5. Заполнение реестра договоров (Google Таблица)\n                         │\n                         ▼\n    6. Заполнение карточки в Битрикс\n       ! ПРОБЛЕМА: Ручной перенос данных САМО - Битрикс</pre>\n<h4 class=\"doch3\">Обработка гарантийных писем (ГП)</h4>\n<p class=\"docp\">1. Проверка типовой формы заявления</p>\n<p class=\"docp\">2. Проверка заявки-гаранта</p>\n<p class=\"docp\">3. Подтверждение / Отказ + подключение КАМа</p>\n<p class=\"docp\">Проблема: КАМы иногда согласовывают ГП напрямую → двойная работа</p>\n<h4 class=\"doch3\">Обработка заявлений на перенос и возврат</h4>\n<p class=\"docp\">1. Проверка данных в САМО-туре</p>\n<p class=\"docp\">2. Проверка в инвойс-трекере</p>\n<p class=\"docp\">3. Внесение в инвойс-трекер (СЗ или СБ)</p>\n<p class=\"docp\">4. Передача в бухгалтерию</p>\n<p class=\"docp\">Ошибки: Путаница в способах оплаты, внесение в неверный трекер</p>\n<h4 class=\"doch3\">4.6. Поддержка MICE-клиентов (корпоративный сегмент)</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Значение</th></tr></thead><tbody><tr><td>Исполнитель</td><td>Отдел круглосуточной работы с клиентами</td></tr><tr><td>Связанный процесс</td><td>BP-03 (MICE и корпоративное обслуживание)</td></tr><tr><td>Режим</td><td>24/7 (в нерабочее время Отдела группового бронирования)</td></tr><tr><td>Критичность</td><td>КРИТИЧНО для удержания корпоративных клиентов</td></tr></tbody></table>\n<p class=\"docp\">Почему это критично:</p>\n<p class=\"docp\">• Корпоративные клиенты (B2B) составляют ~10% выручки и имеют высокие ожидания по уровню сервиса</p>\n<p class=\"docp\">• MICE-мероприятия (конференции, групповые поездки) часто проходят в нестандартное время</p>\n<p class=\"docp\">• Потеря доверия корпоративного клиента = потеря долгосрочного контракта (средний чек в 5-10 раз выше B2C)</p>\n<p class=\"docp\">• Отсутствие 24/7 поддержки — конкурентный недостаток на рынке MICE</p>\n<p class=\"docp\">Алгоритм обработки MICE-обращений:</p>\n<pre class=\"docp\">    ТРИГГЕР: Обращение от MICE-клиента (телефон / мессенджер / email)\n                         │\n                         ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  1. Идентификация MICE-клиента                      │\n    │  - Проверка тега «MICE» / «Корпоративный» в Битрикс │\n    │  - Проверка номера заявки в САМО (тип = групповая)  │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  2. Создание сделки «MICE-поддержка 24/7» в Битрикс │\n    │  - Номер заявки САМО                                │\n    │  - Название компании-клиента                        │\n    │  - Суть обращения                                   │\n    │  - Контакты представителя                           │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  3. Приоритетная обработка                          │\n    │  - SLA: ответ &lt;=15 мин, решение &lt;=2 часа            │\n    │  - Связь с DMC / партнёром / отелем                 │\n    │  - При необходимости: эскалация на руководителя     │\n    └─────────────────────────┬───────────────────────────┘\n                              │\n                              ▼\n    ┌─────────────────────────────────────────────────────┐\n    │  4. Передача в Отдел группового бронирования        │\n    │  - Утром следующего рабочего дня                    │\n    │  - Полная информация о проблеме и действиях         │\n    │  - Статус решения                                   │\n    └─────────────────────────────────────────────────────┘</pre>\n<p class=\"docp\">Типичные сценарии MICE:</p>\n<table class=\"doctbl\"><thead><tr><th>Сценарий</th><th>Действия</th></tr></thead><tbody><tr><td>Проблемы с групповым трансфером</td><td>Связь с DMC → Организация замены → Контроль прибытия</td></tr><tr><td>Изменение программы мероприятия</td><td>Согласование с партнёром → Информирование клиента</td></tr><tr><td>Проблемы с конференц-залом</td><td>Связь с отелем → Поиск альтернативы</td></tr><tr><td>Медицинские ситуации участников</td><td>Координация медпомощи → Информирование организатора</td></tr><tr><td>Отмена рейса группы</td><td>Поиск альтернативного рейса → Координация трансферов</td></tr></tbody></table>\n<p class=\"docp\">SLA для MICE-клиентов:</p>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th></tr></thead><tbody><tr><td>Время первого ответа</td><td>≤15 минут</td></tr><tr><td>Время решения проблемы</td><td>≤2 часа</td></tr><tr><td>Информирование клиента о статусе</td><td>Каждые 30 минут</td></tr></tbody></table>\n<h3 class=\"doch2\">5. Системы и интеграции</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Роль</th><th>Интеграция</th></tr></thead><tbody><tr><td>UIS (телефония)</td><td>Приём звонков</td><td>→ Битрикс</td></tr><tr><td>Битрикс24</td><td>CRM, сделки, чаты</td><td>↔ САМО-тур</td></tr><tr><td>САМО-тур</td><td>Данные по заявкам, агентам</td><td>↔ Битрикс</td></tr><tr><td>Outlook</td><td>Почта sales@</td><td>→ Битрикс (частично)</td></tr><tr><td>WhatsApp</td><td>Связь с DMC, клиентами</td><td>Ручной режим</td></tr><tr><td>Google Таблицы</td><td>Реестр договоров, график работы</td><td>Ручной режим</td></tr><tr><td>Моя команда</td><td>Учёт отсутствий</td><td>Ручной режим</td></tr></tbody></table>\n<h3 class=\"doch2\">6. KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Целевое значение</th><th>Текущее</th><th>Метод измерения</th></tr></thead><tbody><tr><td>Время приёма звонка</td><td>≤30 сек</td><td>~30 сек</td><td>UIS</td></tr><tr><td>Время первого ответа (email)</td><td>≤1 час</td><td>~1-2 часа</td><td>Ручной замер</td></tr><tr><td>Время маршрутизации</td><td>≤5 мин</td><td>~15 мин</td><td>Ручной замер</td></tr><tr><td>Пропущенные звонки</td><td>≤5%</td><td>~8-10%</td><td>UIS</td></tr><tr><td>Время решения проблемы (24/7)</td><td>≤2 часа</td><td>Варьируется</td><td>Битрикс</td></tr><tr><td>Ошибки маршрутизации</td><td>≤2%</td><td>~5%</td><td>Обратная связь</td></tr></tbody></table>\n<h3 class=\"doch2\">7. Риски и проблемы</h3>\n<h4 class=\"doch3\">Критические</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th><th>Статус</th></tr></thead><tbody><tr><td>28 направлений маршрутизации вручную</td><td>Нет автоматической маршрутизации</td><td>Задержки, ошибки</td><td>ОТКРЫТО</td></tr><tr><td>Связь MICE с 24/7 поддержкой</td><td>Ранее: процесс не выстроен</td><td>Потеря корп. клиентов</td><td>РЕШАЕТСЯ (см. раздел 4.6)</td></tr></tbody></table>\n<h4 class=\"doch3\">Высокие</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Долгое ожидание ответа Отдела продаж</td><td>Высокая загрузка</td><td>Пропуск звонков</td></tr><tr><td>Отсутствия сотрудников в разных системах</td><td>Нет единой платформы</td><td>Задержки маршрутизации</td></tr><tr><td>Не все агенты в САМО/Битрикс</td><td>Неполные данные</td><td>Поиск в интернете</td></tr><tr><td>Устаревшие списки направлений</td><td>Не обновляются</td><td>Неверная маршрутизация</td></tr><tr><td>Ручной перенос данных САМО → Битрикс</td><td>Нет интеграции</td><td>Дублирование работы</td></tr></tbody></table>\n<h4 class=\"doch3\">Средние</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема</th><th>Причина</th><th>Влияние</th></tr></thead><tbody><tr><td>Функционал ГП, заявлений не по профилю</td><td>Исторически сложилось</td><td>Отвлечение от основных задач</td></tr><tr><td>Большое время на прослушку звонков</td><td>Ручной контроль качества</td><td>Нехватка времени руководителя</td></tr></tbody></table>\n<h3 class=\"doch2\">8. Точки автоматизации</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Название</th><th>Описание</th><th>Ожидаемый эффект</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-SUP-01</td><td>Автоматическая маршрутизация по региону</td><td>Привязка к ФО → автораспределение сделок</td><td>-50% времени маршрутизации</td><td>CRITICAL</td></tr><tr><td>AUTO-SUP-02</td><td>Переадресация регионов по номеру телефона</td><td>Автопереключение на региональные офисы</td><td>Разгрузка отдела</td><td>HIGH</td></tr><tr><td>AUTO-SUP-03</td><td>ИИ-анализ качества звонков</td><td>Робот прослушивает и анализирует звонки (см. детали ниже)</td><td>Экономия времени руководителя</td><td>HIGH</td></tr><tr><td>AUTO-SUP-04</td><td>Единая платформа учёта отсутствий</td><td>Все отсутствия в одной системе</td><td>Ускорение выбора сотрудника</td><td>HIGH</td></tr><tr><td>AUTO-SUP-05</td><td>Синхронизация САМО → Битрикс</td><td>Автоматическое создание карточек</td><td>Устранение дублирования</td><td>MEDIUM</td></tr><tr><td>AUTO-SUP-06</td><td>Шаблоны ответов в Outlook</td><td>Быстрые ответы по шаблонам</td><td>Ускорение ответов</td><td>MEDIUM</td></tr><tr><td>AUTO-SUP-07</td><td>Авто-отправка договоров из САМО</td><td>САМО отправляет договоры и приветствия</td><td>Разгрузка отдела</td><td>MEDIUM</td></tr><tr><td>AUTO-SUP-08</td><td>Автоопределение федерального округа</td><td>В сообщении о регистрации — город + ФО</td><td>Ускорение маршрутизации</td><td>LOW</td></tr><tr><td>AUTO-SUP-09</td><td>Автомаршрутизация MICE на 24/7</td><td>Автоматическое определение MICE-клиента по тегу в Битрикс и приоритизация обращения</td><td>Гарантия 24/7 поддержки корп. клиентов</td><td>CRITICAL</td></tr></tbody></table>\n<h3 class=\"doch2\">8.1. Детализация AUTO-SUP-03: ИИ-анализ качества звонков</h3>\n<h4 class=\"doch3\">Описание</h4>\n<p class=\"docp\">Автоматизированная система анализа качества звонков с использованием ИИ (речевая аналитика) для оценки работы операторов клиентской поддержки и 24/7 службы.</p>\n<h4 class=\"doch3\">Критерии оценки качества звонков</h4>\n<table class=\"doctbl\"><thead><tr><th>Критерий</th><th>Вес</th><th>Описание</th><th>Целевой показатель</th></tr></thead><tbody><tr><td>1. Приветствие</td><td>10%</td><td>Корректное приветствие по стандарту, представление себя и компании</td><td>100% соблюдение</td></tr><tr><td>2. Выявление потребности</td><td>25%</td><td>Уточняющие вопросы, активное слушание, понимание запроса клиента</td><td>≥4 из 5 баллов</td></tr><tr><td>3. Компетентность</td><td>25%</td><td>Знание продукта, корректность информации, владение системами</td><td>≥4 из 5 баллов</td></tr><tr><td>4. Решение вопроса</td><td>20%</td><td>Полнота ответа, предложение альтернатив, FCR (решение с первого обращения)</td><td>FCR ≥70%</td></tr><tr><td>5. Завершение разговора</td><td>10%</td><td>Подведение итогов, уточнение «всё ли понятно», прощание</td><td>100% соблюдение</td></tr><tr><td>6. Время разговора</td><td>10%</td><td>Соответствие нормативам: простой вопрос ≤3 мин, сложный ≤7 мин</td><td>≤норматива</td></tr></tbody></table>\n<h4 class=\"doch3\">Дополнительные параметры анализа</h4>\n<table class=\"doctbl\"><thead><tr><th>Параметр</th><th>Описание</th><th>Красные флаги</th></tr></thead><tbody><tr><td>Тон и эмоции</td><td>Анализ эмоциональной окраски диалога</td><td>Раздражение, повышение голоса</td></tr><tr><td>Скорость речи</td><td>Темп и внятность речи оператора</td><td>Слишком быстро / нечётко</td></tr><tr><td>Паузы и «э-э-э»</td><td>Заминки, неуверенность</td><td>&gt;5 пауз, &gt;3 сек молчания</td></tr><tr><td>Запрещённые фразы</td><td>«Я не знаю», «Это не ко мне», «Перезвоните»</td><td>Любое использование</td></tr><tr><td>Перебивание клиента</td><td>Прерывание клиента на полуслове</td><td>&gt;2 раз за звонок</td></tr></tbody></table>\n<h4 class=\"doch3\">Связь с HR-процессом обучения (BP-07)</h4>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса / система</td></tr><tr><td>────►</td><td>Направление потока данных</td></tr><tr><td>◄────</td><td>Обратная связь</td></tr></tbody></table>\n<pre class=\"docp\">    ┌─────────────────────────────────────────────────────────────┐\n    │               ЦИКЛ УЛУЧШЕНИЯ КАЧЕСТВА                       │\n    └─────────────────────────────────────────────────────────────┘\n\n    BP-06 (Клиентская поддержка)          BP-07 (HR / Обучение)\n    ────────────────────────────          ────────────────────────\n                │                                    │\n    ┌───────────▼───────────┐                        │\n    │     AUTO-SUP-03       │                        │\n    │  ИИ-анализ звонков    │                        │\n    │  - Оценка по критериям│                        │\n    │  - Выявление проблем  │                        │\n    │  - Рейтинг операторов │                        │\n    └───────────┬───────────┘                        │\n                │                                    │\n                │  Еженедельный отчёт                │\n                │  ─────────────────►                │\n                │  - Сводка по критериям             │\n                │  - ТОП-проблемы                    │\n                │  - Сотрудники с низкими оценками   │\n                │                                    │\n                │                ┌───────────────────▼───────────────┐\n                │                │          AUTO-HR-03               │\n                │                │  Интеграция данных качества       │\n                │                │  - Приём отчётов AUTO-SUP-03      │\n                │                │  - Анализ тенденций               │\n                │                │  - Планирование обучения          │\n                │                └───────────────────┬───────────────┘\n                │                                    │\n                │                ┌───────────────────▼───────────────┐\n                │                │  Формирование программы обучения  │\n                │                │  - Групповые тренинги             │\n                │                │  - Индивидуальная работа          │\n                │                │  - Материалы для ИПР              │\n                │                └───────────────────┬───────────────┘\n                │                                    │\n    ┌───────────▼───────────┐                        │\n    │  Проведение обучения  │◄───────────────────────┘\n    │  сотрудников поддержки│\n    └───────────┬───────────┘\n                │\n                │  Через 2-4 недели\n                │\n    ┌───────────▼───────────┐\n    │   Повторная оценка    │\n    │    (AUTO-SUP-03)      │\n    │  Измерение улучшений  │\n    └───────────────────────┘</pre>\n<h4 class=\"doch3\">Формат передачи данных в HR</h4>\n<p class=\"docp\">Еженедельный отчёт (автоматический):</p>\n<table class=\"doctbl\"><thead><tr><th>Раздел</th><th>Содержание</th></tr></thead><tbody><tr><td>Сводка по критериям</td><td>Средние оценки по каждому из 6 критериев за неделю</td></tr><tr><td>ТОП-3 проблемы</td><td>Наиболее частые нарушения / низкие оценки</td></tr><tr><td>Рейтинг сотрудников</td><td>Оценки по каждому оператору (с динамикой)</td></tr><tr><td>Красные флаги</td><td>Сотрудники с оценкой &lt;60% — требуют внимания</td></tr><tr><td>Лучшие практики</td><td>Примеры отличных звонков для обучения</td></tr></tbody></table>\n<p class=\"docp\">Триггеры для немедленного уведомления HR:</p>\n<p class=\"docp\">• Оценка сотрудника &lt;50% по итогам 10+ звонков</p>\n<p class=\"docp\">• 3+ жалобы клиентов на одного сотрудника за неделю</p>\n<p class=\"docp\">• Грубое нарушение стандарта (использование запрещённых фраз, конфликт)</p>\n<h4 class=\"doch3\">Ожидаемый эффект интеграции</h4>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>До интеграции</th><th>После интеграции</th></tr></thead><tbody><tr><td>Время руководителя на контроль</td><td>8-10 ч/неделю</td><td>1-2 ч/неделю</td></tr><tr><td>Охват анализа звонков</td><td>~5%</td><td>100%</td></tr><tr><td>Время выявления проблем</td><td>2-4 недели</td><td>1 неделя</td></tr><tr><td>Целевое обучение</td><td>Общее</td><td>Персонализированное</td></tr></tbody></table>\n<h3 class=\"doch2\">9. Взаимодействие с другими процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Процесс</th><th>Тип взаимодействия</th><th>Точка передачи</th></tr></thead><tbody><tr><td>BP-01 (Заявка)</td><td>Маршрутизация запросов на расчёт → Продажи</td><td>Сделка в Битрикс</td></tr><tr><td>BP-01 (Заявка)</td><td>Проблемы в поездке → 24/7 поддержка</td><td>Звонок/мессенджер</td></tr><tr><td>BP-03 (MICE)</td><td>Поддержка MICE-клиентов 24/7 (см. раздел 4.6)</td><td>Сделка «MICE-поддержка 24/7» в Битрикс</td></tr><tr><td>BP-04 (Финансы)</td><td>Заявления на перенос/возврат → Бухгалтерия</td><td>Инвойс-трекер</td></tr><tr><td>BP-05 (Продукт)</td><td>Ошибки на сайте → Тарификация/IT</td><td>Задача/почта</td></tr><tr><td>BP-07 (HR)</td><td>Данные качества звонков (AUTO-SUP-03) → Обучение</td><td>Еженедельный отчёт → AUTO-HR-03</td></tr></tbody></table>\n<h3 class=\"doch2\">10. Рекомендации</h3>\n<h4 class=\"doch3\">Немедленные действия</h4>\n<p class=\"docp\">1. Настроить связь MICE с 24/7 поддержкой — РЕШАЕТСЯ (см. раздел 4.6)</p>\n<p class=\"docp\">2. Обновить списки направлений и сотрудников — актуализировать маршрутизацию</p>\n<p class=\"docp\">3. Внедрить единую платформу учёта отсутствий — все в одном месте</p>\n<h4 class=\"doch3\">Среднесрочные</h4>\n<p class=\"docp\">1. Автоматическая маршрутизация по региону (привязка к ФО)</p>\n<p class=\"docp\">2. Переадресация звонков регионов по номеру телефона</p>\n<p class=\"docp\">3. ИИ-анализ качества звонков</p>\n<h4 class=\"doch3\">Долгосрочные</h4>\n<p class=\"docp\">1. Полная интеграция САМО ↔ Битрикс (карточки, сделки)</p>\n<p class=\"docp\">2. Омниканальная платформа для всех обращений</p>\n<p class=\"docp\">3. Чат-бот для первичной классификации обращений</p>\n<h3 class=\"doch2\">11. Контрольные точки процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Время</th><th>Канал</th><th>SLA</th><th>Ответственный</th></tr></thead><tbody><tr><td>24/7</td><td>Телефон</td><td>Приём ≤30 сек</td><td>Клиентская поддержка / 24/7</td></tr><tr><td>Рабочее время</td><td>Email</td><td>Ответ ≤1 час</td><td>Клиентская поддержка</td></tr><tr><td>24/7</td><td>Мессенджеры</td><td>Ответ ≤15 мин</td><td>24/7</td></tr><tr><td>При проблеме в туре</td><td>Любой</td><td>Решение ≤2-4 часа</td><td>24/7</td></tr></tbody></table>\n<h3 class=\"doch2\">12. Связанные документы</h3>\n<p class=\"docp\">• L1_json/Акопова_Управление_клиентского_сервиса.json — Анкета владельца</p>\n<p class=\"docp\">• L2_json/33._Фролова_Отдел_клиентской_поддержки.json — Анкета отдела поддержки</p>\n<p class=\"docp\">• L2_json/34._Акопова_Отдел_круглосуточной_работы_с_клиентами.json — Анкета 24/7</p>\n<p class=\"docp\">• docs/2.1_department_interactions.json — Взаимодействия с Клиентским сервисом</p>\n<p class=\"docp\">• processes/core_processes_list.md — Реестр сквозных процессов</p>\n<p class=\"docp\">• processes/BP_03_MICE_Corporate.md — Процесс MICE и корп. обслуживания (связь 24/7)</p>","07":"<h2 class=\"doch1\">BP-07: Управление персоналом (HR)</h2>\n<p class=\"docp\">Тип процесса: Поддерживающий (Supporting)</p>\n<p class=\"docp\">Код: BP-07</p>\n<p class=\"docp\">Владелец: Жигалина Юлия Александровна (L1-04)</p>\n<p class=\"docp\">Критичность: ВЫСОКИЙ</p>\n<p class=\"docp\">Численность: 5 человек</p>\n<h3 class=\"doch2\">Резюме</h3>\n<p class=\"docp\">Процесс управления персоналом обеспечивает все основные процессы компании квалифицированными кадрами. От качества работы HR зависит укомплектованность штата, скорость адаптации новичков, вовлечённость сотрудников и развитие компетенций.</p>\n<p class=\"docp\">Влияние на основные процессы:</p>\n<p class=\"docp\">• BP-01 (Заявки): Качество менеджеров продаж и бронирования</p>\n<p class=\"docp\">• BP-02 (Маркетинг): Наличие специалистов по маркетингу</p>\n<p class=\"docp\">• BP-03 (MICE): Квалификация MICE-менеджеров</p>\n<p class=\"docp\">• BP-05 (Продукт): Компетенции продуктологов и тарификаторов</p>\n<p class=\"docp\">• BP-06 (Поддержка): Качество операторов поддержки</p>\n<h3 class=\"doch2\">Цель процесса</h3>\n<p class=\"docp\">Обеспечить укомплектованность персоналом в соответствии с потребностями бизнеса, снизить текучесть персонала, повысить вовлечённость и развить компетенции сотрудников.</p>\n<h3 class=\"doch2\">Подпроцессы</h3>\n<h4 class=\"doch3\">7.1 Планирование и подбор персонала</h4>\n<p class=\"docp\">Критичность: Высокая</p>\n<p class=\"docp\">Сотрудников задействовано: 2</p>\n<p class=\"docp\">Регламент: Есть</p>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса</td></tr><tr><td>────►</td><td>Направление потока</td></tr></tbody></table>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │   Заявка от   │───►│  Заполнение   │───►│     Поиск     │───►│   Интервью    │───►│   Оффер и     │\n    │ руководителя  │    │     брифа     │    │  кандидатов   │    │    и отбор    │    │     найм      │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Высокая зависимость от скорости реакции руководителей</p>\n<p class=\"docp\">• Ошибки в заполнении брифа, нежелание его заполнять</p>\n<p class=\"docp\">• Растягивание сроков заполнения</p>\n<p class=\"docp\">Точки автоматизации: Автоматизация уже есть</p>\n<h4 class=\"doch3\">7.2 Адаптация новых сотрудников</h4>\n<p class=\"docp\">Критичность: Высокая</p>\n<p class=\"docp\">Сотрудников задействовано: 3</p>\n<p class=\"docp\">Регламент: Есть</p>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │   Выход на    │───►│   Welcome-    │───►│   Обучение    │───►│    Встречи    │───►│  Завершение   │\n    │    работу     │    │    встреча    │    │   по плану    │    │с руководителем│    │ испыт. срока  │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Руководители несвоевременно проводят встречи с новичками</p>\n<p class=\"docp\">• Иногда пропускают встречи с новичками</p>\n<p class=\"docp\">• Зависимость от вовлечённости руководителей</p>\n<p class=\"docp\">Точки автоматизации: Автоматизация уже есть</p>\n<h4 class=\"doch3\">7.3 Управление вовлечённостью и eNPS</h4>\n<p class=\"docp\">Критичность: Средне-высокая</p>\n<p class=\"docp\">Сотрудников задействовано: 5 (весь HR)</p>\n<p class=\"docp\">Регламент: Отсутствует единый план</p>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │  Проведение   │───►│     Сбор      │───►│    Анализ     │───►│     Планы     │───►│  Реализация   │\n    │    опросов    │    │    данных     │    │  результатов  │    │   улучшений   │    │   и контроль  │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Сложность анализа данных (разные источники)</p>\n<p class=\"docp\">• Ручной сбор и обработка данных</p>\n<p class=\"docp\">• Трудности с реализацией планов улучшений</p>\n<p class=\"docp\">Точки автоматизации: Требуется</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-HR-01</td><td>Единая платформа опросов</td><td>Автоматический сбор и анализ данных</td><td>Управляемость, динамика</td></tr></tbody></table>\n<h4 class=\"doch3\">7.4 Внутренние коммуникации и корпоративная культура</h4>\n<p class=\"docp\">Критичность: Средняя</p>\n<p class=\"docp\">Сотрудников задействовано: HR + все руководители</p>\n<p class=\"docp\">Регламент: Нет</p>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │ Формирование  │───►│  Публикация   │───►│   Обратная    │───►│  Корректи-    │\n    │   контента    │    │  по каналам   │    │     связь     │    │     ровка     │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Разрозненные каналы коммуникаций</p>\n<p class=\"docp\">• Недостаточная информированность сотрудников</p>\n<p class=\"docp\">• Слабая управляемость корпоративной культуры</p>\n<p class=\"docp\">• Высокая доля ручной работы</p>\n<p class=\"docp\">Точки автоматизации: Не требуется (опросы автоматизированы)</p>\n<h4 class=\"doch3\">7.5 Обучение и развитие персонала</h4>\n<p class=\"docp\">Критичность: Средне-высокая</p>\n<p class=\"docp\">Сотрудников задействовано: Бизнес-тренер + все сотрудники</p>\n<p class=\"docp\">Регламент: Нет</p>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │    Анализ     │───►│ Формирование  │───►│  Проведение   │───►│    Оценка     │───►│   Коррекция   │\n    │ потребностей  │    │   программы   │    │   обучения    │    │эффективности  │    │      ИПР      │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Сложность оценки эффективности обучения</p>\n<p class=\"docp\">• Ручной учёт и аналитика</p>\n<p class=\"docp\">• Отсутствие данных о реальном качестве работы сотрудников</p>\n<p class=\"docp\">Точки автоматизации: Требуется</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-HR-02</td><td>LMS-система</td><td>Автоматический учёт обучения</td><td>Прозрачность, оценка ROI</td></tr><tr><td>AUTO-HR-03</td><td>Интеграция данных качества звонков</td><td>Приём отчётов из AUTO-SUP-03 (см. ниже)</td><td>Целевое обучение, измеримость</td></tr></tbody></table>\n<h4 class=\"doch3\">7.5.1 Интеграция с контролем качества звонков (AUTO-HR-03)</h4>\n<p class=\"docp\">Источник данных: AUTO-SUP-03 (ИИ-анализ качества звонков из BP-06)</p>\n<h4 class=\"doch3\">Входящие данные от BP-06 (Клиентская поддержка)</h4>\n<table class=\"doctbl\"><thead><tr><th>Тип данных</th><th>Периодичность</th><th>Содержание</th></tr></thead><tbody><tr><td>Еженедельный отчёт</td><td>Каждый понедельник</td><td>Сводка оценок по 6 критериям качества</td></tr><tr><td>Рейтинг сотрудников</td><td>Еженедельно</td><td>Оценки каждого оператора с динамикой</td></tr><tr><td>ТОП-3 проблемы</td><td>Еженедельно</td><td>Наиболее частые нарушения стандартов</td></tr><tr><td>Красные флаги</td><td>Немедленно</td><td>Сотрудники с критически низкими оценками (&lt;50%)</td></tr><tr><td>Лучшие практики</td><td>Еженедельно</td><td>Примеры отличных звонков для обучения</td></tr></tbody></table>\n<h4 class=\"doch3\">Критерии оценки звонков (из AUTO-SUP-03)</h4>\n<table class=\"doctbl\"><thead><tr><th>Критерий</th><th>Вес</th><th>Фокус обучения при низкой оценке</th></tr></thead><tbody><tr><td>1. Приветствие</td><td>10%</td><td>Скрипты, стандарты коммуникации</td></tr><tr><td>2. Выявление потребности</td><td>25%</td><td>Техники задавания вопросов, активное слушание</td></tr><tr><td>3. Компетентность</td><td>25%</td><td>Знание продукта, работа в системах</td></tr><tr><td>4. Решение вопроса</td><td>20%</td><td>Принятие решений, эскалация</td></tr><tr><td>5. Завершение разговора</td><td>10%</td><td>Стандарты завершения, кросс-продажи</td></tr><tr><td>6. Время разговора</td><td>10%</td><td>Тайм-менеджмент, эффективность</td></tr></tbody></table>\n<h4 class=\"doch3\">Процесс использования данных</h4>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса / система</td></tr><tr><td>────►</td><td>Направление потока данных</td></tr></tbody></table>\n<pre class=\"docp\">    ┌─────────────────────────────────────────────────────────────┐\n    │          ЦИКЛ ОБУЧЕНИЯ НА ОСНОВЕ ДАННЫХ КАЧЕСТВА            │\n    └─────────────────────────────────────────────────────────────┘\n\n    Данные из BP-06 (AUTO-SUP-03)            HR (AUTO-HR-03)\n    ─────────────────────────────            ─────────────────\n                │\n    ┌───────────▼───────────┐\n    │  Еженедельный отчёт   │\n    │  - Оценки по критериям│\n    │  - Рейтинг сотрудников│\n    │  - Красные флаги      │\n    └───────────┬───────────┘\n                │\n                │  Автоматическая передача\n                │  ─────────────────────►\n                │\n                │              ┌─────────────────────────────────┐\n                │              │  1. ПРИЁМ И АНАЛИЗ              │\n                │              │  - Загрузка отчёта              │\n                │              │  - Сравнение с прошлым периодом │\n                │              │  - Выявление тенденций          │\n                │              └─────────────────┬───────────────┘\n                │                                │\n                │              ┌─────────────────▼───────────────┐\n                │              │  2. ПЛАНИРОВАНИЕ ОБУЧЕНИЯ       │\n                │              │  - Определение групп по проблемам│\n                │              │  - Формирование ИПР для «красных»│\n                │              │  - Подготовка материалов        │\n                │              └─────────────────┬───────────────┘\n                │                                │\n                │              ┌─────────────────▼───────────────┐\n                │              │  3. ПРОВЕДЕНИЕ ОБУЧЕНИЯ         │\n                │              │  - Групповые тренинги           │\n                │              │  - Индивидуальные сессии        │\n                │              │  - Разбор лучших практик        │\n                │              └─────────────────┬───────────────┘\n                │                                │\n                │              ┌─────────────────▼───────────────┐\n                │              │  4. ИЗМЕРЕНИЕ ЭФФЕКТИВНОСТИ     │\n                │              │  - Сравнение оценок до/после    │\n                │              │  - Отчёт руководству            │\n                │              │  - Корректировка программы      │\n                │              └─────────────────────────────────┘</pre>\n<h4 class=\"doch3\">Форматы обучения по типам проблем</h4>\n<table class=\"doctbl\"><thead><tr><th>Проблема (по критерию)</th><th>Формат обучения</th><th>Периодичность</th></tr></thead><tbody><tr><td>Приветствие / Завершение</td><td>Групповой тренинг «Стандарты коммуникации»</td><td>1 раз / квартал</td></tr><tr><td>Выявление потребности</td><td>Ролевые игры, разбор кейсов</td><td>2 раза / месяц</td></tr><tr><td>Компетентность</td><td>Продуктовое обучение, тест</td><td>По необходимости</td></tr><tr><td>Решение вопроса</td><td>Мастер-класс «Принятие решений»</td><td>1 раз / месяц</td></tr><tr><td>Время разговора</td><td>Индивидуальный коучинг</td><td>По необходимости</td></tr></tbody></table>\n<h4 class=\"doch3\">Ожидаемый эффект интеграции</h4>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>До интеграции</th><th>После интеграции</th></tr></thead><tbody><tr><td>Время планирования обучения</td><td>2-3 дня</td><td>2-4 часа</td></tr><tr><td>Точность определения потребностей</td><td>Субъективная</td><td>На основе данных</td></tr><tr><td>Измеримость эффективности обучения</td><td>Нет</td><td>Есть (до/после)</td></tr><tr><td>Охват проблемных сотрудников</td><td>~30%</td><td>100%</td></tr><tr><td>Скорость реакции на проблемы</td><td>2-4 недели</td><td>1 неделя</td></tr></tbody></table>\n<h3 class=\"doch2\">KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Цель</th><th>Текущее</th><th>Статус</th></tr></thead><tbody><tr><td>Срок закрытия вакансии</td><td>≤30 дней</td><td>~45 дней</td><td></td></tr><tr><td>Текучесть общая</td><td>≤15%</td><td>~20%</td><td></td></tr><tr><td>Текучесть на испыт. сроке</td><td>≤10%</td><td>~15%</td><td></td></tr><tr><td>eNPS</td><td>≥+30</td><td>Нет данных</td><td></td></tr><tr><td>Охват обучением</td><td>≥80%</td><td>~60%</td><td></td></tr></tbody></table>\n<h3 class=\"doch2\">Связь с основными процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Основной процесс</th><th>Как влияет HR</th><th>Интеграция данных</th></tr></thead><tbody><tr><td>BP-01 (Заявки)</td><td>Качество менеджеров → конверсия, ошибки</td><td>—</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Наличие маркетологов → темп кампаний</td><td>—</td></tr><tr><td>BP-03 (MICE)</td><td>Квалификация MICE-менеджеров → конверсия</td><td>—</td></tr><tr><td>BP-05 (Продукт)</td><td>Компетенции тарификаторов → скорость публикации</td><td>—</td></tr><tr><td>BP-06 (Поддержка)</td><td>Качество операторов → FCR, CSAT</td><td>AUTO-SUP-03 → AUTO-HR-03 (данные качества звонков для обучения)</td></tr></tbody></table>\n<h3 class=\"doch2\">Точки автоматизации (сводка)</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Подпроцесс</th><th>Точка</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-HR-01</td><td>Вовлечённость</td><td>Единая платформа опросов</td><td>Средний</td></tr><tr><td>AUTO-HR-02</td><td>Обучение</td><td>LMS-система</td><td>Средний</td></tr><tr><td>AUTO-HR-03</td><td>Обучение</td><td>Интеграция данных качества звонков (от AUTO-SUP-03)</td><td>Средний</td></tr></tbody></table>\n<h3 class=\"doch2\">Рекомендации</h3>\n<table class=\"doctbl\"><thead><tr><th>Приоритет</th><th>Рекомендация</th><th>Эффект</th></tr></thead><tbody><tr><td>Высокий</td><td>Внедрить регламент планов улучшений по eNPS</td><td>Управляемость культуры</td></tr><tr><td>Средний</td><td>Внедрить единую платформу опросов</td><td>Автоматический анализ</td></tr><tr><td>Средний</td><td>Внедрить LMS для отслеживания обучения</td><td>Прозрачность ROI</td></tr><tr><td>Средний</td><td>Настроить интеграцию с AUTO-SUP-03 (качество звонков)</td><td>Целевое обучение на основе данных</td></tr><tr><td>Низкий</td><td>Унифицировать каналы коммуникаций</td><td>Информированность</td></tr></tbody></table>\n<p class=\"docp\">Документ создан: 17.02.2026 Автор: AI-аналитик (Claude Code)</p>","08":"<h2 class=\"doch1\">BP-08: IT-обеспечение</h2>\n<p class=\"docp\">Тип процесса: Поддерживающий (Supporting)</p>\n<p class=\"docp\">Код: BP-08</p>\n<p class=\"docp\">Владелец: Логвинов Григорий Анатольевич (L1-07)</p>\n<p class=\"docp\">Критичность: КРИТИЧЕСКИЙ</p>\n<p class=\"docp\">Численность: 7 человек</p>\n<h3 class=\"doch2\">Резюме</h3>\n<p class=\"docp\">Процесс IT-обеспечения является инфраструктурным фундаментом для всех бизнес-процессов компании. IT отвечает за стабильность систем (САМО-тур, Битрикс24, 1С), безопасность данных, внедрение новых решений и поддержку пользователей. Сбой IT = остановка бизнеса.</p>\n<p class=\"docp\">Влияние на основные процессы:</p>\n<p class=\"docp\">• BP-01 (Заявки): Работоспособность САМО-тур, Битрикс24</p>\n<p class=\"docp\">• BP-02 (Маркетинг): Сайт, CRM, аналитика</p>\n<p class=\"docp\">• BP-03 (MICE): ETM-платформа, интеграции</p>\n<p class=\"docp\">• BP-04 (Финансы): 1С, банк-клиент, Invoice Tracker</p>\n<p class=\"docp\">• BP-05 (Продукт): САМО-тур, публикация на сайте</p>\n<p class=\"docp\">• BP-06 (Поддержка): Телефония, CRM, базы знаний</p>\n<h3 class=\"doch2\">Цели процесса</h3>\n<p class=\"docp\">1. Обеспечить бесперебойную работу IT-систем при росте нагрузки в 1,5 раза</p>\n<p class=\"docp\">2. Свести к нулю финансовые потери от простоев и кибератак</p>\n<p class=\"docp\">3. Доступность ключевых систем: 99,9%</p>\n<p class=\"docp\">4. Сократить время подключения нового партнёра на 50%</p>\n<p class=\"docp\">5. Удовлетворённость внутренних клиентов: 85%</p>\n<h3 class=\"doch2\">Подпроцессы</h3>\n<h4 class=\"doch3\">8.1 Внедрение аппаратно-программного комплекса</h4>\n<p class=\"docp\">Критичность: Высокая</p>\n<p class=\"docp\">Сотрудников задействовано: 1-7</p>\n<p class=\"docp\">Регламент: Есть блок-схема</p>\n<h4 class=\"doch3\">Легенда диаграммы</h4>\n<table class=\"doctbl\"><thead><tr><th>Элемент</th><th>Значение</th></tr></thead><tbody><tr><td>┌─────┐</td><td>Этап процесса</td></tr><tr><td>────►</td><td>Направление потока</td></tr></tbody></table>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │    Заявка     │───►│   Анализ и    │───►│   Закупка /   │───►│   Настройка   │───►│ Тестирование  │───►│    Ввод в     │\n    │               │    │ согласование  │    │   поставка    │    │               │    │               │    │ эксплуатацию  │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Проблемы коммуникации и согласования</p>\n<p class=\"docp\">• Задержки при реализации</p>\n<p class=\"docp\">• Зависимость от поставщиков</p>\n<p class=\"docp\">• Нехватка сотрудников</p>\n<p class=\"docp\">Точки автоматизации: Приоритет 2</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-IT-01</td><td>Автоматизация согласований</td><td>Workflow в Битрикс24</td><td>Ускорение на 30%</td></tr><tr><td>AUTO-IT-02</td><td>Автоматизация тестирования</td><td>Автотесты для типовых сценариев</td><td>Снижение ошибок</td></tr></tbody></table>\n<h4 class=\"doch3\">8.2 Модернизация систем</h4>\n<p class=\"docp\">Критичность: Высокая</p>\n<p class=\"docp\">Сотрудников задействовано: 1-7</p>\n<p class=\"docp\">Регламент: Есть блок-схема</p>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │   Выявление   │───►│    Подбор     │───►│ Согласование  │───►│ Тестирование  │───►│   Внедрение   │\n    │  потребности  │    │  альтернатив  │    │   и закупка   │    │               │    │               │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Недопонимание требований</p>\n<p class=\"docp\">• Задержки согласований</p>\n<p class=\"docp\">• Отсутствие времени на тестирование</p>\n<p class=\"docp\">• Зависимость от других отделов</p>\n<p class=\"docp\">Точки автоматизации: Приоритет 2 (аналогично 8.1)</p>\n<h4 class=\"doch3\">8.3 Внедрение интеграций</h4>\n<p class=\"docp\">Критичность: Высокая</p>\n<p class=\"docp\">Сотрудников задействовано: 1-7</p>\n<p class=\"docp\">Регламент: Есть блок-схема</p>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │   Запрос от   │───►│    Анализ     │───►│  Разработка / │───►│ Тестирование  │───►│    Запуск     │\n    │   партнёра    │    │  требований   │    │   настройка   │    │  с партнёром  │    │               │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Недопонимание, нехватка информации</p>\n<p class=\"docp\">• Непонимание конечного результата</p>\n<p class=\"docp\">• Зависимость от САМО-софт и поставщиков</p>\n<p class=\"docp\">• Несогласованность действий партнёров</p>\n<p class=\"docp\">Текущий срок подключения партнёра: ~60 дней</p>\n<p class=\"docp\">Целевой срок: 30 дней (-50%)</p>\n<p class=\"docp\">Точки автоматизации: Приоритет 3</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-IT-03</td><td>Шаблоны интеграций</td><td>Готовые коннекторы для типовых партнёров</td><td>Ускорение подключения</td></tr></tbody></table>\n<h4 class=\"doch3\">8.4 Поддержка пользователей (Service Desk)</h4>\n<p class=\"docp\">Критичность: Высокая</p>\n<p class=\"docp\">Сотрудников задействовано: 1-7</p>\n<p class=\"docp\">Регламент: Есть наброски</p>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │   Обращение   │───►│  Классифи-    │───►│    Решение    │───►│   Закрытие    │───►│   Обратная    │\n    │               │    │    кация      │    │  (1-3 линия)  │    │    тикета     │    │     связь     │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Сотрудники не понимают системы и процессы</p>\n<p class=\"docp\">• Не придерживаются регламентов</p>\n<p class=\"docp\">• Проблемы в работе систем поставщиков</p>\n<p class=\"docp\">• Ручная работа, технические проблемы</p>\n<p class=\"docp\">Точки автоматизации: ПРИОРИТЕТ 1</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-IT-04</td><td>AI-помощник / чат-бот</td><td>Автоматические ответы на типовые вопросы</td><td>Снижение нагрузки на 40%</td></tr><tr><td>AUTO-IT-05</td><td>База знаний с поиском</td><td>Самообслуживание пользователей</td><td>Сокращение тикетов на 30%</td></tr></tbody></table>\n<h4 class=\"doch3\">8.5 Управление доступами (приём/увольнение)</h4>\n<p class=\"docp\">Критичность: Высокая</p>\n<p class=\"docp\">Сотрудников задействовано: 2-3</p>\n<p class=\"docp\">Регламент: Есть</p>\n<pre class=\"docp\">    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐    ┌───────────────┐\n    │   Заявка от   │───►│  Создание /   │───►│   Настройка   │───►│    Выдача     │\n    │      HR       │    │ деактивация   │    │   доступов    │    │ оборудования  │\n    │               │    │ учётных зап.  │    │               │    │               │\n    └───────────────┘    └───────────────┘    └───────────────┘    └───────────────┘</pre>\n<p class=\"docp\">Проблемы:</p>\n<p class=\"docp\">• Сотрудник выходит завтра — сообщили сегодня вечером</p>\n<p class=\"docp\">• Ошибки в написании ФИО, должности, подразделения</p>\n<p class=\"docp\">• Оборудование может отсутствовать в наличии</p>\n<p class=\"docp\">• Отсутствие предварительной коммуникации</p>\n<p class=\"docp\">Точки автоматизации: Приоритет 2</p>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Точка</th><th>Описание</th><th>Эффект</th></tr></thead><tbody><tr><td>AUTO-IT-06</td><td>Автоматическое создание УЗ</td><td>Интеграция с HR-системой</td><td>Сокращение ошибок</td></tr></tbody></table>\n<h3 class=\"doch2\">KPI процесса</h3>\n<table class=\"doctbl\"><thead><tr><th>Метрика</th><th>Цель</th><th>Текущее</th><th>Статус</th></tr></thead><tbody><tr><td>Доступность ключевых систем</td><td>≥99,9%</td><td>~99,5%</td><td></td></tr><tr><td>Критические инциденты</td><td>-60%</td><td>Базовый уровень</td><td></td></tr><tr><td>Время восстановления</td><td>-50%</td><td>~4 часа</td><td></td></tr><tr><td>Срок подключения партнёра</td><td>≤30 дней</td><td>~60 дней</td><td></td></tr><tr><td>Удовлетворённость пользователей</td><td>≥85%</td><td>~70%</td><td></td></tr><tr><td>Время решения тикета (среднее)</td><td>≤4 часа</td><td>~8 часов</td><td></td></tr></tbody></table>\n<h3 class=\"doch2\">Связь с основными процессами</h3>\n<table class=\"doctbl\"><thead><tr><th>Основной процесс</th><th>Системы IT</th><th>Влияние сбоя</th></tr></thead><tbody><tr><td>BP-01 (Заявки)</td><td>САМО-тур, Битрикс24, Outlook</td><td>Остановка продаж</td></tr><tr><td>BP-02 (Маркетинг)</td><td>Сайт, CRM, RoiStat</td><td>Потеря лидов</td></tr><tr><td>BP-03 (MICE)</td><td>ETM, интеграции</td><td>Задержки КП</td></tr><tr><td>BP-04 (Финансы)</td><td>1С, банк-клиент</td><td>Остановка платежей</td></tr><tr><td>BP-05 (Продукт)</td><td>САМО-тур, сайт</td><td>Нет публикации цен</td></tr><tr><td>BP-06 (Поддержка)</td><td>Телефония, CRM</td><td>Нет связи с клиентами</td></tr></tbody></table>\n<h3 class=\"doch2\">Точки автоматизации (сводка)</h3>\n<table class=\"doctbl\"><thead><tr><th>ID</th><th>Подпроцесс</th><th>Точка</th><th>Приоритет</th></tr></thead><tbody><tr><td>AUTO-IT-04</td><td>Поддержка</td><td>AI-помощник / чат-бот</td><td>Критический</td></tr><tr><td>AUTO-IT-05</td><td>Поддержка</td><td>База знаний с поиском</td><td>Критический</td></tr><tr><td>AUTO-IT-01</td><td>Внедрение</td><td>Автоматизация согласований</td><td>Средний</td></tr><tr><td>AUTO-IT-02</td><td>Внедрение</td><td>Автоматизация тестирования</td><td>Средний</td></tr><tr><td>AUTO-IT-03</td><td>Интеграции</td><td>Шаблоны интеграций</td><td>Низкий</td></tr><tr><td>AUTO-IT-06</td><td>Доступы</td><td>Автосоздание УЗ</td><td>Средний</td></tr></tbody></table>\n<h3 class=\"doch2\">Критические системы компании</h3>\n<table class=\"doctbl\"><thead><tr><th>Система</th><th>Назначение</th><th>Критичность</th><th>Владелец</th></tr></thead><tbody><tr><td>САМО-тур</td><td>Бронирование, заявки</td><td>Критическая</td><td>IT + САМО-софт</td></tr><tr><td>Битрикс24</td><td>CRM, задачи, коммуникации</td><td>Критическая</td><td>IT</td></tr><tr><td>1С</td><td>Бухгалтерия, финансы</td><td>Критическая</td><td>IT + Финансы</td></tr><tr><td>Outlook</td><td>Почта, календарь</td><td>Высокая</td><td>IT</td></tr><tr><td>ETM</td><td>Бизнес-тревел</td><td>Высокая</td><td>IT + MICE</td></tr><tr><td>Телефония</td><td>Связь с клиентами</td><td>Критическая</td><td>IT</td></tr><tr><td>Сайт</td><td>Витрина, бронирование</td><td>Критическая</td><td>IT + Маркетинг</td></tr></tbody></table>\n<h3 class=\"doch2\">Рекомендации</h3>\n<table class=\"doctbl\"><thead><tr><th>Приоритет</th><th>Рекомендация</th><th>Эффект</th></tr></thead><tbody><tr><td>Критический</td><td>Внедрить AI-помощник для типовых вопросов</td><td>Снижение нагрузки на 40%</td></tr><tr><td>Критический</td><td>Создать базу знаний с умным поиском</td><td>Самообслуживание, -30% тикетов</td></tr><tr><td>Критический</td><td>Система приоритизации задач</td><td>Фокус на критичных для выручки</td></tr><tr><td>Высокий</td><td>Автоматизация согласований через Битрикс24</td><td>Ускорение внедрений на 30%</td></tr><tr><td>Высокий</td><td>Интеграция с HR для автосоздания УЗ</td><td>Снижение ошибок и задержек</td></tr><tr><td>Средний</td><td>Шаблоны интеграций для типовых партнёров</td><td>Ускорение подключения</td></tr></tbody></table>\n<h3 class=\"doch2\">Риски</h3>\n<table class=\"doctbl\"><thead><tr><th>Риск</th><th>Вероятность</th><th>Влияние</th><th>Митигация</th></tr></thead><tbody><tr><td>Уход ключевого сотрудника</td><td>Средняя</td><td>Критическое</td><td>Документирование, дублирование</td></tr><tr><td>Сбой САМО-тур</td><td>Низкая</td><td>Критическое</td><td>SLA с САМО-софт</td></tr><tr><td>Кибератака</td><td>Низкая</td><td>Критическое</td><td>Аудиты безопасности</td></tr><tr><td>Перегрузка IT</td><td>Высокая</td><td>Высокое</td><td>Приоритизация, подрядчики</td></tr></tbody></table>\n<p class=\"docp\">Документ создан: 17.02.2026 Автор: AI-аналитик (Claude Code)</p>"};
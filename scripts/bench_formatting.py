@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк движков форматирования DOCX для Space Travel.
+
+Что измеряется для каждого документа и движка:
+- время (лучшее из --repeat прогонов)
+- пиковая память процесса (RSS) и прирост относительно старта
+- размер результата
+- время по фазам и счётчики элементов (format_profile.py)
+
+Каждый прогон идёт в отдельном процессе, поэтому пиковая память не
+смешивается между движками и документами.
+
+Документы:
+- синтетические DOCX заданного размера (абзацы, таблицы, объединённые
+  ячейки, заголовки, кириллический текст) — наборы SYNTHETIC_CASES
+- реальные документы tz/ и processes/ (фиксированный корпус)
+
+Результаты пишутся в JSON, сравнение с прошлым запуском — через --compare.
+
+Использование:
+    python bench_formatting.py
+    python bench_formatting.py --cases small large --engines xml xml-stream
+    python bench_formatting.py --compare bench_formatting_old.json
+    python bench_formatting.py --generate big.docx --paragraphs 20000 --tables 200
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+import format_profile
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_DIR = SCRIPTS_DIR.parent
+DEFAULT_OUTPUT = 'bench_formatting.json'
+
+# Фиксированный корпус реальных документов
+CORPUS_DIRS = ('tz', 'processes')
+
+# Синтетические наборы: абзацы, таблицы, строки × столбцы, заголовок на каждые N абзацев
+SYNTHETIC_CASES = {
+    'small': {'paragraphs': 200, 'tables': 5, 'rows': 10, 'cols': 4, 'heading_every': 20},
+    'medium': {'paragraphs': 2000, 'tables': 40, 'rows': 20, 'cols': 5, 'heading_every': 25},
+    'large': {'paragraphs': 20000, 'tables': 200, 'rows': 30, 'cols': 6, 'heading_every': 40},
+}
+
+# Движки: модуль, функция и именованные параметры
+ENGINES = {
+    'xml': ('format_docx_xml', 'process_document', {'mode': 'zip'}),
+    'xml-stream': ('format_docx_xml', 'process_document', {'mode': 'stream'}),
+    'xml-styles': ('format_docx_xml', 'process_document', {'mode': 'zip', 'styles': True}),
+    'docx': ('format_docx', 'format_document', {}),
+}
+DEFAULT_ENGINES = ('xml', 'xml-stream', 'docx')
+
+WORDS = (
+    'турист', 'заявка', 'оператор', 'менеджер', 'бронирование', 'отель', 'перелёт',
+    'договор', 'оплата', 'клиент', 'маршрут', 'виза', 'страховка', 'трансфер',
+    'экскурсия', 'департамент', 'отчёт', 'согласование', 'документ', 'поставщик',
+    'SAMO', 'Bitrix24', 'CRM', 'API', 'счёт', 'скидка', 'акция', 'направление',
+)
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:styles xmlns:w="{W_NS}">'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/>'
+    '<w:basedOn w:val="Normal"/></w:style>'
+    '<w:style w:type="table" w:default="1" w:styleId="TableNormal"><w:name w:val="Normal Table"/>'
+    '</w:style>'
+    '</w:styles>'
+)
+
+
+# ============================================================
+# Генератор синтетических DOCX
+# ============================================================
+
+def _sentence(rng, words=12):
+    """Случайное предложение; иногда с лишними пробелами, как в реальных текстах."""
+    text = ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+    if rng.random() < 0.1:
+        text = text.replace(' ', '  ', 1) + ' .'
+    else:
+        text += '.'
+    return text
+
+
+def _run(text, bold=False):
+    props = '<w:rPr><w:b/></w:rPr>' if bold else ''
+    return f'<w:r>{props}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def _paragraph(rng, heading=False):
+    if heading:
+        return ('<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+                f'{_run(_sentence(rng, 4))}</w:p>')
+    # Абзац из нескольких run, как после конвертации из markdown
+    runs = [_run(_sentence(rng, rng.randint(6, 18)) + ' ', bold=rng.random() < 0.2)
+            for _ in range(rng.randint(1, 4))]
+    return f'<w:p>{"".join(runs)}</w:p>'
+
+
+def _cell(text, width, extra=''):
+    return (f'<w:tc><w:tcPr><w:tcW w:w="{width}" w:type="dxa"/>{extra}</w:tcPr>'
+            f'<w:p>{_run(text)}</w:p></w:tc>')
+
+
+def _table(rng, rows, cols, merged=True):
+    """Таблица rows × cols; при merged — gridSpan в шапке и vMerge в первом столбце."""
+    width = 9000 // cols
+    grid = ''.join(f'<w:gridCol w:w="{width}"/>' for _ in range(cols))
+    parts = [f'<w:tbl><w:tblPr><w:tblW w:w="0" w:type="auto"/></w:tblPr><w:tblGrid>{grid}</w:tblGrid>']
+    for row in range(rows):
+        cells = []
+        col = 0
+        while col < cols:
+            if row == 0 and merged and col == 0 and cols > 2:
+                # Объединение двух ячеек шапки по горизонтали
+                cells.append(_cell('Объединённая шапка', width * 2, '<w:gridSpan w:val="2"/>'))
+                col += 2
+                continue
+            if merged and col == 0 and 1 <= row <= 3:
+                # Объединение первого столбца по вертикали
+                vmerge = '<w:vMerge w:val="restart"/>' if row == 1 else '<w:vMerge/>'
+                cells.append(_cell('Группа' if row == 1 else '', width, vmerge))
+            else:
+                words = 2 if row == 0 else rng.randint(1, 10)
+                cells.append(_cell(_sentence(rng, words), width))
+            col += 1
+        parts.append(f'<w:tr>{"".join(cells)}</w:tr>')
+    parts.append('</w:tbl>')
+    return ''.join(parts)
+
+
+def generate_docx(path, paragraphs=200, tables=5, rows=10, cols=4, heading_every=20,
+                  merged=True, seed=42):
+    """Сгенерировать синтетический DOCX. Вернуть путь."""
+    rng = random.Random(seed)
+    # Таблицы равномерно распределены между абзацами
+    table_at = set()
+    if tables:
+        step = max(1, paragraphs // tables)
+        table_at = {i * step for i in range(tables)}
+
+    body = []
+    for idx in range(max(paragraphs, max(table_at, default=0) + 1)):
+        if idx < paragraphs:
+            body.append(_paragraph(rng, heading=heading_every and idx % heading_every == 0))
+        if idx in table_at:
+            body.append(_table(rng, rows, cols, merged))
+    body.append('<w:sectPr><w:pgSz w:w="11906" w:h="16838"/></w:sectPr>')
+
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W_NS}" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<w:body>{"".join(body)}</w:body></w:document>'
+    )
+
+    path = Path(path)
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', CONTENT_TYPES)
+        zf.writestr('_rels/.rels', PACKAGE_RELS)
+        zf.writestr('word/_rels/document.xml.rels', DOCUMENT_RELS)
+        zf.writestr('word/document.xml', document)
+        zf.writestr('word/styles.xml', STYLES)
+    return path
+
+
+# ============================================================
+# Прогон одного движка (в отдельном процессе)
+# ============================================================
+
+def run_engine(engine, input_path, output_path):
+    """Выполнить движок в текущем процессе и вернуть замер (с профилем по фазам)."""
+    module_name, func_name, kwargs = ENGINES[engine]
+    func = getattr(importlib.import_module(module_name), func_name)
+
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log), format_profile.profiling() as profile:
+        saved = func(str(input_path), str(output_path), **kwargs)
+    report = profile.report()
+
+    lines = log.getvalue().strip().splitlines()
+    return {
+        'ok': saved is not None,
+        'seconds': report['seconds'],
+        'peak_rss_mb': report['peak_rss_mb'],
+        'rss_growth_mb': round(report['peak_rss_mb'] - report['rss_start_mb'], 1),
+        'output_bytes': Path(output_path).stat().st_size if Path(output_path).exists() else 0,
+        'phases': {name: phase['seconds'] for name, phase in report['phases'].items()},
+        'counters': report['counters'],
+        'error': None if saved is not None else (lines[-1] if lines else None),
+    }
+
+
+def measure(engine, input_path, workdir, repeat=1, timeout=600):
+    """Замерить движок на документе: repeat прогонов, каждый в новом процессе."""
+    output_path = Path(workdir) / f'out_{engine}_{Path(input_path).name}'
+    best = None
+    for _ in range(repeat):
+        cmd = [sys.executable, str(Path(__file__).resolve()), '--worker', engine,
+               str(input_path), str(output_path)]
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout,
+                              cwd=SCRIPTS_DIR)
+        if proc.returncode != 0:
+            lines = (proc.stderr or proc.stdout).strip().splitlines()
+            return {'ok': False, 'error': lines[-1] if lines else f'код {proc.returncode}'}
+        result = json.loads(proc.stdout)
+        if not result['ok']:
+            return result
+        if best is None or result['seconds'] < best['seconds']:
+            peak = max(result['peak_rss_mb'], best['peak_rss_mb']) if best else result['peak_rss_mb']
+            best = dict(result, peak_rss_mb=peak)
+        else:
+            best['peak_rss_mb'] = max(best['peak_rss_mb'], result['peak_rss_mb'])
+    output_path.unlink(missing_ok=True)
+    return best
+
+
+# ============================================================
+# Набор документов, запуск, сравнение
+# ============================================================
+
+def collect_cases(case_names, workdir, corpus=True):
+    """Документы для замера: синтетические и реальные. Вернуть [(имя, путь, описание)]."""
+    cases = []
+    for name in case_names:
+        params = SYNTHETIC_CASES[name]
+        path = generate_docx(Path(workdir) / f'synthetic_{name}.docx', **params)
+        cases.append((f'synthetic/{name}', path, dict(params)))
+    if corpus:
+        for dirname in CORPUS_DIRS:
+            for path in sorted((PROJECT_DIR / dirname).glob('*.docx')):
+                if not path.name.startswith('~$'):
+                    cases.append((f'{dirname}/{path.name}', path, {}))
+    return cases
+
+
+def run_suite(case_names, engines, repeat=1, corpus=True, on_result=None):
+    """Прогнать все документы на всех движках. Вернуть отчёт в виде словаря."""
+    report = {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'results': [],
+    }
+    with tempfile.TemporaryDirectory(prefix='bench_formatting_') as workdir:
+        for case, path, params in collect_cases(case_names, workdir, corpus):
+            for engine in engines:
+                result = measure(engine, path, workdir, repeat)
+                result.update(case=case, engine=engine, input_bytes=path.stat().st_size,
+                              params=params)
+                report['results'].append(result)
+                if on_result:
+                    on_result(result)
+
+    # Итог по движкам: суммарное время по корпусу, максимум памяти
+    totals = {}
+    for result in report['results']:
+        if not result['ok']:
+            continue
+        total = totals.setdefault(result['engine'], {'documents': 0, 'seconds': 0.0,
+                                                     'peak_rss_mb': 0.0})
+        total['documents'] += 1
+        total['seconds'] = round(total['seconds'] + result['seconds'], 4)
+        total['peak_rss_mb'] = max(total['peak_rss_mb'], result['peak_rss_mb'])
+    report['totals'] = totals
+    return report
+
+
+def compare_reports(old, new, threshold=0.10):
+    """Сравнить два отчёта. Вернуть список строк с изменениями времени и памяти."""
+    old_index = {(r['case'], r['engine']): r for r in old['results'] if r.get('ok')}
+    lines = []
+    for result in new['results']:
+        before = old_index.get((result['case'], result['engine']))
+        if not result.get('ok') or before is None:
+            continue
+        for key, unit in (('seconds', 'с'), ('peak_rss_mb', 'МБ')):
+            if not before[key]:
+                continue
+            change = (result[key] - before[key]) / before[key]
+            if abs(change) >= threshold:
+                mark = 'РЕГРЕССИЯ' if change > 0 else 'улучшение'
+                lines.append(f"  {mark:9} {result['engine']:10} {result['case']}: "
+                             f"{key} {before[key]} → {result[key]} {unit} ({change:+.0%})")
+    return lines
+
+
+def print_result(result):
+    """Вывести строку замера."""
+    if not result['ok']:
+        print(f"  [ERR] {result['engine']:10} {result['case']} — {result.get('error')}", flush=True)
+        return
+    print(f"  {result['engine']:10} {result['seconds']:8.3f} с  {result['peak_rss_mb']:7.1f} МБ  "
+          f"{result['output_bytes'] / 1024:9.1f} КБ  {result['case']}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк форматирования DOCX (Space Travel)")
+    parser.add_argument('--cases', nargs='*', choices=sorted(SYNTHETIC_CASES),
+                        default=sorted(SYNTHETIC_CASES), help="синтетические наборы")
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES),
+                        default=list(DEFAULT_ENGINES), help="движки для замера")
+    parser.add_argument('--no-corpus', action='store_true', help="без документов tz/ и processes/")
+    parser.add_argument('--repeat', type=int, default=1, help="число прогонов (берётся лучший)")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help="файл результатов JSON")
+    parser.add_argument('--compare', help="сравнить с результатами прошлого запуска")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="порог изменения для --compare (доля, по умолчанию 0.10)")
+    # Генерация одного синтетического документа
+    parser.add_argument('--generate', metavar='DOCX', help="только сгенерировать документ")
+    parser.add_argument('--paragraphs', type=int, default=2000)
+    parser.add_argument('--tables', type=int, default=40)
+    parser.add_argument('--rows', type=int, default=20)
+    parser.add_argument('--cols', type=int, default=5)
+    parser.add_argument('--heading-every', type=int, default=25)
+    parser.add_argument('--no-merged', action='store_true', help="без объединённых ячеек")
+    parser.add_argument('--seed', type=int, default=42)
+    # Внутренний режим: один прогон движка в дочернем процессе
+    parser.add_argument('--worker', nargs=3, metavar=('ENGINE', 'INPUT', 'OUTPUT'),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        engine, input_path, output_path = args.worker
+        print(json.dumps(run_engine(engine, input_path, output_path), ensure_ascii=False))
+        return
+
+    if args.generate:
+        path = generate_docx(args.generate, args.paragraphs, args.tables, args.rows, args.cols,
+                             args.heading_every, not args.no_merged, args.seed)
+        print(f"Создан: {path} ({path.stat().st_size / 1024:.1f} КБ)")
+        return
+
+    engines = []
+    for engine in args.engines:
+        try:
+            importlib.import_module(ENGINES[engine][0])
+            engines.append(engine)
+        except ImportError as exc:
+            print(f"Движок {engine} недоступен ({exc}) — пропущен")
+    if not engines:
+        print("Ошибка: нет доступных движков")
+        sys.exit(1)
+
+    print(f"Движки: {', '.join(engines)}; повторов: {args.repeat}")
+    report = run_suite(args.cases, engines, args.repeat, not args.no_corpus,
+                       on_result=print_result)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print("\nИтог по движкам:")
+    for engine, total in report['totals'].items():
+        print(f"  {engine:10} документов: {total['documents']}, время: {total['seconds']} с, "
+              f"пик памяти: {total['peak_rss_mb']} МБ")
+    print(f"Результаты: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            old = json.load(f)
+        changes = compare_reports(old, report, args.threshold)
+        print(f"\nСравнение с {args.compare}:")
+        print('\n'.join(changes) if changes else "  изменений выше порога нет")
+        if any('РЕГРЕССИЯ' in line for line in changes):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Нормализация категорий анкет Space Travel.
+
+Поля-перечисления (уровень рутинности, регулярность, тип и характер
+задачи, приоритет, критичность процесса и т.д.) заполнялись вручную:
+«Высокий» и «Bысокий» (латинская B), «ежедневно» и «Ежедневно»,
+имена файлов вида oprosnik_chernysheva.xlsх.json (кириллическая х).
+Здесь каждое значение приводится к каноническому и получает целочисленный
+код; группировки дальше идут по кодам.
+
+Порядок приведения:
+1. пусто / None → «Не указано» (код 0)
+2. похожие буквы другого алфавита внутри слова → буквы основного
+   алфавита слова (Bысокий → Высокий, xlsх → xlsx)
+3. пробелы схлопываются, точка в конце убирается, регистр не важен
+4. таблица синонимов поля, затем префиксы («Другое (…)» → «Другое»)
+5. не найдено — значение попадает в отчёт о неприведённых; закрытые
+   поля с вариантом «прочее» получают его, остальные — новый код
+   с очищенным значением
+
+Использование:
+    from categories import Categories
+    cats = Categories()
+    code = cats.code('routine_level', 'Bысокий')   # → код «Высокий»
+    cats.label('routine_level', code)             # → 'Высокий'
+    cats.unmapped_report()                        # неприведённые значения
+
+    python categories.py            — отчёт по корпусу L1/L2/L3
+    python categories.py --json
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import Counter
+
+
+NOT_SPECIFIED = 'Не указано'
+
+# Латиница, похожая на кириллицу, и обратно
+LATIN_TO_CYRILLIC = str.maketrans('ABCEHKMOPTXaceopxy', 'АВСЕНКМОРТХасеорху')
+CYRILLIC_TO_LATIN = str.maketrans('АВСЕНКМОРТХасеорху', 'ABCEHKMOPTXaceopxy')
+CYRILLIC_RE = re.compile(r'[А-Яа-яЁё]')
+LATIN_RE = re.compile(r'[A-Za-z]')
+WORD_RE = re.compile(r'[^\W\d_]+')  # буквенные слова: «_» и цифры разделяют
+# Слово, где встречаются оба алфавита: без него текст не трогаем
+MIXED_RE = re.compile(r'[A-Za-z][^\W\d_]*[А-Яа-яЁё]|[А-Яа-яЁё][^\W\d_]*[A-Za-z]')
+SPACES_RE = re.compile(r'\s+')
+
+
+def fix_confusables(text):
+    """Заменить в каждом слове буквы-двойники на буквы основного алфавита слова."""
+    def fix_word(match):
+        word = match.group()
+        cyrillic = len(CYRILLIC_RE.findall(word))
+        latin = len(LATIN_RE.findall(word))
+        if not cyrillic or not latin:
+            return word
+        if cyrillic >= latin:
+            return word.translate(LATIN_TO_CYRILLIC)
+        return word.translate(CYRILLIC_TO_LATIN)
+    if not MIXED_RE.search(text):
+        return text
+    return WORD_RE.sub(fix_word, text)
+
+
+def clean(value):
+    """Очищенная строка значения или None, если значение пустое."""
+    if value is None:
+        return None
+    text = SPACES_RE.sub(' ', fix_confusables(str(value))).strip().rstrip('.').strip()
+    return text or None
+
+
+# ============================================================
+# Справочники
+# ============================================================
+
+# Поле → (канонические значения, синонимы, префиксы, значение «прочее»)
+# Синонимы и префиксы записываются в нижнем регистре.
+FIELDS = {
+    'routine_level': (
+        ('Очень высокий', 'Высокий', 'Средний', 'Низкий'),
+        {'оч. высокий': 'Очень высокий', 'очень высокая': 'Очень высокий',
+         'высокая': 'Высокий', 'средняя': 'Средний', 'низкая': 'Низкий'},
+        (), None,
+    ),
+    'regularity': (
+        ('Ежедневно', 'Еженедельно', 'Ежемесячно', 'Ежеквартально', 'По запросу', 'Выходные'),
+        {'каждый день': 'Ежедневно', 'раз в неделю': 'Еженедельно', 'раз в месяц': 'Ежемесячно',
+         'раз в квартал': 'Ежеквартально', 'по требованию': 'По запросу',
+         'по необходимости': 'По запросу'},
+        (), None,
+    ),
+    'task_type': (
+        ('Рутинная задача', 'Проблемная задача'),
+        {'рутинная': 'Рутинная задача', 'проблемная': 'Проблемная задача'},
+        (), None,
+    ),
+    'task_character': (
+        ('Ручной ввод данных', 'Обработка текстов', 'Обработка голосовой информации',
+         'Обработка изображений', 'Другое'),
+        {'обработка текста': 'Обработка текстов', 'обработка изображения': 'Обработка изображений'},
+        # Несколько вариантов через запятую — по первому
+        (('ручной ввод данных', 'Ручной ввод данных'), ('обработка текст', 'Обработка текстов'),
+         ('обработка голосов', 'Обработка голосовой информации'),
+         ('обработка изображ', 'Обработка изображений'), ('другое', 'Другое')),
+        'Другое',
+    ),
+    'priority': (
+        ('1', '2', '3', '4', '5', '6'),
+        {},
+        (), None,
+    ),
+    'criticality': (
+        ('Высокая', 'Средне-высокая', 'Средняя', 'Низкая'),
+        {'высокий': 'Высокая', 'средний': 'Средняя', 'низкий': 'Низкая',
+         'средне высокая': 'Средне-высокая', 'важно': 'Высокая'},
+        (), None,
+    ),
+    'has_regulation': (
+        ('Да', 'Нет', 'Частично'),
+        {'есть': 'Да', 'да/нет': 'Частично'},
+        (('есть, но', 'Частично'), ('есть', 'Да'), ('нет', 'Нет'), ('отсутств', 'Нет'),
+         ('частично', 'Частично')),
+        None,
+    ),
+}
+
+# Поля без закрытого списка: только очистка (департаменты, отделы)
+OPEN_FIELDS = ('department', 'division')
+
+
+class Vocabulary:
+    """Коды одного поля: 0 — «Не указано», далее канонические, далее новые."""
+
+    def __init__(self, field, canonical=(), synonyms=None, prefixes=(), other=None):
+        self.field = field
+        self.labels = [NOT_SPECIFIED]
+        self.index = {NOT_SPECIFIED.casefold(): 0}
+        for label in canonical:
+            self._add(label)
+        self.closed = bool(canonical)
+        self.synonyms = {key.casefold(): value for key, value in (synonyms or {}).items()}
+        self.prefixes = tuple(prefixes)
+        self.other = other
+        self.unmapped = Counter()
+        self._cache = {}
+
+    def _add(self, label):
+        label = sys.intern(label)
+        self.index[label.casefold()] = len(self.labels)
+        self.labels.append(label)
+        return len(self.labels) - 1
+
+    def code(self, value):
+        """Код значения (значения запоминаются: повторное приведение — поиск в словаре)."""
+        cached = self._cache.get(value)
+        if cached is not None:
+            if value in self.unmapped:
+                self.unmapped[value] += 1
+            return cached
+        code = self._resolve(value)
+        if isinstance(value, (str, int, type(None))):
+            self._cache[value] = code
+        return code
+
+    def _resolve(self, value):
+        text = clean(value)
+        if text is None:
+            return 0
+        key = text.casefold()
+        if key in self.index:
+            return self.index[key]
+        target = self.synonyms.get(key)
+        if target is None:
+            target = next((label for prefix, label in self.prefixes if key.startswith(prefix)), None)
+        if target is not None:
+            return self.index[target.casefold()]
+        if not self.closed:
+            return self._add(text)
+        # Закрытое поле, значение не распознано
+        self.unmapped[value] += 1
+        if self.other is not None:
+            return self.index[self.other.casefold()]
+        return self._add(text[:1].upper() + text[1:])
+
+    def label(self, code):
+        return self.labels[code]
+
+
+class Categories:
+    """Справочники всех полей корпуса."""
+
+    def __init__(self, fields=None):
+        self.vocabularies = {}
+        for field, (canonical, synonyms, prefixes, other) in (fields or FIELDS).items():
+            self.vocabularies[field] = Vocabulary(field, canonical, synonyms, prefixes, other)
+        for field in OPEN_FIELDS:
+            self.vocabularies[field] = Vocabulary(field)
+
+    def vocabulary(self, field):
+        return self.vocabularies[field]
+
+    def code(self, field, value):
+        """Целочисленный код значения поля."""
+        return self.vocabularies[field].code(value)
+
+    def label(self, field, code):
+        """Каноническое значение по коду."""
+        return self.vocabularies[field].labels[code]
+
+    def canonical(self, field, value):
+        """Каноническое значение (интернированная строка)."""
+        vocab = self.vocabularies[field]
+        return vocab.labels[vocab.code(value)]
+
+    def unmapped_report(self):
+        """Неприведённые значения закрытых полей: {поле: [(значение, сколько раз)]}."""
+        return {field: vocab.unmapped.most_common()
+                for field, vocab in self.vocabularies.items() if vocab.unmapped}
+
+
+# ============================================================
+# Имена файлов анкет
+# ============================================================
+
+SOURCE_PREFIXES = (('опросник_', 'oprosnik_'),)
+# Хвосты выгрузки из Excel: .xlsx., .xlsx._, лишние точки
+SOURCE_TAIL_RE = re.compile(r'(\.xlsx)?[._]*$', re.IGNORECASE)
+
+
+def source_key(file_name):
+    """Имя анкеты без расширения и опечаток: oprosnik_chernysheva.xlsх.json → oprosnik_chernysheva."""
+    name = fix_confusables(file_name)
+    if name.lower().endswith('.json'):
+        name = name[:-len('.json')]
+    name = SOURCE_TAIL_RE.sub('', name)
+    for prefix, replacement in SOURCE_PREFIXES:
+        if name.lower().startswith(prefix):
+            name = replacement + name[len(prefix):]
+    return name
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нормализация категорий анкет (Space Travel)")
+    parser.add_argument('--json', action='store_true', help="отчёт в JSON")
+    parser.add_argument('--limit', type=int, default=10,
+                        help="сколько неприведённых значений показать на поле (по умолчанию 10)")
+    args = parser.parse_args()
+
+    import corpus  # корпус нормализуется при загрузке этим модулем
+
+    data = corpus.load_corpus()
+    categories = data.categories
+    report = {
+        'fields': {field: {vocab.label(code): count for code, count in sorted(Counter(codes).items())}
+                   for field, vocab in categories.vocabularies.items()
+                   if (codes := data.category_codes(field)) is not None},
+        'unmapped': {field: [[value, count] for value, count in values]
+                     for field, values in categories.unmapped_report().items()},
+        'sources_renamed': {r.source: r.key for r in data.respondents
+                            if r.key != r.source.rsplit('/', 1)[-1][:-len('.json')]},
+    }
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=1))
+        return
+
+    for field, counts in report['fields'].items():
+        print(f"{field}: " + ', '.join(f"{label} {n}" for label, n in counts.items()))
+    print()
+    for field, values in report['unmapped'].items():
+        total = sum(count for _, count in values)
+        print(f"Не приведено ({field}): {len(values)} значений, {total} раз")
+        for value, count in values[:args.limit]:
+            print(f"  {count:4d}  {str(value)[:90]}")
+    print()
+    print(f"Имена файлов приведены: {len(report['sources_renamed'])}")
+    for source, key in list(report['sources_renamed'].items())[:args.limit]:
+        print(f"  {source} → {key}")
+
+
+if __name__ == "__main__":
+    main()
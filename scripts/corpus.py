@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+Корпус анкет Space Travel в памяти: L1, L2, L3 и иерархия.
+
+Все JSON разбираются один раз (параллельно) и раскладываются в
+компактные записи со __slots__:
+- Respondent — респондент любой анкеты (уровень, ФИО, департамент, отдел)
+- Task — задача L3 (время, регулярность, рутинность, взаимодействия)
+- DivisionTask / Process — задачи и процессы отделов L2
+- Goal / GoalTask / GoalProcess — цели, задачи и процессы департаментов L1
+Файлы hierarchy/*.json хранятся как есть (словари).
+
+Индексы: респонденты по уровню, департаменту и отделу; задачи L3 по
+респонденту, департаменту, отделу и любому полю задачи (строятся по
+запросу).
+
+Категории (рутинность, регулярность, тип и характер задачи, приоритет,
+критичность и наличие регламента процесса L1, департамент и отдел)
+приводятся при загрузке справочником categories.py к каноническим
+интернированным строкам; их целочисленные коды — category_codes(поле).
+Свободный текст хранится как в анкете. Respondent.key — имя анкеты без
+опечаток в имени файла (oprosnik_chernysheva.xlsх.json → oprosnik_chernysheva).
+
+Снимок: корпус сохраняется в .corpus_snapshot.pickle вместе с mtime и
+размерами исходных файлов. Следующий запуск загружает снимок за
+десятки миллисекунд вместо разбора JSON, если ни один файл (и сам
+corpus.py) не изменился; иерархия и процессы L2 разбираются из снимка
+при первом обращении.
+
+Использование из кода:
+    from corpus import load_corpus
+    corpus = load_corpus()
+    for task in corpus.tasks_where(department='IT', regularity='Ежедневно'):
+        print(task.name, task.time_minutes)
+
+Из командной строки:
+    python corpus.py                 — сводка и время загрузки
+    python corpus.py --rebuild       — пересобрать снимок
+    python corpus.py --department IT — респонденты и задачи департамента
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import tempfile
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import categories
+from categories import Categories
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Каталоги корпуса: (шаблон, уровень)
+SOURCES = (
+    ('L1_json/*.json', 'L1'),
+    ('L2_json/*.json', 'L2'),
+    ('L3_json/*.json', 'L3'),
+    ('hierarchy/*.json', 'hierarchy'),
+)
+
+SNAPSHOT_FILE = '.corpus_snapshot.pickle'
+SNAPSHOT_VERSION = 2
+# Крупные и редко нужные части снимка разбираются при первом обращении
+LAZY_FIELDS = ('hierarchy', 'division_tasks', 'goal_processes')
+
+# Поля-категории с кодами: список записей → поля справочника categories.py
+CATEGORY_FIELDS = {
+    'respondents': ('department', 'division'),
+    'tasks': ('task_type', 'routine_level', 'regularity', 'task_character', 'priority'),
+    'goal_processes': ('criticality', 'has_regulation'),
+}
+
+# Разделители в перечислениях ресурсов, заданных одной строкой
+LIST_SEPARATORS_RE = re.compile(r'\s*[,;\n]\s*')
+
+
+# ============================================================
+# Записи
+# ============================================================
+
+class Record:
+    """Базовая запись: поля из __slots__, создание по именованным аргументам."""
+
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __reduce__(self):
+        # Кортеж значений вместо словаря состояния: снимок меньше и грузится быстрее
+        return _restore, (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        shown = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__[:4])
+        return f'{type(self).__name__}({shown}, …)'
+
+
+def _restore(cls, values):
+    record = cls.__new__(cls)
+    for name, value in zip(cls.__slots__, values):
+        setattr(record, name, value)
+    return record
+
+
+class Respondent(Record):
+    __slots__ = ('id', 'level', 'fio', 'department', 'division', 'position',
+                 'division_size', 'date', 'modeled', 'source', 'key')
+
+
+class Task(Record):
+    """Задача L3. interactions — кортеж пар (департамент, описание)."""
+
+    __slots__ = ('id', 'respondent', 'number', 'name', 'task_type', 'routine_level',
+                 'regularity', 'time_minutes', 'character', 'priority', 'problem',
+                 'problem_cause', 'expected_results', 'risks', 'internal_resources',
+                 'external_resources', 'interactions')
+
+
+class DivisionTask(Record):
+    """Задача отдела L2 с процессами."""
+
+    __slots__ = ('id', 'respondent', 'name', 'processes')
+
+
+class Process(Record):
+    """Процесс L2. steps — кортеж словарей шагов как в анкете."""
+
+    __slots__ = ('name', 'description', 'trigger', 'result', 'systems', 'databases',
+                 'steps_count', 'steps', 'interactions')
+
+
+class Goal(Record):
+    __slots__ = ('respondent', 'row', 'text')
+
+
+class GoalTask(Record):
+    __slots__ = ('respondent', 'row', 'goal_row', 'text')
+
+
+class GoalProcess(Record):
+    __slots__ = ('respondent', 'row', 'task_row', 'name', 'criticality',
+                 'employees_involved', 'departments_involved', 'has_regulation',
+                 'problems', 'causes', 'needs_automation', 'why', 'expected_effect')
+
+
+# ============================================================
+# Нормализация значений
+# ============================================================
+
+def _int_or_none(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+def _as_tuple(value):
+    """Список или строка-перечисление → кортеж строк."""
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return tuple(item for item in LIST_SEPARATORS_RE.split(value.strip()) if item)
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return (value,)
+
+
+# ============================================================
+# Корпус
+# ============================================================
+
+class Corpus:
+    """Записи анкет и индексы по ним."""
+
+    def __init__(self):
+        self.respondents = []
+        self.tasks = []
+        self.division_tasks = []
+        self.goals = []
+        self.goal_tasks = []
+        self.goal_processes = []
+        self.hierarchy = {}
+        self.sources = {}
+        self.by_level = {}
+        self.by_department = {}
+        self.by_division = {}
+        self.tasks_by_respondent = {}
+        self.categories = Categories()
+        # Коды категорий: поле → array('H') параллельно задачам или процессам L1
+        self.codes = {field: array('H') for fields in CATEGORY_FIELDS.values() for field in fields}
+        self._task_indexes = {}
+        self._packed = {}
+
+    # --- снимок
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for name in LAZY_FIELDS:
+            if name in state:
+                state[name] = pickle.dumps(state[name], protocol=pickle.HIGHEST_PROTOCOL)
+        state['_packed'] = {}
+        state['_task_indexes'] = {}
+        return state
+
+    def __setstate__(self, state):
+        packed = {name: state.pop(name) for name in LAZY_FIELDS if name in state}
+        self.__dict__.update(state)
+        self._packed = packed
+
+    def __getattr__(self, name):
+        # Вызывается только для отсутствующих атрибутов — отложенные части снимка
+        packed = self.__dict__.get('_packed')
+        if packed and name in packed:
+            value = pickle.loads(packed.pop(name))
+            setattr(self, name, value)
+            return value
+        raise AttributeError(name)
+
+    # --- наполнение
+
+    def _category(self, field, value):
+        """Каноническое значение категории; код — в столбец codes[field]."""
+        vocab = self.categories.vocabulary(field)
+        code = vocab.code(value)
+        if field in self.codes:
+            self.codes[field].append(code)
+        return vocab.labels[code] if code else None
+
+    def _interactions(self, items):
+        result = []
+        for item in items or ():
+            if isinstance(item, dict):
+                code = self.categories.code('department', item.get('department'))
+                result.append((self.categories.label('department', code) if code else None,
+                               item.get('description')))
+        return tuple(result)
+
+    def add_respondent(self, level, data, source):
+        info = data.get('respondent') or {}
+        respondent = Respondent(
+            id=len(self.respondents), level=level,
+            fio=info.get('fio'),
+            department=self._category('department', info.get('department')),
+            division=self._category('division', info.get('division')),
+            position=info.get('position'),
+            division_size=_int_or_none(info.get('division_size')),
+            date=info.get('date'),
+            modeled='modeling_note' in data,
+            source=source,
+            key=categories.source_key(Path(source).name),
+        )
+        self.respondents.append(respondent)
+        return respondent.id
+
+    def add_l3(self, data, source):
+        rid = self.add_respondent('L3', data, source)
+        for item in data.get('tasks') or ():
+            self.tasks.append(Task(
+                id=len(self.tasks), respondent=rid,
+                number=item.get('task_number'),
+                name=item.get('task_name'),
+                task_type=self._category('task_type', item.get('task_type')),
+                routine_level=self._category('routine_level', item.get('routine_level')),
+                regularity=self._category('regularity', item.get('regularity')),
+                time_minutes=item.get('time_minutes') if isinstance(item.get('time_minutes'), int) else None,
+                character=self._category('task_character', item.get('task_character')),
+                priority=self._category('priority', item.get('priority')),
+                problem=item.get('problem'),
+                problem_cause=item.get('problem_cause'),
+                expected_results=item.get('expected_results'),
+                risks=item.get('risks'),
+                internal_resources=_as_tuple(item.get('internal_resources')),
+                external_resources=_as_tuple(item.get('external_resources')),
+                interactions=self._interactions(item.get('interactions')),
+            ))
+
+    def add_l2(self, data, source):
+        rid = self.add_respondent('L2', data, source)
+        for item in data.get('division_tasks') or ():
+            processes = tuple(Process(
+                name=p.get('process_name'),
+                description=p.get('process_description'),
+                trigger=p.get('process_trigger'),
+                result=p.get('process_result'),
+                systems=_as_tuple(p.get('process_systems')),
+                databases=_as_tuple(p.get('process_databases')),
+                steps_count=_int_or_none(p.get('process_steps_count')),
+                steps=tuple(p.get('process_steps') or ()),
+                interactions=self._interactions(p.get('interactions_from_L3')),
+            ) for p in item.get('task_processes') or ())
+            self.division_tasks.append(DivisionTask(
+                id=len(self.division_tasks), respondent=rid,
+                name=item.get('task_name'), processes=processes))
+
+    def add_l1(self, data, source):
+        rid = self.add_respondent('L1', data, source)
+        for item in data.get('goals') or ():
+            self.goals.append(Goal(respondent=rid, row=item.get('row'), text=item.get('text')))
+        for item in (data.get('tasks') or []) + (data.get('global_tasks') or []):
+            self.goal_tasks.append(GoalTask(respondent=rid, row=item.get('row'),
+                                            goal_row=item.get('goal_row'), text=item.get('text')))
+        for item in data.get('processes') or ():
+            fields = {name: item.get(name) for name in GoalProcess.__slots__ if name != 'respondent'}
+            for field in CATEGORY_FIELDS['goal_processes']:
+                fields[field] = self._category(field, fields[field])
+            self.goal_processes.append(GoalProcess(respondent=rid, **fields))
+
+    def build_indexes(self):
+        """Индексы по респондентам и задачам (после наполнения)."""
+        for index in (self.by_level, self.by_department, self.by_division, self.tasks_by_respondent):
+            index.clear()
+        self._task_indexes = {}
+        for respondent in self.respondents:
+            self.by_level.setdefault(respondent.level, []).append(respondent.id)
+            if respondent.department:
+                self.by_department.setdefault(respondent.department, []).append(respondent.id)
+            if respondent.division:
+                self.by_division.setdefault(respondent.division, []).append(respondent.id)
+        for task in self.tasks:
+            self.tasks_by_respondent.setdefault(task.respondent, []).append(task.id)
+
+    # --- запросы
+
+    def respondent_of(self, record):
+        """Респондент задачи, процесса или цели."""
+        return self.respondents[record.respondent]
+
+    def respondents_in(self, department=None, division=None, level=None):
+        """Респонденты по департаменту, отделу и/или уровню."""
+        ids = None
+        for index, key in ((self.by_department, department), (self.by_division, division),
+                           (self.by_level, level)):
+            if key is None:
+                continue
+            found = set(index.get(key, ()))
+            ids = found if ids is None else ids & found
+        if ids is None:
+            return list(self.respondents)
+        return [self.respondents[rid] for rid in sorted(ids)]
+
+    def category_codes(self, field):
+        """Коды категории (array) параллельно задачам L3, процессам L1 или респондентам.
+
+        Метки кодов — self.categories.label(field, code); None, если поле не категория.
+        """
+        return self.codes.get(field)
+
+    def tasks_of(self, respondent_id):
+        """Задачи L3 респондента."""
+        return [self.tasks[tid] for tid in self.tasks_by_respondent.get(respondent_id, ())]
+
+    def task_index(self, field):
+        """Индекс задач L3 по полю: значение → список id (строится один раз).
+
+        Кроме полей Task доступны department и division респондента.
+        """
+        if field not in self._task_indexes:
+            index = {}
+            if field in ('department', 'division'):
+                for task in self.tasks:
+                    value = getattr(self.respondents[task.respondent], field)
+                    index.setdefault(value, []).append(task.id)
+            elif field in Task.__slots__:
+                for task in self.tasks:
+                    index.setdefault(getattr(task, field), []).append(task.id)
+            else:
+                raise ValueError(f"Нет такого поля задачи: {field}")
+            self._task_indexes[field] = index
+        return self._task_indexes[field]
+
+    def tasks_where(self, **conditions):
+        """Задачи L3, у которых все указанные поля равны заданным значениям."""
+        ids = None
+        for field, value in conditions.items():
+            found = self.task_index(field).get(value, ())
+            ids = set(found) if ids is None else ids & set(found)
+            if not ids:
+                return []
+        if ids is None:
+            return list(self.tasks)
+        return [self.tasks[tid] for tid in sorted(ids)]
+
+    def summary(self):
+        """Размеры корпуса (для CLI и отчётов)."""
+        return {
+            'respondents': {level: len(ids) for level, ids in sorted(self.by_level.items())},
+            'departments': len(self.by_department),
+            'divisions': len(self.by_division),
+            'tasks_l3': len(self.tasks),
+            'division_tasks_l2': len(self.division_tasks),
+            'processes_l2': sum(len(t.processes) for t in self.division_tasks),
+            'goals_l1': len(self.goals),
+            'goal_processes_l1': len(self.goal_processes),
+            'hierarchy_files': len(self.hierarchy),
+            'source_files': len(self.sources),
+        }
+
+
+# ============================================================
+# Загрузка
+# ============================================================
+
+def source_files(root=REPO_ROOT):
+    """Исходные файлы корпуса: [(путь, уровень)] в стабильном порядке."""
+    files = []
+    for pattern, level in SOURCES:
+        for path in sorted(glob.glob(str(Path(root) / pattern))):
+            files.append((Path(path), level))
+    return files
+
+
+def source_stamps(files, root=REPO_ROOT):
+    """mtime и размер исходных файлов — ключ снимка."""
+    stamps = {}
+    for path, _ in files:
+        st = path.stat()
+        stamps[str(path.relative_to(root))] = (st.st_mtime_ns, st.st_size)
+    return stamps
+
+
+def _code_version():
+    # Изменение загрузчика или справочника категорий тоже делает снимок устаревшим
+    digest = hashlib.sha256(Path(__file__).read_bytes()
+                            + Path(categories.__file__).read_bytes()).hexdigest()[:16]
+    return f'{SNAPSHOT_VERSION}:{digest}'
+
+
+def _read_json(path):
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def parse_corpus(root=REPO_ROOT, workers=None):
+    """Разобрать все JSON корпуса (чтение и разбор в пуле потоков)."""
+    files = source_files(root)
+    corpus = Corpus()
+    corpus.sources = source_stamps(files, root)
+    with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as pool:
+        parsed = list(pool.map(_read_json, [path for path, _ in files]))
+
+    # Записи добавляются в порядке файлов: id стабильны между запусками
+    for (path, level), data in zip(files, parsed):
+        source = str(path.relative_to(root))
+        if level == 'hierarchy':
+            corpus.hierarchy[path.name] = data
+        elif level == 'L3':
+            corpus.add_l3(data, source)
+        elif level == 'L2':
+            corpus.add_l2(data, source)
+        else:
+            corpus.add_l1(data, source)
+    corpus.build_indexes()
+    return corpus
+
+
+def load_snapshot(snapshot_path, stamps):
+    """Корпус из снимка или None, если снимка нет или он устарел."""
+    try:
+        with open(snapshot_path, 'rb') as f:
+            key = pickle.load(f)
+            if key != {'version': _code_version(), 'sources': stamps}:
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+
+def save_snapshot(corpus, snapshot_path):
+    """Атомарно записать снимок: сначала ключ, затем корпус."""
+    snapshot_path = Path(snapshot_path)
+    fd, tmp_name = tempfile.mkstemp(prefix='.corpus_', suffix='.tmp', dir=snapshot_path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'version': _code_version(), 'sources': corpus.sources}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(corpus, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, snapshot_path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+def load_corpus(root=REPO_ROOT, snapshot=True, rebuild=False, workers=None):
+    """Загрузить корпус: из снимка, если он актуален, иначе разобрать JSON.
+
+    snapshot=False — не читать и не писать снимок; rebuild=True —
+    разобрать заново и перезаписать снимок.
+    """
+    root = Path(root)
+    snapshot_path = root / SNAPSHOT_FILE
+    if snapshot and not rebuild:
+        corpus = load_snapshot(snapshot_path, source_stamps(source_files(root), root))
+        if corpus is not None:
+            return corpus
+    corpus = parse_corpus(root, workers)
+    if snapshot:
+        try:
+            save_snapshot(corpus, snapshot_path)
+        except OSError as exc:
+            print(f"Предупреждение: снимок не сохранён ({exc})", file=sys.stderr)
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Корпус анкет L1/L2/L3 (Space Travel)")
+    parser.add_argument('--root', default=str(REPO_ROOT), help="корень репозитория")
+    parser.add_argument('--rebuild', action='store_true', help="пересобрать снимок")
+    parser.add_argument('--no-snapshot', action='store_true', help="не использовать снимок")
+    parser.add_argument('--department', help="показать респондентов и задачи департамента")
+    parser.add_argument('--json', action='store_true', help="сводка в JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    corpus = load_corpus(args.root, snapshot=not args.no_snapshot, rebuild=args.rebuild)
+    seconds = time.perf_counter() - start
+
+    if args.department:
+        respondents = corpus.respondents_in(department=args.department)
+        if not respondents:
+            print(f"Ошибка: департамент не найден: {args.department}")
+            sys.exit(1)
+        for respondent in respondents:
+            tasks = corpus.tasks_of(respondent.id)
+            minutes = sum(task.time_minutes or 0 for task in tasks)
+            print(f"  {respondent.level}  {respondent.fio} — {respondent.division or '—'}: "
+                  f"задач {len(tasks)}, {minutes} мин")
+        return
+
+    summary = corpus.summary()
+    summary['load_ms'] = round(seconds * 1000, 1)
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=1))
+        return
+    print(f"Загрузка: {summary['load_ms']} мс")
+    print("Респонденты: " + ', '.join(f"{level} {n}" for level, n in summary['respondents'].items()))
+    print(f"Департаментов: {summary['departments']}, отделов: {summary['divisions']}")
+    print(f"Задач L3: {summary['tasks_l3']}, задач L2: {summary['division_tasks_l2']} "
+          f"(процессов {summary['processes_l2']}), целей L1: {summary['goals_l1']}")
+    print(f"Файлов: {summary['source_files']} (иерархия: {summary['hierarchy_files']})")
+
+
+if __name__ == "__main__":
+    main()
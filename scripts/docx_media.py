@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Оптимизация изображений при переупаковке DOCX (word/media/*).
+
+- одинаковые файлы (по sha256) остаются в одном экземпляре, связи во
+  всех *.rels переводятся на него, дубликаты удаляются из архива
+- изображения шире 19 см (ширина контента) при заданном DPI
+  уменьшаются до этой ширины (нужен Pillow)
+- PNG пересжимаются без потерь; JPEG перекодируются, только если задано
+  качество (quality) или изображение уменьшено
+- результат берётся, только если он меньше исходного файла
+
+Pillow необязателен: без него PNG пересжимаются zlib (уровень 9),
+а уменьшение и перекодирование JPEG пропускаются.
+
+Размер на странице задаётся в document.xml (wp:extent) и не меняется.
+
+Используется из format_docx_xml.py (--media) и format_docx.py (--media).
+"""
+
+import hashlib
+import io
+import posixpath
+import re
+import struct
+import zlib
+from xml.sax.saxutils import escape, unescape
+
+from table_layout import CONTENT_WIDTH_TWIPS
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow не установлен — только сжатие PNG без потерь
+    Image = None
+
+
+MEDIA_PREFIX = 'word/media/'
+
+# Разрешение по умолчанию: 150 точек на дюйм — чётко на экране и при печати
+DEFAULT_DPI = 150
+# Качество JPEG, если изображение уменьшено, а quality не задано
+DEFAULT_JPEG_QUALITY = 90
+TWIPS_PER_INCH = 1440
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Маркеры JPEG с размерами кадра (SOF0…SOF15 без DHT, JPG, DAC)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+RELATIONSHIP_RE = re.compile(r'<Relationship\b[^>]*>')
+TARGET_RE = re.compile(r'\bTarget="([^"]*)"')
+OVERRIDE_RE = re.compile(r'<Override\b[^>]*\bPartName="([^"]*)"[^>]*/>')
+
+
+def max_width_px(dpi=DEFAULT_DPI):
+    """Ширина контента (19 см) в пикселях при заданном DPI."""
+    return CONTENT_WIDTH_TWIPS * dpi // TWIPS_PER_INCH
+
+
+# ============================================================
+# Форматы без Pillow
+# ============================================================
+
+def image_format(data):
+    """'PNG', 'JPEG' или None (прочие форматы не трогаем)."""
+    if data.startswith(PNG_SIGNATURE):
+        return 'PNG'
+    if data.startswith(b'\xff\xd8'):
+        return 'JPEG'
+    return None
+
+
+def image_width(data):
+    """Ширина изображения в пикселях по заголовку (PNG/JPEG) или None."""
+    fmt = image_format(data)
+    if fmt == 'PNG' and len(data) >= 24:
+        return struct.unpack('>I', data[16:20])[0]
+    if fmt == 'JPEG':
+        pos = 2
+        while pos + 9 <= len(data):
+            if data[pos] != 0xFF:
+                return None
+            marker = data[pos + 1]
+            if marker == 0xFF:
+                pos += 1
+                continue
+            length = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+            if marker in JPEG_SOF_MARKERS:
+                return struct.unpack('>H', data[pos + 7:pos + 9])[0]
+            pos += 2 + length
+    return None
+
+
+def _png_chunks(data):
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        yield kind, data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b'IEND':
+            break
+
+
+def _png_chunk(kind, body):
+    return struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body))
+
+
+def recompress_png(data):
+    """PNG без потерь: все IDAT склеиваются и сжимаются zlib с уровнем 9."""
+    chunks = list(_png_chunks(data))
+    idat = b''.join(body for kind, body in chunks if kind == b'IDAT')
+    if not idat:
+        return data
+    packed = zlib.compress(zlib.decompress(idat), 9)
+    parts = [PNG_SIGNATURE]
+    written = False
+    for kind, body in chunks:
+        if kind == b'IDAT':
+            if not written:
+                parts.append(_png_chunk(kind, packed))
+                written = True
+            continue
+        parts.append(_png_chunk(kind, body))
+    return b''.join(parts)
+
+
+# ============================================================
+# Оптимизация одного изображения
+# ============================================================
+
+def _pillow_optimise(data, fmt, max_width, quality):
+    """Уменьшить и пересохранить через Pillow. Вернуть (байты, уменьшено) или None."""
+    with Image.open(io.BytesIO(data)) as img:
+        img.load()
+        resized = img.width > max_width
+        if fmt == 'JPEG' and not resized and quality is None:
+            return None
+        icc_profile = img.info.get('icc_profile')
+        if resized:
+            if img.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                img = img.convert('RGBA' if fmt == 'PNG' else 'RGB')
+            height = max(1, round(img.height * max_width / img.width))
+            img = img.resize((max_width, height), Image.LANCZOS)
+        out = io.BytesIO()
+        if fmt == 'PNG':
+            img.save(out, 'PNG', optimize=True, icc_profile=icc_profile)
+        else:
+            if img.mode not in ('RGB', 'L', 'CMYK'):
+                img = img.convert('RGB')
+            img.save(out, 'JPEG', quality=quality or DEFAULT_JPEG_QUALITY, optimize=True,
+                     icc_profile=icc_profile)
+    return out.getvalue(), resized
+
+
+def optimise_image(data, max_width, quality=None):
+    """Оптимизировать изображение. Вернуть (байты, действие).
+
+    Действие: 'resized', 'recompressed' или None — оставлено как есть.
+    Шире max_width без Pillow — см. needs_resize().
+    """
+    fmt = image_format(data)
+    if fmt is None:
+        return data, None
+    if Image is not None:
+        try:
+            result = _pillow_optimise(data, fmt, max_width, quality)
+        except (OSError, ValueError, SyntaxError):
+            result = None  # повреждённое или неподдерживаемое изображение
+        if result is not None and len(result[0]) < len(data):
+            return result[0], 'resized' if result[1] else 'recompressed'
+        return data, None
+
+    if fmt == 'PNG':
+        try:
+            packed = recompress_png(data)
+        except zlib.error:
+            packed = data
+        if len(packed) < len(data):
+            return packed, 'recompressed'
+    return data, None
+
+
+def needs_resize(data, max_width):
+    """Изображение шире max_width, а уменьшить его нечем (нет Pillow)."""
+    return Image is None and (image_width(data) or 0) > max_width
+
+
+# ============================================================
+# План для архива
+# ============================================================
+
+def plan_media(zf, dpi=DEFAULT_DPI, quality=None):
+    """Подготовить оптимизацию word/media/* открытого архива.
+
+    Вернуть план: images — {имя: новые байты} (только изменённые),
+    duplicates — {дубликат: оставляемый файл}, rels — части *.rels со
+    ссылками на дубликаты, счётчики и размеры до/после.
+    """
+    max_width = max_width_px(dpi)
+    seen = {}
+    plan = {'images': {}, 'duplicates': {}, 'rels': [], 'files': 0, 'before': 0, 'after': 0,
+            'resized': 0, 'recompressed': 0, 'oversized': 0}
+    for info in zf.infolist():
+        name = info.filename
+        if not name.startswith(MEDIA_PREFIX) or name.endswith('/'):
+            continue
+        data = zf.read(info)
+        plan['files'] += 1
+        plan['before'] += len(data)
+        digest = hashlib.sha256(data).digest()
+        if digest in seen:
+            plan['duplicates'][name] = seen[digest]
+            continue
+        seen[digest] = name
+        new_data, action = optimise_image(data, max_width, quality)
+        if action is not None:
+            plan[action] += 1
+        if needs_resize(data, max_width):
+            plan['oversized'] += 1
+        if new_data is not data:
+            plan['images'][name] = new_data
+        plan['after'] += len(new_data)
+
+    if plan['duplicates']:
+        plan['rels'] = [name for name in zf.NameToInfo
+                        if name.endswith('.rels') and b'media/' in zf.read(name)]
+    return plan
+
+
+def _rels_base(rels_part):
+    """Каталог, от которого считаются Target в части связей (word/_rels/x.rels → word)."""
+    folder = posixpath.dirname(rels_part)
+    return posixpath.dirname(folder) if posixpath.basename(folder) == '_rels' else folder
+
+
+def rewrite_relationships(data, rels_part, duplicates):
+    """Перевести связи с дубликатов на оставляемые файлы (остальные байты не трогаются)."""
+    base = _rels_base(rels_part)
+
+    def retarget(match):
+        tag = match.group()
+        if 'TargetMode="External"' in tag:
+            return tag
+        target = TARGET_RE.search(tag)
+        if target is None:
+            return tag
+        value = unescape(target.group(1), {'&quot;': '"'})
+        absolute = value.startswith('/')
+        name = value[1:] if absolute else posixpath.normpath(posixpath.join(base, value))
+        keep = duplicates.get(name)
+        if keep is None:
+            return tag
+        new_value = '/' + keep if absolute else posixpath.relpath(keep, base or '.')
+        return tag[:target.start(1)] + escape(new_value, {'"': '&quot;'}) + tag[target.end(1):]
+
+    return RELATIONSHIP_RE.sub(retarget, data.decode('utf-8')).encode('utf-8')
+
+
+def drop_overrides(data, removed):
+    """[Content_Types].xml без Override для удалённых частей."""
+    def drop(match):
+        return '' if match.group(1).lstrip('/') in removed else match.group()
+    return OVERRIDE_RE.sub(drop, data.decode('utf-8')).encode('utf-8')
+
+
+def saved_bytes(plan):
+    """Сколько байт медиа сэкономлено (до сжатия архива)."""
+    return plan['before'] - plan['after']
+
+
+def summary(plan):
+    """Строка отчёта по плану."""
+    if not plan['files']:
+        return "Медиа: нет изображений"
+    parts = [f"дубликатов {len(plan['duplicates'])}", f"уменьшено {plan['resized']}",
+             f"пересжато {plan['recompressed']}"]
+    line = (f"Медиа: {plan['files']} файлов ({', '.join(parts)}), "
+            f"{plan['before'] / 1024:.0f} → {plan['after'] / 1024:.0f} КБ, "
+            f"экономия {saved_bytes(plan) / 1024:.0f} КБ")
+    if plan['oversized']:
+        line += f"; без Pillow не уменьшено: {plan['oversized']}"
+    return line
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Экспорт описаний бизнес-процессов для docs/bp_interactive.html по частям.
+
+docs/docs_data.js (const DOCS) и docs/ex_data.js (const EX) — единые
+блоки на все процессы; страница загружала бы их целиком до первого
+рендера. Здесь те же данные собираются из processes/2.3_BP_NN_*.md и
+раскладываются по файлам:
+- docs/data/bp-NN.<хэш>.json — документ одного процесса: HTML описания
+  (классы doch1/doch2/doch3/docp/doctbl, как в DOCS) и таблицы EX
+  (участники, системы, KPI, риски, точки автоматизации); таблица, которой
+  нет в .md, берётся из docs/ex_data.js (EX собирался вручную)
+- docs/data/ex.<хэш>.json — EX всех процессов из docs/ex_data.js для
+  сводных вкладок (те же данные, что у страницы без сервера)
+- docs/data/manifest.json — маленький список процессов (название,
+  владелец, критичность, имя файла части) и имя части EX; загружается
+  первым
+- docs/data/bp_loader.js — loadBPManifest(), loadBPEx(), loadBP(id):
+  манифест, затем нужная часть по запросу (fetch, с запоминанием;
+  неудачная загрузка не запоминается)
+
+docs/bp_interactive.html по http загружает манифест, затем EX, а
+описание процесса (DOCS) — из его части при первом открытии. По file://
+fetch недоступен: страница подключает docs_data.js и ex_data.js.
+docs_data.js записывается по --legacy из тех же частей, поэтому оба
+способа показывают один и тот же документ.
+
+Имена частей содержат хэш содержимого — браузер может кэшировать их
+бессрочно. JSON без пробелов. В манифесте хранится хэш исходного .md
+и версия экспортёра (с учётом ex_data.js): пересобираются только части
+изменённых процессов, устаревшие файлы удаляются.
+
+Использование:
+    python export_docs.py                 — обновить docs/data/
+    python export_docs.py --force         — пересобрать все части
+    python export_docs.py --check         — расхождения EX с docs/ex_data.js
+                                            (ex_data.js собирался вручную)
+    python export_docs.py --legacy        — также записать docs_data.js
+                                            (ex_data.js не перезаписывается)
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+from md_to_docx import BULLET_CHARS, iter_blocks, parse_inline
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PROCESSES_DIR = REPO_ROOT / 'processes'
+OUTPUT_DIR = REPO_ROOT / 'docs' / 'data'
+LEGACY_DOCS = REPO_ROOT / 'docs' / 'docs_data.js'
+LEGACY_EX = REPO_ROOT / 'docs' / 'ex_data.js'
+
+EXPORT_VERSION = 1
+MANIFEST = 'manifest.json'
+LOADER = 'bp_loader.js'
+SHARD_RE = re.compile(r'^(bp-\d+|ex)\.[0-9a-f]+\.json$')
+PROCESS_RE = re.compile(r'^2\.3_BP_(\d+)_.+\.md$')
+HASH_CHARS = 10
+
+# Значки статусов в таблицах: 🔴 КРИТИЧЕСКИЙ → КРИТИЧЕСКИЙ
+MARKS_RE = re.compile('[\U0001F300-\U0001FAFF☀-➿⬛-⭕️]\\s*')
+HEADING_TAGS = {1: ('h2', 'doch1'), 2: ('h3', 'doch2')}
+DEFAULT_HEADING = ('h4', 'doch3')
+# Строки «**Поле:** значение» подряд — отдельные абзацы, а не один
+FIELD_LINE_RE = re.compile(r'\s+(?=\*\*[^*]+:\*\*)')
+
+# Таблицы EX: поле → (обязательные столбцы, ключ → начало названия столбца)
+EX_TABLES = {
+    'participants': (('роль', 'ответствен'), {'role': 'роль', 'dept': 'подразделен', 'resp': 'ответствен'}),
+    'systems': (('система',), {'name': 'система', 'role': 'роль', 'int': 'интеграц'}),
+    'kpis': (('метрика', 'текущ'), {'metric': 'метрика', 'target': 'цел', 'current': 'текущ'}),
+    'risks': (('проблема', 'причина'), {'problem': 'проблема', 'cause': 'причина', 'impact': 'влияние'}),
+    'automation': (('id', 'название'), {'id': 'id', 'name': 'название', 'desc': 'описание',
+                                       'effect': 'ожидаемый эффект', 'priority': 'приоритет'}),
+}
+# Подзаголовок над таблицей рисков → уровень
+RISK_LEVELS = (('критич', 'critical'), ('высок', 'high'), ('средн', 'medium'), ('низк', 'low'))
+TOTAL_ROW_RE = re.compile(r'^итого', re.IGNORECASE)
+
+LOADER_JS = """// Создано scripts/export_docs.py — не редактировать вручную
+(function(){
+  var base=(document.currentScript&&document.currentScript.src||'').replace(/[^/]*$/,'');
+  var parts={};
+  function getJSON(name){return fetch(base+name).then(function(r){
+    if(!r.ok)throw new Error(name+': '+r.status);return r.json();});}
+  function once(key,load){
+    if(!parts[key])parts[key]=load().catch(function(e){delete parts[key];throw e;});
+    return parts[key];}
+  window.loadBPManifest=function(){return once('manifest',function(){return getJSON('manifest.json');});};
+  window.loadBPEx=function(){return once('ex',function(){
+    return window.loadBPManifest().then(function(m){return getJSON(m.ex);});});};
+  window.loadBP=function(id){return once('bp-'+id,function(){
+    return window.loadBPManifest().then(function(m){
+      var p=m.processes.find(function(x){return x.id===id;});
+      if(!p)throw new Error('BP-'+id+' не найден');return getJSON(p.file);});});};
+})();
+"""
+
+
+# ============================================================
+# Markdown → HTML
+# ============================================================
+
+def plain_text(text):
+    """Текст без строчной разметки и значков статусов."""
+    pieces = [' ' if piece is None else piece for piece, _, _ in parse_inline(text)]
+    return ' '.join(MARKS_RE.sub('', ''.join(pieces)).split())
+
+
+def render_html(lines):
+    """HTML описания процесса в разметке DOCS."""
+    out = []
+    for block in iter_blocks(lines):
+        kind = block[0]
+        if kind == 'heading':
+            tag, css = HEADING_TAGS.get(block[1], DEFAULT_HEADING)
+            out.append(f'<{tag} class="{css}">{html.escape(plain_text(block[2]))}</{tag}>')
+        elif kind in ('paragraph', 'quote'):
+            for part in FIELD_LINE_RE.split(block[1]):
+                text = plain_text(part)
+                if text:
+                    out.append(f'<p class="docp">{html.escape(text)}</p>')
+        elif kind == 'item':
+            _, _, level, start, text = block
+            marker = f'{start}.' if start is not None else BULLET_CHARS[level % len(BULLET_CHARS)]
+            indent = ' ' * (4 * level)
+            out.append(f'<p class="docp">{indent}{marker} {html.escape(plain_text(text))}</p>')
+        elif kind == 'table':
+            head, *rows = block[1]
+            cells = ''.join(f'<th>{html.escape(plain_text(cell))}</th>' for cell in head)
+            body = ''.join('<tr>' + ''.join(f'<td>{html.escape(plain_text(cell))}</td>' for cell in row)
+                           + '</tr>' for row in rows)
+            out.append(f'<table class="doctbl"><thead><tr>{cells}</tr></thead><tbody>{body}</tbody></table>')
+        elif kind == 'code':
+            # Диаграммы mermaid на странице не рисуются
+            if block[1] and not block[1][0].strip().startswith(('graph', 'flowchart', 'sequenceDiagram')):
+                out.append(f'<pre class="docp">{html.escape(chr(10).join(block[1]))}</pre>')
+    return '\n'.join(out)
+
+
+# ============================================================
+# Таблицы EX
+# ============================================================
+
+def _columns(header, wanted):
+    """Ключ → номер столбца по началу названия."""
+    names = [plain_text(cell).casefold() for cell in header]
+    columns = {}
+    for key, prefix in wanted.items():
+        index = next((i for i, name in enumerate(names) if name.startswith(prefix)), None)
+        if index is not None:
+            columns[key] = index
+    return columns
+
+
+def _table_kind(header):
+    names = [plain_text(cell).casefold() for cell in header]
+    for field, (required, _) in EX_TABLES.items():
+        if all(any(name.startswith(prefix) for name in names) for prefix in required):
+            return field
+    return None
+
+
+def extract_ex(lines):
+    """Таблицы процесса в формате EX: {participants, systems, kpis, risks, automation}."""
+    ex = {field: [] for field in EX_TABLES}
+    subheading = ''
+    for block in iter_blocks(lines):
+        if block[0] == 'heading':
+            subheading = plain_text(block[2]).casefold()
+            continue
+        if block[0] != 'table':
+            continue
+        head, *rows = block[1]
+        field = _table_kind(head)
+        if field is None or (field != 'risks' and ex[field]):
+            continue
+        columns = _columns(head, EX_TABLES[field][1])
+        level = next((name for prefix, name in RISK_LEVELS if prefix in subheading), 'high')
+        for row in rows:
+            values = {key: plain_text(row[i]) if i < len(row) else '' for key, i in columns.items()}
+            if TOTAL_ROW_RE.match(next(iter(values.values()), '')):
+                continue
+            if field == 'risks':
+                values['level'] = level
+            ex[field].append(values)
+    return ex
+
+
+# ============================================================
+# Части и манифест
+# ============================================================
+
+def _code_version(legacy_ex=LEGACY_EX):
+    code = hashlib.sha256(Path(__file__).read_bytes())
+    if Path(legacy_ex).exists():
+        code.update(Path(legacy_ex).read_bytes())
+    digest = code.hexdigest()[:16]
+    return f'{EXPORT_VERSION}:{digest}'
+
+
+def minified(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_atomic(path, text):
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix='.export_', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(text)
+        os.chmod(tmp_name, 0o644)  # файлы отдаются веб-сервером
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+def process_sources(processes_dir=PROCESSES_DIR):
+    """{'01': путь к .md} по файлам 2.3_BP_NN_*.md."""
+    sources = {}
+    for path in sorted(Path(processes_dir).glob('2.3_BP_*.md')):
+        match = PROCESS_RE.match(path.name)
+        if match:
+            sources[match.group(1).zfill(2)] = path
+    return sources
+
+
+def summary(process_id, lines):
+    """Краткие данные процесса для манифеста: название и «Общая информация»."""
+    info = {'id': process_id, 'title': '', 'owner': '', 'criticality': ''}
+    for block in iter_blocks(lines):
+        if block[0] == 'heading' and block[1] == 1 and not info['title']:
+            info['title'] = plain_text(block[2])
+        elif block[0] == 'table':
+            columns = _columns(block[1][0], {'name': 'параметр', 'value': 'значение'})
+            if len(columns) == 2:
+                for row in block[1][1:]:
+                    name = plain_text(row[columns['name']]).casefold()
+                    value = plain_text(row[columns['value']]) if columns['value'] < len(row) else ''
+                    if name.startswith('владелец'):
+                        info['owner'] = value
+                    elif name.startswith('критичн'):
+                        info['criticality'] = value
+            break
+    return info
+
+
+def curated_ex(legacy_path=LEGACY_EX):
+    """EX из docs/ex_data.js или {}, если файла нет."""
+    if not Path(legacy_path).exists():
+        return {}
+    return read_legacy(legacy_path, 'EX')
+
+
+def build_shard(process_id, source, curated=None):
+    """Текст части и данные для манифеста.
+
+    Пустые таблицы EX (в .md нет такой таблицы) заполняются из curated —
+    EX этого процесса из docs/ex_data.js.
+    """
+    lines = Path(source).read_text(encoding='utf-8').splitlines()
+    ex = extract_ex(lines)
+    for field in EX_TABLES:
+        if not ex[field] and curated and curated.get(field):
+            ex[field] = curated[field]
+    text = minified({'id': process_id, 'doc': render_html(lines), 'ex': ex})
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:HASH_CHARS]
+    entry = summary(process_id, lines)
+    entry['file'] = f'bp-{process_id}.{digest}.json'
+    entry['bytes'] = len(text.encode('utf-8'))
+    return text, entry
+
+
+def load_manifest(output_dir):
+    try:
+        with open(Path(output_dir) / MANIFEST, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def export(processes_dir=PROCESSES_DIR, output_dir=OUTPUT_DIR, force=False):
+    """Обновить части и манифест. Вернуть (манифест, пересобранные id)."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = None if force else load_manifest(output_dir)
+    version = _code_version()
+    known = {}
+    if previous and previous.get('version') == version:
+        known = {entry['id']: entry for entry in previous.get('processes', [])}
+
+    processes = []
+    rebuilt = []
+    curated = curated_ex()
+    for process_id, source in process_sources(processes_dir).items():
+        source_hash = hashlib.sha256(source.read_bytes()).hexdigest()[:HASH_CHARS]
+        entry = known.get(process_id)
+        if (entry is not None and entry.get('source_hash') == source_hash
+                and (output_dir / entry['file']).exists()):
+            processes.append(entry)
+            continue
+        text, entry = build_shard(process_id, source, curated.get(process_id))
+        entry['source'] = source.relative_to(REPO_ROOT).as_posix() if source.is_relative_to(REPO_ROOT) else str(source)
+        entry['source_hash'] = source_hash
+        write_atomic(output_dir / entry['file'], text)
+        processes.append(entry)
+        rebuilt.append(process_id)
+
+    if not curated:
+        for entry in processes:
+            shard = json.loads((output_dir / entry['file']).read_text(encoding='utf-8'))
+            curated[entry['id']] = shard['ex']
+    ex_text = minified(curated)
+    ex_file = f"ex.{hashlib.sha256(ex_text.encode('utf-8')).hexdigest()[:HASH_CHARS]}.json"
+    if not (output_dir / ex_file).exists():
+        write_atomic(output_dir / ex_file, ex_text)
+
+    manifest = {'version': version, 'ex': ex_file, 'processes': processes}
+    if rebuilt or previous != manifest:
+        write_atomic(output_dir / MANIFEST, minified(manifest))
+    loader = output_dir / LOADER
+    if not loader.exists() or loader.read_text(encoding='utf-8') != LOADER_JS:
+        write_atomic(loader, LOADER_JS)
+
+    # Части, на которые манифест больше не ссылается
+    current = {entry['file'] for entry in processes} | {ex_file}
+    for path in output_dir.iterdir():
+        if SHARD_RE.match(path.name) and path.name not in current:
+            path.unlink()
+    return manifest, rebuilt
+
+
+def read_legacy(path, name):
+    """Объект из docs/*.js вида const NAME={...};"""
+    text = Path(path).read_text(encoding='utf-8').strip()
+    prefix = f'const {name}='
+    if not text.startswith(prefix):
+        raise ValueError(f"{path}: нет {prefix}")
+    return json.loads(text[len(prefix):].rstrip(';'))
+
+
+def check_ex(sources, legacy_path=LEGACY_EX):
+    """Сравнить таблицы EX из .md (без подстановки) с docs/ex_data.js. Вернуть список расхождений."""
+    legacy = read_legacy(legacy_path, 'EX')
+    problems = []
+    for process_id, source in sources.items():
+        ex = extract_ex(Path(source).read_text(encoding='utf-8').splitlines())
+        old = legacy.get(process_id)
+        if old is None:
+            problems.append(f"BP-{process_id}: нет в {Path(legacy_path).name}")
+            continue
+        for field in EX_TABLES:
+            if ex[field] != old.get(field, []):
+                problems.append(f"BP-{process_id} {field}: {len(ex[field])} строк, в ex_data.js {len(old.get(field, []))}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Экспорт бизнес-процессов для bp_interactive.html по частям")
+    parser.add_argument('--processes', default=str(PROCESSES_DIR), help="каталог с 2.3_BP_NN_*.md")
+    parser.add_argument('-o', '--output', default=str(OUTPUT_DIR), help="каталог частей (docs/data)")
+    parser.add_argument('--force', action='store_true', help="пересобрать все части")
+    parser.add_argument('--check', action='store_true', help="сравнить EX с docs/ex_data.js")
+    parser.add_argument('--legacy', action='store_true',
+                        help="также записать docs/docs_data.js (минифицированный); ex_data.js не трогается")
+    args = parser.parse_args()
+
+    sources = process_sources(args.processes)
+    if not sources:
+        print(f"Ошибка: нет файлов 2.3_BP_*.md в {args.processes}")
+        sys.exit(1)
+
+    if args.check:
+        problems = check_ex(sources)
+        for problem in problems:
+            print(f"Расхождение: {problem}")
+        print("Совпадает с ex_data.js" if not problems else f"Расхождений: {len(problems)}")
+        sys.exit(1 if problems else 0)
+
+    manifest, rebuilt = export(args.processes, args.output, args.force)
+    total = sum(entry['bytes'] for entry in manifest['processes'])
+    manifest_size = (Path(args.output) / MANIFEST).stat().st_size
+    print(f"Процессов: {len(manifest['processes'])}, пересобрано: {len(rebuilt)}"
+          + (f" ({', '.join(rebuilt)})" if rebuilt else ''))
+    print(f"Манифест: {manifest_size / 1024:.1f} КБ, части: {total / 1024:.1f} КБ")
+
+    if args.legacy:
+        docs = {}
+        for entry in manifest['processes']:
+            shard = json.loads((Path(args.output) / entry['file']).read_text(encoding='utf-8'))
+            docs[entry['id']] = shard['doc']
+        write_atomic(LEGACY_DOCS, f'const DOCS={minified(docs)};\n')
+        print(f"Сохранение: {LEGACY_DOCS.name}")
+    print("Готово!")
+
+
+if __name__ == "__main__":
+    main()
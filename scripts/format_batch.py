@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Пакетное форматирование DOCX для Space Travel.
+
+Принимает каталоги, отдельные файлы и glob-шаблоны и форматирует все
+найденные документы в пуле процессов. Каждый процесс импортирует движок
+форматирования один раз и обрабатывает много файлов подряд.
+
+Движки:
+- xml  — format_docx_xml.process_document (без python-docx)
+- docx — format_docx.format_document (через python-docx)
+- md   — md_to_docx.render_markdown (Markdown → DOCX рядом с .md)
+
+Неизменённые документы пропускаются по кэшу (format_cache.py):
+повторный запуск после правки одного ТЗ форматирует один файл.
+
+Использование:
+    python format_batch.py tz processes -j 8
+    python format_batch.py "ЗАЩИТА_ПРОЕКТА 2/**/*.docx" --engine docx
+    python format_batch.py tz --force
+    python format_batch.py tz processes --engine md
+"""
+
+import argparse
+import contextlib
+import glob
+import importlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import format_cache
+
+
+# Модуль и функция форматирования для каждого движка
+ENGINES = {
+    'xml': ('format_docx_xml', 'process_document'),
+    'docx': ('format_docx', 'format_document'),
+    'md': ('md_to_docx', 'render_markdown'),
+}
+
+# Расширение входных файлов движка (по умолчанию .docx)
+ENGINE_SUFFIXES = {
+    'md': '.md',
+}
+
+# Загруженная функция форматирования (своя в каждом процессе пула)
+_format_func = None
+
+
+def collect_documents(patterns, suffix='.docx'):
+    """Собрать документы из каталогов, файлов и glob-шаблонов (без дублей)."""
+    seen = set()
+    documents = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = sorted(path.rglob(f'*{suffix}'))
+        elif path.is_file():
+            candidates = [path]
+        else:
+            candidates = sorted(Path(p) for p in glob.glob(pattern, recursive=True))
+
+        for candidate in candidates:
+            # ~$*.docx — lock-файлы открытых в Word документов
+            if candidate.suffix.lower() != suffix or candidate.name.startswith('~$'):
+                continue
+            key = candidate.resolve()
+            if key not in seen:
+                seen.add(key)
+                documents.append(candidate)
+    return documents
+
+
+def load_engine(engine):
+    """Импортировать движок и вернуть его функцию форматирования."""
+    if engine not in ENGINES:
+        raise ValueError(f"Неизвестный движок: {engine}")
+    module_name, func_name = ENGINES[engine]
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def _init_worker(engine):
+    """Прогреть процесс пула: импортировать движок один раз."""
+    global _format_func
+    _format_func = load_engine(engine)
+
+
+def output_for(path, engine):
+    """Путь результата: DOCX форматируется на месте, Markdown — в .docx рядом."""
+    path = Path(path)
+    return path.with_suffix('.docx') if engine == 'md' else path
+
+
+def format_one(input_path, output_path=None):
+    """Отформатировать один документ и вернуть результат в виде словаря."""
+    log = io.StringIO()
+    start = time.perf_counter()
+    result = {'path': str(input_path), 'output': str(output_path or input_path),
+              'ok': False, 'seconds': 0.0, 'error': None}
+    try:
+        with contextlib.redirect_stdout(log):
+            saved = _format_func(input_path, output_path)
+        if saved is None:
+            # Движок сам сообщил об ошибке и ничего не сохранил
+            lines = log.getvalue().strip().splitlines()
+            result['error'] = lines[-1] if lines else 'документ не сохранён'
+        else:
+            result['ok'] = True
+            result['output'] = str(saved)
+    except Exception as exc:
+        result['error'] = f"{type(exc).__name__}: {exc}"
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def format_batch(paths, engine='xml', workers=None, on_result=None):
+    """Отформатировать список документов в пуле процессов.
+
+    workers=1 — обработка в текущем процессе без пула.
+    on_result — необязательный callback, вызывается для каждого результата.
+    """
+    paths = [Path(p) for p in paths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths) or 1))
+
+    results = []
+    if workers == 1:
+        _init_worker(engine)
+        for path in paths:
+            result = format_one(path)
+            results.append(result)
+            if on_result:
+                on_result(result)
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(engine,)) as pool:
+        futures = {pool.submit(format_one, path): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as exc:
+                # Процесс пула упал целиком (например, нехватка памяти)
+                result = {'path': str(futures[future]), 'ok': False, 'seconds': 0.0,
+                          'error': f"{type(exc).__name__}: {exc}"}
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    order = {str(path): idx for idx, path in enumerate(paths)}
+    results.sort(key=lambda r: order.get(r['path'], 0))
+    return results
+
+
+def summarize(results, wall_seconds):
+    """Сводка по пакету: количество, ошибки, суммарное и реальное время."""
+    cpu_seconds = sum(r['seconds'] for r in results)
+    return {
+        'files': len(results),
+        'ok': sum(1 for r in results if r['ok']),
+        'failed': sum(1 for r in results if not r['ok']),
+        'wall_seconds': round(wall_seconds, 3),
+        'sum_seconds': round(cpu_seconds, 3),
+        'speedup': round(cpu_seconds / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+    }
+
+
+def print_result(result):
+    """Вывести строку результата по одному файлу."""
+    status = 'OK ' if result['ok'] else 'ERR'
+    line = f"  [{status}] {result['seconds']:7.2f} с  {result['path']}"
+    if result['error']:
+        line += f"  — {result['error']}"
+    print(line, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетное форматирование DOCX (Space Travel)")
+    parser.add_argument('paths', nargs='+', help="каталоги, файлы .docx (.md) или glob-шаблоны")
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='xml',
+                        help="движок форматирования (по умолчанию xml)")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="число процессов (по умолчанию — число ядер)")
+    parser.add_argument('--cache-file', default=format_cache.DEFAULT_CACHE_FILE,
+                        help="файл манифеста кэша")
+    parser.add_argument('--no-cache', action='store_true', help="не использовать кэш")
+    parser.add_argument('--force', action='store_true',
+                        help="переформатировать всё, даже актуальные документы")
+    args = parser.parse_args()
+
+    documents = collect_documents(args.paths, ENGINE_SUFFIXES.get(args.engine, '.docx'))
+    if not documents:
+        print("Ошибка: документы не найдены")
+        sys.exit(1)
+
+    try:
+        load_engine(args.engine)
+    except ImportError as exc:
+        print(f"Ошибка: движок {args.engine} недоступен ({exc})")
+        sys.exit(1)
+
+    print(f"Найдено документов: {len(documents)}, движок: {args.engine}")
+    start = time.perf_counter()
+
+    manifest = None
+    input_hashes = {}
+    pending = documents
+    if not args.no_cache:
+        manifest = format_cache.load_manifest(args.cache_file)
+        fingerprint = format_cache.config_fingerprint(args.engine)
+        pending = []
+        for path in documents:
+            fresh, input_hashes[str(path)] = format_cache.is_up_to_date(
+                manifest, path, output_for(path, args.engine), fingerprint)
+            if args.force or not fresh:
+                pending.append(path)
+        skipped = len(documents) - len(pending)
+        if skipped:
+            print(f"Актуальны (пропущены по кэшу): {skipped}")
+
+    results = format_batch(pending, args.engine, args.workers, on_result=print_result)
+
+    if manifest is not None:
+        for result in results:
+            if result['ok']:
+                format_cache.record(manifest, input_hashes[result['path']],
+                                    result['output'], fingerprint)
+        format_cache.save_manifest(manifest, args.cache_file)
+
+    summary = summarize(results, time.perf_counter() - start)
+
+    print(f"Готово: {summary['ok']} из {summary['files']}, ошибок: {summary['failed']}")
+    print(f"Время: {summary['wall_seconds']} с (сумма по файлам {summary['sum_seconds']} с, "
+          f"ускорение x{summary['speedup']})")
+
+    if summary['failed']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
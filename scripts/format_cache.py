@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Кэш форматирования DOCX для Space Travel.
+
+Манифест хранит записи вида «хеш входа + отпечаток конфигурации →
+хеш результата». Документ пропускается, если его результат уже
+получен с теми же параметрами и файл результата не менялся.
+
+Отпечаток конфигурации включает параметры форматирования движка
+(шрифт, размеры, LIGHT_BLUE_BG, MARGIN_CM и т.д.) и исходный код
+движка вместе с локальными модулями, которые он импортирует.
+
+Использование:
+    python format_cache.py --stats
+    python format_cache.py --evict [--max-age 30]
+    python format_cache.py --clear
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_FILE = '.format_cache.json'
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Модуль движка для каждого имени движка (как в format_batch.ENGINES)
+ENGINE_MODULES = {
+    'xml': 'format_docx_xml',
+    'docx': 'format_docx',
+    'md': 'md_to_docx',
+}
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """SHA-256 содержимого файла."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _local_modules(module_name, seen=None):
+    """Модуль и все локальные модули scripts/, которые он импортирует."""
+    if seen is None:
+        seen = {}
+    path = SCRIPTS_DIR / f'{module_name}.py'
+    if module_name in seen or not path.exists():
+        return seen
+    tree = ast.parse(path.read_text(encoding='utf-8'))
+    seen[module_name] = tree
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            _local_modules(name.split('.')[0], seen)
+    return seen
+
+
+def engine_config(engine):
+    """Параметры форматирования движка: константы верхнего уровня в UPPER_CASE."""
+    tree = _local_modules(ENGINE_MODULES[engine])[ENGINE_MODULES[engine]]
+    config = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id.isupper():
+                    config[target.id] = ast.unparse(node.value)
+    return config
+
+
+def config_fingerprint(engine, extra=None):
+    """Отпечаток конфигурации: движок, его параметры и исходный код."""
+    digest = hashlib.sha256()
+    digest.update(f'v{CACHE_VERSION}:{engine}'.encode('utf-8'))
+    digest.update(json.dumps(engine_config(engine), sort_keys=True).encode('utf-8'))
+    for name, tree in sorted(_local_modules(ENGINE_MODULES[engine]).items()):
+        digest.update(name.encode('utf-8'))
+        digest.update(ast.dump(tree).encode('utf-8'))
+    if extra:
+        digest.update(json.dumps(extra, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def load_manifest(cache_file=DEFAULT_CACHE_FILE):
+    """Прочитать манифест кэша (пустой, если файла нет или версия другая)."""
+    try:
+        with open(cache_file, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = None
+    if not manifest or manifest.get('version') != CACHE_VERSION:
+        manifest = {'version': CACHE_VERSION, 'entries': {}}
+    return manifest
+
+
+def save_manifest(manifest, cache_file=DEFAULT_CACHE_FILE):
+    """Атомарно записать манифест кэша."""
+    cache_file = Path(cache_file)
+    fd, tmp_name = tempfile.mkstemp(prefix='.format_cache_', suffix='.tmp',
+                                    dir=cache_file.parent or '.')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_name, cache_file)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+def _key(input_hash, fingerprint):
+    return f'{input_hash}:{fingerprint}'
+
+
+def is_up_to_date(manifest, input_path, output_path, fingerprint):
+    """Проверить, актуален ли результат. Вернуть (актуален, хеш входа).
+
+    Актуален, только если запись ведёт именно в output_path и текущее
+    содержимое output_path совпадает с записанным результатом. На месте
+    (вход = результат) это значит: вход уже отформатирован — откат
+    файла к исходному содержимому или копия в другой каталог не
+    считаются актуальными.
+    """
+    input_hash = file_hash(input_path)
+    entry = manifest['entries'].get(_key(input_hash, fingerprint))
+    output_path = Path(output_path)
+    if entry is None or entry['output'] != str(output_path.resolve()) or not output_path.exists():
+        return False, input_hash
+    same_file = Path(input_path).resolve() == output_path.resolve()
+    output_hash = input_hash if same_file else file_hash(output_path)
+    if output_hash != entry['output_hash']:
+        return False, input_hash
+    entry['used'] = time.time()
+    return True, input_hash
+
+
+def record(manifest, input_hash, output_path, fingerprint):
+    """Записать результат форматирования в манифест."""
+    output_hash = file_hash(output_path)
+    now = time.time()
+    entry = {
+        'output': str(Path(output_path).resolve()),
+        'output_hash': output_hash,
+        'used': now,
+    }
+    manifest['entries'][_key(input_hash, fingerprint)] = entry
+    # Повторное форматирование результата ничего не меняет:
+    # запись «результат → результат» позволяет пропускать форматирование на месте
+    manifest['entries'][_key(output_hash, fingerprint)] = dict(entry)
+    return output_hash
+
+
+def evict(manifest, max_age_days=None):
+    """Удалить устаревшие записи. Вернуть число удалённых.
+
+    Запись устарела, если файла результата нет, его содержимое уже
+    другое или запись не использовалась дольше max_age_days дней.
+    """
+    now = time.time()
+    hashes = {}
+    stale = []
+    for key, entry in manifest['entries'].items():
+        output = entry['output']
+        if max_age_days is not None and now - entry.get('used', 0) > max_age_days * 86400:
+            stale.append(key)
+            continue
+        if output not in hashes:
+            hashes[output] = file_hash(output) if Path(output).exists() else None
+        if hashes[output] != entry['output_hash']:
+            stale.append(key)
+    for key in stale:
+        del manifest['entries'][key]
+    return len(stale)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Кэш форматирования DOCX (Space Travel)")
+    parser.add_argument('--cache-file', default=DEFAULT_CACHE_FILE, help="файл манифеста")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument('--stats', action='store_true', help="показать состояние кэша")
+    action.add_argument('--evict', action='store_true', help="удалить устаревшие записи")
+    action.add_argument('--clear', action='store_true', help="очистить кэш")
+    parser.add_argument('--max-age', type=float, default=None,
+                        help="для --evict: удалить записи старше N дней")
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.cache_file)
+    entries = manifest['entries']
+
+    if args.stats:
+        outputs = {entry['output'] for entry in entries.values()}
+        print(f"Записей: {len(entries)}, документов: {len(outputs)}")
+        for engine in ENGINE_MODULES:
+            print(f"Отпечаток {engine}: {config_fingerprint(engine)}")
+        return
+
+    if args.clear:
+        removed = len(entries)
+        entries.clear()
+    else:
+        removed = evict(manifest, args.max_age)
+
+    save_manifest(manifest, args.cache_file)
+    print(f"Удалено записей: {removed}, осталось: {len(entries)}")
+
+
+if __name__ == "__main__":
+    main()
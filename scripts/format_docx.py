@@ -6,20 +6,33 @@
 - Поля 1 см со всех сторон
 - Шрифт Tahoma, размер 9
 - Заголовки: Tahoma 16, синий цвет
-- Таблицы: на всю ширину (от края до края), с сеткой, шапка голубая
+- Таблицы: на всю ширину (от края до края), с сеткой, шапка голубая,
+  ширина столбцов по содержимому (table_layout.py)
 - Нумерация страниц внизу по центру
+
+--media после сохранения оптимизирует изображения word/media/*
+(docx_media.py через format_docx_xml.optimise_media).
 """
 
+import argparse
+import io
 import sys
 import re
 from pathlib import Path
 from docx import Document
 from docx.shared import Pt, Cm, Twips, RGBColor
 from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.table import _Cell
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+import docx_media
+import format_docx_xml
+import format_profile
+from table_layout import layout_table
+from text_normalize import normalize_text, normalize_runs
+
 
 # Цвета
 BLUE_HEADING = RGBColor(0, 51, 153)  # Синий для заголовков
@@ -81,6 +94,7 @@ def add_page_numbers(doc):
 
 def set_font_style(run, font_name='Tahoma', font_size=9, color=None, bold=False):
     """Установить шрифт."""
+    format_profile.count('rpr_created' if run._element.rPr is None else 'rpr_reused')
     run.font.name = font_name
     run.font.size = Pt(font_size)
     run.font.bold = bold
@@ -109,19 +123,17 @@ def is_heading(paragraph):
 
 def remove_extra_spaces(text):
     """Удалить лишние пробелы, оставив ровно 1 пробел между словами."""
-    if not text:
-        return text
-    # Заменить неразрывные пробелы на обычные (но НЕ zero-width space)
-    text = re.sub(r'[\u00A0\u2000-\u200A\u202F\u205F\u3000]+', ' ', text)
-    # Удалить zero-width space (он не нужен)
-    text = re.sub(r'\u200B', '', text)
-    # Заменить множественные пробелы на один
-    text = re.sub(r' {2,}', ' ', text)
-    # Убрать пробелы перед знаками препинания
-    text = re.sub(r' +([.,;:!?)\]}])', r'\1', text)
-    # Добавить пробел после знаков препинания, если его нет (кроме случаев внутри чисел)
-    text = re.sub(r'([.,;:!?])([А-Яа-яA-Za-z])', r'\1 \2', text)
-    return text
+    return normalize_text(text)
+
+
+def normalize_paragraph_text(paragraph):
+    """Нормализовать пробелы во всех run абзаца (с учётом границ run)."""
+    runs = paragraph.runs
+    texts = [run.text for run in runs]
+    for run, old, new in zip(runs, texts, normalize_runs(texts)):
+        if new != old:
+            run.text = new
+            format_profile.count('texts_normalized')
 
 
 def is_bullet_list(paragraph):
@@ -140,9 +152,10 @@ def format_paragraph(paragraph, font_name='Tahoma', font_size=9):
     is_head = is_heading(paragraph)
     is_bullet = is_bullet_list(paragraph)
 
-    for run in paragraph.runs:
-        if run.text:
-            run.text = remove_extra_spaces(run.text)
+    normalize_paragraph_text(paragraph)
+    runs = paragraph.runs
+    format_profile.count('runs', len(runs))
+    for run in runs:
         if is_head:
             set_font_style(run, font_name, 16, BLUE_HEADING, bold=True)
         else:
@@ -237,38 +250,8 @@ def set_table_full_width(table):
     jc.set(qn('w:val'), 'left')
     tblPr.append(jc)
 
-    # 7. Установить ширину колонок через tblGrid
-    num_cols = len(table.columns)
-    if num_cols > 0:
-        col_width = CONTENT_WIDTH_TWIPS // num_cols
-
-        # Удалить старый tblGrid
-        old_grid = tbl.find(qn('w:tblGrid'))
-        if old_grid is not None:
-            tbl.remove(old_grid)
-
-        # Создать новый tblGrid
-        tblGrid = OxmlElement('w:tblGrid')
-        for _ in range(num_cols):
-            gridCol = OxmlElement('w:gridCol')
-            gridCol.set(qn('w:w'), str(col_width))
-            tblGrid.append(gridCol)
-
-        # Вставить после tblPr
-        tblPr_index = list(tbl).index(tblPr)
-        tbl.insert(tblPr_index + 1, tblGrid)
-
-        # Установить ширину каждой ячейки
-        for row in table.rows:
-            for idx, cell in enumerate(row.cells):
-                tc = cell._tc
-                tcPr = tc.get_or_add_tcPr()
-
-                remove_element(tcPr, 'w:tcW')
-                tcW = OxmlElement('w:tcW')
-                tcW.set(qn('w:w'), str(col_width))
-                tcW.set(qn('w:type'), 'dxa')
-                tcPr.insert(0, tcW)
+    # 7. Ширина колонок по содержимому (tblGrid и tcW, один проход по ячейкам)
+    layout_table(tbl, CONTENT_WIDTH_TWIPS)
 
 
 def set_table_borders(table):
@@ -298,16 +281,19 @@ def format_table(table, font_name='Tahoma', font_size=9):
     # Установить границы
     set_table_borders(table)
 
-    # Форматировать строки
-    for row_idx, row in enumerate(table.rows):
-        for cell in row.cells:
+    # Форматировать строки (напрямую по w:tr/w:tc: объединённые ячейки — один раз)
+    for row_idx, tr in enumerate(table._tbl.tr_lst):
+        format_profile.count('cells', len(tr.tc_lst))
+        for tc in tr.tc_lst:
+            cell = _Cell(tc, table)
             if row_idx == 0:
                 set_cell_shading(cell, LIGHT_BLUE_BG)
 
             for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    if run.text:
-                        run.text = remove_extra_spaces(run.text)
+                normalize_paragraph_text(paragraph)
+                runs = paragraph.runs
+                format_profile.count('runs', len(runs))
+                for run in runs:
                     if row_idx == 0:
                         set_font_style(run, font_name, font_size, bold=True)
                     else:
@@ -320,48 +306,98 @@ def format_table(table, font_name='Tahoma', font_size=9):
                 paragraph.paragraph_format.right_indent = Pt(0)
 
 
-def format_document(input_path, output_path=None, font_name='Tahoma', font_size=9):
-    """Форматировать весь документ."""
-    print(f"Открываю документ: {input_path}")
-    doc = Document(input_path)
-
-    print("Устанавливаю поля 1 см...")
-    set_narrow_margins(doc)
+def apply_house_style(doc, font_name='Tahoma', font_size=9):
+    """Оформить открытый документ python-docx: поля, нумерация, текст, таблицы."""
+    with format_profile.phase('sections'):
+        print("Устанавливаю поля 1 см...")
+        set_narrow_margins(doc)
 
-    print("Добавляю нумерацию страниц...")
-    add_page_numbers(doc)
+        print("Добавляю нумерацию страниц...")
+        add_page_numbers(doc)
+    format_profile.count('sections', len(doc.sections))
 
     print(f"Форматирую текст: {font_name}, {font_size}pt (заголовки 16pt синие)...")
-    for paragraph in doc.paragraphs:
-        format_paragraph(paragraph, font_name, font_size)
+    with format_profile.phase('paragraphs'):
+        paragraphs = doc.paragraphs
+        for paragraph in paragraphs:
+            format_paragraph(paragraph, font_name, font_size)
+    format_profile.count('paragraphs', len(paragraphs))
 
     print(f"Форматирую таблицы ({len(doc.tables)} шт.)...")
-    for table in doc.tables:
-        format_table(table, font_name, font_size)
+    with format_profile.phase('tables'):
+        for table in doc.tables:
+            format_table(table, font_name, font_size)
+    format_profile.count('tables', len(doc.tables))
+
+
+def format_document(input_path, output_path=None, font_name='Tahoma', font_size=9,
+                    media=False, dpi=docx_media.DEFAULT_DPI, quality=None):
+    """Форматировать весь документ (media=True — затем оптимизировать изображения)."""
+    print(f"Открываю документ: {input_path}")
+    # python-docx распаковывает и разбирает все части сразу
+    with format_profile.phase('parse'):
+        doc = Document(input_path)
+
+    apply_house_style(doc, font_name, font_size)
 
     if output_path is None:
         output_path = input_path
 
     print(f"Сохраняю: {output_path}")
-    doc.save(output_path)
+    # Сборка XML и запись архива в python-docx не разделяются
+    with format_profile.phase('serialise'):
+        doc.save(output_path)
+    if media:
+        saved = format_docx_xml.optimise_media(output_path, dpi=dpi, quality=quality)
+        print(f"Размер архива уменьшен на {saved / 1024:.0f} КБ")
     print("Готово!")
 
     return output_path
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Использование: python format_docx.py <файл.docx> [выходной_файл.docx]")
-        sys.exit(1)
+def format_bytes(data, font_name='Tahoma', font_size=9):
+    """Отформатировать DOCX в памяти: байты на входе, байты на выходе."""
+    with format_profile.phase('parse'):
+        doc = Document(io.BytesIO(data))
+
+    apply_house_style(doc, font_name, font_size)
+
+    output = io.BytesIO()
+    with format_profile.phase('serialise'):
+        doc.save(output)
+    return output.getvalue()
 
-    input_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
 
-    if not Path(input_path).exists():
-        print(f"Ошибка: файл не найден: {input_path}")
+def main():
+    parser = argparse.ArgumentParser(description="Форматирование DOCX через python-docx (Space Travel)")
+    parser.add_argument('input', help="файл .docx")
+    parser.add_argument('output', nargs='?', help="выходной файл (по умолчанию — перезаписать входной)")
+    parser.add_argument('--media', action='store_true',
+                        help="оптимизировать изображения: дубликаты, уменьшение, пересжатие")
+    parser.add_argument('--dpi', type=int, default=docx_media.DEFAULT_DPI,
+                        help=f"для --media: разрешение при ширине контента 19 см "
+                             f"(по умолчанию {docx_media.DEFAULT_DPI})")
+    parser.add_argument('--quality', type=int, default=None,
+                        help="для --media: качество JPEG 1–95 (по умолчанию JPEG не перекодируются)")
+    parser.add_argument('--profile', nargs='?', const='-', metavar='JSON',
+                        help="время по фазам и счётчики в JSON (без файла — в stdout)")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="для --profile: пик памяти Python по фазам (медленнее)")
+    args = parser.parse_args()
+
+    if not Path(args.input).exists():
+        print(f"Ошибка: файл не найден: {args.input}")
         sys.exit(1)
 
-    format_document(input_path, output_path)
+    options = {'media': args.media, 'dpi': args.dpi, 'quality': args.quality}
+    if args.profile is None:
+        format_document(args.input, args.output, **options)
+        return
+
+    with format_profile.profiling(trace_memory=args.profile_memory) as profile:
+        format_document(args.input, args.output, **options)
+    format_profile.save_report(profile, args.profile,
+                               {'engine': 'docx', 'input': args.input, 'ok': True})
 
 
 if __name__ == "__main__":
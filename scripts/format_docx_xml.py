@@ -4,17 +4,49 @@
 Не требует python-docx - работает с ZIP/XML напрямую.
 
 Форматирование:
-- Таблицы: границы, голубая шапка (#B8CCE4), авто-ширина
+- Страница: A4, поля 1 см (снизу 1.5 см), номер страницы внизу по центру
+- Таблицы: границы, голубая шапка (#B8CCE4), на всю ширину,
+  столбцы по содержимому (table_layout.py)
 - Шрифт: Tahoma 9pt
 - Заголовки: синие (#003399)
+- Текст: лишние пробелы убираются (text_normalize.py)
+- Колонтитулы и сноски форматируются так же, как основной текст
+
+--profile выводит время по фазам и счётчики элементов в JSON
+(format_profile.py).
+
+Режим --styles задаёт то же оформление один раз в styles.xml
+(Tahoma 9pt по умолчанию, стиль заголовка, табличный стиль
+«Space Travel grid»), а в document.xml оставляет только ссылки на стили.
+
+format_bytes() форматирует документ в памяти (байты → байты) — для
+сервиса format_service.py и других инструментов.
+
+--media при переупаковке оптимизирует word/media/* (docx_media.py):
+дубликаты удаляются, крупные изображения уменьшаются до ширины
+контента при --dpi, PNG пересжимаются без потерь, JPEG — с --quality.
 """
 
+import argparse
+import copy
+import functools
+import io
+import os
 import sys
+import struct
 import zipfile
 import shutil
+import tempfile
+import time
 import re
 from pathlib import Path
 from xml.etree import ElementTree as ET
+from xml.sax.saxutils import quoteattr
+
+import docx_media
+import format_profile
+from table_layout import CONTENT_WIDTH_TWIPS, layout_table
+from text_normalize import normalize_runs
 
 # Namespaces
 NS = {
@@ -60,29 +92,74 @@ def create_border_element(tag, color='000000', size='4', space='0', val='single'
     return el
 
 
+# Порядок дочерних элементов tblPr по схеме WordprocessingML
+TBL_PR_ORDER = ('w:tblStyle', 'w:tblpPr', 'w:tblOverlap', 'w:bidiVisual',
+                'w:tblStyleRowBandSize', 'w:tblStyleColBandSize', 'w:tblW', 'w:jc',
+                'w:tblCellSpacing', 'w:tblInd', 'w:tblBorders', 'w:shd', 'w:tblLayout',
+                'w:tblCellMar', 'w:tblLook')
+
+
+def set_ordered(parent, tag, order, attrs=None):
+    """Заменить дочерний элемент tag новым, вставив его на место по схеме order."""
+    old = parent.find(qn(tag))
+    if old is not None:
+        parent.remove(old)
+    el = ET.Element(qn(tag))
+    for key, value in (attrs or {}).items():
+        el.set(qn(key), value)
+
+    rank = order.index(tag)
+    ranks = {qn(name): idx for idx, name in enumerate(order)}
+    index = 0
+    for idx, child in enumerate(parent):
+        if ranks.get(child.tag, len(order)) <= rank:
+            index = idx + 1
+    parent.insert(index, el)
+    return el
+
+
 def set_table_borders(tbl):
     """Установить границы таблицы."""
     tblPr = tbl.find(qn('w:tblPr'))
     if tblPr is None:
-        tblPr = ET.SubElement(tbl, qn('w:tblPr'))
+        tblPr = ET.Element(qn('w:tblPr'))
         tbl.insert(0, tblPr)
 
-    # Удалить старые границы
-    old_borders = tblPr.find(qn('w:tblBorders'))
-    if old_borders is not None:
-        tblPr.remove(old_borders)
-
-    # Создать новые границы
-    tblBorders = ET.SubElement(tblPr, qn('w:tblBorders'))
+    # Создать новые границы (старые заменяются)
+    tblBorders = set_ordered(tblPr, 'w:tblBorders', TBL_PR_ORDER)
     for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
         tblBorders.append(create_border_element(border_name))
 
 
+def set_table_full_width(tbl):
+    """Растянуть таблицу на всю ширину контента (как в format_docx.py).
+
+    Ширины столбцов — по содержимому (table_layout.py).
+    """
+    tblPr = tbl.find(qn('w:tblPr'))
+    if tblPr is None:
+        tblPr = ET.Element(qn('w:tblPr'))
+        tbl.insert(0, tblPr)
+
+    set_ordered(tblPr, 'w:tblW', TBL_PR_ORDER, {'w:w': str(CONTENT_WIDTH_TWIPS), 'w:type': 'dxa'})
+    set_ordered(tblPr, 'w:jc', TBL_PR_ORDER, {'w:val': 'left'})
+    set_ordered(tblPr, 'w:tblCellSpacing', TBL_PR_ORDER, {'w:w': '0', 'w:type': 'dxa'})
+    set_ordered(tblPr, 'w:tblInd', TBL_PR_ORDER, {'w:w': '0', 'w:type': 'dxa'})
+    set_ordered(tblPr, 'w:tblLayout', TBL_PR_ORDER, {'w:type': 'fixed'})
+    tblCellMar = set_ordered(tblPr, 'w:tblCellMar', TBL_PR_ORDER)
+    for side in ['top', 'left', 'bottom', 'right']:
+        margin = ET.SubElement(tblCellMar, qn(f'w:{side}'))
+        margin.set(qn('w:w'), '28')  # ~0.5 мм
+        margin.set(qn('w:type'), 'dxa')
+
+    layout_table(tbl, CONTENT_WIDTH_TWIPS)
+
+
 def set_cell_shading(tc, color='B8CCE4'):
     """Установить цвет фона ячейки."""
     tcPr = tc.find(qn('w:tcPr'))
     if tcPr is None:
-        tcPr = ET.SubElement(tc, qn('w:tcPr'))
+        tcPr = ET.Element(qn('w:tcPr'))
         tc.insert(0, tcPr)
 
     # Удалить старый shading
@@ -135,40 +212,180 @@ def set_run_font(rPr, font_name='Tahoma', font_size='18', bold=False, color=None
         c.set(qn('w:val'), color)
 
 
-def format_table(tbl):
-    """Форматировать таблицу."""
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+
+def _element_key(el):
+    """Ключ для сравнения элементов по содержимому (порядок атрибутов не важен)."""
+    return (el.tag, tuple(sorted(el.attrib.items())), (el.text or '').strip(),
+            tuple(_element_key(child) for child in el))
+
+
+def _text_run_key(r):
+    """Ключ свойств run, если run содержит только rPr и w:t, иначе None."""
+    rPr = None
+    has_text = False
+    for child in r:
+        if child.tag == qn('w:t'):
+            has_text = True
+        elif child.tag == qn('w:rPr') and rPr is None:
+            rPr = child
+        else:
+            # w:tab, w:br, поля, рисунки и т.п. не сливаем
+            return None
+    if not has_text:
+        return None
+    return _element_key(rPr) if rPr is not None else ()
+
+
+def _set_text(t, text):
+    """Записать текст в w:t, сохранив пробелы на краях через xml:space."""
+    t.text = text
+    if text != text.strip() or '  ' in text:
+        t.set(XML_SPACE, 'preserve')
+    elif XML_SPACE in t.attrib:
+        del t.attrib[XML_SPACE]
+
+
+def coalesce_runs(parent):
+    """Слить соседние текстовые run с одинаковыми свойствами.
+
+    Вернуть число удалённых run.
+    """
+    merged = 0
+    target = None
+    target_key = None
+    pieces = []
+
+    def flush():
+        if target is not None and len(pieces) > 1:
+            _set_text(target, ''.join(pieces))
+
+    for child in list(parent):
+        key = _text_run_key(child) if child.tag == qn('w:r') else None
+        if key is not None and key == target_key:
+            pieces.extend(t.text or '' for t in child.findall(qn('w:t')))
+            parent.remove(child)
+            merged += 1
+            continue
+
+        flush()
+        target = target_key = None
+        pieces = []
+        if key is not None:
+            texts = child.findall(qn('w:t'))
+            # Несколько w:t внутри одного run сводим в первый
+            for extra in texts[1:]:
+                child.remove(extra)
+            target, target_key = texts[0], key
+            pieces = [t.text or '' for t in texts]
+            if len(texts) > 1:
+                _set_text(target, ''.join(pieces))
+                pieces = [target.text]
+    flush()
+    return merged
+
+
+def coalesce_paragraph(p):
+    """Слить run в параграфе и в его гиперссылках. Вернуть число удалённых run."""
+    merged = coalesce_runs(p)
+    for link in p.findall(qn('w:hyperlink')):
+        merged += coalesce_runs(link)
+    return merged
+
+
+def _text_segments(p):
+    """Группы w:t параграфа, идущие подряд без табуляций, разрывов и полей."""
+    segments = [[]]
+
+    def visit(container):
+        for child in container:
+            if child.tag == qn('w:r'):
+                for el in child:
+                    if el.tag == qn('w:t'):
+                        segments[-1].append(el)
+                    elif el.tag != qn('w:rPr'):
+                        segments.append([])
+            elif child.tag == qn('w:hyperlink'):
+                visit(child)
+
+    visit(p)
+    return [segment for segment in segments if segment]
+
+
+def normalize_paragraph(p):
+    """Нормализовать пробелы в тексте параграфа (как remove_extra_spaces в format_docx).
+
+    Пробелы и пунктуация на границах run обрабатываются вместе.
+    Вернуть число изменённых w:t.
+    """
+    changed = 0
+    for segment in _text_segments(p):
+        texts = [t.text or '' for t in segment]
+        for t, old, new in zip(segment, texts, normalize_runs(texts)):
+            if new != old:
+                _set_text(t, new)
+                changed += 1
+    format_profile.count('texts_normalized', changed)
+    return changed
+
+
+def get_run_properties(r):
+    """Найти или создать rPr run."""
+    rPr = r.find(qn('w:rPr'))
+    if rPr is None:
+        rPr = ET.Element(qn('w:rPr'))
+        r.insert(0, rPr)
+        format_profile.count('rpr_created')
+    else:
+        format_profile.count('rpr_reused')
+    return rPr
+
+
+def iter_block_paragraphs(parent):
+    """Параграфы вне таблиц: прямые и вложенные в w:sdt, w:customXml и т.п."""
+    for child in list(parent):
+        if child.tag == qn('w:p'):
+            yield child
+        elif child.tag not in (qn('w:tbl'), qn('w:sectPr')):
+            yield from iter_block_paragraphs(child)
+
+
+def format_table(tbl, coalesce=True):
+    """Форматировать таблицу. Вернуть число слитых run."""
     # Установить границы
     set_table_borders(tbl)
 
-    # Установить авто-ширину
-    tblPr = tbl.find(qn('w:tblPr'))
-    if tblPr is not None:
-        tblW = tblPr.find(qn('w:tblW'))
-        if tblW is None:
-            tblW = ET.SubElement(tblPr, qn('w:tblW'))
-        tblW.set(qn('w:type'), 'auto')
-        tblW.set(qn('w:w'), '0')
+    # Растянуть на всю ширину, столбцы по содержимому
+    set_table_full_width(tbl)
 
     # Форматировать строки
+    merged = 0
     rows = tbl.findall(qn('w:tr'))
     for row_idx, tr in enumerate(rows):
         cells = tr.findall(qn('w:tc'))
+        format_profile.count('cells', len(cells))
         for tc in cells:
             # Голубая шапка для первой строки
             if row_idx == 0:
                 set_cell_shading(tc, 'B8CCE4')
 
             # Форматировать текст в ячейке
-            for p in tc.findall(qn('w:p')):
-                for r in p.findall(qn('w:r')):
-                    rPr = r.find(qn('w:rPr'))
-                    if rPr is None:
-                        rPr = ET.SubElement(r, qn('w:rPr'))
-                        r.insert(0, rPr)
+            for p in iter_block_paragraphs(tc):
+                normalize_paragraph(p)
+                runs = p.findall(qn('w:r'))
+                format_profile.count('runs', len(runs))
+                for r in runs:
+                    rPr = get_run_properties(r)
 
                     # Шрифт и bold для шапки
                     set_run_font(rPr, 'Tahoma', '18', bold=(row_idx == 0))
 
+                if coalesce:
+                    merged += coalesce_paragraph(p)
+
+    return merged
+
 
 def is_heading_paragraph(p):
     """Проверить, является ли параграф заголовком."""
@@ -189,41 +406,699 @@ def is_heading_paragraph(p):
     return False
 
 
-def format_paragraph(p):
-    """Форматировать параграф."""
+def format_paragraph(p, coalesce=True):
+    """Форматировать параграф. Вернуть число слитых run."""
     is_heading = is_heading_paragraph(p)
+    normalize_paragraph(p)
 
-    for r in p.findall(qn('w:r')):
-        rPr = r.find(qn('w:rPr'))
-        if rPr is None:
-            rPr = ET.SubElement(r, qn('w:rPr'))
-            r.insert(0, rPr)
+    runs = p.findall(qn('w:r'))
+    format_profile.count('runs', len(runs))
+    for r in runs:
+        rPr = get_run_properties(r)
 
         if is_heading:
             set_run_font(rPr, 'Tahoma', '32', bold=True, color='003399')  # 16pt = 32
         else:
             set_run_font(rPr, 'Tahoma', '18')  # 9pt = 18
 
+    return coalesce_paragraph(p) if coalesce else 0
 
-def process_document(input_path, output_path=None):
-    """Обработать документ."""
-    input_path = Path(input_path)
-    if output_path is None:
-        output_path = input_path
+
+# Стили Space Travel для режима форматирования через styles.xml
+STYLES_PART = 'word/styles.xml'
+GRID_TABLE_STYLE = 'SpaceTravelGrid'
+DEFAULT_HEADING_STYLE = 'Heading1'
+
+# Прямое форматирование run, которое в режиме стилей задают стили
+RUN_FORMAT_TAGS = ('w:rFonts', 'w:sz', 'w:szCs', 'w:b', 'w:color')
+
+
+def strip_run_formatting(r):
+    """Убрать из run прямое форматирование шрифта, размера, bold и цвета."""
+    format_profile.count('runs')
+    rPr = r.find(qn('w:rPr'))
+    if rPr is None:
+        return
+    for tag in RUN_FORMAT_TAGS:
+        el = rPr.find(qn(tag))
+        if el is not None:
+            rPr.remove(el)
+    if len(rPr) == 0:
+        r.remove(rPr)
+        format_profile.count('rpr_removed')
+
+
+def get_or_insert(parent, tag, index=0):
+    """Найти дочерний элемент или вставить новый на позицию index."""
+    el = parent.find(qn(tag))
+    if el is None:
+        el = ET.Element(qn(tag))
+        parent.insert(index, el)
+    return el
+
+
+def style_format_table(tbl, coalesce=True):
+    """Форматировать таблицу ссылкой на табличный стиль Space Travel grid.
+
+    Вернуть число слитых run.
+    """
+    tblPr = get_or_insert(tbl, 'w:tblPr')
+
+    # tblStyle по схеме идёт первым в tblPr
+    tblStyle = get_or_insert(tblPr, 'w:tblStyle')
+    tblStyle.set(qn('w:val'), GRID_TABLE_STYLE)
+
+    # Границы берутся из стиля
+    old_borders = tblPr.find(qn('w:tblBorders'))
+    if old_borders is not None:
+        tblPr.remove(old_borders)
+
+    # Ширина, как в format_table
+    set_table_full_width(tbl)
+
+    # Включить условное форматирование шапки
+    tblLook = tblPr.find(qn('w:tblLook'))
+    if tblLook is None:
+        tblLook = ET.SubElement(tblPr, qn('w:tblLook'))
+    tblLook.set(qn('w:firstRow'), '1')
+
+    merged = 0
+    for row_idx, tr in enumerate(tbl.findall(qn('w:tr'))):
+        cells = tr.findall(qn('w:tc'))
+        format_profile.count('cells', len(cells))
+        for tc in cells:
+            if row_idx == 0:
+                # Заливку шапки задаёт стиль
+                tcPr = tc.find(qn('w:tcPr'))
+                shd = tcPr.find(qn('w:shd')) if tcPr is not None else None
+                if shd is not None:
+                    tcPr.remove(shd)
+            for p in iter_block_paragraphs(tc):
+                normalize_paragraph(p)
+                for r in p.findall(qn('w:r')):
+                    strip_run_formatting(r)
+                if coalesce:
+                    merged += coalesce_paragraph(p)
+
+    return merged
+
+
+def style_format_paragraph(p, heading_style=DEFAULT_HEADING_STYLE, coalesce=True):
+    """Форматировать параграф ссылкой на стиль (заголовок или обычный текст).
+
+    Вернуть число слитых run.
+    """
+    if is_heading_paragraph(p):
+        pPr = get_or_insert(p, 'w:pPr')
+        pStyle = get_or_insert(pPr, 'w:pStyle')
+        style_val = pStyle.get(qn('w:val'), '').lower()
+        if 'heading' not in style_val and 'заголовок' not in style_val:
+            pStyle.set(qn('w:val'), heading_style)
+
+    normalize_paragraph(p)
+    for r in p.findall(qn('w:r')):
+        strip_run_formatting(r)
+
+    return coalesce_paragraph(p) if coalesce else 0
+
+
+def _grid_table_style():
+    """Табличный стиль Space Travel grid: сетка и голубая шапка."""
+    style = ET.Element(qn('w:style'))
+    style.set(qn('w:type'), 'table')
+    style.set(qn('w:customStyle'), '1')
+    style.set(qn('w:styleId'), GRID_TABLE_STYLE)
+    ET.SubElement(style, qn('w:name')).set(qn('w:val'), 'Space Travel grid')
+    ET.SubElement(style, qn('w:qFormat'))
+
+    tblPr = ET.SubElement(style, qn('w:tblPr'))
+    tblBorders = ET.SubElement(tblPr, qn('w:tblBorders'))
+    for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
+        tblBorders.append(create_border_element(border_name))
+
+    first_row = ET.SubElement(style, qn('w:tblStylePr'))
+    first_row.set(qn('w:type'), 'firstRow')
+    ET.SubElement(ET.SubElement(first_row, qn('w:rPr')), qn('w:b'))
+    shd = ET.SubElement(ET.SubElement(first_row, qn('w:tcPr')), qn('w:shd'))
+    shd.set(qn('w:val'), 'clear')
+    shd.set(qn('w:color'), 'auto')
+    shd.set(qn('w:fill'), 'B8CCE4')
+    return style
+
+
+def build_house_styles(data):
+    """Записать стили Space Travel в styles.xml.
+
+    Вернуть (новый styles.xml, id стиля заголовка для абзацев с «#»).
+    """
+    root = ET.fromstring(data)
+
+    # Tahoma 9pt — по умолчанию для всего документа
+    docDefaults = get_or_insert(root, 'w:docDefaults')
+    rPrDefault = get_or_insert(docDefaults, 'w:rPrDefault')
+    rPr = get_or_insert(rPrDefault, 'w:rPr')
+    for attr in list(get_or_insert(rPr, 'w:rFonts').attrib):
+        # Темы шрифтов (minorHAnsi и т.п.) перекрывают явное имя шрифта
+        if attr.endswith('Theme') or attr.endswith('theme'):
+            del rPr.find(qn('w:rFonts')).attrib[attr]
+    set_run_font(rPr, 'Tahoma', '18')
+    rPr.find(qn('w:rFonts')).set(qn('w:eastAsia'), 'Tahoma')
+
+    heading_ids = []
+    for style in root.findall(qn('w:style')):
+        style_id = style.get(qn('w:styleId'), '')
+        if style_id == GRID_TABLE_STYLE:
+            root.remove(style)
+            continue
+        if style.get(qn('w:type')) != 'paragraph':
+            continue
+        name_el = style.find(qn('w:name'))
+        name = name_el.get(qn('w:val'), '').lower() if name_el is not None else ''
+        rPr = style.find(qn('w:rPr'))
+        if name.startswith('heading') or 'заголовок' in name:
+            heading_ids.append(style_id)
+            if rPr is None:
+                rPr = ET.SubElement(style, qn('w:rPr'))
+            rFonts = rPr.find(qn('w:rFonts'))
+            if rFonts is not None:
+                rPr.remove(rFonts)
+            set_run_font(rPr, 'Tahoma', '32', bold=True, color='003399')  # 16pt = 32
+        elif rPr is not None:
+            # Обычные стили наследуют Tahoma 9pt из docDefaults
+            for tag in ('w:rFonts', 'w:sz', 'w:szCs'):
+                el = rPr.find(qn(tag))
+                if el is not None:
+                    rPr.remove(el)
+            if len(rPr) == 0:
+                style.remove(rPr)
+
+    if DEFAULT_HEADING_STYLE in heading_ids:
+        heading_style = DEFAULT_HEADING_STYLE
+    elif heading_ids:
+        heading_style = heading_ids[0]
     else:
-        output_path = Path(output_path)
+        heading_style = DEFAULT_HEADING_STYLE
+        style = ET.SubElement(root, qn('w:style'))
+        style.set(qn('w:type'), 'paragraph')
+        style.set(qn('w:styleId'), heading_style)
+        ET.SubElement(style, qn('w:name')).set(qn('w:val'), 'heading 1')
+        ET.SubElement(style, qn('w:qFormat'))
+        set_run_font(ET.SubElement(style, qn('w:rPr')), 'Tahoma', '32', bold=True, color='003399')
+
+    root.append(_grid_table_style())
+    return ET.tostring(root, encoding='UTF-8', xml_declaration=True), heading_style
+
+
+# Параметры страницы (как в format_docx.py): A4, поля 1 см, снизу 1.5 см
+PAGE_WIDTH_TWIPS = 11906
+PAGE_HEIGHT_TWIPS = 16838
+MARGIN_TWIPS = 567
+BOTTOM_MARGIN_TWIPS = 850
+
+# Порядок начала sectPr по схеме (до pgMar включительно)
+SECT_PR_ORDER = ('w:headerReference', 'w:footerReference', 'w:footnotePr', 'w:endnotePr',
+                 'w:type', 'w:pgSz', 'w:pgMar')
+
+CONTENT_TYPES_PART = '[Content_Types].xml'
+DOCUMENT_RELS_PART = 'word/_rels/document.xml.rels'
+FOOTER_REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer'
+FOOTER_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml'
+
+# Части с текстом помимо document.xml: тип связи → форматируются как документ
+TEXT_PART_TYPES = ('header', 'footer', 'footnotes', 'endnotes')
+
+
+def set_section_layout(sectPr):
+    """Установить размер A4 и поля 1 см (снизу 1.5 см)."""
+    pgSz = sectPr.find(qn('w:pgSz'))
+    if pgSz is None:
+        pgSz = set_ordered(sectPr, 'w:pgSz', SECT_PR_ORDER)
+    pgSz.set(qn('w:w'), str(PAGE_WIDTH_TWIPS))
+    pgSz.set(qn('w:h'), str(PAGE_HEIGHT_TWIPS))
+    pgSz.attrib.pop(qn('w:orient'), None)
+
+    pgMar = sectPr.find(qn('w:pgMar'))
+    if pgMar is None:
+        pgMar = set_ordered(sectPr, 'w:pgMar', SECT_PR_ORDER,
+                            {'w:header': '708', 'w:footer': '708', 'w:gutter': '0'})
+    for side in ('top', 'left', 'right'):
+        pgMar.set(qn(f'w:{side}'), str(MARGIN_TWIPS))
+    pgMar.set(qn('w:bottom'), str(BOTTOM_MARGIN_TWIPS))
+
+
+def read_relationships(data):
+    """Связи document.xml: {rId: (тип, имя части в архиве)}; внешние пропускаются."""
+    rels = {}
+    for rel in ET.fromstring(data):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        name = target.lstrip('/') if target.startswith('/') else os.path.normpath(
+            os.path.join('word', target)).replace(os.sep, '/')
+        rels[rel.get('Id')] = (rel.get('Type', '').rsplit('/', 1)[-1], name)
+    return rels
+
+
+def plan_page_footers(zf):
+    """Подготовить нумерацию страниц: какие колонтитулы есть и куда добавить новый.
+
+    Вернуть словарь-план или None, если связей document.xml нет.
+    """
+    if DOCUMENT_RELS_PART not in zf.NameToInfo:
+        return None
+    rels = read_relationships(zf.read(DOCUMENT_RELS_PART))
+    numbers = [int(rid[3:]) for rid in rels if re.fullmatch(r'rId\d+', rid or '')]
+    footer_no = 1
+    while f'word/footer{footer_no}.xml' in zf.NameToInfo:
+        footer_no += 1
+    return {
+        'rels': rels,
+        'new_rid': f'rId{max(numbers, default=0) + 1}',
+        'new_part': f'word/footer{footer_no}.xml',
+        'new_used': False,
+        'page_parts': set(),
+    }
+
+
+def link_page_footer(sectPr, plan):
+    """Связать раздел с колонтитулом с номером страницы.
 
-    # Создать временную директорию
-    temp_dir = Path('/tmp/docx_format_temp')
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
-    temp_dir.mkdir()
+    Существующий нижний колонтитул по умолчанию отмечается в плане для
+    замены содержимого, иначе раздел ссылается на новый колонтитул.
+    """
+    for ref in sectPr.findall(qn('w:footerReference')):
+        if ref.get(qn('w:type'), 'default') == 'default':
+            rel = plan['rels'].get(ref.get(qn('r:id')))
+            if rel is not None:
+                plan['page_parts'].add(rel[1])
+                return
+            sectPr.remove(ref)
+
+    # Ссылки на колонтитулы идут первыми в sectPr: новая — после них
+    ref = ET.Element(qn('w:footerReference'))
+    ref.set(qn('w:type'), 'default')
+    ref.set(qn('r:id'), plan['new_rid'])
+    index = 0
+    for idx, child in enumerate(sectPr):
+        if child.tag in (qn('w:headerReference'), qn('w:footerReference')):
+            index = idx + 1
+    sectPr.insert(index, ref)
+    plan['new_used'] = True
+
+
+def format_section(sectPr, plan=None):
+    """Форматировать раздел: размер страницы, поля и (при плане) нумерация страниц."""
+    set_section_layout(sectPr)
+    if plan is not None:
+        link_page_footer(sectPr, plan)
+
+
+def page_number_paragraph(p=None):
+    """Абзац с полем PAGE по центру (Tahoma 9pt), как add_page_numbers в format_docx.py."""
+    if p is None:
+        p = ET.Element(qn('w:p'))
+    pPr = get_or_insert(p, 'w:pPr')
+    jc = pPr.find(qn('w:jc'))
+    if jc is None:
+        jc = ET.SubElement(pPr, qn('w:jc'))
+    jc.set(qn('w:val'), 'center')
+
+    for kind in ('begin', 'instr', 'separate', 'text', 'end'):
+        r = ET.SubElement(p, qn('w:r'))
+        set_run_font(ET.SubElement(r, qn('w:rPr')), 'Tahoma', '18')
+        if kind == 'instr':
+            instr = ET.SubElement(r, qn('w:instrText'))
+            instr.set(XML_SPACE, 'preserve')
+            instr.text = 'PAGE'
+        elif kind == 'text':
+            ET.SubElement(r, qn('w:t')).text = '1'
+        else:
+            ET.SubElement(r, qn('w:fldChar')).set(qn('w:fldCharType'), kind)
+    return p
+
+
+def set_page_number_footer(ftr):
+    """Очистить абзацы колонтитула и поставить номер страницы в первый."""
+    paragraphs = ftr.findall(qn('w:p'))
+    for p in paragraphs:
+        for child in list(p):
+            if child.tag != qn('w:pPr'):
+                p.remove(child)
+    if paragraphs:
+        page_number_paragraph(paragraphs[0])
+    else:
+        ftr.append(page_number_paragraph())
+
+
+def new_footer_xml():
+    """Новая часть footer*.xml с номером страницы."""
+    ftr = ET.Element(qn('w:ftr'))
+    ftr.append(page_number_paragraph())
+    return ET.tostring(ftr, encoding='UTF-8', xml_declaration=True)
+
+
+def format_part_xml(src, dst, table_func=format_table, paragraph_func=format_paragraph,
+                    page_number=False):
+    """Отформатировать колонтитул или сноски (header*.xml, footer*.xml, footnotes.xml)."""
+    with format_profile.phase('parse'):
+        tree = ET.parse(src)
+    root = tree.getroot()
+    format_container(root, table_func, paragraph_func)
+    if page_number:
+        with format_profile.phase('sections'):
+            set_page_number_footer(root)
+    with format_profile.phase('serialise'):
+        tree.write(dst, encoding='UTF-8', xml_declaration=True)
+
+
+def _footer_transform(name, plan, table_func, paragraph_func):
+    """Преобразование footer*.xml: номер страницы, если колонтитул отмечен в плане."""
+    def transform(src, dst):
+        format_part_xml(src, dst, table_func, paragraph_func,
+                        page_number=name in plan['page_parts'])
+    return transform
+
+
+def _append_to_root(data, element):
+    """Дописать элемент в конец корня XML, не трогая остальные байты."""
+    close = data.rfind(b'</')
+    if close < 0:
+        raise ValueError("Пустой корень XML")
+    return data[:close] + element.encode('utf-8') + data[close:]
+
+
+def _add_footer_relationship(plan):
+    """Преобразование document.xml.rels: связь с новым колонтитулом, если он нужен."""
+    def transform(src, dst):
+        if not plan['new_used']:
+            shutil.copyfileobj(src, dst)
+            return
+        rel = (f'<Relationship Id={quoteattr(plan["new_rid"])} Type="{FOOTER_REL_TYPE}" '
+               f'Target={quoteattr(plan["new_part"][len("word/"):])}/>')
+        dst.write(_append_to_root(src.read(), rel))
+    return transform
+
+
+def _add_footer_content_type(plan):
+    """Преобразование [Content_Types].xml: тип нового колонтитула, если он нужен."""
+    def transform(src, dst):
+        if not plan['new_used']:
+            shutil.copyfileobj(src, dst)
+            return
+        override = (f'<Override PartName={quoteattr("/" + plan["new_part"])} '
+                    f'ContentType="{FOOTER_CONTENT_TYPE}"/>')
+        dst.write(_append_to_root(src.read(), override))
+    return transform
+
+
+def _new_footer_parts(plan):
+    """Новые члены архива: колонтитул с номером страницы, если на него есть ссылки."""
+    return {plan['new_part']: new_footer_xml()} if plan['new_used'] else {}
+
+
+DOCUMENT_PART = 'word/document.xml'
+
+# Режимы обработки пакета
+MODES = ('zip', 'stream', 'extract')
+
+# Размер блока при копировании сжатых данных
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def format_container(el, table_func=format_table, paragraph_func=format_paragraph,
+                     section_func=None, counts=None):
+    """Отформатировать таблицы, параграфы вне таблиц и разделы внутри элемента.
+
+    el — body, колонтитул, сноски или отдельный элемент body (в потоковом
+    режиме). Счётчики накапливаются в counts; вернуть counts.
+    """
+    if counts is None:
+        counts = {'tables': 0, 'paragraphs': 0, 'merged': 0}
+    merged = 0
+
+    # Таблицы, включая вложенные
+    tables = list(el.iter(qn('w:tbl')))
+    if tables:
+        with format_profile.phase('tables'):
+            for tbl in tables:
+                merged += table_func(tbl)
+
+    # Параграфы вне таблиц
+    if el.tag == qn('w:p'):
+        paragraphs = [el]
+    elif el.tag in (qn('w:tbl'), qn('w:sectPr')):
+        paragraphs = []
+    else:
+        paragraphs = list(iter_block_paragraphs(el))
+    if paragraphs:
+        with format_profile.phase('paragraphs'):
+            for p in paragraphs:
+                merged += paragraph_func(p)
+
+    # Разделы: в конце body и в свойствах абзацев с разрывом раздела
+    if section_func is not None:
+        sections = list(el.iter(qn('w:sectPr')))
+        if sections:
+            with format_profile.phase('sections'):
+                for sectPr in sections:
+                    section_func(sectPr)
+            format_profile.count('sections', len(sections))
+
+    counts['tables'] += len(tables)
+    counts['paragraphs'] += len(paragraphs)
+    counts['merged'] += merged
+    format_profile.count('tables', len(tables))
+    format_profile.count('paragraphs', len(paragraphs))
+    format_profile.count('runs_merged', merged)
+    return counts
+
+
+def format_document_xml(src, dst, table_func=format_table, paragraph_func=format_paragraph,
+                        section_func=format_section):
+    """Отформатировать document.xml: прочитать из потока src, записать в dst."""
+    # Парсить с сохранением всех атрибутов
+    with format_profile.phase('parse'):
+        tree = ET.parse(src)
+    root = tree.getroot()
+
+    # Найти body
+    body = root.find(qn('w:body'))
+    if body is None:
+        raise ValueError("body не найден")
+
+    counts = format_container(body, table_func, paragraph_func, section_func)
+    print(f"Найдено таблиц: {counts['tables']}")
+    print(f"Найдено параграфов: {counts['paragraphs']}")
+    print(f"Объединено run: {counts['merged']}")
+
+    with format_profile.phase('serialise'):
+        tree.write(dst, encoding='UTF-8', xml_declaration=True)
+
+
+def _prefixed_name(name, prefixes):
+    """Перевести имя вида {uri}local в prefix:local по исходным префиксам."""
+    if name[0] != '{':
+        return name
+    uri, local = name[1:].split('}', 1)
+    prefix = prefixes.get(uri)
+    if prefix is None:
+        raise ValueError(f"Не объявлен namespace: {uri}")
+    return f'{prefix}:{local}' if prefix else local
+
+
+def _start_tag(elem, declarations, prefixes):
+    """Собрать открывающий тег элемента с объявлениями namespace."""
+    parts = ['<', _prefixed_name(elem.tag, prefixes)]
+    for prefix, uri in declarations:
+        attr = f'xmlns:{prefix}' if prefix else 'xmlns'
+        parts.append(f' {attr}={quoteattr(uri)}')
+    for key, value in elem.attrib.items():
+        parts.append(f' {_prefixed_name(key, prefixes)}={quoteattr(value)}')
+    parts.append('>')
+    return ''.join(parts).encode('utf-8')
+
+
+def stream_format_document_xml(src, dst, table_func=format_table,
+                               paragraph_func=format_paragraph, section_func=format_section,
+                               chunk_size=64 * 1024):
+    """Потоково отформатировать document.xml за один проход.
+
+    В памяти держится только текущий элемент верхнего уровня body
+    (абзац или таблица): он форматируется по тем же правилам, сразу
+    записывается в dst и удаляется из дерева.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end', 'start-ns'))
+    declarations = []
+    prefixes = {'http://www.w3.org/XML/1998/namespace': 'xml'}
+    stack = []
+    body_tag = qn('w:body')
+    counts = {'tables': 0, 'paragraphs': 0, 'merged': 0}
+    found_body = False
+
+    def handle(events):
+        nonlocal found_body
+        for event, item in events:
+            if event == 'start-ns':
+                prefix, uri = item
+                if not stack:
+                    # Объявления на корне переносим в выход как есть
+                    declarations.append((prefix, uri))
+                    prefixes.setdefault(uri, prefix)
+                continue
+
+            if event == 'start':
+                stack.append(item)
+                if len(stack) == 1:
+                    dst.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+                    dst.write(_start_tag(item, declarations, prefixes))
+                elif len(stack) == 2 and item.tag == body_tag:
+                    found_body = True
+                    dst.write(_start_tag(item, (), prefixes))
+                continue
+
+            # event == 'end'
+            stack.pop()
+            depth = len(stack)
+            if depth == 0 or (depth == 1 and item.tag == body_tag):
+                dst.write(f'</{_prefixed_name(item.tag, prefixes)}>'.encode('utf-8'))
+            elif depth == 1 or (depth == 2 and stack[1].tag == body_tag):
+                # Элемент верхнего уровня: отформатировать, записать, забыть
+                if depth == 2:
+                    format_container(item, table_func, paragraph_func, section_func, counts)
+                item.tail = None
+                with format_profile.phase('serialise'):
+                    dst.write(ET.tostring(item, encoding='utf-8'))
+                stack[-1].remove(item)
+
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        with format_profile.phase('parse'):
+            parser.feed(chunk)
+            events = list(parser.read_events())
+        handle(events)
+    with format_profile.phase('parse'):
+        parser.close()
+        events = list(parser.read_events())
+    handle(events)
+
+    if not found_body:
+        raise ValueError("body не найден")
+    print(f"Найдено таблиц: {counts['tables']}")
+    print(f"Найдено параграфов: {counts['paragraphs']}")
+    print(f"Объединено run: {counts['merged']}")
+
+
+def copy_member_raw(zin, zout, info):
+    """Скопировать член архива как есть: сжатые байты без распаковки и пересжатия.
+
+    Для зашифрованных и zip64-членов — обычная копия с пересжатием.
+    """
+    if info.flag_bits & 0x01 or info.compress_size >= zipfile.ZIP64_LIMIT:
+        zout.writestr(info, zin.read(info))
+        return
+
+    # Найти начало данных: за локальным заголовком идут имя и extra
+    zin.fp.seek(info.header_offset)
+    header = zin.fp.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Повреждён заголовок: {info.filename}")
+    name_len, extra_len = struct.unpack('<HH', header[26:30])
+    zin.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_len + extra_len)
+
+    out_info = copy.copy(info)
+    # Размеры и CRC известны заранее — data descriptor не нужен
+    out_info.flag_bits &= ~0x08
+    out_info.header_offset = zout.fp.tell()
+    zout.fp.write(out_info.FileHeader(False))
+
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = zin.fp.read(min(COPY_CHUNK_SIZE, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Обрезанные данные: {info.filename}")
+        zout.fp.write(chunk)
+        remaining -= len(chunk)
+
+    # Зарегистрировать член в центральном каталоге выходного архива
+    zout.filelist.append(out_info)
+    zout.NameToInfo[out_info.filename] = out_info
+    zout.start_dir = zout.fp.tell()
+    zout._didModify = True
+
+
+def repack_archive(zin, zout, transforms, deferred=(), additions=None, removed=()):
+    """Переписать члены открытого архива zin в открытый архив zout.
+
+    transforms — словарь {имя члена: функция(src, dst)}; эти члены
+    преобразуются потоково, остальные копируются сжатыми байтами.
+    deferred — члены, которые записываются после всех остальных: их
+    преобразование зависит от результата обработки document.xml.
+    additions — функция без аргументов, возвращающая {имя: байты} новых
+    членов; вызывается в самом конце.
+    removed — члены, которые не переносятся (дубликаты медиа).
+    """
+    infos = zin.infolist()
+    if removed:
+        infos = [info for info in infos if info.filename not in removed]
+        format_profile.count('members_removed', len(removed))
+    later = [info for info in infos if info.filename in deferred]
+    for info in [info for info in infos if info.filename not in deferred] + later:
+        transform = transforms.get(info.filename)
+        if transform is None:
+            with format_profile.phase('zip'):
+                copy_member_raw(zin, zout, info)
+            format_profile.count('members_copied')
+            continue
+        out_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        out_info.compress_type = zipfile.ZIP_DEFLATED
+        out_info.external_attr = info.external_attr
+        with zin.open(info) as src, zout.open(out_info, 'w') as dst:
+            transform(format_profile.timed_stream(src, 'unzip'),
+                      format_profile.timed_stream(dst, 'zip'))
+        format_profile.count('members_rewritten')
+    if additions is not None:
+        for name, data in additions().items():
+            with format_profile.phase('zip'):
+                zout.writestr(zipfile.ZipInfo(name, date_time=time.localtime()[:6]),
+                              data, compress_type=zipfile.ZIP_DEFLATED)
+            format_profile.count('members_added')
+
+
+def repack_docx(input_path, output_path, transforms, deferred=(), additions=None, removed=()):
+    """Переупаковать DOCX из архива в архив без распаковки на диск.
+
+    Параметры — как у repack_archive. Результат пишется во временный файл
+    рядом с output_path и атомарно заменяет его, поэтому параллельные
+    запуски не мешают друг другу.
+    """
+    output_path = Path(output_path)
+    fd, tmp_name = tempfile.mkstemp(prefix='.docx_format_', suffix='.tmp',
+                                    dir=output_path.parent)
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(input_path, 'r') as zin, \
+                zipfile.ZipFile(tmp_name, 'w', zipfile.ZIP_DEFLATED) as zout:
+            repack_archive(zin, zout, transforms, deferred, additions, removed)
+        shutil.copymode(input_path, tmp_name)  # mkstemp создаёт файл с правами 0600
+        os.replace(tmp_name, output_path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+def _process_extracted(input_path, output_path):
+    """Старый режим: распаковать во временный каталог, обработать, запаковать."""
+    # Создать временную директорию (своя для каждого запуска)
+    temp_dir = Path(tempfile.mkdtemp(prefix='docx_format_'))
 
     try:
         # Распаковать DOCX
         print(f"Распаковка: {input_path}")
         with zipfile.ZipFile(input_path, 'r') as zf:
-            zf.extractall(temp_dir)
+            with format_profile.phase('unzip'):
+                zf.extractall(temp_dir)
 
         # Обработать document.xml
         doc_path = temp_dir / 'word' / 'document.xml'
@@ -232,41 +1107,20 @@ def process_document(input_path, output_path=None):
             return
 
         print("Обработка document.xml...")
-
-        # Парсить с сохранением всех атрибутов
-        tree = ET.parse(doc_path)
-        root = tree.getroot()
-
-        # Найти body
-        body = root.find(qn('w:body'))
-        if body is None:
-            print("Ошибка: body не найден")
-            return
-
-        # Форматировать таблицы
-        tables = body.findall('.//' + qn('w:tbl'))
-        print(f"Найдено таблиц: {len(tables)}")
-        for tbl in tables:
-            format_table(tbl)
-
-        # Форматировать параграфы (вне таблиц)
-        paragraphs = body.findall(qn('w:p'))
-        print(f"Найдено параграфов: {len(paragraphs)}")
-        for p in paragraphs:
-            format_paragraph(p)
-
-        # Сохранить document.xml
-        tree.write(doc_path, encoding='UTF-8', xml_declaration=True)
+        data = doc_path.read_bytes()
+        with open(doc_path, 'wb') as dst:
+            format_document_xml(io.BytesIO(data), dst)
 
         # Запаковать обратно
         print(f"Сохранение: {output_path}")
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with format_profile.phase('zip'), \
+                zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
             for file_path in temp_dir.rglob('*'):
                 if file_path.is_file():
                     arc_name = file_path.relative_to(temp_dir)
                     zf.write(file_path, arc_name)
 
-        print("Готово!")
+        return output_path
 
     finally:
         # Очистить временные файлы
@@ -274,19 +1128,247 @@ def process_document(input_path, output_path=None):
             shutil.rmtree(temp_dir)
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Использование: python format_docx_xml.py <файл.docx> [выходной.docx]")
-        sys.exit(1)
+def _write_bytes(data):
+    """Преобразование члена архива, которое записывает готовые байты."""
+    def transform(src, dst):
+        dst.write(data)
+    return transform
+
+
+def _rewrite_before(rewrite, transform=None):
+    """Преобразование: сначала rewrite(байты) → байты, затем transform (если есть)."""
+    def wrapped(src, dst):
+        data = rewrite(src.read())
+        if transform is None:
+            dst.write(data)
+        else:
+            transform(io.BytesIO(data), dst)
+    return wrapped
+
+
+def plan_media_transforms(zf, transforms, dpi=docx_media.DEFAULT_DPI, quality=None):
+    """Добавить в transforms оптимизацию word/media/* (docx_media.py).
+
+    Существующие преобразования *.rels и [Content_Types].xml сохраняются:
+    связи переписываются до них. Вернуть (removed, план медиа).
+    """
+    with format_profile.phase('media'):
+        media = docx_media.plan_media(zf, dpi, quality)
+    print(docx_media.summary(media))
+    format_profile.count('media_files', media['files'])
+    format_profile.count('media_bytes_saved', docx_media.saved_bytes(media))
+
+    for name, data in media['images'].items():
+        transforms[name] = _write_bytes(data)
+    duplicates = media['duplicates']
+    for name in media['rels']:
+        transforms[name] = _rewrite_before(
+            functools.partial(docx_media.rewrite_relationships, rels_part=name,
+                              duplicates=duplicates),
+            transforms.get(name))
+    if duplicates and CONTENT_TYPES_PART in zf.NameToInfo:
+        transforms[CONTENT_TYPES_PART] = _rewrite_before(
+            functools.partial(docx_media.drop_overrides, removed=set(duplicates)),
+            transforms.get(CONTENT_TYPES_PART))
+    return set(duplicates), media
+
+
+def plan_transforms(zf, mode='zip', styles=False, coalesce=True, media=False,
+                    dpi=docx_media.DEFAULT_DPI, quality=None):
+    """Подготовить преобразования членов открытого архива для repack_archive.
+
+    Вернуть (transforms, deferred, additions, removed) или None, если в
+    архиве нет document.xml. Параметры — как у process_document (кроме
+    mode='extract').
+    """
+    if DOCUMENT_PART not in zf.NameToInfo:
+        print("Ошибка: document.xml не найден")
+        return None
+
+    transforms = {}
+    table_func = functools.partial(format_table, coalesce=coalesce)
+    paragraph_func = functools.partial(format_paragraph, coalesce=coalesce)
+    if styles and STYLES_PART in zf.NameToInfo:
+        print("Запись стилей Space Travel в styles.xml...")
+        with format_profile.phase('styles'):
+            styles_xml, heading_style = build_house_styles(zf.read(STYLES_PART))
+        transforms[STYLES_PART] = _write_bytes(styles_xml)
+        table_func = functools.partial(style_format_table, coalesce=coalesce)
+        paragraph_func = functools.partial(style_format_paragraph,
+                                           heading_style=heading_style,
+                                           coalesce=coalesce)
+    elif styles:
+        print("styles.xml не найден — прямое форматирование")
+
+    # Нумерация страниц: план колонтитулов до обработки document.xml
+    plan = plan_page_footers(zf)
+    deferred = ()
+    additions = None
+    if plan is not None:
+        parts = [(kind, name) for kind, name in plan['rels'].values()
+                 if kind in TEXT_PART_TYPES and name in zf.NameToInfo]
+        for kind, name in parts:
+            if kind == 'footer':
+                transforms[name] = _footer_transform(name, plan, table_func, paragraph_func)
+            else:
+                transforms[name] = functools.partial(
+                    format_part_xml, table_func=table_func, paragraph_func=paragraph_func)
+        if parts:
+            print(f"Колонтитулы и сноски: {len(parts)}")
+        transforms[DOCUMENT_RELS_PART] = _add_footer_relationship(plan)
+        transforms[CONTENT_TYPES_PART] = _add_footer_content_type(plan)
+        deferred = {name for kind, name in parts if kind == 'footer'}
+        deferred |= {DOCUMENT_RELS_PART, CONTENT_TYPES_PART}
+        additions = functools.partial(_new_footer_parts, plan)
 
-    input_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    print("Обработка document.xml...")
+    transform = stream_format_document_xml if mode == 'stream' else format_document_xml
+    transforms[DOCUMENT_PART] = functools.partial(
+        transform, table_func=table_func, paragraph_func=paragraph_func,
+        section_func=functools.partial(format_section, plan=plan))
 
-    if not Path(input_path).exists():
-        print(f"Ошибка: файл не найден: {input_path}")
+    removed = ()
+    if media:
+        removed, _ = plan_media_transforms(zf, transforms, dpi, quality)
+    return transforms, deferred, additions, removed
+
+
+def optimise_media(input_path, output_path=None, dpi=docx_media.DEFAULT_DPI, quality=None):
+    """Только оптимизация медиа (без форматирования) — для документов из format_docx.py.
+
+    Вернуть сэкономленные байты архива.
+    """
+    input_path = Path(input_path)
+    output_path = Path(output_path) if output_path else input_path
+    before = input_path.stat().st_size
+    with zipfile.ZipFile(input_path, 'r') as zf:
+        transforms = {}
+        removed, _ = plan_media_transforms(zf, transforms, dpi, quality)
+    repack_docx(input_path, output_path, transforms, removed=removed)
+    return before - output_path.stat().st_size
+
+
+def process_document(input_path, output_path=None, mode='zip', styles=False, coalesce=True,
+                     media=False, dpi=docx_media.DEFAULT_DPI, quality=None):
+    """Обработать документ.
+
+    mode='zip'     — из архива в архив, document.xml целиком в памяти (по умолчанию);
+    mode='stream'  — из архива в архив, document.xml потоково по абзацам и таблицам;
+    mode='extract' — через распаковку во временный каталог (только document.xml,
+                     без колонтитулов и нумерации страниц).
+
+    styles=True — записать оформление один раз в styles.xml, а абзацам и
+    таблицам назначить ссылки на стили вместо прямого форматирования run.
+
+    coalesce=True — после форматирования слить соседние run с одинаковыми
+    свойствами.
+
+    media=True — оптимизировать word/media/* (dpi — разрешение для ширины
+    контента, quality — качество JPEG; None — без перекодирования JPEG).
+    """
+    if mode not in MODES:
+        raise ValueError(f"Неизвестный режим: {mode}")
+    if styles and mode == 'extract':
+        print("Ошибка: режим стилей поддерживается только для zip и stream")
+        return
+    if media and mode == 'extract':
+        print("Ошибка: оптимизация медиа поддерживается только для zip и stream")
+        return
+
+    input_path = Path(input_path)
+    if output_path is None:
+        output_path = input_path
+    else:
+        output_path = Path(output_path)
+
+    try:
+        if mode == 'extract':
+            saved = _process_extracted(input_path, output_path)
+        else:
+            print(f"Чтение: {input_path}")
+            before = input_path.stat().st_size
+            with zipfile.ZipFile(input_path, 'r') as zf:
+                planned = plan_transforms(zf, mode, styles, coalesce, media, dpi, quality)
+            if planned is None:
+                return
+            repack_docx(input_path, output_path, *planned)
+            print(f"Сохранение: {output_path}")
+            if media:
+                after = output_path.stat().st_size
+                print(f"Размер архива: {before / 1024:.0f} → {after / 1024:.0f} КБ")
+            saved = output_path
+    except ValueError as exc:
+        print(f"Ошибка: {exc}")
+        return
+
+    if saved is not None:
+        print("Готово!")
+    return saved
+
+
+def format_bytes(data, mode='zip', styles=False, coalesce=True, media=False,
+                 dpi=docx_media.DEFAULT_DPI, quality=None):
+    """Отформатировать DOCX в памяти: байты на входе, байты на выходе.
+
+    Без временных файлов; mode — 'zip' или 'stream'. Ошибки входных
+    данных — ValueError или zipfile.BadZipFile.
+    """
+    if mode not in ('zip', 'stream'):
+        raise ValueError(f"Режим {mode} не поддерживается для байтов")
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data), 'r') as zin:
+        planned = plan_transforms(zin, mode, styles, coalesce, media, dpi, quality)
+        if planned is None:
+            raise ValueError("document.xml не найден")
+        with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as zout:
+            repack_archive(zin, zout, *planned)
+    return output.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Форматирование DOCX через XML (Space Travel)")
+    parser.add_argument('input', help="файл .docx")
+    parser.add_argument('output', nargs='?', help="выходной файл (по умолчанию — перезаписать входной)")
+    parser.add_argument('--mode', choices=MODES, default='zip',
+                        help="zip — из архива в архив в памяти, stream — потоково "
+                             "(для очень больших документов), extract — через временный каталог")
+    parser.add_argument('--styles', action='store_true',
+                        help="оформление через styles.xml вместо прямого форматирования run")
+    parser.add_argument('--no-coalesce', action='store_true',
+                        help="не сливать соседние run с одинаковыми свойствами")
+    parser.add_argument('--media', action='store_true',
+                        help="оптимизировать изображения: дубликаты, уменьшение, пересжатие")
+    parser.add_argument('--dpi', type=int, default=docx_media.DEFAULT_DPI,
+                        help=f"для --media: разрешение при ширине контента 19 см "
+                             f"(по умолчанию {docx_media.DEFAULT_DPI})")
+    parser.add_argument('--quality', type=int, default=None,
+                        help="для --media: качество JPEG 1–95 (по умолчанию JPEG не перекодируются)")
+    parser.add_argument('--profile', nargs='?', const='-', metavar='JSON',
+                        help="время по фазам и счётчики в JSON (без файла — в stdout)")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="для --profile: пик памяти Python по фазам (медленнее)")
+    args = parser.parse_args()
+
+    if not Path(args.input).exists():
+        print(f"Ошибка: файл не найден: {args.input}")
+        sys.exit(1)
+    if args.mode == 'extract' and (args.styles or args.media):
+        option = '--styles' if args.styles else '--media'
+        print(f"Ошибка: {option} поддерживается только для --mode zip и stream")
         sys.exit(1)
 
-    process_document(input_path, output_path)
+    options = {'mode': args.mode, 'styles': args.styles, 'coalesce': not args.no_coalesce,
+               'media': args.media, 'dpi': args.dpi, 'quality': args.quality}
+    if args.profile is None:
+        process_document(args.input, args.output, **options)
+        return
+
+    with format_profile.profiling(trace_memory=args.profile_memory) as profile:
+        saved = process_document(args.input, args.output, **options)
+    format_profile.save_report(profile, args.profile, {
+        'engine': 'xml', 'mode': args.mode, 'styles': args.styles, 'media': args.media,
+        'input': args.input, 'ok': saved is not None,
+    })
 
 
 if __name__ == "__main__":
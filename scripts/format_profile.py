@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Профилирование форматирования DOCX для Space Travel.
+
+Движки (format_docx_xml.py, format_docx.py) отмечают фазы работы и
+считают обработанные элементы через этот модуль. Пока профилирование не
+включено, phase() и count() ничего не делают.
+
+Фазы (время без вложенных фаз):
+- unzip      — чтение и распаковка членов архива
+- parse      — разбор XML
+- tables     — форматирование таблиц
+- paragraphs — форматирование абзацев
+- sections   — поля страницы и колонтитулы
+- styles     — запись стилей (режим --styles)
+- serialise  — сборка XML
+- zip        — сжатие и запись архива
+
+Счётчики: абзацы, таблицы, ячейки, run, rPr созданные и существующие,
+слитые run, исправленные тексты и т.д.
+
+Использование из кода:
+    with format_profile.profiling() as prof:
+        process_document('отчёт.docx', 'out.docx')
+    print(prof.report())
+
+Из командной строки движков:
+    python format_docx_xml.py отчёт.docx out.docx --profile profile.json
+"""
+
+import contextlib
+import json
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Текущий профиль (None — профилирование выключено)
+_active = None
+
+
+def peak_rss_mb():
+    """Пиковая память процесса (RSS) в МБ или None, если недоступно."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux — килобайты, macOS — байты
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+class Profile:
+    """Время по фазам, счётчики и память одного прогона."""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.seconds = {}
+        self.calls = {}
+        self.memory = {}
+        self.counters = {}
+        self._stack = []
+        self._start = None
+        self._total = 0.0
+        self._rss_start = None
+
+    def start(self):
+        self._rss_start = peak_rss_mb()
+        if self.trace_memory:
+            tracemalloc.start()
+        self._start = time.perf_counter()
+
+    def stop(self):
+        self._total = time.perf_counter() - self._start
+        if self.trace_memory:
+            self._note_memory()
+            tracemalloc.stop()
+
+    def _note_memory(self):
+        """Пик памяти Python с прошлой отметки — в текущую фазу."""
+        name = self._stack[-1][0] if self._stack else 'other'
+        peak = tracemalloc.get_traced_memory()[1]
+        self.memory[name] = max(self.memory.get(name, 0), peak)
+        tracemalloc.reset_peak()
+
+    def enter(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            # Внешняя фаза на паузе, пока идёт вложенная
+            outer = self._stack[-1]
+            self.seconds[outer[0]] = self.seconds.get(outer[0], 0.0) + now - outer[1]
+        if self.trace_memory:
+            self._note_memory()
+        self._stack.append([name, now])
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def exit(self):
+        now = time.perf_counter()
+        if self.trace_memory:
+            self._note_memory()
+        name, start = self._stack.pop()
+        self.seconds[name] = self.seconds.get(name, 0.0) + now - start
+        if self._stack:
+            self._stack[-1][1] = now
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def report(self):
+        """Результат в виде словаря (для JSON)."""
+        phases = {
+            name: {'seconds': round(seconds, 4), 'calls': self.calls.get(name, 0)}
+            for name, seconds in sorted(self.seconds.items(), key=lambda item: -item[1])
+        }
+        measured = sum(self.seconds.values())
+        phases['other'] = {'seconds': round(max(0.0, self._total - measured), 4), 'calls': 0}
+        for name, peak in self.memory.items():
+            phases.setdefault(name, {'seconds': 0.0, 'calls': 0})
+            phases[name]['traced_peak_mb'] = round(peak / (1024 * 1024), 2)
+        return {
+            'seconds': round(self._total, 4),
+            'phases': phases,
+            'counters': dict(sorted(self.counters.items())),
+            'rss_start_mb': self._rss_start,
+            'peak_rss_mb': peak_rss_mb(),
+        }
+
+
+@contextlib.contextmanager
+def profiling(trace_memory=False):
+    """Включить профилирование на время блока. Вернуть Profile.
+
+    trace_memory=True — дополнительно пик памяти Python по фазам
+    (tracemalloc, заметно замедляет работу).
+    """
+    global _active
+    previous = _active
+    profile = Profile(trace_memory)
+    _active = profile
+    profile.start()
+    try:
+        yield profile
+    finally:
+        profile.stop()
+        _active = previous
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Отметить фазу работы (без профилирования — ничего не делает)."""
+    profile = _active
+    if profile is None:
+        yield
+        return
+    profile.enter(name)
+    try:
+        yield
+    finally:
+        profile.exit()
+
+
+def count(name, n=1):
+    """Увеличить счётчик (без профилирования — ничего не делает)."""
+    if _active is not None:
+        _active.count(name, n)
+
+
+def active():
+    """Включено ли профилирование."""
+    return _active is not None
+
+
+class _TimedStream:
+    """Обёртка потока: время read() и write() идёт в отдельную фазу."""
+
+    def __init__(self, stream, name):
+        self._stream = stream
+        self._name = name
+
+    def read(self, *args):
+        with phase(self._name):
+            return self._stream.read(*args)
+
+    def write(self, data):
+        with phase(self._name):
+            return self._stream.write(data)
+
+    def __getattr__(self, attr):
+        return getattr(self._stream, attr)
+
+
+def timed_stream(stream, name):
+    """Обернуть поток для учёта времени чтения/записи (unzip, zip)."""
+    if _active is None:
+        return stream
+    return _TimedStream(stream, name)
+
+
+def save_report(profile, destination, extra=None):
+    """Записать отчёт в JSON-файл или в stdout (destination='-')."""
+    report = dict(extra or {}, **profile.report())
+    text = json.dumps(report, ensure_ascii=False, indent=1)
+    if destination == '-':
+        print(text)
+    else:
+        with open(destination, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    return report
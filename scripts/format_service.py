@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Локальный сервис форматирования DOCX для Space Travel.
+
+Запуск format_docx.py на каждый документ — это старт интерпретатора и
+импорт движка ради нескольких миллисекунд работы. Сервис держит пул
+заранее прогретых процессов (движок уже импортирован) и принимает
+документы по HTTP через TCP-порт или Unix-сокет:
+- POST /format?engine=xml&mode=stream&styles=1 — тело запроса DOCX,
+  ответ — отформатированный DOCX
+- GET /metrics — счётчики, пропускная способность, задержки (p50/p95/p99)
+- GET /health  — проверка, что сервис жив
+
+Очередь ограничена: если заняты все процессы и все места в очереди,
+запрос сразу получает 503. Запрос дольше --timeout секунд получает 504;
+зависшая задача продолжает занимать место, пока процесс её не закончит.
+
+Без сервиса — тот же API в памяти, без временных файлов:
+    format_bytes(data, engine='xml', mode='stream') → bytes
+
+Использование:
+    python format_service.py serve --port 8765 -j 4
+    python format_service.py serve --socket /tmp/format.sock
+    python format_service.py send отчёт.docx out.docx --port 8765
+    curl --data-binary @отчёт.docx -o out.docx 'http://127.0.0.1:8765/format?styles=1'
+"""
+
+import argparse
+import collections
+import contextlib
+import http.client
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlsplit
+from xml.etree import ElementTree as ET
+
+
+# Модуль движка (в каждом есть format_bytes)
+ENGINES = {
+    'xml': 'format_docx_xml',
+    'docx': 'format_docx',
+}
+
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE = 16
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_MB = 50
+# Число последних запросов для перцентилей задержки
+LATENCY_WINDOW = 1000
+# Окно «текущей» пропускной способности, секунд
+RATE_WINDOW = 60
+
+DOCX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+# Ошибки во входном документе (ответ 400, а не 500)
+CLIENT_ERRORS = (ValueError, zipfile.BadZipFile, ET.ParseError)
+
+
+def _flag(value):
+    value = value.lower()
+    if value in ('1', 'true', 'yes', 'on'):
+        return True
+    if value in ('0', 'false', 'no', 'off'):
+        return False
+    raise ValueError(f"ожидается 0/1, получено: {value}")
+
+
+# Параметры движков, допустимые в строке запроса: имя → преобразование
+ENGINE_OPTIONS = {
+    'xml': {'mode': str, 'styles': _flag, 'coalesce': _flag, 'media': _flag, 'dpi': int,
+            'quality': int},
+    'docx': {'font_name': str, 'font_size': int},
+}
+
+
+def format_bytes(data, engine='xml', **options):
+    """Отформатировать DOCX в памяти выбранным движком. Вернуть байты результата."""
+    if engine not in ENGINES:
+        raise ValueError(f"Неизвестный движок: {engine}")
+    module = importlib.import_module(ENGINES[engine])
+    return module.format_bytes(data, **options)
+
+
+def parse_options(engine, query):
+    """Параметры форматирования из строки запроса (parse_qs). ValueError при ошибке."""
+    if engine not in ENGINES:
+        raise ValueError(f"Неизвестный движок: {engine}")
+    allowed = ENGINE_OPTIONS[engine]
+    options = {}
+    for name, values in query.items():
+        if name == 'engine':
+            continue
+        if name not in allowed:
+            raise ValueError(f"Неизвестный параметр для движка {engine}: {name}")
+        try:
+            options[name] = allowed[name](values[-1])
+        except ValueError as exc:
+            raise ValueError(f"Параметр {name}: {exc}") from None
+    return options
+
+
+def available_engines(engines=None):
+    """Движки, которые удаётся импортировать (python-docx может быть не установлен)."""
+    result = []
+    for engine in engines or ENGINES:
+        try:
+            importlib.import_module(ENGINES[engine])
+        except ImportError:
+            continue
+        result.append(engine)
+    return result
+
+
+# ============================================================
+# Процессы пула
+# ============================================================
+
+def _init_worker(engines):
+    """Прогреть процесс пула: импортировать движки один раз."""
+    # Ctrl+C обрабатывает только основной процесс
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for engine in engines:
+        importlib.import_module(ENGINES[engine])
+
+
+def _format_job(data, engine, options):
+    """Задача процесса пула. Вернуть (статус, байты или сообщение, секунды)."""
+    start = time.perf_counter()
+    try:
+        # Движки печатают ход работы — сервису он не нужен
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = format_bytes(data, engine, **options)
+        status = 'ok'
+    except CLIENT_ERRORS as exc:
+        status, result = 'bad', f"{type(exc).__name__}: {exc}"
+    except Exception as exc:
+        status, result = 'error', f"{type(exc).__name__}: {exc}"
+    return status, result, time.perf_counter() - start
+
+
+# ============================================================
+# Метрики
+# ============================================================
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, round(q * (len(sorted_values) - 1)))]
+
+
+class Metrics:
+    """Счётчики и задержки последних запросов (потокобезопасно)."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.counters = collections.Counter()
+        self.in_flight = 0
+        # (время завершения, полная задержка, время работы процесса)
+        self.recent = collections.deque(maxlen=window)
+
+    def add(self, name, n=1):
+        with self.lock:
+            self.counters[name] += n
+
+    def begin(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def end(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def observe(self, latency, work):
+        with self.lock:
+            self.recent.append((time.time(), latency, work))
+
+    def snapshot(self):
+        """Метрики в виде словаря (для /metrics)."""
+        with self.lock:
+            now = time.time()
+            uptime = now - self.started
+            counters = dict(self.counters)
+            recent = list(self.recent)
+            in_flight = self.in_flight
+
+        latencies = sorted(item[1] for item in recent)
+        works = sorted(item[2] for item in recent)
+        waits = sorted(item[1] - item[2] for item in recent)
+        last_window = sum(1 for item in recent if now - item[0] <= RATE_WINDOW)
+
+        def ms(values, q):
+            value = _percentile(values, q)
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            'uptime_seconds': round(uptime, 1),
+            'in_flight': in_flight,
+            'counters': counters,
+            'throughput_per_sec': round(counters.get('ok', 0) / uptime, 3) if uptime else 0.0,
+            'recent_per_sec': round(last_window / min(uptime, RATE_WINDOW), 3) if uptime else 0.0,
+            'latency_ms': {'p50': ms(latencies, 0.5), 'p95': ms(latencies, 0.95),
+                           'p99': ms(latencies, 0.99), 'max': ms(latencies, 1.0)},
+            'work_ms': {'p50': ms(works, 0.5), 'p95': ms(works, 0.95)},
+            'queue_wait_ms': {'p50': ms(waits, 0.5), 'p95': ms(waits, 0.95)},
+            'window': len(recent),
+        }
+
+
+# ============================================================
+# Сервис
+# ============================================================
+
+class FormatService:
+    """Пул прогретых процессов с ограниченной очередью и таймаутом."""
+
+    def __init__(self, workers=None, queue_size=DEFAULT_QUEUE, timeout=DEFAULT_TIMEOUT,
+                 engines=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.engines = available_engines(engines)
+        if not self.engines:
+            raise RuntimeError("нет доступных движков форматирования")
+        # Места: по одному на процесс плюс очередь ожидания
+        self.slots = threading.BoundedSemaphore(self.workers + queue_size)
+        self.metrics = Metrics()
+        self.pool = multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                         initargs=(self.engines,))
+
+    def submit(self, data, engine, options):
+        """Отформатировать документ в пуле. Вернуть (HTTP-код, тело, Content-Type)."""
+        metrics = self.metrics
+        if engine not in self.engines:
+            metrics.add('bad_request')
+            return 400, f"Движок недоступен: {engine}", None
+        if not self.slots.acquire(blocking=False):
+            metrics.add('rejected')
+            return 503, "Очередь заполнена, повторите позже", None
+
+        def release(_):
+            # Место освобождается, только когда процесс закончил задачу
+            self.slots.release()
+
+        start = time.perf_counter()
+        metrics.begin()
+        try:
+            pending = self.pool.apply_async(_format_job, (data, engine, options),
+                                            callback=release, error_callback=release)
+            try:
+                status, result, work = pending.get(self.timeout)
+            except multiprocessing.TimeoutError:
+                metrics.add('timeouts')
+                return 504, f"Превышено время форматирования ({self.timeout} с)", None
+        finally:
+            metrics.end()
+
+        metrics.observe(time.perf_counter() - start, work)
+        if status == 'ok':
+            metrics.add('ok')
+            metrics.add('bytes_out', len(result))
+            return 200, result, DOCX_CONTENT_TYPE
+        metrics.add('bad_request' if status == 'bad' else 'failed')
+        return (400 if status == 'bad' else 500), result, None
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+
+
+class FormatHandler(BaseHTTPRequestHandler):
+    """HTTP-обработчик: /format, /metrics, /health."""
+
+    server_version = 'SpaceTravelFormat/1.0'
+    # keep-alive: клиент может слать документы по одному соединению
+    protocol_version = 'HTTP/1.1'
+
+    def _send(self, code, body, content_type=None):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+            content_type = content_type or 'text/plain; charset=utf-8'
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if code == 503:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, code, data):
+        self._send(code, json.dumps(data, ensure_ascii=False, indent=1),
+                   'application/json; charset=utf-8')
+
+    def do_GET(self):
+        service = self.server.service
+        path = urlsplit(self.path).path
+        if path == '/health':
+            self._send_json(200, {'ok': True, 'engines': service.engines,
+                                  'workers': service.workers})
+        elif path == '/metrics':
+            snapshot = service.metrics.snapshot()
+            snapshot.update(workers=service.workers, queue_size=service.queue_size,
+                            timeout_seconds=service.timeout)
+            self._send_json(200, snapshot)
+        else:
+            self._send(404, "Не найдено")
+
+    def do_POST(self):
+        service = self.server.service
+        url = urlsplit(self.path)
+        if url.path != '/format':
+            self.close_connection = True
+            self._send(404, "Не найдено")
+            return
+        service.metrics.add('requests')
+
+        length = self.headers.get('Content-Length')
+        if length is None or not length.isdigit():
+            self.close_connection = True
+            service.metrics.add('bad_request')
+            self._send(411, "Нужен заголовок Content-Length")
+            return
+        length = int(length)
+        if length > self.server.max_bytes:
+            # Тело не читаем — соединение закрывается
+            self.close_connection = True
+            service.metrics.add('bad_request')
+            self._send(413, f"Документ больше {self.server.max_bytes // (1024 * 1024)} МБ")
+            return
+        data = self.rfile.read(length)
+        service.metrics.add('bytes_in', len(data))
+
+        query = parse_qs(url.query)
+        engine = query.get('engine', ['xml'])[-1]
+        try:
+            options = parse_options(engine, query)
+        except ValueError as exc:
+            service.metrics.add('bad_request')
+            self._send(400, str(exc))
+            return
+
+        code, body, content_type = service.submit(data, engine, options)
+        self._send(code, body, content_type)
+
+    def address_string(self):
+        # У Unix-сокета нет адреса клиента
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP-сервер на Unix-сокете, поток на соединение."""
+
+    daemon_threads = True
+
+
+def make_server(service, port=None, socket_path=None, host='127.0.0.1',
+                max_mb=DEFAULT_MAX_MB, verbose=False):
+    """Создать HTTP-сервер (TCP или Unix-сокет) для сервиса."""
+    if socket_path:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, FormatHandler)
+    else:
+        server = ThreadingHTTPServer((host, port or DEFAULT_PORT), FormatHandler)
+        server.daemon_threads = True
+    server.service = service
+    server.max_bytes = int(max_mb * 1024 * 1024)
+    server.verbose = verbose
+    return server
+
+
+# ============================================================
+# Клиент
+# ============================================================
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP-соединение через Unix-сокет."""
+
+    def __init__(self, socket_path, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def request_format(data, port=None, socket_path=None, host='127.0.0.1',
+                   timeout=DEFAULT_TIMEOUT + 10, engine='xml', **options):
+    """Отформатировать DOCX через сервис. Вернуть байты результата.
+
+    Ошибка сервиса — RuntimeError с кодом ответа и сообщением.
+    """
+    if socket_path:
+        connection = UnixHTTPConnection(socket_path, timeout=timeout)
+    else:
+        connection = http.client.HTTPConnection(host, port or DEFAULT_PORT, timeout=timeout)
+    query = {'engine': engine}
+    query.update({name: int(value) if isinstance(value, bool) else value
+                  for name, value in options.items()})
+    try:
+        connection.request('POST', '/format?' + urlencode(query), body=data,
+                           headers={'Content-Type': DOCX_CONTENT_TYPE})
+        response = connection.getresponse()
+        body = response.read()
+    finally:
+        connection.close()
+    if response.status != 200:
+        raise RuntimeError(f"{response.status}: {body.decode('utf-8', 'replace')}")
+    return body
+
+
+# ============================================================
+# Командная строка
+# ============================================================
+
+def serve(args):
+    """Запустить сервис до Ctrl+C / SIGTERM."""
+    try:
+        service = FormatService(args.workers, args.queue, args.timeout, args.engine)
+    except RuntimeError as exc:
+        print(f"Ошибка: {exc}")
+        sys.exit(1)
+    server = make_server(service, args.port, args.socket, args.host, args.max_mb, args.verbose)
+    address = args.socket or f"http://{args.host}:{args.port}"
+    print(f"Сервис форматирования: {address}")
+    print(f"Движки: {', '.join(service.engines)}; процессов: {service.workers}, "
+          f"очередь: {service.queue_size}, таймаут: {service.timeout} с")
+
+    # SIGTERM завершает сервис так же, как Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Остановка...")
+    finally:
+        # Повторный сигнал не должен прервать остановку пула
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        server.server_close()
+        if args.socket:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(args.socket)
+        service.close()
+
+
+def send(args):
+    """Отправить документ в сервис и сохранить результат."""
+    data = Path(args.input).read_bytes()
+    options = {}
+    if args.engine == 'xml':
+        options = {'mode': args.mode, 'styles': args.styles}
+    start = time.perf_counter()
+    try:
+        result = request_format(data, args.port, args.socket, args.host,
+                                engine=args.engine, **options)
+    except (OSError, RuntimeError) as exc:
+        print(f"Ошибка: {exc}")
+        sys.exit(1)
+    output = Path(args.output or args.input)
+    output.write_bytes(result)
+    print(f"Сохранение: {output} ({(time.perf_counter() - start) * 1000:.0f} мс)")
+    print("Готово!")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сервис форматирования DOCX (Space Travel)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_address(sub):
+        sub.add_argument('--host', default='127.0.0.1', help="адрес (по умолчанию 127.0.0.1)")
+        sub.add_argument('--port', type=int, default=DEFAULT_PORT,
+                         help=f"TCP-порт (по умолчанию {DEFAULT_PORT})")
+        sub.add_argument('--socket', help="Unix-сокет вместо TCP-порта")
+
+    serve_parser = commands.add_parser('serve', help="запустить сервис")
+    add_address(serve_parser)
+    serve_parser.add_argument('-j', '--workers', type=int, default=None,
+                              help="число процессов (по умолчанию — число ядер)")
+    serve_parser.add_argument('--queue', type=int, default=DEFAULT_QUEUE,
+                              help=f"мест в очереди сверх процессов (по умолчанию {DEFAULT_QUEUE})")
+    serve_parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                              help=f"таймаут запроса, секунд (по умолчанию {DEFAULT_TIMEOUT:g})")
+    serve_parser.add_argument('--max-mb', type=float, default=DEFAULT_MAX_MB,
+                              help=f"максимальный размер документа, МБ (по умолчанию {DEFAULT_MAX_MB})")
+    serve_parser.add_argument('--engine', action='append', choices=sorted(ENGINES),
+                              help="движок (можно несколько; по умолчанию все доступные)")
+    serve_parser.add_argument('-v', '--verbose', action='store_true', help="журнал запросов")
+
+    send_parser = commands.add_parser('send', help="отформатировать документ через сервис")
+    add_address(send_parser)
+    send_parser.add_argument('input', help="файл .docx")
+    send_parser.add_argument('output', nargs='?', help="выходной файл (по умолчанию — перезаписать входной)")
+    send_parser.add_argument('--engine', choices=sorted(ENGINES), default='xml', help="движок")
+    send_parser.add_argument('--mode', choices=('zip', 'stream'), default='zip',
+                             help="режим движка xml")
+    send_parser.add_argument('--styles', action='store_true', help="оформление через styles.xml")
+
+    args = parser.parse_args()
+    if args.command == 'serve':
+        serve(args)
+    else:
+        if not Path(args.input).exists():
+            print(f"Ошибка: файл не найден: {args.input}")
+            sys.exit(1)
+        send(args)
+
+
+if __name__ == "__main__":
+    main()
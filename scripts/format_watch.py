@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Наблюдение за документами Space Travel: переформатирование после сохранения.
+
+Следит за каталогами (по умолчанию tz/, processes/ и отчёты в корне
+репозитория) и после сохранения форматирует только изменённый файл:
+- .docx — на месте движком xml (или --engine docx)
+- .md   — в .docx рядом (md_to_docx.py), если такой .docx уже есть;
+          --md-all — для всех .md
+
+Как это устроено:
+- inotify (Linux, через ctypes) — без событий процесс спит в select();
+  на других системах — опрос os.scandir раз в --interval секунд
+- серия сохранений одного файла схлопывается: форматирование начинается,
+  когда файл не меняется --debounce секунд
+- собственные записи не вызывают повторного форматирования: запоминается
+  размер и mtime результата, а кэш format_cache.py пропускает
+  уже отформатированные документы
+- форматирование идёт в фоновом пуле процессов (как format_batch.py),
+  один файл одновременно обрабатывается только одним процессом
+
+Использование:
+    python format_watch.py                     — tz/, processes/, корень
+    python format_watch.py tz --debounce 1
+    python format_watch.py ЗАЩИТА_ПРОЕКТА\\ 2 -r --poll
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import format_batch
+import format_cache
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Каталоги по умолчанию: (путь, рекурсивно)
+DEFAULT_TARGETS = (('tz', True), ('processes', True), ('.', False))
+
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_INTERVAL = 1.0
+DEFAULT_WORKERS = 2
+# Пока есть задачи в работе, цикл просыпается так часто, чтобы забрать результат
+RESULT_POLL_SECONDS = 0.2
+
+# Временные файлы движков и Word — не документы
+IGNORED_PREFIXES = ('~$', '.docx_format_', '.md_to_docx_', '.format_cache_', '.~lock.')
+
+# inotify (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct('iIII')
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF | IN_ONLYDIR
+
+
+def _walk_dirs(root, recursive):
+    """Каталог и (при recursive) все вложенные, кроме скрытых."""
+    yield root
+    if not recursive:
+        return
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+            yield from _walk_dirs(Path(entry.path), True)
+
+
+class InotifyWatcher:
+    """Изменённые файлы через inotify: без событий процесс не просыпается."""
+
+    def __init__(self, targets):
+        libc_name = ctypes.util.find_library('c')
+        if not sys.platform.startswith('linux') or not libc_name:
+            raise OSError("inotify недоступен")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self._dirs = {}  # wd → (каталог, рекурсивно)
+        for root, recursive in targets:
+            for directory in _walk_dirs(root, recursive):
+                self._add(directory, recursive)
+
+    def _add(self, directory, recursive):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            print(f"Предупреждение: не удалось следить за {directory} "
+                  f"({os.strerror(ctypes.get_errno())})")
+            return
+        self._dirs[wd] = (Path(directory), recursive)
+
+    def wait(self, timeout):
+        """Дождаться событий (timeout=None — без ограничения). Вернуть изменённые пути."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changed = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                print("Предупреждение: очередь inotify переполнена, часть событий потеряна")
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            if wd not in self._dirs or not name:
+                continue
+            directory, recursive = self._dirs[wd]
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                # Новый подкаталог — следить и за ним
+                if recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                    for sub in _walk_dirs(path, True):
+                        self._add(sub, True)
+                continue
+            if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                changed.append(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Изменённые файлы по опросу размера и mtime (запасной вариант)."""
+
+    def __init__(self, targets, interval=DEFAULT_INTERVAL, suffixes=('.docx', '.md')):
+        self.targets = targets
+        self.interval = interval
+        self.suffixes = suffixes
+        self._state = self._scan()
+
+    def _scan(self):
+        state = {}
+        for root, recursive in self.targets:
+            for directory in _walk_dirs(root, recursive):
+                try:
+                    entries = list(os.scandir(directory))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if not entry.name.endswith(self.suffixes):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    state[entry.path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def wait(self, timeout):
+        """Подождать до следующего опроса. Вернуть изменённые пути."""
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        state = self._scan()
+        changed = [Path(path) for path, sig in state.items() if self._state.get(path) != sig]
+        self._state = state
+        return changed
+
+    def close(self):
+        pass
+
+
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class Formatter:
+    """Фоновое форматирование изменённых файлов с кэшем и защитой от петель."""
+
+    def __init__(self, docx_engine='xml', workers=DEFAULT_WORKERS, md_all=False,
+                 cache_file=None):
+        self.docx_engine = docx_engine
+        self.workers = workers
+        self.md_all = md_all
+        self.cache_file = cache_file
+        self.manifest = format_cache.load_manifest(cache_file) if cache_file else None
+        self._fingerprints = {}
+        self._pools = {}
+        self.running = {}   # путь → (future, движок, хеш входа)
+        self.dirty = set()  # изменились во время форматирования
+        self.own = {}       # путь результата → (mtime_ns, размер) нашей записи
+
+    def engine_for(self, path):
+        """Движок для файла или None, если файл форматировать не нужно."""
+        if path.name.startswith(IGNORED_PREFIXES):
+            return None
+        suffix = path.suffix.lower()
+        if suffix == '.docx':
+            return self.docx_engine
+        if suffix == '.md' and (self.md_all or path.with_suffix('.docx').exists()):
+            return 'md'
+        return None
+
+    def _pool(self, engine):
+        # Пул на движок: процессы импортируют движок один раз
+        if engine not in self._pools:
+            self._pools[engine] = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=format_batch._init_worker,
+                initargs=(engine,))
+        return self._pools[engine]
+
+    def _fingerprint(self, engine):
+        if engine not in self._fingerprints:
+            self._fingerprints[engine] = format_cache.config_fingerprint(engine)
+        return self._fingerprints[engine]
+
+    def submit(self, path):
+        """Поставить файл в очередь форматирования (если он действительно изменился)."""
+        engine = self.engine_for(path)
+        if engine is None or not path.exists():
+            return
+        if self.own.get(path) == _signature(path):
+            return  # наша же запись
+        if path in self.running:
+            self.dirty.add(path)
+            return
+
+        output = format_batch.output_for(path, engine)
+        input_hash = None
+        if self.manifest is not None:
+            fresh, input_hash = format_cache.is_up_to_date(
+                self.manifest, path, output, self._fingerprint(engine))
+            if fresh:
+                return
+        future = self._pool(engine).submit(format_batch.format_one, path)
+        self.running[path] = (future, engine, input_hash)
+
+    def collect(self):
+        """Забрать готовые результаты. Вернуть список результатов format_one."""
+        results = []
+        for path, (future, engine, input_hash) in list(self.running.items()):
+            if not future.done():
+                continue
+            del self.running[path]
+            try:
+                result = future.result()
+            except Exception as exc:
+                result = {'path': str(path), 'ok': False, 'seconds': 0.0,
+                          'error': f"{type(exc).__name__}: {exc}"}
+            if result['ok']:
+                output = Path(result['output'])
+                self.own[output] = _signature(output)
+                if self.manifest is not None and input_hash is not None:
+                    format_cache.record(self.manifest, input_hash, output,
+                                        self._fingerprint(engine))
+                    format_cache.save_manifest(self.manifest, self.cache_file)
+            results.append(result)
+            if path in self.dirty:
+                # Файл сохранили ещё раз, пока он форматировался
+                self.dirty.discard(path)
+                self.submit(path)
+        return results
+
+    def close(self):
+        for pool in self._pools.values():
+            pool.shutdown(cancel_futures=True)
+
+
+def resolve_targets(paths, recursive):
+    """Каталоги наблюдения: (Path, рекурсивно)."""
+    if not paths:
+        return [(REPO_ROOT / path, rec) for path, rec in DEFAULT_TARGETS
+                if (REPO_ROOT / path).is_dir()]
+    return [(Path(path), recursive) for path in paths if Path(path).is_dir()]
+
+
+def watch(targets, formatter, debounce=DEFAULT_DEBOUNCE, poll=False, interval=DEFAULT_INTERVAL):
+    """Основной цикл: события → задержка → форматирование в пуле."""
+    watcher = None
+    if not poll:
+        try:
+            watcher = InotifyWatcher(targets)
+            print("Режим: inotify")
+        except OSError as exc:
+            print(f"inotify недоступен ({exc}), опрос каждые {interval} с")
+    if watcher is None:
+        watcher = PollingWatcher(targets, interval)
+        if poll:
+            print(f"Режим: опрос каждые {interval} с")
+
+    pending = {}  # путь → момент, после которого можно форматировать
+    try:
+        while True:
+            now = time.monotonic()
+            timeout = None
+            if pending:
+                timeout = max(0.0, min(pending.values()) - now)
+            if formatter.running:
+                timeout = RESULT_POLL_SECONDS if timeout is None else min(timeout, RESULT_POLL_SECONDS)
+
+            for path in watcher.wait(timeout):
+                if formatter.engine_for(path) is not None:
+                    # Каждое новое сохранение откладывает форматирование
+                    pending[path] = time.monotonic() + debounce
+
+            now = time.monotonic()
+            for path in [path for path, deadline in pending.items() if deadline <= now]:
+                del pending[path]
+                formatter.submit(path)
+
+            for result in formatter.collect():
+                format_batch.print_result(result)
+    finally:
+        watcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Переформатирование документов после сохранения (Space Travel)")
+    parser.add_argument('paths', nargs='*',
+                        help="каталоги (по умолчанию tz/, processes/ и корень репозитория)")
+    parser.add_argument('-r', '--recursive', action='store_true',
+                        help="для заданных каталогов: следить и за вложенными")
+    parser.add_argument('--engine', choices=('xml', 'docx'), default='xml',
+                        help="движок для .docx (по умолчанию xml)")
+    parser.add_argument('--md-all', action='store_true',
+                        help="собирать .docx из всех .md, а не только из тех, у которых он уже есть")
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE,
+                        help=f"пауза после последнего сохранения, секунд (по умолчанию {DEFAULT_DEBOUNCE})")
+    parser.add_argument('--poll', action='store_true', help="опрос вместо inotify")
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help=f"период опроса, секунд (по умолчанию {DEFAULT_INTERVAL})")
+    parser.add_argument('-j', '--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"процессов на движок (по умолчанию {DEFAULT_WORKERS})")
+    parser.add_argument('--cache-file', default=format_cache.DEFAULT_CACHE_FILE,
+                        help="файл манифеста кэша")
+    parser.add_argument('--no-cache', action='store_true', help="не использовать кэш")
+    args = parser.parse_args()
+
+    targets = resolve_targets(args.paths, args.recursive)
+    if not targets:
+        print("Ошибка: каталоги не найдены")
+        sys.exit(1)
+
+    try:
+        format_batch.load_engine(args.engine)
+    except ImportError as exc:
+        print(f"Ошибка: движок {args.engine} недоступен ({exc})")
+        sys.exit(1)
+
+    formatter = Formatter(args.engine, args.workers, args.md_all,
+                          None if args.no_cache else args.cache_file)
+    print("Наблюдение: " + ', '.join(f"{path}{'/**' if rec else ''}" for path, rec in targets))
+    try:
+        watch(targets, formatter, args.debounce, args.poll, args.interval)
+    except KeyboardInterrupt:
+        print("Остановка...")
+    finally:
+        formatter.close()
+
+
+if __name__ == "__main__":
+    main()
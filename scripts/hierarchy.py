@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Единая модель иерархии Space Travel: цели → задачи департамента →
+задачи отделов → функции.
+
+Источники — hierarchy/1.3_*_HIERARCHY_MODEL*.json (по департаменту L1,
+структура файлов различается: задачи отделов вложены в задачи
+департамента или в отделы, функции — в задачи отделов или на верхнем
+уровне со ссылкой linked_task). Все узлы собираются по ID вида
+L1-05-G1 / L1-05-T1 / L2-31-T1 / L2-31-F1 в один индекс:
+- nodes[ключ] — узел (O(1)); ключ — ID, а если один ID встречается в
+  разных департаментах (L2-33 в SRV и FIN), — «департамент/ID»
+- parents / children — связи по вложенности и ссылкам linked_goal(s),
+  linked_department_task(s), linked_task; ancestors — все предки
+- узлы по отделу и департаменту для привязки задач L3
+
+Проверки (validate):
+- ссылки на несуществующие ID, задачи и функции без родителя
+- ID, повторяющиеся в разных департаментах
+- расхождения с hierarchy/1.3_FULL_HIERARCHY_GOALS_TASKS.json: название
+  департамента, цели и их формулировки, число задач у цели, состав и
+  номера отделов
+- отделы респондентов L3, которых нет в модели
+
+Задачи L3 привязываются к функциям своего отдела (или департамента)
+по пересечению основ слов названия задачи и описания функции
+(task_clusters.normalize_name); соответствие считается один раз при
+построении индекса.
+
+Использование:
+    python hierarchy.py                  — проверка и сводка
+    python hierarchy.py --id L2-31-F1    — узел, предки и потомки
+    python hierarchy.py --json           — отчёт проверки в JSON
+    python hierarchy.py --mapping map.json — задачи L3 → функции
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import corpus
+from categories import clean
+from task_clusters import normalize_name
+
+
+MODEL_SUFFIX_RE = re.compile(r'^1\.3_L1-\d+_.+_HIERARCHY_MODEL.*\.json$')
+FULL_MODEL = '1.3_FULL_HIERARCHY_GOALS_TASKS.json'
+
+ID_RE = re.compile(r'^L([12])-([^-]+)(?:-([GTF])(\d+))?$')
+KINDS = {('1', None): 'department', ('1', 'G'): 'goal', ('1', 'T'): 'department_task',
+         ('1', 'F'): 'function', ('2', None): 'division', ('2', 'G'): 'division_goal',
+         ('2', 'T'): 'division_task', ('2', 'F'): 'function'}
+# Поля-ссылки на родителя
+LINK_FIELDS = ('linked_goals', 'linked_goal', 'linked_department_tasks',
+               'linked_department_task', 'linked_task')
+NAME_FIELDS = ('function_name', 'task_name', 'division_name', 'department_name',
+               'smart_text', 'goal_text_SMART', 'original_text', 'text')
+
+# Названия департаментов в анкетах, отличающиеся от модели
+DEPARTMENT_ALIASES = {'департамент финансов': 'Финансовый департамент'}
+
+# Привязка задач L3: доля основ названия задачи, найденных в функции
+MATCH_THRESHOLD = 0.34
+MATCH_MIN_COMMON = 2
+
+
+class Node:
+    """Узел иерархии."""
+
+    __slots__ = ('key', 'id', 'kind', 'name', 'department', 'division', 'source', 'links')
+
+    def __init__(self, key, node_id, kind, name, department, division, source, links):
+        self.key = key
+        self.id = node_id
+        self.kind = kind
+        self.name = name
+        self.department = department
+        self.division = division
+        self.source = source
+        self.links = links
+
+    def __repr__(self):
+        return f'Node({self.key!r}, {self.kind}, {self.name!r})'
+
+
+def _name_key(text):
+    text = clean(text)
+    return text.casefold() if text else None
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _node_name(data):
+    for field in NAME_FIELDS:
+        if isinstance(data.get(field), str):
+            return ' '.join(data[field].split())
+    return None
+
+
+def _function_text(data):
+    """Текст функции для привязки задач: название, триггер, результат, шаги."""
+    parts = [data.get('function_name'), data.get('trigger'), data.get('result')]
+    for step in data.get('steps') or ():
+        parts.append(step.get('description') if isinstance(step, dict) else step)
+    return ' '.join(part for part in parts if isinstance(part, str))
+
+
+# ============================================================
+# Индекс
+# ============================================================
+
+class Hierarchy:
+    """Все модели департаментов в одном индексе."""
+
+    def __init__(self):
+        self.nodes = {}           # ключ → Node
+        self.ids = {}             # ID → ключи
+        self.parents = {}         # ключ → ключи родителей
+        self.children = {}        # ключ → ключи детей
+        self._ancestors = {}
+        self.by_department = {}   # ID департамента → ключи узлов
+        self.by_division = {}     # ключ отдела → ключи узлов
+        self.department_names = {}  # название (нижний регистр) → ID департамента
+        self.division_names = {}    # название (нижний регистр) → ключи отделов
+        self.function_texts = {}  # ключ функции → основы слов
+        self.issues = []
+        self.task_functions = {}  # id задачи L3 → (ключ функции, оценка)
+
+    # --- построение
+
+    def load(self, models):
+        """Построить индекс по моделям {имя файла: данные}."""
+        records = []
+        for source, data in sorted(models.items()):
+            # department_tasks и functions бывают рядом с department, а не внутри
+            info = data.get('department') if isinstance(data, dict) else None
+            department = info.get('department_id') if isinstance(info, dict) else None
+            self._collect(data, source, records, department=department, parent=None, division=None)
+
+        # Ключи: ID, а при совпадении ID в разных департаментах — «департамент/ID»
+        owners = {}
+        for record in records:
+            owners.setdefault(record['id'], set()).add(record['department'])
+        for node_id, departments in sorted(owners.items()):
+            if len(departments) > 1:
+                self.issue('duplicate_id', node_id, f"ID в нескольких департаментах: {', '.join(sorted(map(str, departments)))}")
+
+        def key_of(node_id, department):
+            if len(owners.get(node_id, ())) > 1:
+                return f'{department}/{node_id}'
+            return node_id
+
+        for record in records:
+            key = key_of(record['id'], record['department'])
+            node = self.nodes.get(key)
+            if node is None:
+                node = self.nodes[key] = Node(key, record['id'], record['kind'], record['name'],
+                                              record['department'], None, record['source'], [])
+                self.ids.setdefault(record['id'], []).append(key)
+                self.by_department.setdefault(record['department'], []).append(key)
+            elif record['name'] and node.name and _name_key(record['name']) != _name_key(node.name):
+                self.issue('name_conflict', key, f"«{node.name}» и «{record['name']}»")
+            node.name = node.name or record['name']
+            if record['division']:
+                node.division = key_of(record['division'], record['department'])
+            if record['parent']:
+                node.links.append(key_of(record['parent'], record['department']))
+            node.links.extend(key_of(link, record['department']) for link in record['links'])
+            if record['text']:
+                self.function_texts[key] = set(normalize_name(record['text']).split())
+
+        for key, node in self.nodes.items():
+            parents = []
+            for link in node.links:
+                if link not in self.nodes:
+                    self.issue('dangling_link', key, f"ссылка на несуществующий {link}")
+                elif link != key and link not in parents:
+                    parents.append(link)
+            self.parents[key] = tuple(parents)
+            for parent in parents:
+                self.children.setdefault(parent, []).append(key)
+            if node.kind == 'department':
+                self.department_names[_name_key(node.name)] = node.id
+            elif node.kind == 'division':
+                self.division_names.setdefault(_name_key(node.name), []).append(key)
+            if node.division:
+                self.by_division.setdefault(node.division, []).append(key)
+            if node.kind in ('department_task', 'division_task', 'function') and not parents:
+                self.issue('orphan', key, f"{node.kind} без родителя")
+        for alias, name in DEPARTMENT_ALIASES.items():
+            if _name_key(name) in self.department_names:
+                self.department_names[alias] = self.department_names[_name_key(name)]
+        return self
+
+    def _collect(self, data, source, records, department, parent, division):
+        """Обойти JSON модели и собрать записи узлов."""
+        if isinstance(data, list):
+            for item in data:
+                self._collect(item, source, records, department, parent, division)
+            return
+        if not isinstance(data, dict):
+            return
+
+        node_id = None
+        for field in ('function_id', 'task_id', 'goal_id'):
+            if isinstance(data.get(field), str):
+                node_id = data[field]
+                break
+        if node_id is None and isinstance(data.get('division_id'), str):
+            node_id = data['division_id']
+        if node_id is None and isinstance(data.get('department_id'), str):
+            node_id = data['department_id']
+        # Единственная цель без ID («goal»): цель G1 департамента
+        if node_id is None and department and parent == department and \
+                ('smart_text' in data or 'original_text' in data):
+            node_id = f'{department}-G1'
+
+        match = ID_RE.match(node_id) if node_id else None
+        if match:
+            kind = KINDS.get((match.group(1), match.group(3)))
+            if kind == 'department':
+                department = node_id
+            if kind == 'division' or (kind == 'division_task' and isinstance(data.get('division_id'), str)):
+                division = data.get('division_id')
+            links = [link for field in LINK_FIELDS for link in _as_list(data.get(field))
+                     if isinstance(link, str) and ID_RE.match(link)]
+            # Родитель по вложенности: задача/функция — ближайший узел-задача или цель
+            structural = parent if kind in ('division_task', 'function', 'goal', 'division') and \
+                not (kind == 'division_task' and links) else None
+            if kind == 'department_task' and not links:
+                structural = parent
+            records.append({
+                'id': node_id, 'kind': kind, 'name': _node_name(data), 'department': department,
+                'division': division if kind != 'division' else None,
+                'parent': structural, 'links': links, 'source': source,
+                'text': _function_text(data) if kind == 'function' else None,
+            })
+            if kind != 'division':
+                parent = node_id
+            else:
+                parent = department
+        for value in data.values():
+            if isinstance(value, (dict, list)):
+                self._collect(value, source, records, department, parent, division)
+
+    def issue(self, kind, key, message):
+        self.issues.append({'kind': kind, 'id': key, 'message': message})
+
+    # --- запросы
+
+    def get(self, node_id):
+        """Узел по ключу или ID (при неоднозначном ID — первый)."""
+        node = self.nodes.get(node_id)
+        if node is None and node_id in self.ids:
+            node = self.nodes[self.ids[node_id][0]]
+        return node
+
+    def ancestors(self, key):
+        """Все предки узла (ближайшие первыми)."""
+        cached = self._ancestors.get(key)
+        if cached is None:
+            result = []
+            for parent in self.parents.get(key, ()):
+                for item in (parent, *self.ancestors(parent)):
+                    if item not in result:
+                        result.append(item)
+            cached = self._ancestors[key] = tuple(result)
+        return cached
+
+    def descendants(self, key):
+        result = []
+        stack = list(self.children.get(key, ()))
+        while stack:
+            item = stack.pop()
+            if item not in result:
+                result.append(item)
+                stack.extend(self.children.get(item, ()))
+        return result
+
+    def functions_of(self, division=None, department=None):
+        """Ключи функций отдела (по названию) или департамента (по ID)."""
+        keys = []
+        if division:
+            for div_key in self.division_names.get(_name_key(division), ()):
+                keys.extend(k for k in self.by_division.get(div_key, ()) if self.nodes[k].kind == 'function')
+                # Функции, вложенные в задачи отдела
+                for task_key in self.by_division.get(div_key, ()):
+                    keys.extend(k for k in self.descendants(task_key) if self.nodes[k].kind == 'function')
+        if not keys and department:
+            keys = [k for k in self.by_department.get(department, ()) if self.nodes[k].kind == 'function']
+        return list(dict.fromkeys(keys))
+
+    # --- проверки
+
+    def compare_full(self, full, source=FULL_MODEL):
+        """Расхождения с полной моделью (1.3_FULL_HIERARCHY_GOALS_TASKS.json)."""
+        for dep in full.get('departments') or ():
+            dep_id = dep.get('department_id')
+            node = self.nodes.get(dep_id)
+            if node is None:
+                self.issue('full_missing_department', dep_id, f"{source}: департамента нет в моделях")
+                continue
+            if _name_key(dep.get('department_name')) != _name_key(node.name):
+                self.issue('full_department_name', dep_id,
+                           f"«{dep.get('department_name')}» в {source}, «{node.name}» в модели")
+            model_goals = {k for k in self.by_department.get(dep_id, ()) if self.nodes[k].kind == 'goal'}
+            full_divisions = {}
+            for goal in dep.get('goals') or ():
+                goal_id = goal.get('goal_id')
+                goal_node = self.nodes.get(goal_id)
+                if goal_node is None:
+                    self.issue('full_missing_goal', goal_id, f"цель из {source} отсутствует в модели")
+                else:
+                    model_goals.discard(goal_id)
+                    if _name_key(goal.get('goal_text_SMART')) != _name_key(goal_node.name):
+                        self.issue('full_goal_text', goal_id, "формулировка цели отличается")
+                    tasks_full = len(goal.get('department_tasks') or goal.get('tasks') or ())
+                    tasks_model = sum(1 for k in self.children.get(goal_id, ())
+                                      if self.nodes[k].kind == 'department_task')
+                    if tasks_full != tasks_model:
+                        self.issue('full_goal_tasks', goal_id,
+                                   f"задач у цели: {tasks_full} в {source}, {tasks_model} в модели")
+                for division in goal.get('linked_L2') or ():
+                    full_divisions[division.get('division_id')] = division.get('division_name')
+            for goal_id in sorted(model_goals):
+                self.issue('model_goal_not_in_full', goal_id, f"цели модели нет в {source}")
+
+            model_divisions = {self.nodes[k].name: self.nodes[k].id for k in self.by_department.get(dep_id, ())
+                               if self.nodes[k].kind == 'division'}
+            model_stems = {name: set(normalize_name(name).split()) for name in model_divisions}
+            for full_id, full_name in sorted(full_divisions.items(), key=lambda item: str(item[0])):
+                stems = set(normalize_name(full_name or '').split())
+                match = next((name for name in model_divisions if _name_key(name) == _name_key(full_name)), None)
+                if match is None:
+                    match = next((name for name, s in model_stems.items()
+                                  if s and stems and (s <= stems or stems <= s)), None)
+                if match is None:
+                    self.issue('full_division_missing', full_id, f"отдел «{full_name}» из {source} отсутствует в модели {dep_id}")
+                elif model_divisions[match] != full_id:
+                    self.issue('full_division_id', full_id,
+                               f"«{full_name}»: {full_id} в {source}, {model_divisions[match]} в модели")
+
+    def attach_tasks(self, data):
+        """Привязать задачи L3 корпуса к функциям. Вернуть число привязанных."""
+        missing = Counter()
+        scopes = {}
+        self.task_functions = {}
+        for task in data.tasks:
+            respondent = data.respondents[task.respondent]
+            scope_key = (respondent.division, respondent.department)
+            functions = scopes.get(scope_key)
+            if functions is None:
+                department = self.department_names.get(_name_key(respondent.department))
+                if respondent.division and _name_key(respondent.division) not in self.division_names:
+                    missing[respondent.division] += 1
+                functions = scopes[scope_key] = self.functions_of(respondent.division, department)
+            if not functions:
+                continue
+            stems = set(normalize_name(task.name).split())
+            if not stems:
+                continue
+            best = None
+            for key in functions:
+                common = len(stems & self.function_texts.get(key, set()))
+                score = common / len(stems)
+                if common >= min(MATCH_MIN_COMMON, len(stems)) and score >= MATCH_THRESHOLD and \
+                        (best is None or score > best[1]):
+                    best = (key, score)
+            if best:
+                self.task_functions[task.id] = (best[0], round(best[1], 2))
+        for division, count in sorted(missing.items()):
+            self.issue('l3_division_missing', division, f"отдел респондентов L3 отсутствует в модели ({count} задач)")
+        return len(self.task_functions)
+
+    def summary(self):
+        kinds = Counter(node.kind for node in self.nodes.values())
+        return {
+            'nodes': len(self.nodes),
+            'kinds': dict(sorted(kinds.items())),
+            'issues': dict(sorted(Counter(issue['kind'] for issue in self.issues).items())),
+            'l3_tasks_attached': len(self.task_functions),
+        }
+
+
+def is_model_file(name):
+    return bool(MODEL_SUFFIX_RE.match(name))
+
+
+def build_hierarchy(data=None, root=corpus.REPO_ROOT):
+    """Индекс иерархии с проверкой и привязкой задач L3 (корпус — из снимка)."""
+    if data is None:
+        data = corpus.load_corpus(root)
+    models = {name: model for name, model in data.hierarchy.items() if is_model_file(name)}
+    hierarchy = Hierarchy().load(models)
+    if FULL_MODEL in data.hierarchy:
+        hierarchy.compare_full(data.hierarchy[FULL_MODEL])
+    hierarchy.attach_tasks(data)
+    return hierarchy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Иерархия целей, задач и функций (Space Travel)")
+    parser.add_argument('--root', default=str(corpus.REPO_ROOT), help="корень репозитория")
+    parser.add_argument('--id', help="показать узел: предки и потомки")
+    parser.add_argument('--json', action='store_true', help="отчёт проверки в JSON")
+    parser.add_argument('--mapping', help="записать привязку задач L3 к функциям в JSON")
+    parser.add_argument('--limit', type=int, default=10, help="сколько замечаний каждого вида показать")
+    args = parser.parse_args()
+
+    data = corpus.load_corpus(args.root)
+    start = time.perf_counter()
+    hierarchy = build_hierarchy(data)
+    seconds = time.perf_counter() - start
+
+    if args.id:
+        node = hierarchy.get(args.id)
+        if node is None:
+            print(f"Ошибка: узел не найден: {args.id}")
+            sys.exit(1)
+        print(f"{node.key} [{node.kind}] {node.name}  ({node.source})")
+        for key in hierarchy.ancestors(node.key):
+            print(f"  ↑ {key} [{hierarchy.nodes[key].kind}] {hierarchy.nodes[key].name}")
+        for key in hierarchy.children.get(node.key, ()):
+            print(f"  ↓ {key} [{hierarchy.nodes[key].kind}] {hierarchy.nodes[key].name}")
+        tasks = [tid for tid, (key, _) in hierarchy.task_functions.items() if key == node.key]
+        for tid in tasks[:args.limit]:
+            print(f"  L3: {data.tasks[tid].name}")
+        return
+
+    if args.mapping:
+        mapping = [{'task_id': tid, 'respondent': data.respondents[data.tasks[tid].respondent].key,
+                    'number': data.tasks[tid].number, 'function': key, 'score': score}
+                   for tid, (key, score) in sorted(hierarchy.task_functions.items())]
+        Path(args.mapping).write_text(json.dumps(mapping, ensure_ascii=False, indent=1), encoding='utf-8')
+        print(f"Сохранение: {args.mapping}")
+
+    summary = hierarchy.summary()
+    summary['ms'] = round(seconds * 1000, 1)
+    if args.json:
+        print(json.dumps({'summary': summary, 'issues': hierarchy.issues}, ensure_ascii=False, indent=1))
+        return
+    print(f"Узлов: {summary['nodes']} (" + ', '.join(f"{k} {n}" for k, n in summary['kinds'].items()) + ")")
+    print(f"Задач L3 привязано к функциям: {summary['l3_tasks_attached']} из {len(data.tasks)}")
+    print(f"Проверка: {summary['ms']} мс, замечаний: {len(hierarchy.issues)}")
+    shown = Counter()
+    for issue in hierarchy.issues:
+        shown[issue['kind']] += 1
+        if shown[issue['kind']] <= args.limit:
+            print(f"  {issue['kind']}: {issue['id']} — {issue['message']}")
+    for kind, count in summary['issues'].items():
+        if count > args.limit:
+            print(f"  … {kind}: ещё {count - args.limit}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,633 @@
+#!/usr/bin/env python3
+"""
+Граф взаимодействий подразделений Space Travel по анкетам L3.
+
+Каждая задача L3 содержит interactions[] — {department, description}:
+с каким подразделением и как сотрудник взаимодействует. Граф строится
+одним проходом по задачам корпуса:
+- узлы — отделы и департаменты; источник — отдел респондента (или
+  департамент, если отдела нет), адресат — подразделение из анкеты,
+  приведённое таблицей UNIT_ALIASES («ВИП отдел» → «ВИП-отдел», «IT» →
+  департамент ИТ); «нет отделов» и пустые значения пропускаются
+- вес ребра — число задач с таким взаимодействием и их часы в месяц
+  (по правилам workload.py; задача учитывается в ребре один раз)
+- тип ребра — по ключевым словам описания: передача, запрос,
+  согласование, контроль, информирование
+
+После наполнения рёбра упаковываются в разреженные массивы (CSR:
+смещения, соседи, задачи, часы) для исходящих и входящих связей.
+Запросы: соседи узла, топ-k партнёров по задачам или часам, группы
+сильной связности (Тарьян) для отделов и департаментов.
+
+Из того же индекса за один проход формируются JSON в схеме
+docs/2.1_department_interactions.json (metadata, interactions с
+source_file, summary с interaction_types, top_connected_departments,
+key_hubs) и таблицы матрицы в Markdown (коды L1-NN и AGN…MKT, как в
+processes/2.1_interactions_matrix.md). Опубликованные файлы собраны
+вручную по анкетам L1/L2: --write перезаписывает только JSON, матрица
+с ручными разделами (интерпретация, паттерны, рекомендации) не
+перезаписывается — таблицы пишутся в отдельный файл по --md.
+
+Использование:
+    python interaction_graph.py                       — сводка
+    python interaction_graph.py --unit "Отдел продаж" — соседи и топ партнёров
+    python interaction_graph.py --groups              — группы сильной связности
+    python interaction_graph.py --md out.md --json out.json
+    python interaction_graph.py --write               — перезаписать docs/2.1_department_interactions.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from array import array
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+import corpus
+import workload
+from categories import clean
+from text_normalize import normalize_text
+
+
+REPO_ROOT = corpus.REPO_ROOT
+MATRIX_FILE = REPO_ROOT / 'processes' / '2.1_interactions_matrix.md'
+JSON_FILE = REPO_ROOT / 'docs' / '2.1_department_interactions.json'
+
+# Департаменты в порядке L1-01…L1-09: полное имя → (код, краткое имя)
+DEPARTMENTS = {
+    'Департамент развития взаимодействия с агентствами': ('AGN', 'Агентства'),
+    'Департамент по управлению операционными доходами': ('REV', 'Продукт'),
+    'Департамент въездного туризма, MICE и корпоративного обслуживания': ('MICE', 'MICE/BT'),
+    'Департамент HR': ('HR', 'HR'),
+    'Операционный департамент': ('OPS', 'Операционный'),
+    'Управление клиентского сервиса': ('SRV', 'Клиентский сервис'),
+    'Департамент информационных технологий': ('IT', 'IT'),
+    'Департамент финансов': ('FIN', 'Финансы'),
+    'Департамент маркетинга и рекламы': ('MKT', 'Маркетинг'),
+    'Сотрудники без отделов': ('STAFF', 'Без отделов'),
+    'Руководство': ('CEO', 'Руководство'),
+}
+MANAGEMENT = 'Руководство'
+
+# Адресаты из анкет → подразделение (ключи — в нижнем регистре);
+# None — адресат не подразделение, взаимодействие пропускается
+UNIT_ALIASES = {
+    'нет отделов': None,
+    'нет отдела': None,
+    'вкладка 1': None,
+    'частные клиенты': None,
+    'it': 'Департамент информационных технологий',
+    'ит': 'Департамент информационных технологий',
+    'hr': 'Департамент HR',
+    'вип отдел': 'ВИП-отдел',
+    'vip-отдел': 'ВИП-отдел',
+    'группа стран «ближний восток»': 'Отдел продукта (Ближний Восток)',
+    'группа стран fit': 'Отдел продукта (FIT)',
+    'группа стран «экзотика»': 'Отдел продукта (Экзотика)',
+    'группа стран «юва»': 'Отдел продукта (ЮВА)',
+    'группа по привлечению агенств': 'Группа по привлечению агентств',
+    'отдел продаж/прямые агенты': 'Отдел продаж',
+    'отдел по работе с ключевыми клиентами региональные офисы': 'Отдел по работе с ключевыми клиентами',
+    'первый згд': MANAGEMENT,
+    'генеральный директор': MANAGEMENT,
+    'администрация': MANAGEMENT,
+}
+
+# Тип взаимодействия по началам слов в описании; первый найденный — тип
+TYPE_RULES = (
+    ('согласование', ('соглас', 'утвержд', 'подпис')),
+    ('контроль', ('контрол', 'провер', 'свер', 'отслеж')),
+    ('запрос', ('запрос', 'запраш', 'уточн', 'обращ')),
+    ('информирование', ('информир', 'уведом', 'сообщ', 'оповещ', 'рассыл')),
+)
+DEFAULT_TYPE = 'передача'
+TYPES = (DEFAULT_TYPE, 'запрос', 'согласование', 'контроль', 'информирование')
+
+CONTEXT_CHARS = 150
+TOP_EDGES = 30
+TOP_CONNECTED = 8
+KEY_HUBS = 5
+
+
+def interaction_type(description):
+    """Тип взаимодействия по описанию."""
+    text = (description or '').casefold()
+    found = [(text.find(stem), kind) for kind, stems in TYPE_RULES for stem in stems if stem in text]
+    return min(found)[1] if found else DEFAULT_TYPE
+
+
+# ============================================================
+# Граф
+# ============================================================
+
+class InteractionGraph:
+    """Разреженный ориентированный граф подразделений с весами рёбер."""
+
+    def __init__(self):
+        self.nodes = []           # имена узлов
+        self.node_ids = {}
+        self.department = []      # департамент узла
+        self.aliases = {}         # имя в нижнем регистре → узел
+        self.unresolved = Counter()
+        self.stats = Counter()
+        self._edges = {}          # (от, к) → [задачи, часы, типы, описания, файлы]
+        # Упакованные рёбра (после freeze)
+        self.out_ptr = self.out_dst = self.out_tasks = self.out_hours = None
+        self.in_ptr = self.in_src = None
+        self.edge_info = []
+
+    # --- узлы
+
+    def add_node(self, name, department):
+        nid = self.node_ids.get(name)
+        if nid is None:
+            nid = self.node_ids[name] = len(self.nodes)
+            self.nodes.append(name)
+            self.department.append(department)
+            self.aliases[name.casefold()] = nid
+        return nid
+
+    def resolve(self, name):
+        """Узел адресата по имени из анкеты или None (пропустить)."""
+        text = clean(name)
+        if text is None:
+            return None
+        key = text.casefold()
+        if key in UNIT_ALIASES:
+            target = UNIT_ALIASES[key]
+            if target is None:
+                return None
+            key = target.casefold()
+            if key not in self.aliases:
+                return self.add_node(target, target if target in DEPARTMENTS else MANAGEMENT)
+        nid = self.aliases.get(key)
+        if nid is None:
+            self.unresolved[text] += 1
+        return nid
+
+    # --- наполнение
+
+    def add_corpus(self, data):
+        """Добавить все задачи L3 корпуса."""
+        # Узлы — все отделы и департаменты респондентов; отдел без
+        # департамента (пустая ячейка в анкете) относится к руководству
+        for respondent in data.respondents:
+            if respondent.department:
+                self.add_node(respondent.department, respondent.department)
+            if respondent.division:
+                self.add_node(respondent.division, respondent.department or MANAGEMENT)
+
+        for task in data.tasks:
+            if not task.interactions:
+                continue
+            respondent = data.respondents[task.respondent]
+            source = respondent.division or respondent.department
+            if not source:
+                self.stats['no_source'] += len(task.interactions)
+                continue
+            src = self.node_ids[source]
+            hours = workload.task_hours(task.time_minutes, task.regularity)
+            seen = set()
+            for unit, description in task.interactions:
+                self.stats['interactions'] += 1
+                dst = self.resolve(unit)
+                if dst is None:
+                    self.stats['skipped'] += 1
+                    continue
+                if dst == src:
+                    self.stats['internal'] += 1
+                    continue
+                edge = self._edges.get((src, dst))
+                if edge is None:
+                    edge = self._edges[(src, dst)] = [0, 0.0, Counter(), Counter(), set()]
+                if dst not in seen:
+                    seen.add(dst)
+                    edge[0] += 1
+                    edge[1] += hours
+                if description:
+                    edge[2][interaction_type(description)] += 1
+                    edge[3][normalize_text(' '.join(description.split()))] += 1
+                else:
+                    edge[2][DEFAULT_TYPE] += 1
+                edge[4].add(respondent.source)
+                self.stats['edges_interactions'] += 1
+        self.freeze()
+        return self
+
+    def freeze(self):
+        """Упаковать рёбра в массивы CSR (исходящие и входящие)."""
+        size = len(self.nodes)
+        ordered = sorted(self._edges)
+        self.out_ptr = array('I', [0] * (size + 1))
+        self.out_dst = array('I')
+        self.out_tasks = array('I')
+        self.out_hours = array('d')
+        self.edge_info = []
+        for src, dst in ordered:
+            tasks, hours, types, contexts, sources = self._edges[(src, dst)]
+            self.out_ptr[src + 1] += 1
+            self.out_dst.append(dst)
+            self.out_tasks.append(tasks)
+            self.out_hours.append(hours)
+            self.edge_info.append((types, contexts, sources))
+        for nid in range(size):
+            self.out_ptr[nid + 1] += self.out_ptr[nid]
+
+        # Входящие: номера рёбер, сгруппированные по адресату
+        self.in_ptr = array('I', [0] * (size + 1))
+        for dst in self.out_dst:
+            self.in_ptr[dst + 1] += 1
+        for nid in range(size):
+            self.in_ptr[nid + 1] += self.in_ptr[nid]
+        fill = array('I', self.in_ptr)
+        self.in_src = array('I', [0] * len(self.out_dst))
+        for eid, dst in enumerate(self.out_dst):
+            self.in_src[fill[dst]] = eid
+            fill[dst] += 1
+
+    # --- запросы
+
+    def edge_source(self, eid):
+        """Источник ребра (поиск по смещениям)."""
+        lo, hi = 0, len(self.nodes)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.out_ptr[mid + 1] <= eid:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def out_edges(self, nid):
+        return range(self.out_ptr[nid], self.out_ptr[nid + 1])
+
+    def in_edges(self, nid):
+        return (self.in_src[i] for i in range(self.in_ptr[nid], self.in_ptr[nid + 1]))
+
+    def node(self, name):
+        """Узел по имени (с учётом синонимов) или None."""
+        text = clean(name)
+        if text is None:
+            return None
+        key = text.casefold()
+        target = UNIT_ALIASES.get(key)
+        return self.aliases.get(target.casefold() if target else key)
+
+    def neighbours(self, nid, direction='out'):
+        """Соседи узла: [(узел, задачи, часы)] для 'out', 'in' или 'both'."""
+        result = Counter()
+        hours = Counter()
+        if direction in ('out', 'both'):
+            for eid in self.out_edges(nid):
+                result[self.out_dst[eid]] += self.out_tasks[eid]
+                hours[self.out_dst[eid]] += self.out_hours[eid]
+        if direction in ('in', 'both'):
+            for eid in self.in_edges(nid):
+                src = self.edge_source(eid)
+                result[src] += self.out_tasks[eid]
+                hours[src] += self.out_hours[eid]
+        return [(other, result[other], hours[other]) for other in result]
+
+    def top_partners(self, nid, k=5, by='tasks', direction='both'):
+        """k самых связанных подразделений по задачам или часам."""
+        column = 1 if by == 'tasks' else 2
+        items = self.neighbours(nid, direction)
+        items.sort(key=lambda item: (-item[column], self.nodes[item[0]]))
+        return items[:k]
+
+    def strongly_connected(self, departments=False):
+        """Группы сильной связности (больше одного узла), крупные первыми."""
+        if departments:
+            names = sorted(set(self.department), key=department_order)
+            index = {name: i for i, name in enumerate(names)}
+            adjacency = [set() for _ in names]
+            for eid, dst in enumerate(self.out_dst):
+                src = self.department[self.edge_source(eid)]
+                if src != self.department[dst]:
+                    adjacency[index[src]].add(index[self.department[dst]])
+            adjacency = [sorted(items) for items in adjacency]
+        else:
+            names = self.nodes
+            adjacency = [self.out_dst[self.out_ptr[n]:self.out_ptr[n + 1]] for n in range(len(names))]
+        groups = [[names[n] for n in group] for group in tarjan(adjacency) if len(group) > 1]
+        for group in groups:
+            group.sort()
+        groups.sort(key=lambda group: (-len(group), group))
+        return groups
+
+    def department_matrix(self):
+        """Матрица департамент → департамент: {(от, к): [задачи, часы, типы]}."""
+        matrix = {}
+        for eid, dst in enumerate(self.out_dst):
+            key = (self.department[self.edge_source(eid)], self.department[dst])
+            cell = matrix.get(key)
+            if cell is None:
+                cell = matrix[key] = [0, 0.0, Counter()]
+            cell[0] += self.out_tasks[eid]
+            cell[1] += self.out_hours[eid]
+            cell[2].update(self.edge_info[eid][0])
+        return matrix
+
+    def edges(self):
+        """Рёбра по убыванию задач: (от, к, задачи, часы, номер ребра)."""
+        items = [(self.edge_source(eid), dst, self.out_tasks[eid], self.out_hours[eid], eid)
+                 for eid, dst in enumerate(self.out_dst)]
+        items.sort(key=lambda e: (-e[2], -e[3], self.nodes[e[0]], self.nodes[e[1]]))
+        return items
+
+
+def tarjan(adjacency):
+    """Компоненты сильной связности (итеративный алгоритм Тарьяна)."""
+    size = len(adjacency)
+    index = [-1] * size
+    low = [0] * size
+    on_stack = [False] * size
+    stack = []
+    components = []
+    counter = 0
+    for root in range(size):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, pos = work.pop()
+            if pos == 0:
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            neighbours = adjacency[node]
+            while pos < len(neighbours):
+                nxt = neighbours[pos]
+                pos += 1
+                if index[nxt] == -1:
+                    work.append((node, pos))
+                    work.append((nxt, 0))
+                    break
+                if on_stack[nxt]:
+                    low[node] = min(low[node], index[nxt])
+            else:
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        item = stack.pop()
+                        on_stack[item] = False
+                        component.append(item)
+                        if item == node:
+                            break
+                    components.append(component)
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+    return components
+
+
+def department_order(name):
+    order = list(DEPARTMENTS)
+    return (order.index(name), name) if name in DEPARTMENTS else (len(order), name)
+
+
+def department_code(name):
+    return DEPARTMENTS.get(name, (name, name))[0]
+
+
+def level_code(name):
+    """Код анкеты L1 (L1-01…L1-09) или краткий код для подразделений вне L1."""
+    order = list(DEPARTMENTS)[:9]
+    return f'L1-{order.index(name) + 1:02d}' if name in order else department_code(name)
+
+
+# ============================================================
+# Отчёты
+# ============================================================
+
+def edge_context(graph, eid):
+    contexts = graph.edge_info[eid][1]
+    if not contexts:
+        return ''
+    text = min(contexts, key=lambda c: (-contexts[c], c))
+    return text if len(text) <= CONTEXT_CHARS else text[:CONTEXT_CHARS - 1].rstrip() + '…'
+
+
+def edge_type(types):
+    return min(types, key=lambda t: (-types[t], TYPES.index(t))) if types else DEFAULT_TYPE
+
+
+def _md_cell(text):
+    return str(text).replace('|', '\\|').replace('\n', ' ')
+
+
+def render_markdown(graph, report_date, files):
+    """Матрица взаимодействий в Markdown (схема 2.1_interactions_matrix.md)."""
+    matrix = graph.department_matrix()
+    departments = sorted({dep for pair in matrix for dep in pair}, key=department_order)
+    lines = [
+        '# Матрица взаимодействий между подразделениями Space Travel',
+        '',
+        '**Версия:** 1.0',
+        f'**Дата:** {report_date}',
+        '**Этап:** 2.1',
+        f'**Источник:** L3_json ({files} анкет, {graph.stats["interactions"]} взаимодействий '
+        f'в задачах; сформировано interaction_graph.py)',
+        '',
+        '---',
+        '',
+        '## Сводная матрица по департаментам (L1)',
+        '',
+        '### Количество исходящих связей по типам',
+        '',
+        '| Департамент | Код | ' + ' | '.join(t.capitalize() for t in TYPES) + ' | ИТОГО |',
+        '|' + '---|' * (len(TYPES) + 3),
+    ]
+    totals = Counter()
+    for dep in departments:
+        types = Counter()
+        for (src, _), cell in matrix.items():
+            if src == dep:
+                types.update(cell[2])
+        totals.update(types)
+        lines.append(f'| {DEPARTMENTS.get(dep, (dep, dep))[1]} | {level_code(dep)} | '
+                     + ' | '.join(str(types[t]) for t in TYPES)
+                     + f' | **{sum(types.values())}** |')
+    lines.append('| **ИТОГО** | — | ' + ' | '.join(f'**{totals[t]}**' for t in TYPES)
+                 + f' | **{sum(totals.values())}** |')
+
+    codes = [department_code(dep) for dep in departments]
+    lines += [
+        '',
+        '---',
+        '',
+        '## Детальная матрица L1 → L1',
+        '',
+        '### Количество задач с взаимодействием (исходящие → входящие)',
+        '',
+        '|  | ' + ' | '.join(codes) + ' |',
+        '|--|' + '-----|' * len(codes),
+    ]
+    for src in departments:
+        cells = ['—' if src == dst else str(matrix.get((src, dst), (0,))[0]) for dst in departments]
+        lines.append(f'| **{department_code(src)}** | ' + ' | '.join(cells) + ' |')
+
+    top = sorted(((cell[0], cell[1], src, dst) for (src, dst), cell in matrix.items() if src != dst),
+                 key=lambda item: (-item[0], -item[1], department_order(item[2]), department_order(item[3])))
+    lines += ['', '**Топ-5 связей по числу задач:**']
+    for number, (tasks, hours, src, dst) in enumerate(top[:5], 1):
+        lines.append(f'{number}. **{department_code(src)} → {department_code(dst)}** ({tasks} задач, {hours:.0f} ч/мес)')
+
+    lines += [
+        '',
+        '---',
+        '',
+        f'## Связи отделов (топ-{TOP_EDGES} по числу задач)',
+        '',
+        '| От | К | Задач | Ч/мес | Тип | Контекст |',
+        '|----|---|-------|-------|-----|----------|',
+    ]
+    for src, dst, tasks, hours, eid in graph.edges()[:TOP_EDGES]:
+        lines.append(f'| {_md_cell(graph.nodes[src])} | {_md_cell(graph.nodes[dst])} | {tasks} | {hours:.0f} | '
+                     f'{edge_type(graph.edge_info[eid][0])} | {_md_cell(edge_context(graph, eid))} |')
+
+    lines += ['', '---', '', '## Группы сильной связности', '',
+              'Подразделения, между которыми есть путь в обе стороны (по исходящим связям).', '']
+    for title, groups in (('Департаменты', graph.strongly_connected(departments=True)),
+                          ('Отделы', graph.strongly_connected())):
+        lines.append(f'**{title}:**')
+        if not groups:
+            lines.append('- нет')
+        for group in groups:
+            names = [department_code(name) if title == 'Департаменты' else name for name in group]
+            lines.append(f'- ({len(group)}) ' + ', '.join(names))
+        lines.append('')
+
+    if graph.unresolved:
+        lines += ['## Неразобранные адресаты', '']
+        for name, count in graph.unresolved.most_common():
+            lines.append(f'- {_md_cell(name)} — {count}')
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def render_json(graph, report_date):
+    """Взаимодействия в JSON (схема 2.1_department_interactions.json, по рёбрам)."""
+    interactions = []
+    types_total = Counter()
+    incoming, outgoing = Counter(), Counter()
+    for src, dst, tasks, hours, eid in graph.edges():
+        types, _, sources = graph.edge_info[eid]
+        kind = edge_type(types)
+        types_total[kind] += 1
+        outgoing[src] += 1
+        incoming[dst] += 1
+        interactions.append({
+            'from': graph.nodes[src],
+            'to': graph.nodes[dst],
+            'context': edge_context(graph, eid),
+            'type': kind,
+            'source_file': min(sources) if sources else '',
+            'from_department': graph.department[src],
+            'to_department': graph.department[dst],
+            'tasks': tasks,
+            'hours_per_month': round(hours, 1),
+        })
+
+    connections = incoming + outgoing
+    ranked = sorted(connections, key=lambda nid: (-connections[nid], graph.nodes[nid]))
+    return {
+        'metadata': {
+            'version': '1.0',
+            'created_date': report_date,
+            'description': 'Карта взаимодействий между подразделениями Space Travel, '
+                           'построенная по interactions[] задач анкет L3',
+            'total_interactions': len(interactions),
+            'task_interactions': graph.stats['edges_interactions'],
+            'skipped': graph.stats['skipped'],
+            'internal': graph.stats['internal'],
+        },
+        'interactions': interactions,
+        'summary': {
+            'total_departments_involved': len(connections),
+            'interaction_types': {kind: types_total[kind] for kind in TYPES},
+            'top_connected_departments': [
+                {'department': graph.nodes[nid], 'total_connections': connections[nid]}
+                for nid in ranked[:TOP_CONNECTED]
+            ],
+            'key_hubs': [
+                f'{graph.nodes[nid]} - {incoming[nid]} входящих и {outgoing[nid]} исходящих связей'
+                for nid in ranked[:KEY_HUBS]
+            ],
+        },
+    }
+
+
+def build_graph(root=REPO_ROOT):
+    """Загрузить корпус и построить граф. Вернуть (граф, число анкет L3)."""
+    data = corpus.load_corpus(root)
+    graph = InteractionGraph().add_corpus(data)
+    return graph, len(data.by_level.get('L3', ()))
+
+
+def _write(path, text):
+    path = Path(path)
+    path.write_text(text, encoding='utf-8')
+    print(f"Сохранение: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Граф взаимодействий подразделений (Space Travel)")
+    parser.add_argument('--root', default=str(REPO_ROOT), help="корень репозитория")
+    parser.add_argument('--unit', help="подразделение: соседи и топ партнёров")
+    parser.add_argument('--top', type=int, default=5, help="сколько партнёров показать")
+    parser.add_argument('--by', choices=('tasks', 'hours'), default='tasks', help="вес для топа")
+    parser.add_argument('--groups', action='store_true', help="группы сильной связности")
+    parser.add_argument('--md', help="записать матрицу в Markdown")
+    parser.add_argument('--json', help="записать взаимодействия в JSON")
+    parser.add_argument('--write', action='store_true',
+                        help="перезаписать docs/2.1_department_interactions.json (матрица — только по --md)")
+    parser.add_argument('--date', default=date.today().isoformat(), help="дата в отчётах")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph, files = build_graph(args.root)
+    seconds = time.perf_counter() - start
+
+    if args.unit:
+        nid = graph.node(args.unit)
+        if nid is None:
+            print(f"Ошибка: подразделение не найдено: {args.unit}")
+            sys.exit(1)
+        print(f"{graph.nodes[nid]} ({graph.department[nid]})")
+        for direction, title in (('out', 'Исходящие'), ('in', 'Входящие')):
+            print(f"{title}:")
+            for other, tasks, hours in graph.top_partners(nid, args.top, args.by, direction):
+                print(f"  {tasks:4d} задач  {hours:7.1f} ч  {graph.nodes[other]}")
+        return
+
+    if args.groups:
+        for title, groups in (('Департаменты', graph.strongly_connected(departments=True)),
+                              ('Отделы', graph.strongly_connected())):
+            print(f"{title}:")
+            for group in groups:
+                print(f"  ({len(group)}) " + ', '.join(group))
+        return
+
+    json_path = JSON_FILE if args.write else args.json
+    if args.md:
+        if Path(args.md).resolve() == MATRIX_FILE.resolve():
+            print(f"Ошибка: {MATRIX_FILE.name} содержит ручные разделы; укажите другой файл для --md")
+            sys.exit(1)
+        _write(args.md, render_markdown(graph, args.date, files) + '\n')
+    if json_path:
+        _write(json_path, json.dumps(render_json(graph, args.date), ensure_ascii=False, indent=2) + '\n')
+
+    stats = graph.stats
+    print(f"Узлов: {len(graph.nodes)}, рёбер: {len(graph.out_dst)} ({seconds * 1000:.0f} мс)")
+    print(f"Взаимодействий: {stats['interactions']}, в рёбрах: {stats['edges_interactions']}, "
+          f"внутри подразделения: {stats['internal']}, пропущено: {stats['skipped']}")
+    if graph.unresolved:
+        print("Неразобранные адресаты: " + ', '.join(f"{name} ({n})" for name, n in graph.unresolved.most_common()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,661 @@
+#!/usr/bin/env python3
+"""
+Рендер Markdown → DOCX сразу в стиле Space Travel (без pandoc и
+повторного форматирования).
+
+Поддерживается Markdown наших документов:
+- заголовки # … ######
+- абзацы, **жирный**, *курсив*, ~~зачёркнутый~~, `код`, [ссылки](url), <br>
+- маркированные и нумерованные списки (с вложенностью)
+- таблицы | … | (шапка, выравнивание столбцов)
+- цитаты >, блоки кода ```, разделители ---
+
+Оформление (как после format_docx.py / format_docx_xml.py):
+- A4, поля 1 см (снизу 1.5 см), номер страницы внизу по центру
+- Tahoma 9pt; заголовки Tahoma 16pt, синие (#003399)
+- таблицы на всю ширину, сетка, голубая шапка (#B8CCE4),
+  столбцы по содержимому
+
+document.xml пишется в архив потоково, блок за блоком.
+
+Использование:
+    python md_to_docx.py tz/TZ_01_SAMO_Bitrix_Integration.md [выход.docx]
+    python format_batch.py tz processes --engine md    — пакетно, с кэшем
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import quoteattr
+
+import format_docx_xml as fx
+import format_profile
+from text_normalize import normalize_text
+
+
+qn = fx.qn
+
+# Связи document.xml (ссылки получают rId начиная с HYPERLINK_RID_START)
+STYLES_RID = 'rId1'
+NUMBERING_RID = 'rId2'
+FOOTER_RID = 'rId3'
+HYPERLINK_RID_START = 10
+
+FOOTER_PART = 'word/footer1.xml'
+
+# Нумерация списков: abstractNum для маркеров и для цифр
+BULLET_ABSTRACT_ID = 1
+DECIMAL_ABSTRACT_ID = 2
+BULLET_NUM_ID = 1
+BULLET_CHARS = ('•', '◦', '▪')
+LIST_INDENT_TWIPS = 360  # ~6 мм на уровень
+
+# Интервалы абзацев, как в format_docx.format_paragraph (в twips: 1pt = 20)
+BODY_SPACING = {'w:before': '0', 'w:after': '40', 'w:line': '240', 'w:lineRule': 'auto'}
+HEADING_SPACING = {'w:before': '60', 'w:after': '120', 'w:line': '240', 'w:lineRule': 'auto'}
+CELL_SPACING = {'w:before': '20', 'w:after': '20', 'w:line': '240', 'w:lineRule': 'auto'}
+
+CODE_FONT = 'Courier New'
+CODE_FONT_SIZE = '16'  # 8pt
+LINK_COLOR = '0563C1'
+
+W_NS = fx.NS['w']
+R_NS = fx.NS['r']
+RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+WORDML_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.'
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    f'<Override PartName="/word/document.xml" ContentType="{WORDML_TYPE}document.main+xml"/>'
+    f'<Override PartName="/word/styles.xml" ContentType="{WORDML_TYPE}styles+xml"/>'
+    f'<Override PartName="/word/numbering.xml" ContentType="{WORDML_TYPE}numbering+xml"/>'
+    f'<Override PartName="/{FOOTER_PART}" ContentType="{WORDML_TYPE}footer+xml"/>'
+    '</Types>'
+)
+
+PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{RELS_NS}">'
+    f'<Relationship Id="rId1" Type="{REL_TYPE}officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+# Базовые стили (как у pandoc); оформление Space Travel добавляет build_house_styles
+BASE_STYLES_XML = f'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="{W_NS}">
+<w:docDefaults><w:rPrDefault><w:rPr><w:lang w:val="ru-RU"/></w:rPr></w:rPrDefault>
+<w:pPrDefault><w:pPr><w:spacing w:before="0" w:after="40" w:line="240" w:lineRule="auto"/></w:pPr></w:pPrDefault>
+</w:docDefaults>
+<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>
+{"".join(
+    f'<w:style w:type="paragraph" w:styleId="Heading{level}"><w:name w:val="heading {level}"/>'
+    f'<w:basedOn w:val="Normal"/><w:next w:val="Normal"/><w:qFormat/>'
+    f'<w:pPr><w:keepNext/><w:spacing w:before="60" w:after="120"/><w:outlineLvl w:val="{level - 1}"/></w:pPr>'
+    f'</w:style>'
+    for level in range(1, 7))}
+<w:style w:type="paragraph" w:styleId="Compact"><w:name w:val="Compact"/><w:basedOn w:val="Normal"/>
+<w:qFormat/><w:pPr><w:spacing w:before="20" w:after="20"/></w:pPr></w:style>
+<w:style w:type="paragraph" w:styleId="BlockText"><w:name w:val="Block Text"/><w:basedOn w:val="Normal"/>
+<w:qFormat/><w:pPr><w:pBdr><w:left w:val="single" w:sz="12" w:space="4" w:color="B8CCE4"/></w:pBdr>
+<w:spacing w:before="60" w:after="60"/><w:ind w:left="284"/></w:pPr></w:style>
+<w:style w:type="paragraph" w:styleId="SourceCode"><w:name w:val="Source Code"/><w:basedOn w:val="Normal"/>
+<w:pPr><w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/></w:pPr></w:style>
+<w:style w:type="character" w:styleId="VerbatimChar"><w:name w:val="Verbatim Char"/>
+<w:rPr><w:rFonts w:ascii="{CODE_FONT}" w:hAnsi="{CODE_FONT}" w:cs="{CODE_FONT}"/>
+<w:sz w:val="{CODE_FONT_SIZE}"/><w:szCs w:val="{CODE_FONT_SIZE}"/></w:rPr></w:style>
+<w:style w:type="character" w:styleId="Hyperlink"><w:name w:val="Hyperlink"/>
+<w:rPr><w:color w:val="{LINK_COLOR}"/><w:u w:val="single"/></w:rPr></w:style>
+<w:style w:type="table" w:default="1" w:styleId="TableNormal"><w:name w:val="Normal Table"/>
+<w:tblPr><w:tblInd w:w="0" w:type="dxa"/><w:tblCellMar><w:top w:w="0" w:type="dxa"/>
+<w:left w:w="108" w:type="dxa"/><w:bottom w:w="0" w:type="dxa"/><w:right w:w="108" w:type="dxa"/>
+</w:tblCellMar></w:tblPr></w:style>
+</w:styles>'''
+
+
+# ============================================================
+# Разбор Markdown на блоки
+# ============================================================
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+RULE_RE = re.compile(r'^\s{0,3}([-*_])(\s*\1){2,}\s*$')
+FENCE_RE = re.compile(r'^\s*(`{3,}|~{3,})')
+LIST_RE = re.compile(r'^(\s*)([-*+]|\d{1,9}[.)])\s+(.*)$')
+TABLE_SEPARATOR_RE = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+QUOTE_RE = re.compile(r'^\s{0,3}>\s?(.*)$')
+# Пункт-чекбокс: - [x] сделано / - [ ] не сделано
+TASK_RE = re.compile(r'^\[([ xX])\]\s+')
+CHECKBOXES = {' ': '☐ ', 'x': '☑ ', 'X': '☑ '}
+
+
+def split_table_row(line):
+    """Разбить строку таблицы на ячейки (\\| — экранированная черта)."""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    cells = re.split(r'(?<!\\)\|', line)
+    return [cell.strip().replace('\\|', '|') for cell in cells]
+
+
+def _alignment(cell):
+    cell = cell.strip()
+    if cell.startswith(':') and cell.endswith(':'):
+        return 'center'
+    if cell.endswith(':'):
+        return 'right'
+    return None
+
+
+def iter_blocks(lines):
+    """Разобрать строки Markdown на блоки (генератор).
+
+    Блоки: ('heading', уровень, текст), ('paragraph', текст),
+    ('item', вид, уровень, начало, текст), ('table', строки, выравнивания),
+    ('code', строки), ('quote', текст), ('rule',).
+    """
+    lines = iter(lines)
+    pending = None
+    paragraph = []
+    list_indents = []  # отступы открытых уровней списка
+    item = None
+
+    def flush():
+        nonlocal paragraph, item
+        blocks = []
+        if item is not None:
+            blocks.append(item)
+            item = None
+        if paragraph:
+            blocks.append(('paragraph', ' '.join(paragraph)))
+            paragraph = []
+        return blocks
+
+    def next_line():
+        nonlocal pending
+        if pending is not None:
+            line, pending = pending, None
+            return line
+        return next(lines, None)
+
+    while True:
+        line = next_line()
+        if line is None:
+            break
+        line = line.rstrip('\n').rstrip('\r')
+        stripped = line.strip()
+
+        if not stripped:
+            yield from flush()
+            continue
+
+        fence = FENCE_RE.match(line)
+        if fence:
+            yield from flush()
+            list_indents = []
+            marker = fence.group(1)
+            code = []
+            while True:
+                code_line = next_line()
+                if code_line is None or code_line.strip().startswith(marker):
+                    break
+                code.append(code_line.rstrip('\n').rstrip('\r'))
+            yield ('code', code)
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            yield from flush()
+            list_indents = []
+            yield ('heading', len(heading.group(1)), heading.group(2))
+            continue
+
+        if RULE_RE.match(line) and not paragraph:
+            yield from flush()
+            list_indents = []
+            yield ('rule',)
+            continue
+
+        if stripped.startswith('|'):
+            separator = next_line()
+            if separator is not None and TABLE_SEPARATOR_RE.match(separator):
+                yield from flush()
+                list_indents = []
+                aligns = [_alignment(cell) for cell in split_table_row(separator)]
+                rows = [split_table_row(line)]
+                while True:
+                    row = next_line()
+                    if row is None or not row.strip().startswith('|'):
+                        pending = row
+                        break
+                    rows.append(split_table_row(row))
+                yield ('table', rows, aligns)
+                continue
+            pending = separator
+
+        quote = QUOTE_RE.match(line)
+        if quote:
+            yield from flush()
+            list_indents = []
+            text = [quote.group(1).strip()]
+            while True:
+                more = next_line()
+                match = QUOTE_RE.match(more) if more is not None else None
+                if match is None or not match.group(1).strip():
+                    pending = more if match is None else None
+                    break
+                text.append(match.group(1).strip())
+            yield ('quote', ' '.join(text))
+            continue
+
+        list_item = LIST_RE.match(line)
+        if list_item:
+            yield from flush()
+            indent = len(list_item.group(1).expandtabs(4))
+            while list_indents and indent < list_indents[-1]:
+                list_indents.pop()
+            if not list_indents or indent > list_indents[-1]:
+                list_indents.append(indent)
+            marker = list_item.group(2)
+            kind = 'bullet' if marker in '-*+' else 'decimal'
+            start = int(marker[:-1]) if kind == 'decimal' else None
+            item = ('item', kind, len(list_indents) - 1, start, list_item.group(3).strip())
+            continue
+
+        if item is not None:
+            # Продолжение пункта списка на следующей строке
+            item = item[:4] + (item[4] + ' ' + stripped,)
+            continue
+
+        list_indents = []
+        paragraph.append(line[:-2].strip() + '\n' if line.endswith('  ') else stripped)
+
+    yield from flush()
+
+
+# ============================================================
+# Строчная разметка
+# ============================================================
+
+INLINE_RE = re.compile(
+    r'(?P<code>`+)(?P<code_text>.+?)(?P=code)'
+    r'|(?P<bold>\*\*|__)(?P<bold_text>.+?)(?P=bold)'
+    r'|~~(?P<strike_text>.+?)~~'
+    r'|\*(?P<italic_text>[^\s*](?:.*?[^\s*])?)\*'
+    r'|(?<!\w)_(?P<italic2_text>[^\s_](?:.*?[^\s_])?)_(?!\w)'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)\s]+)\)'
+    r'|(?P<br><br\s*/?>|\n)'
+    r'|\\(?P<escaped>[\\`*_{}\[\]()#+\-.!|~<>])'
+)
+
+
+def parse_inline(text, fmt=frozenset(), url=None):
+    """Разобрать строчную разметку. Вернуть список (текст, формат, url);
+    текст None — разрыв строки."""
+    pieces = []
+    position = 0
+    for match in INLINE_RE.finditer(text):
+        if match.start() > position:
+            pieces.append((text[position:match.start()], fmt, url))
+        kind = match.lastgroup
+        if kind == 'code_text':
+            pieces.append((match.group('code_text'), fmt | {'code'}, url))
+        elif kind == 'bold_text':
+            pieces.extend(parse_inline(match.group('bold_text'), fmt | {'b'}, url))
+        elif kind == 'strike_text':
+            pieces.extend(parse_inline(match.group('strike_text'), fmt | {'strike'}, url))
+        elif kind in ('italic_text', 'italic2_text'):
+            pieces.extend(parse_inline(match.group(kind), fmt | {'i'}, url))
+        elif kind == 'link_url':
+            pieces.extend(parse_inline(match.group('link_text'), fmt, match.group('link_url')))
+        elif kind == 'br':
+            pieces.append((None, fmt, url))
+        elif kind == 'escaped':
+            pieces.append((match.group('escaped'), fmt, url))
+        position = match.end()
+    if position < len(text):
+        pieces.append((text[position:], fmt, url))
+    return pieces
+
+
+# ============================================================
+# Построение OOXML
+# ============================================================
+
+def _set_attrs(el, attrs):
+    for key, value in attrs.items():
+        el.set(qn(key), value)
+    return el
+
+
+def make_paragraph(style=None, spacing=None, jc=None):
+    """Пустой абзац с заданным стилем, интервалами и выравниванием."""
+    p = ET.Element(qn('w:p'))
+    if style or spacing or jc:
+        pPr = ET.SubElement(p, qn('w:pPr'))
+        if style:
+            ET.SubElement(pPr, qn('w:pStyle')).set(qn('w:val'), style)
+        if spacing:
+            _set_attrs(ET.SubElement(pPr, qn('w:spacing')), spacing)
+        if jc:
+            ET.SubElement(pPr, qn('w:jc')).set(qn('w:val'), jc)
+    return p
+
+
+def make_run(text, fmt=frozenset(), style=None):
+    """run с текстом (None — разрыв строки) и форматированием."""
+    r = ET.Element(qn('w:r'))
+    if style or fmt - {'code'} or 'code' in fmt:
+        rPr = ET.SubElement(r, qn('w:rPr'))
+        rstyle = 'VerbatimChar' if 'code' in fmt else style
+        if rstyle:
+            ET.SubElement(rPr, qn('w:rStyle')).set(qn('w:val'), rstyle)
+        if 'b' in fmt:
+            ET.SubElement(rPr, qn('w:b'))
+        if 'i' in fmt:
+            ET.SubElement(rPr, qn('w:i'))
+        if 'strike' in fmt:
+            ET.SubElement(rPr, qn('w:strike'))
+        if len(rPr) == 0:
+            r.remove(rPr)
+    if text is None:
+        ET.SubElement(r, qn('w:br'))
+    else:
+        fx._set_text(ET.SubElement(r, qn('w:t')), text)
+    return r
+
+
+def add_inline(p, text, state, bold=False):
+    """Добавить в абзац текст со строчной разметкой."""
+    fmt = frozenset({'b'}) if bold else frozenset()
+    link = None
+    for piece, piece_fmt, url in parse_inline(text, fmt):
+        if piece is not None and 'code' not in piece_fmt:
+            piece = normalize_text(piece)
+        if url is None:
+            link = None
+            p.append(make_run(piece, piece_fmt))
+            continue
+        if link is None or link.get(qn('r:id')) != state['links'].get(url):
+            link = ET.SubElement(p, qn('w:hyperlink'))
+            link.set(qn('r:id'), hyperlink_rid(state, url))
+        link.append(make_run(piece, piece_fmt, style='Hyperlink'))
+    return p
+
+
+def hyperlink_rid(state, url):
+    """rId внешней ссылки (одна связь на адрес)."""
+    links = state['links']
+    if url not in links:
+        links[url] = f'rId{HYPERLINK_RID_START + len(links)}'
+    return links[url]
+
+
+def list_num_id(state, kind, level, start):
+    """numId для пункта списка. Нумерованный список на новом уровне начинается заново."""
+    numbered = state['numbered']
+    # Уровни глубже текущего закрываются
+    for deeper in [lvl for lvl in numbered if lvl > level]:
+        del numbered[deeper]
+    if kind == 'bullet':
+        numbered.pop(level, None)
+        return BULLET_NUM_ID
+    if level not in numbered:
+        num_id = BULLET_NUM_ID + 1 + len(state['nums'])
+        state['nums'].append((num_id, level, start or 1))
+        numbered[level] = num_id
+    return numbered[level]
+
+
+def render_block(block, state):
+    """Построить элементы body для блока Markdown."""
+    kind = block[0]
+    if kind != 'item':
+        state['numbered'].clear()
+
+    if kind == 'heading':
+        _, level, text = block
+        return [add_inline(make_paragraph(f'Heading{level}', HEADING_SPACING), text, state)]
+
+    if kind == 'paragraph':
+        return [add_inline(make_paragraph(spacing=BODY_SPACING), block[1], state)]
+
+    if kind == 'item':
+        _, item_kind, level, start, text = block
+        text = TASK_RE.sub(lambda m: CHECKBOXES[m.group(1)], text)
+        p = make_paragraph('Compact')
+        numPr = ET.SubElement(p.find(qn('w:pPr')), qn('w:numPr'))
+        ET.SubElement(numPr, qn('w:ilvl')).set(qn('w:val'), str(min(level, 8)))
+        ET.SubElement(numPr, qn('w:numId')).set(
+            qn('w:val'), str(list_num_id(state, item_kind, level, start)))
+        return [add_inline(p, text, state)]
+
+    if kind == 'quote':
+        return [add_inline(make_paragraph('BlockText'), block[1], state)]
+
+    if kind == 'code':
+        paragraphs = []
+        for line in block[1] or ['']:
+            p = make_paragraph('SourceCode')
+            if line:
+                p.append(make_run(line.expandtabs(4), frozenset({'code'})))
+            paragraphs.append(p)
+        return paragraphs
+
+    if kind == 'rule':
+        p = make_paragraph(spacing=BODY_SPACING)
+        pBdr = ET.SubElement(p.find(qn('w:pPr')), qn('w:pBdr'))
+        _set_attrs(ET.SubElement(pBdr, qn('w:bottom')),
+                   {'w:val': 'single', 'w:sz': '6', 'w:space': '1', 'w:color': 'auto'})
+        return [p]
+
+    if kind == 'table':
+        return [render_table(block[1], block[2], state)]
+
+    raise ValueError(f"Неизвестный блок: {kind}")
+
+
+def render_table(rows, aligns, state):
+    """Таблица в стиле Space Travel: сетка, голубая шапка, ширина по содержимому."""
+    columns = max(len(row) for row in rows)
+    tbl = ET.Element(qn('w:tbl'))
+    ET.SubElement(tbl, qn('w:tblPr'))
+    for row_idx, row in enumerate(rows):
+        tr = ET.SubElement(tbl, qn('w:tr'))
+        if row_idx == 0:
+            # Шапка повторяется на каждой странице
+            ET.SubElement(ET.SubElement(tr, qn('w:trPr')), qn('w:tblHeader'))
+        for col in range(columns):
+            tc = ET.SubElement(tr, qn('w:tc'))
+            if row_idx == 0:
+                fx.set_cell_shading(tc, 'B8CCE4')
+            jc = aligns[col] if col < len(aligns) else None
+            p = make_paragraph(spacing=CELL_SPACING, jc=jc)
+            add_inline(p, row[col] if col < len(row) else '', state, bold=(row_idx == 0))
+            tc.append(p)
+    fx.set_table_borders(tbl)
+    fx.set_table_full_width(tbl)
+    return tbl
+
+
+def numbering_xml(state):
+    """numbering.xml: маркированный и нумерованный списки."""
+    root = ET.Element(qn('w:numbering'))
+    for abstract_id, fmt in ((BULLET_ABSTRACT_ID, 'bullet'), (DECIMAL_ABSTRACT_ID, 'decimal')):
+        abstract = ET.SubElement(root, qn('w:abstractNum'))
+        abstract.set(qn('w:abstractNumId'), str(abstract_id))
+        ET.SubElement(abstract, qn('w:multiLevelType')).set(qn('w:val'), 'hybridMultilevel')
+        for level in range(9):
+            lvl = ET.SubElement(abstract, qn('w:lvl'))
+            lvl.set(qn('w:ilvl'), str(level))
+            ET.SubElement(lvl, qn('w:start')).set(qn('w:val'), '1')
+            ET.SubElement(lvl, qn('w:numFmt')).set(qn('w:val'), fmt)
+            text = BULLET_CHARS[level % len(BULLET_CHARS)] if fmt == 'bullet' else f'%{level + 1}.'
+            ET.SubElement(lvl, qn('w:lvlText')).set(qn('w:val'), text)
+            ET.SubElement(lvl, qn('w:lvlJc')).set(qn('w:val'), 'left')
+            ind = ET.SubElement(ET.SubElement(lvl, qn('w:pPr')), qn('w:ind'))
+            _set_attrs(ind, {'w:left': str(LIST_INDENT_TWIPS * (level + 1)),
+                             'w:hanging': str(LIST_INDENT_TWIPS)})
+
+    def add_num(num_id, abstract_id):
+        num = ET.SubElement(root, qn('w:num'))
+        num.set(qn('w:numId'), str(num_id))
+        ET.SubElement(num, qn('w:abstractNumId')).set(qn('w:val'), str(abstract_id))
+        return num
+
+    add_num(BULLET_NUM_ID, BULLET_ABSTRACT_ID)
+    for num_id, level, start in state['nums']:
+        # Каждый нумерованный список начинается со своего номера
+        override = ET.SubElement(add_num(num_id, DECIMAL_ABSTRACT_ID), qn('w:lvlOverride'))
+        override.set(qn('w:ilvl'), str(min(level, 8)))
+        ET.SubElement(override, qn('w:startOverride')).set(qn('w:val'), str(start))
+    return ET.tostring(root, encoding='UTF-8', xml_declaration=True)
+
+
+def document_rels_xml(state):
+    """word/_rels/document.xml.rels: стили, нумерация, колонтитул и ссылки."""
+    rels = [
+        (STYLES_RID, 'styles', 'styles.xml', None),
+        (NUMBERING_RID, 'numbering', 'numbering.xml', None),
+        (FOOTER_RID, 'footer', FOOTER_PART[len('word/'):], None),
+    ]
+    rels += [(rid, 'hyperlink', url, 'External') for url, rid in state['links'].items()]
+    parts = [f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{RELS_NS}">']
+    for rid, kind, target, mode in rels:
+        mode_attr = f' TargetMode="{mode}"' if mode else ''
+        parts.append(f'<Relationship Id="{rid}" Type="{REL_TYPE}{kind}" '
+                     f'Target={quoteattr(target)}{mode_attr}/>')
+    parts.append('</Relationships>')
+    return ''.join(parts)
+
+
+def section_properties():
+    """sectPr: A4, поля 1 см, колонтитул с номером страницы."""
+    sectPr = ET.Element(qn('w:sectPr'))
+    ref = ET.SubElement(sectPr, qn('w:footerReference'))
+    ref.set(qn('w:type'), 'default')
+    ref.set(qn('r:id'), FOOTER_RID)
+    fx.set_section_layout(sectPr)
+    return sectPr
+
+
+def write_document_xml(lines, dst, state):
+    """Потоково записать document.xml: каждый блок сериализуется сразу."""
+    dst.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+    dst.write(f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}"><w:body>'.encode('utf-8'))
+    blocks = 0
+    for block in iter_blocks(lines):
+        with format_profile.phase('paragraphs' if block[0] != 'table' else 'tables'):
+            elements = render_block(block, state)
+        with format_profile.phase('serialise'):
+            for el in elements:
+                dst.write(ET.tostring(el, encoding='utf-8'))
+        blocks += 1
+    dst.write(ET.tostring(section_properties(), encoding='utf-8'))
+    dst.write(b'</w:body></w:document>')
+    format_profile.count('blocks', blocks)
+    return blocks
+
+
+def default_output(input_path):
+    """DOCX рядом с исходным Markdown."""
+    return Path(input_path).with_suffix('.docx')
+
+
+def write_package(output_path, write_document, state):
+    """Записать DOCX атомарно: части пакета и document.xml через write_document(dst).
+
+    Вернуть результат write_document.
+    """
+    output_path = Path(output_path)
+    fd, tmp_name = tempfile.mkstemp(prefix='.md_to_docx_', suffix='.tmp',
+                                    dir=output_path.parent)
+    os.close(fd)
+    date_time = time.localtime()[:6]
+    try:
+        with zipfile.ZipFile(tmp_name, 'w', zipfile.ZIP_DEFLATED) as zf:
+
+            def member(name):
+                return zipfile.ZipInfo(name, date_time=date_time)
+
+            zf.writestr(member('[Content_Types].xml'), CONTENT_TYPES_XML,
+                        compress_type=zipfile.ZIP_DEFLATED)
+            zf.writestr(member('_rels/.rels'), PACKAGE_RELS_XML,
+                        compress_type=zipfile.ZIP_DEFLATED)
+            info = member(fx.DOCUMENT_PART)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with zf.open(info, 'w') as dst:
+                result = write_document(format_profile.timed_stream(dst, 'zip'))
+
+            with format_profile.phase('styles'):
+                styles_xml, _ = fx.build_house_styles(BASE_STYLES_XML.encode('utf-8'))
+            for name, data in (
+                ('word/_rels/document.xml.rels', document_rels_xml(state)),
+                (fx.STYLES_PART, styles_xml),
+                ('word/numbering.xml', numbering_xml(state)),
+                (FOOTER_PART, fx.new_footer_xml()),
+            ):
+                with format_profile.phase('zip'):
+                    zf.writestr(member(name), data, compress_type=zipfile.ZIP_DEFLATED)
+        os.chmod(tmp_name, 0o644)  # mkstemp создаёт файл с правами 0600
+        os.replace(tmp_name, output_path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+    return result
+
+
+def new_state():
+    """Состояние рендера: ссылки, нумерованные списки."""
+    return {'links': {}, 'nums': [], 'numbered': {}}
+
+
+def render_markdown(input_path, output_path=None):
+    """Собрать DOCX из Markdown. Вернуть путь к результату."""
+    input_path = Path(input_path)
+    output_path = Path(output_path) if output_path else default_output(input_path)
+    print(f"Чтение: {input_path}")
+
+    state = new_state()
+    with open(input_path, encoding='utf-8-sig') as src:
+        blocks = write_package(output_path, lambda dst: write_document_xml(src, dst, state), state)
+    print(f"Блоков: {blocks}, ссылок: {len(state['links'])}")
+
+    print(f"Сохранение: {output_path}")
+    print("Готово!")
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown → DOCX в стиле Space Travel")
+    parser.add_argument('input', help="файл .md")
+    parser.add_argument('output', nargs='?', help="выходной .docx (по умолчанию — рядом с .md)")
+    parser.add_argument('--profile', nargs='?', const='-', metavar='JSON',
+                        help="время по фазам и счётчики в JSON (без файла — в stdout)")
+    args = parser.parse_args()
+
+    if not Path(args.input).exists():
+        print(f"Ошибка: файл не найден: {args.input}")
+        sys.exit(1)
+
+    if args.profile is None:
+        render_markdown(args.input, args.output)
+        return
+
+    with format_profile.profiling() as profile:
+        render_markdown(args.input, args.output)
+    format_profile.save_report(profile, args.profile, {'engine': 'md', 'input': args.input})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Отчёт по шаблону: Markdown + таблицы из данных (CSV, JSON) → DOCX в
+стиле Space Travel.
+
+Шаблон — обычный Markdown (как для md_to_docx.py), в котором таблица из
+данных задаётся строкой-директивой:
+
+    <!-- table: automation/4.3_ROI_calculations.csv columns="ID, Инициатива, ROI за год (%)" -->
+    <!-- table: L3_json/*.json items=tasks columns="ФИО=respondent.fio, Задача=task_name, Мин=time_minutes" -->
+
+Параметры директивы:
+- путь к источнику (относительно шаблона; для JSON можно маску *.json)
+- sep=;          — разделитель CSV (по умолчанию ; , или табуляция по шапке)
+- columns="…"    — столбцы через запятую: «Заголовок» или «Заголовок=поле»;
+                   по умолчанию — все столбцы CSV / скалярные поля JSON
+- items=путь     — список записей внутри JSON (через точку: tasks, a.b);
+                   поле ищется в записи, затем в корне файла
+
+Таблицы пишутся сразу в оформлении format_docx_xml.py (сетка, голубая
+шапка, Tahoma 9pt, ширины столбцов по содержимому) — без повторного
+форматирования. Каждая таблица — два потоковых прохода по источнику:
+1. ширины столбцов и числовые столбцы (память — O(числа столбцов));
+2. строки сериализуются в document.xml по одной.
+Время и память растут линейно с числом строк.
+
+Использование:
+    python report_builder.py шаблон.md [выход.docx]
+    python report_builder.py шаблон.md --profile    — время по фазам (JSON)
+"""
+
+import argparse
+import csv
+import glob
+import json
+import re
+import shlex
+import sys
+from pathlib import Path
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape
+
+import format_docx_xml as fx
+import format_profile
+from md_to_docx import (CELL_SPACING, R_NS, W_NS, iter_blocks, make_paragraph, make_run,
+                        new_state, render_block, section_properties, write_package)
+from table_layout import column_widths
+from text_normalize import normalize_text
+
+
+qn = fx.qn
+
+DIRECTIVE_RE = re.compile(r'^\s*<!--\s*table:\s*(.*?)\s*-->\s*$')
+CSV_SEPARATORS = (';', ',', '\t')
+
+# Значения «нет данных» не мешают признать столбец числовым
+EMPTY_VALUES = frozenset({'', '-', '—', '–'})
+NUMBER_RE = re.compile(r'^[-+−]?\d[\d  ]*(?:[.,]\d+)?\s*(?:%|₽|руб\.?)?$')
+# Управляющие символы недопустимы в XML
+CONTROL_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+HEADER_FILL = 'B8CCE4'
+# Числовые столбцы выравниваются вправо
+JC_RIGHT = '<w:jc w:val="right"/>'
+
+
+# ============================================================
+# Шаблон и директивы
+# ============================================================
+
+def parse_directive(text):
+    """Директива таблицы → {'source', 'sep', 'columns', 'items'}."""
+    parts = shlex.split(text)
+    if not parts:
+        raise ValueError("в директиве table не указан источник")
+    spec = {'source': parts[0], 'sep': None, 'columns': None, 'items': None}
+    for part in parts[1:]:
+        key, eq, value = part.partition('=')
+        if not eq or key not in spec or key == 'source':
+            raise ValueError(f"неизвестный параметр директивы table: {part}")
+        spec[key] = value
+    if spec['sep'] == '\\t':
+        spec['sep'] = '\t'
+    if spec['columns'] is not None:
+        spec['columns'] = parse_columns(spec['columns'])
+    return spec
+
+
+def parse_columns(text):
+    """«Заголовок» / «Заголовок=поле» через запятую → [(заголовок, поле)]."""
+    columns = []
+    for item in text.split(','):
+        header, _, field = item.partition('=')
+        header = header.strip()
+        if header:
+            columns.append((header, field.strip() or header))
+    return columns
+
+
+def iter_template(lines):
+    """Разбить шаблон на куски: ('markdown', строки) и ('table', директива)."""
+    chunk = []
+    for number, line in enumerate(lines, 1):
+        match = DIRECTIVE_RE.match(line)
+        if match is None:
+            chunk.append(line)
+            continue
+        if chunk:
+            yield 'markdown', chunk
+            chunk = []
+        try:
+            yield 'table', parse_directive(match.group(1))
+        except ValueError as exc:
+            raise ValueError(f"строка {number}: {exc}") from None
+    if chunk:
+        yield 'markdown', chunk
+
+
+# ============================================================
+# Источники данных
+# ============================================================
+
+def cell_text(value):
+    """Значение из JSON → текст ячейки."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'да' if value else 'нет'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, list):
+        return ', '.join(cell_text(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def lookup(data, path):
+    """Значение по пути через точку (None, если пути нет)."""
+    for key in path.split('.'):
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    return data
+
+
+def detect_separator(line):
+    """Разделитель CSV по шапке: самый частый из ; , табуляции."""
+    return max(CSV_SEPARATORS, key=line.count)
+
+
+def iter_csv(path, spec):
+    """Строки CSV: шапка, затем данные."""
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        first = f.readline()
+        sep = spec['sep'] or detect_separator(first)
+        header = next(csv.reader([first], delimiter=sep), [])
+        header = [name.strip() for name in header]
+        if spec['columns'] is None:
+            indexes = list(range(len(header)))
+            yield header
+        else:
+            positions = {name: idx for idx, name in reversed(list(enumerate(header)))}
+            missing = [field for _, field in spec['columns'] if field not in positions]
+            if missing:
+                raise ValueError(f"{path.name}: нет столбцов: {', '.join(missing)}")
+            indexes = [positions[field] for _, field in spec['columns']]
+            yield [title for title, _ in spec['columns']]
+        for row in csv.reader(f, delimiter=sep):
+            if not any(cell.strip() for cell in row):
+                continue
+            yield [row[idx].strip() if idx < len(row) else '' for idx in indexes]
+
+
+def iter_json(paths, spec):
+    """Строки из JSON-файлов: шапка, затем по записи items (или файлу) на строку."""
+    columns = spec['columns']
+    header_sent = False
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            doc = json.load(f)
+        if spec['items']:
+            records = lookup(doc, spec['items']) or []
+        else:
+            records = doc if isinstance(doc, list) else [doc]
+        for record in records:
+            if columns is None:
+                # По умолчанию — скалярные поля первой записи
+                columns = [(key, key) for key, value in record.items()
+                           if not isinstance(value, (dict, list))]
+            if not header_sent:
+                yield [title for title, _ in columns]
+                header_sent = True
+            row = []
+            for _, field in columns:
+                value = lookup(record, field)
+                if value is None and record is not doc:
+                    value = lookup(doc, field)
+                row.append(cell_text(value))
+            yield row
+    if not header_sent and columns is not None:
+        yield [title for title, _ in columns]
+
+
+def iter_table(spec, base_dir):
+    """Строки таблицы по директиве: сначала шапка, затем данные."""
+    pattern = Path(base_dir) / spec['source']
+    if pattern.suffix.lower() == '.csv':
+        if not pattern.exists():
+            raise ValueError(f"источник не найден: {spec['source']}")
+        return iter_csv(pattern, spec)
+    if pattern.suffix.lower() == '.json':
+        paths = sorted(glob.glob(str(pattern)))
+        if not paths:
+            raise ValueError(f"источник не найден: {spec['source']}")
+        return iter_json(paths, spec)
+    raise ValueError(f"неподдерживаемый источник (нужен .csv или .json): {spec['source']}")
+
+
+# ============================================================
+# Таблица: раскладка и потоковая запись
+# ============================================================
+
+def scan_columns(rows):
+    """Первый проход: метрики столбцов для table_layout.column_widths.
+
+    Вернуть (шапка, ячейки-метрики, числовые столбцы, число строк данных).
+    """
+    header = next(rows, None)
+    if header is None:
+        return None, [], [], 0
+    columns = len(header)
+    lines = [0] * columns
+    words = [0] * columns
+    numbers = [0] * columns
+    others = [0] * columns
+
+    def measure(cells):
+        for col, text in enumerate(cells[:columns]):
+            for line in text.split('\n'):
+                lines[col] = max(lines[col], len(line))
+                words[col] = max(words[col], max(map(len, line.split()), default=0))
+
+    measure(header)
+    count = 0
+    for cells in rows:
+        measure(cells)
+        for col, text in enumerate(cells[:columns]):
+            if text in EMPTY_VALUES:
+                continue
+            if NUMBER_RE.match(text):
+                numbers[col] += 1
+            else:
+                others[col] += 1
+        count += 1
+    metrics = [(None, col, 1, lines[col], words[col]) for col in range(columns)]
+    numeric = [numbers[col] > 0 and others[col] == 0 for col in range(columns)]
+    return header, metrics, numeric, count
+
+
+def table_start(widths):
+    """Открывающая часть таблицы: tblPr (сетка, ширина) и tblGrid."""
+    tbl = ET.Element(qn('w:tbl'))
+    ET.SubElement(tbl, qn('w:tblPr'))
+    fx.set_table_borders(tbl)
+    fx.set_table_full_width(tbl)
+    grid = ET.Element(qn('w:tblGrid'))
+    for width in widths:
+        ET.SubElement(grid, qn('w:gridCol')).set(qn('w:w'), str(width))
+    return (b'<w:tbl>' + ET.tostring(tbl.find(qn('w:tblPr')), encoding='utf-8')
+            + ET.tostring(grid, encoding='utf-8'))
+
+
+def header_row(header, widths):
+    """Шапка: голубая заливка, жирный текст, повтор на каждой странице."""
+    tr = ET.Element(qn('w:tr'))
+    ET.SubElement(ET.SubElement(tr, qn('w:trPr')), qn('w:tblHeader'))
+    for text, width in zip(header, widths):
+        tc = ET.SubElement(tr, qn('w:tc'))
+        fx.set_cell_shading(tc, HEADER_FILL)
+        tcW = ET.Element(qn('w:tcW'))
+        tcW.set(qn('w:w'), str(width))
+        tcW.set(qn('w:type'), 'dxa')
+        tc.find(qn('w:tcPr')).insert(0, tcW)
+        p = make_paragraph(spacing=CELL_SPACING)
+        if text:
+            p.append(make_run(normalize_text(text), frozenset({'b'})))
+        tc.append(p)
+    return ET.tostring(tr, encoding='utf-8')
+
+
+def cell_templates(widths, numeric):
+    """Начало ячейки для каждого столбца (tcW, интервалы, выравнивание)."""
+    spacing = ' '.join(f'{key}="{value}"' for key, value in CELL_SPACING.items())
+    return [
+        f'<w:tc><w:tcPr><w:tcW w:w="{width}" w:type="dxa"/></w:tcPr>'
+        f'<w:p><w:pPr><w:spacing {spacing}/>{JC_RIGHT if right else ""}</w:pPr>'
+        for width, right in zip(widths, numeric)
+    ]
+
+
+def cell_runs(text):
+    """run ячейки данных: строки текста через w:br."""
+    if not text:
+        return ''
+    text = CONTROL_RE.sub('', text)
+    lines = [escape(normalize_text(line)) for line in text.split('\n')]
+    body = '</w:t><w:br/><w:t xml:space="preserve">'.join(lines)
+    return f'<w:r><w:t xml:space="preserve">{body}</w:t></w:r>'
+
+
+def write_data_table(dst, spec, base_dir):
+    """Записать таблицу из источника в dst. Вернуть число строк данных."""
+    with format_profile.phase('scan'):
+        header, metrics, numeric, count = scan_columns(iter_table(spec, base_dir))
+    if header is None:
+        return 0
+    widths = column_widths(metrics, len(header))
+    templates = cell_templates(widths, numeric)
+    empty = [''] * len(header)
+
+    with format_profile.phase('tables'):
+        rows = iter_table(spec, base_dir)
+        next(rows)
+        dst.write(table_start(widths))
+        dst.write(header_row(header, widths))
+        for cells in rows:
+            cells = cells[:len(header)] + empty[len(cells):]
+            dst.write(('<w:tr>' + ''.join(
+                start + cell_runs(text) + '</w:p></w:tc>'
+                for start, text in zip(templates, cells)
+            ) + '</w:tr>').encode('utf-8'))
+        dst.write(b'</w:tbl>')
+    format_profile.count('tables')
+    format_profile.count('rows', count)
+    format_profile.count('cells', count * len(header))
+    return count
+
+
+# ============================================================
+# Документ
+# ============================================================
+
+def write_report_xml(lines, dst, state, base_dir):
+    """Потоково записать document.xml: Markdown-блоки и таблицы из данных.
+
+    Вернуть (число блоков, число таблиц, число строк данных).
+    """
+    dst.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+    dst.write(f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}"><w:body>'.encode('utf-8'))
+    blocks = tables = rows = 0
+    for kind, part in iter_template(lines):
+        if kind == 'table':
+            rows += write_data_table(dst, part, base_dir)
+            # Между таблицей и следующим блоком — пустой абзац (Word склеивает соседние таблицы)
+            dst.write(ET.tostring(make_paragraph(spacing=CELL_SPACING), encoding='utf-8'))
+            tables += 1
+            continue
+        for block in iter_blocks(part):
+            with format_profile.phase('paragraphs' if block[0] != 'table' else 'tables'):
+                elements = render_block(block, state)
+            with format_profile.phase('serialise'):
+                for el in elements:
+                    dst.write(ET.tostring(el, encoding='utf-8'))
+            blocks += 1
+    dst.write(ET.tostring(section_properties(), encoding='utf-8'))
+    dst.write(b'</w:body></w:document>')
+    format_profile.count('blocks', blocks)
+    return blocks, tables, rows
+
+
+def build_report(template_path, output_path=None):
+    """Собрать DOCX по шаблону. Вернуть путь к результату."""
+    template_path = Path(template_path)
+    output_path = Path(output_path) if output_path else template_path.with_suffix('.docx')
+    print(f"Шаблон: {template_path}")
+
+    state = new_state()
+    with open(template_path, encoding='utf-8-sig') as src:
+        blocks, tables, rows = write_package(
+            output_path, lambda dst: write_report_xml(src, dst, state, template_path.parent), state)
+    print(f"Блоков: {blocks}, таблиц из данных: {tables}, строк: {rows}")
+
+    print(f"Сохранение: {output_path}")
+    print("Готово!")
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Отчёт по шаблону: Markdown + CSV/JSON → DOCX")
+    parser.add_argument('template', help="шаблон .md с директивами <!-- table: … -->")
+    parser.add_argument('output', nargs='?', help="выходной .docx (по умолчанию — рядом с шаблоном)")
+    parser.add_argument('--profile', nargs='?', const='-', metavar='JSON',
+                        help="время по фазам и счётчики в JSON (без файла — в stdout)")
+    args = parser.parse_args()
+
+    if not Path(args.template).exists():
+        print(f"Ошибка: файл не найден: {args.template}")
+        sys.exit(1)
+
+    try:
+        if args.profile is None:
+            build_report(args.template, args.output)
+            return
+        with format_profile.profiling() as profile:
+            build_report(args.template, args.output)
+    except (ValueError, OSError) as exc:
+        print(f"Ошибка: {exc}")
+        sys.exit(1)
+    format_profile.save_report(profile, args.profile, {'engine': 'report', 'input': args.template})
+
+
+if __name__ == "__main__":
+    main()
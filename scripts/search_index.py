@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+"""
+Полнотекстовый поиск по документам Space Travel (.docx и .md).
+
+Индекс:
+- текст DOCX читается потоково из word/document.xml (zipfile +
+  iterparse, пространства имён format_docx_xml.py) по блокам: абзац или
+  ячейка таблицы (таблица, строка, столбец); Markdown — по абзацам,
+  заголовкам и ячейкам таблиц
+- слова приводятся к нижнему регистру, ё → е, буквы-двойники исправляются
+  (categories.fix_confusables), слова из одних двойников — к кириллице
+  (1C → 1с, CAMO → само), транслитерации систем — синонимы (SAMO → само,
+  Bitrix → битрикс); у русских слов отсекаются окончания
+- инвертированный индекс с позициями: слово → {документ: позиции};
+  между блоками — пропуск позиции, фраза не склеивается из двух абзацев
+- индекс сохраняется в .search_index.pickle вместе с mtime и размером
+  файлов; при следующем запуске перечитываются только изменённые,
+  новые и удалённые документы
+
+Запрос:
+- слова через пробел — все обязательны (И)
+- "точная фраза" — слова подряд в одном блоке
+- OR между частями — любая из частей; -слово — исключить
+- результаты ранжируются по BM25, для каждого документа — блоки с
+  совпадениями (абзац или ячейка) с контекстом
+
+Использование:
+    python search_index.py САМО API
+    python search_index.py '"выгрузка из САМО" OR Битрикс -тест'
+    python search_index.py --stats          — размер индекса, обновление
+    python search_index.py --rebuild САМО   — переиндексировать всё
+"""
+
+import argparse
+import bisect
+import json
+import math
+import os
+import pickle
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from array import array
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+from categories import fix_confusables
+from format_docx_xml import qn
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+INDEX_FILE = '.search_index.pickle'
+INDEX_VERSION = 1
+SUFFIXES = ('.docx', '.md')
+SKIP_DIRS = {'scripts', 'node_modules', '__pycache__'}
+
+DOCUMENT_PART = 'word/document.xml'
+BLOCK_GAP = 1  # пропуск позиции между блоками
+
+TOKEN_RE = re.compile(r'[^\W_]+')
+LOOKALIKE_LATIN = set('ABCEHKMOPTXaceopxy')
+LOOKALIKE_TO_CYRILLIC = str.maketrans('ABCEHKMOPTXaceopxy', 'АВСЕНКМОРТХасеорху')
+CYRILLIC_RE = re.compile(r'[а-я]')
+
+# Транслитерации названий систем → как в тексте документов
+SYNONYMS = {
+    'samo': 'само',
+    'bitrix': 'битрикс',
+    'bitrix24': 'битрикс24',
+    'roistat': 'ройстат',
+    'excel': 'эксель',
+    'outlook': 'аутлук',
+}
+
+# Окончания русских слов; отсекается самое длинное, основа — не короче 3 букв
+RUSSIAN_ENDINGS = frozenset((
+    'иями', 'ями', 'ами', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими', 'ая', 'яя', 'ое', 'ее',
+    'ые', 'ие', 'ый', 'ий', 'ой', 'ей', 'ую', 'юю', 'ом', 'ем', 'ах', 'ях', 'ов', 'ев',
+    'ам', 'ям', 'ию', 'ия', 'ии', 'ью', 'ье', 'ть', 'ет', 'ут', 'ют', 'ит', 'ат',
+    'ят', 'ешь', 'ишь', 'им', 'ете', 'ите', 'ила', 'ило', 'или', 'ала', 'али',
+    'ять', 'ать', 'ить', 'ение', 'ения', 'ений', 'ением', 'ениям', 'ость', 'ости',
+    'а', 'я', 'о', 'е', 'ы', 'и', 'у', 'ю', 'ь', 'й',
+))
+MAX_ENDING = max(map(len, RUSSIAN_ENDINGS))
+MIN_STEM = 3
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+SNIPPET_CHARS = 160
+
+
+# ============================================================
+# Слова
+# ============================================================
+
+def stem(word):
+    """Отсечь окончание русского слова."""
+    if not CYRILLIC_RE.search(word):
+        return word
+    for size in range(min(MAX_ENDING, len(word) - MIN_STEM), 0, -1):
+        if word[-size:] in RUSSIAN_ENDINGS:
+            return word[:-size]
+    return word
+
+
+_token_cache = {}
+
+
+def normalize_token(token):
+    """Нормальная форма слова для индекса и запроса (с запоминанием)."""
+    normal = _token_cache.get(token)
+    if normal is None:
+        normal = _token_cache[token] = _normalize(token)
+    return normal
+
+
+def _normalize(token):
+    token = token.casefold().replace('ё', 'е')
+    token = SYNONYMS.get(token, token)
+    letters = [c for c in token if not c.isdigit()]
+    if letters and all(c in LOOKALIKE_LATIN for c in letters):
+        token = token.translate(LOOKALIKE_TO_CYRILLIC)
+    return stem(token)
+
+
+def tokenize(text):
+    """Нормализованные слова текста."""
+    return [normalize_token(token) for token in TOKEN_RE.findall(fix_confusables(text))]
+
+
+# ============================================================
+# Извлечение текста
+# ============================================================
+
+def docx_blocks(path):
+    """Блоки DOCX: (вид, место, текст); вид — 'p' или 'cell'.
+
+    document.xml разбирается потоково (iterparse): обработанные абзацы и
+    таблицы сразу очищаются.
+    """
+    P, T, TAB, BR = qn('w:p'), qn('w:t'), qn('w:tab'), qn('w:br')
+    TBL, TR, TC = qn('w:tbl'), qn('w:tr'), qn('w:tc')
+    blocks = []
+    paragraph = 0
+    tables = 0
+    # Стек таблиц: [номер, строка, столбец, тексты текущей ячейки]
+    stack = []
+    with zipfile.ZipFile(path) as zf:
+        with zf.open(DOCUMENT_PART) as f:
+            for event, el in ET.iterparse(f, events=('start', 'end')):
+                tag = el.tag
+                if event == 'start':
+                    if tag == TBL:
+                        tables += 1
+                        stack.append([tables, 0, 0, []])
+                    elif tag == TR and stack:
+                        stack[-1][1] += 1
+                        stack[-1][2] = 0
+                    elif tag == TC and stack:
+                        stack[-1][2] += 1
+                        stack[-1][3] = []
+                    continue
+                if tag == P:
+                    parts = []
+                    for child in el.iter():
+                        if child.tag == T and child.text:
+                            parts.append(child.text)
+                        elif child.tag in (TAB, BR):
+                            parts.append(' ')
+                    text = ''.join(parts).strip()
+                    if stack:
+                        if text:
+                            stack[-1][3].append(text)
+                    else:
+                        paragraph += 1
+                        if text:
+                            blocks.append(('p', (paragraph,), text))
+                    el.clear()
+                elif tag == TC and stack:
+                    table, row, col, texts = stack[-1]
+                    if texts:
+                        blocks.append(('cell', (table, row, col), ' / '.join(texts)))
+                    el.clear()
+                elif tag == TBL and stack:
+                    stack.pop()
+                    el.clear()
+    return blocks
+
+
+MD_TABLE_RULE_RE = re.compile(r'^\s*\|?\s*:?-{2,}')
+
+
+def markdown_blocks(path):
+    """Блоки Markdown: абзацы и заголовки ('p', (строка,)), ячейки таблиц ('cell', (строка, столбец))."""
+    blocks = []
+    buffer = []
+    start = 0
+
+    def flush():
+        if buffer:
+            blocks.append(('p', (start,), ' '.join(buffer)))
+            buffer.clear()
+
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for number, line in enumerate(f, 1):
+            text = line.strip()
+            if not text:
+                flush()
+                continue
+            if text.startswith('|'):
+                flush()
+                if MD_TABLE_RULE_RE.match(text):
+                    continue
+                cells = [cell.strip() for cell in text.strip('|').split('|')]
+                for col, cell in enumerate(cells, 1):
+                    if cell:
+                        blocks.append(('cell', (number, col), cell))
+                continue
+            if text.startswith('#'):
+                flush()
+                blocks.append(('p', (number,), text.lstrip('#').strip()))
+                continue
+            if not buffer:
+                start = number
+            buffer.append(text)
+    flush()
+    return blocks
+
+
+def document_blocks(path):
+    if path.suffix.lower() == '.docx':
+        return docx_blocks(path)
+    return markdown_blocks(path)
+
+
+def describe_location(suffix, kind, place):
+    """Место блока словами."""
+    if suffix == '.docx':
+        if kind == 'cell':
+            return f"таблица {place[0]}, строка {place[1]}, столбец {place[2]}"
+        return f"абзац {place[0]}"
+    if kind == 'cell':
+        return f"строка {place[0]}, столбец {place[1]}"
+    return f"строка {place[0]}"
+
+
+# ============================================================
+# Индекс
+# ============================================================
+
+class Document:
+    """Документ в индексе: блоки, начальные позиции блоков, число слов."""
+
+    __slots__ = ('path', 'stamp', 'blocks', 'starts', 'length', 'terms')
+
+    def __init__(self, path, stamp, blocks, starts, length, terms):
+        self.path = path
+        self.stamp = stamp
+        self.blocks = blocks
+        self.starts = starts
+        self.length = length
+        self.terms = terms
+
+    def __reduce__(self):
+        return Document, (self.path, self.stamp, self.blocks, self.starts, self.length, self.terms)
+
+    def block_at(self, position):
+        return bisect.bisect_right(self.starts, position) - 1
+
+
+class SearchIndex:
+    """Инвертированный индекс с позициями."""
+
+    def __init__(self):
+        self.documents = {}   # id → Document
+        self.by_path = {}     # относительный путь → id
+        self.postings = {}    # слово → {id документа: array позиций}
+        self.next_id = 0
+        self.total_length = 0
+        self.errors = {}
+
+    # --- обновление
+
+    def add(self, rel_path, stamp, blocks):
+        doc_id = self.next_id
+        self.next_id += 1
+        starts = array('I')
+        positions = {}
+        position = 0
+        for _, _, text in blocks:
+            starts.append(position)
+            for token in tokenize(text):
+                positions.setdefault(token, array('I')).append(position)
+                position += 1
+            position += BLOCK_GAP
+        for term, items in positions.items():
+            self.postings.setdefault(term, {})[doc_id] = items
+        self.documents[doc_id] = Document(rel_path, stamp, blocks, starts, position, tuple(positions))
+        self.by_path[rel_path] = doc_id
+        self.total_length += position
+
+    def remove(self, rel_path):
+        doc_id = self.by_path.pop(rel_path)
+        document = self.documents.pop(doc_id)
+        for term in document.terms:
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.postings[term]
+        self.total_length -= document.length
+
+    def update(self, root=REPO_ROOT, files=None):
+        """Переиндексировать изменённые файлы. Вернуть (добавлено, обновлено, удалено)."""
+        root = Path(root)
+        files = document_files(root) if files is None else files
+        current = {}
+        for path in files:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            current[str(path.relative_to(root))] = (path, (st.st_mtime_ns, st.st_size))
+
+        removed = [rel for rel in self.by_path if rel not in current]
+        for rel in removed:
+            self.remove(rel)
+        added = updated = 0
+        for rel, (path, stamp) in sorted(current.items()):
+            doc_id = self.by_path.get(rel)
+            if doc_id is not None:
+                if self.documents[doc_id].stamp == stamp:
+                    continue
+                self.remove(rel)
+                updated += 1
+            else:
+                added += 1
+            try:
+                blocks = document_blocks(path)
+                self.errors.pop(rel, None)
+            except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError) as exc:
+                self.errors[rel] = str(exc)
+                blocks = []
+            self.add(rel, stamp, blocks)
+        return added, updated, len(removed)
+
+    # --- поиск
+
+    def _phrase_positions(self, terms, doc_id):
+        """Позиции начала фразы в документе."""
+        first = self.postings.get(terms[0], {}).get(doc_id)
+        if first is None:
+            return []
+        rest = []
+        for term in terms[1:]:
+            items = self.postings.get(term, {}).get(doc_id)
+            if items is None:
+                return []
+            rest.append(set(items))
+        return [p for p in first if all(p + i in items for i, items in enumerate(rest, 1))]
+
+    def _matches(self, item):
+        """Документы, где встречается элемент запроса: {id: позиции начала}."""
+        terms = item
+        if len(terms) == 1:
+            return {doc_id: list(positions) for doc_id, positions in self.postings.get(terms[0], {}).items()}
+        # Фраза: кандидаты — документы с самым редким словом
+        candidates = None
+        for term in sorted(terms, key=lambda t: len(self.postings.get(t, ()))):
+            docs = set(self.postings.get(term, ()))
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return {}
+        result = {}
+        for doc_id in candidates:
+            positions = self._phrase_positions(terms, doc_id)
+            if positions:
+                result[doc_id] = positions
+        return result
+
+    def search(self, query, limit=10, hits_per_doc=3):
+        """Выполнить запрос. Вернуть список результатов по убыванию оценки."""
+        clauses = parse_query(query)
+        scores = {}
+        positions = {}
+        count = len(self.documents) or 1
+        average = self.total_length / count if count else 1
+        for required, excluded in clauses:
+            if not required:
+                continue
+            matched = None
+            found = {}
+            for item in required:
+                docs = self._matches(item)
+                found[item] = docs
+                matched = set(docs) if matched is None else matched & set(docs)
+                if not matched:
+                    break
+            if not matched:
+                continue
+            for item in excluded:
+                matched -= set(self._matches(item))
+            for doc_id in matched:
+                document = self.documents[doc_id]
+                score = 0.0
+                for item, docs in found.items():
+                    tf = len(docs[doc_id])
+                    df = len(docs)
+                    idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * document.length / average)
+                    score += idf * tf * (BM25_K1 + 1) / (tf + norm) * len(item)
+                    positions.setdefault(doc_id, []).extend(docs[doc_id])
+                scores[doc_id] = max(scores.get(doc_id, 0.0), score)
+
+        results = []
+        for doc_id in sorted(scores, key=lambda d: (-scores[d], self.documents[d].path))[:limit]:
+            document = self.documents[doc_id]
+            suffix = Path(document.path).suffix.lower()
+            block_hits = {}
+            for position in sorted(positions[doc_id]):
+                block = document.block_at(position)
+                block_hits[block] = block_hits.get(block, 0) + 1
+            best = sorted(block_hits, key=lambda b: (-block_hits[b], b))[:hits_per_doc]
+            hits = []
+            for block in sorted(best):
+                kind, place, text = document.blocks[block]
+                hits.append({'where': describe_location(suffix, kind, place),
+                             'text': snippet(text, clauses)})
+            results.append({'path': document.path, 'score': round(scores[doc_id], 3), 'hits': hits})
+        return results
+
+    def stats(self):
+        return {
+            'documents': len(self.documents),
+            'terms': len(self.postings),
+            'postings': sum(len(p) for p in self.postings.values()),
+            'tokens': self.total_length,
+            'errors': len(self.errors),
+        }
+
+
+# ============================================================
+# Запрос
+# ============================================================
+
+QUERY_RE = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+
+def parse_query(query):
+    """Запрос → [(обязательные, исключённые)]; элемент — кортеж слов (слово или фраза)."""
+    clauses = [([], [])]
+    for match in QUERY_RE.finditer(query):
+        negate, phrase, word = match.groups()
+        if word is not None and word == 'OR':
+            clauses.append(([], []))
+            continue
+        if word is not None:
+            negate = '-' if word.startswith('-') and len(word) > 1 else ''
+            text = word[1:] if negate else word
+        else:
+            text = phrase
+        terms = tuple(tokenize(text))
+        if not terms:
+            continue
+        clauses[-1][1 if negate else 0].append(terms)
+    return [(tuple(required), tuple(excluded)) for required, excluded in clauses]
+
+
+def snippet(text, clauses):
+    """Фрагмент блока вокруг первого совпадения."""
+    text = ' '.join(text.split())
+    if len(text) <= SNIPPET_CHARS:
+        return text
+    wanted = {term for required, _ in clauses for item in required for term in item}
+    for match in TOKEN_RE.finditer(fix_confusables(text)):
+        if normalize_token(match.group()) in wanted:
+            start = max(0, match.start() - SNIPPET_CHARS // 3)
+            piece = text[start:start + SNIPPET_CHARS]
+            return ('…' if start else '') + piece + ('…' if start + SNIPPET_CHARS < len(text) else '')
+    return text[:SNIPPET_CHARS] + '…'
+
+
+# ============================================================
+# Файлы и хранение
+# ============================================================
+
+def document_files(root=REPO_ROOT):
+    """Все .docx и .md репозитория (без скрытых каталогов и scripts/)."""
+    root = Path(root)
+    files = []
+    for directory, dirs, names in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d not in SKIP_DIRS)
+        for name in sorted(names):
+            if name.startswith(('~$', '.')):
+                continue
+            if os.path.splitext(name)[1].lower() in SUFFIXES:
+                files.append(Path(directory) / name)
+    return files
+
+
+def load_index(path):
+    try:
+        with open(path, 'rb') as f:
+            version, index = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError, ImportError):
+        return None
+    return index if version == INDEX_VERSION else None
+
+
+def save_index(index, path):
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix='.search_', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((INDEX_VERSION, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+def open_index(root=REPO_ROOT, rebuild=False):
+    """Загрузить индекс и обновить изменённые файлы. Вернуть (индекс, (добавлено, обновлено, удалено))."""
+    root = Path(root)
+    index_path = root / INDEX_FILE
+    index = None if rebuild else load_index(index_path)
+    if index is None:
+        index = SearchIndex()
+    changes = index.update(root)
+    if any(changes):
+        try:
+            save_index(index, index_path)
+        except OSError as exc:
+            print(f"Предупреждение: индекс не сохранён ({exc})", file=sys.stderr)
+    return index, changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Полнотекстовый поиск по DOCX и Markdown (Space Travel)")
+    parser.add_argument('query', nargs='*', help="запрос: слова, \"фраза\", OR, -исключить")
+    parser.add_argument('--root', default=str(REPO_ROOT), help="корень репозитория")
+    parser.add_argument('--rebuild', action='store_true', help="переиндексировать все документы")
+    parser.add_argument('--stats', action='store_true', help="размер индекса")
+    parser.add_argument('--limit', type=int, default=10, help="сколько документов показать")
+    parser.add_argument('--hits', type=int, default=3, help="сколько фрагментов на документ")
+    parser.add_argument('--json', action='store_true', help="результаты в JSON")
+    args = parser.parse_args()
+
+    if not args.query and not args.stats:
+        parser.error("укажите запрос или --stats")
+
+    start = time.perf_counter()
+    index, (added, updated, removed) = open_index(args.root, args.rebuild)
+    loaded = time.perf_counter()
+
+    if args.stats:
+        stats = index.stats()
+        stats.update({'added': added, 'updated': updated, 'removed': removed,
+                      'load_ms': round((loaded - start) * 1000, 1)})
+        print(json.dumps(stats, ensure_ascii=False, indent=1))
+        for rel, error in sorted(index.errors.items()):
+            print(f"Ошибка: {rel}: {error}", file=sys.stderr)
+        if not args.query:
+            return
+
+    query = ' '.join(args.query)
+    results = index.search(query, args.limit, args.hits)
+    searched = time.perf_counter()
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=1))
+        return
+    if not results:
+        print(f"Ничего не найдено: {query}")
+    for result in results:
+        print(f"{result['score']:7.2f}  {result['path']}")
+        for hit in result['hits']:
+            print(f"         {hit['where']}: {hit['text']}")
+    print(f"Найдено документов: {len(results)} (загрузка {(loaded - start) * 1000:.0f} мс, "
+          f"поиск {(searched - loaded) * 1000:.1f} мс)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Раскладка таблиц DOCX: ширина столбцов по содержимому.
+
+Работает напрямую с элементами w:tbl / w:tr / w:tc — одинаково для
+python-docx (lxml) и xml.etree, без сетки ячеек python-docx.
+
+Алгоритм (линейный по числу ячеек):
+1. Один проход по ячейкам: позиция в сетке с учётом gridSpan, длина
+   текста и самого длинного слова. Продолжения vMerge текста не несут.
+2. Для каждого столбца — желаемая ширина (текст до MAX_LINE_CHARS
+   символов) и минимальная (самое длинное слово, не меньше MIN_COL_TWIPS).
+   Объединённые по gridSpan ячейки раздают недостающую ширину поровну
+   своим столбцам.
+3. Ширины вписываются в ширину контента: при избытке места оно делится
+   пропорционально желаемой ширине, при нехватке — столбцы сжимаются от
+   желаемой ширины к минимальной.
+4. tblGrid пересоздаётся, каждой ячейке задаётся tcW = сумма её столбцов.
+
+Использование:
+    python table_layout.py документ.docx   — показать рассчитанные ширины
+"""
+
+import sys
+import zipfile
+from xml.etree import ElementTree as ET
+
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+# Ширина контента A4 при полях 1 см (как CONTENT_WIDTH_TWIPS в format_docx.py)
+CONTENT_WIDTH_TWIPS = 10773
+
+# Оценка ширины текста Tahoma 9pt: ~100 twips на символ
+CHAR_WIDTH_TWIPS = 100
+# Поля ячейки слева и справа (tblCellMar 28 + 28)
+CELL_PADDING_TWIPS = 56
+# Минимальная ширина столбца — 1 см
+MIN_COL_TWIPS = 567
+# Текст длиннее переносится: желаемая ширина не больше этой строки
+MAX_LINE_CHARS = 60
+# Один столбец не шире этой доли таблицы
+MAX_COL_SHARE = 0.6
+
+
+def w(tag):
+    """Qualified name в namespace WordprocessingML."""
+    return f'{{{W_NS}}}{tag}'
+
+
+def _int_attr(el, default):
+    if el is None:
+        return default
+    try:
+        return int(el.get(w('val')))
+    except (TypeError, ValueError):
+        return default
+
+
+def _text_metrics(tc):
+    """Длина текста ячейки (самого длинного абзаца) и самого длинного слова."""
+    longest_line = 0
+    longest_word = 0
+    for p in tc.iter(w('p')):
+        text = ''.join(t.text or '' for t in p.iter(w('t')))
+        if not text:
+            continue
+        longest_line = max(longest_line, len(text))
+        longest_word = max(longest_word, max((len(word) for word in text.split()), default=0))
+    return longest_line, longest_word
+
+
+def scan_table(tbl):
+    """Один проход по ячейкам таблицы.
+
+    Вернуть (cells, columns): cells — список (tc, первый столбец, gridSpan,
+    длина текста, длина слова), columns — число столбцов сетки.
+    """
+    cells = []
+    columns = 0
+    for tr in tbl.iterfind(w('tr')):
+        col = 0
+        # w:gridBefore — пропущенные столбцы в начале строки
+        trPr = tr.find(w('trPr'))
+        if trPr is not None:
+            col = _int_attr(trPr.find(w('gridBefore')), 0)
+        for tc in tr.iterfind(w('tc')):
+            tcPr = tc.find(w('tcPr'))
+            span = 1
+            continuation = False
+            if tcPr is not None:
+                span = max(1, _int_attr(tcPr.find(w('gridSpan')), 1))
+                vmerge = tcPr.find(w('vMerge'))
+                # vMerge без val или с val="continue" — продолжение объединения
+                continuation = vmerge is not None and vmerge.get(w('val'), 'continue') == 'continue'
+            line, word = (0, 0) if continuation else _text_metrics(tc)
+            cells.append((tc, col, span, line, word))
+            col += span
+        columns = max(columns, col)
+    grid = tbl.find(w('tblGrid'))
+    if grid is not None:
+        columns = max(columns, len(grid.findall(w('gridCol'))))
+    return cells, columns
+
+
+def _text_width(chars):
+    return chars * CHAR_WIDTH_TWIPS + CELL_PADDING_TWIPS
+
+
+def column_widths(cells, columns, total_width=CONTENT_WIDTH_TWIPS):
+    """Рассчитать ширины столбцов (twips), в сумме ровно total_width."""
+    if columns == 0:
+        return []
+    max_col = max(MIN_COL_TWIPS, int(total_width * MAX_COL_SHARE))
+    desired = [MIN_COL_TWIPS] * columns
+    minimum = [MIN_COL_TWIPS] * columns
+
+    # Сначала ячейки без объединения, затем объединённые — по остатку
+    spanned = []
+    for _, col, span, line, word in cells:
+        if col >= columns:
+            continue
+        want = min(_text_width(min(line, MAX_LINE_CHARS)), max_col)
+        need = min(_text_width(word), max_col)
+        if span == 1:
+            desired[col] = max(desired[col], want)
+            minimum[col] = max(minimum[col], need)
+        else:
+            spanned.append((col, min(span, columns - col), want, need))
+
+    for col, span, want, need in spanned:
+        cols = range(col, col + span)
+        for widths, value in ((desired, want), (minimum, need)):
+            missing = value - sum(widths[c] for c in cols)
+            if missing > 0:
+                for c in cols:
+                    widths[c] += missing / span
+
+    for c in range(columns):
+        desired[c] = min(max(desired[c], minimum[c]), max_col)
+        minimum[c] = min(minimum[c], desired[c])
+
+    sum_desired = sum(desired)
+    sum_minimum = sum(minimum)
+    if sum_desired <= total_width:
+        # Свободное место делится пропорционально желаемой ширине
+        scale = total_width / sum_desired
+        widths = [d * scale for d in desired]
+    elif sum_minimum < total_width:
+        # Сжатие от желаемой ширины к минимальной
+        k = (total_width - sum_minimum) / (sum_desired - sum_minimum)
+        widths = [m + (d - m) * k for d, m in zip(desired, minimum)]
+    else:
+        # Даже минимум не помещается — пропорционально минимальной ширине
+        scale = total_width / sum_minimum
+        widths = [m * scale for m in minimum]
+
+    result = [int(x) for x in widths]
+    # Остаток от округления — самому широкому столбцу
+    result[result.index(max(result))] += total_width - sum(result)
+    return result
+
+
+def _get_or_insert(parent, tag, index=0):
+    el = parent.find(w(tag))
+    if el is None:
+        el = parent.makeelement(w(tag), {})
+        parent.insert(index, el)
+    return el
+
+
+def apply_widths(tbl, cells, widths):
+    """Пересоздать tblGrid и задать tcW каждой ячейке."""
+    old_grid = tbl.find(w('tblGrid'))
+    index = 1 if tbl.find(w('tblPr')) is not None else 0
+    if old_grid is not None:
+        index = list(tbl).index(old_grid)
+        tbl.remove(old_grid)
+    grid = tbl.makeelement(w('tblGrid'), {})
+    for width in widths:
+        gridCol = grid.makeelement(w('gridCol'), {})
+        gridCol.set(w('w'), str(width))
+        grid.append(gridCol)
+    tbl.insert(index, grid)
+
+    # Накопленные суммы: ширина ячейки за O(1)
+    offsets = [0]
+    for width in widths:
+        offsets.append(offsets[-1] + width)
+    for tc, col, span, _, _ in cells:
+        end = min(col + span, len(widths))
+        tcPr = _get_or_insert(tc, 'tcPr')
+        tcW = _get_or_insert(tcPr, 'tcW')
+        tcW.set(w('w'), str(offsets[end] - offsets[min(col, end)]))
+        tcW.set(w('type'), 'dxa')
+
+
+def layout_table(tbl, total_width=CONTENT_WIDTH_TWIPS):
+    """Задать таблице ширины столбцов по содержимому. Вернуть список ширин."""
+    cells, columns = scan_table(tbl)
+    widths = column_widths(cells, columns, total_width)
+    if widths:
+        apply_widths(tbl, cells, widths)
+    return widths
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Использование: python table_layout.py <файл.docx>")
+        sys.exit(1)
+
+    with zipfile.ZipFile(sys.argv[1]) as zf:
+        root = ET.fromstring(zf.read('word/document.xml'))
+    for idx, tbl in enumerate(root.iter(w('tbl')), 1):
+        cells, columns = scan_table(tbl)
+        widths = column_widths(cells, columns)
+        print(f"Таблица {idx}: {columns} столбцов, {len(cells)} ячеек — "
+              f"{', '.join(f'{x / 567:.1f}' for x in widths)} см")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Кластеры похожих задач L3 Space Travel (MinHash + LSH).
+
+Одна и та же работа описана в анкетах по-разному: «ОТВЕЧАЮ НА ЗВОНКИ
+АГЕНТОВ», «Ответы на звонки агентов» и т.д. Сравнение всех задач со
+всеми растёт квадратично, поэтому:
+1. название нормализуется: правила text_normalize (как remove_extra_spaces),
+   регистр, ё → е, буквы-двойники (categories.fix_confusables),
+   пунктуация → пробел, служебные слова убираются, слова обрезаются
+   до основы (первые 6 букв)
+2. нормализованный текст режется на символьные шинглы по 4 символа
+3. MinHash-подпись из 64 хэшей (blake2b шингла с 4 солями даёт 64
+   независимых 32-битных значения); подпись делится на 16 полос по 4 хэша,
+   задачи с совпавшей полосой — кандидаты (порог ≈ 0.5)
+4. кандидаты проверяются точным коэффициентом Жаккара по шинглам
+   (по умолчанию ≥ 0.5) и объединяются (union-find)
+
+Работа линейна по числу задач: каждая задача хэшируется один раз, а
+сравниваются только задачи из общих корзин LSH.
+
+Кластерам присваиваются канонические ID (TC-001, …) по убыванию часов.
+Часы задачи — как в workload.py (минуты × коэффициент регулярности ÷ 60,
+не больше 200 ч/мес), потенциал — часы × коэффициент автоматизации по
+уровню рутинности. Это входные данные для таблиц automation/3.4_*.
+
+Использование:
+    python task_clusters.py                  — топ кластеров по часам
+    python task_clusters.py --top 50 --min-size 3
+    python task_clusters.py -o clusters.json — кластеры и задачи в JSON
+    python task_clusters.py --threshold 0.6
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+
+import corpus
+import workload
+from categories import fix_confusables
+from text_normalize import normalize_text
+
+
+SHINGLE_SIZE = 4
+NUM_HASHES = 64
+BANDS = 16
+ROWS = NUM_HASHES // BANDS
+DEFAULT_THRESHOLD = 0.5
+STEM_LENGTH = 6
+# Корзины LSH больше этого размера — общие слова, а не похожие задачи
+MAX_BUCKET = 200
+HASH_SEED = 20260217
+# Один дайджест blake2b (64 байта) — 16 хэшей по 32 бита
+HASHES_PER_DIGEST = 16
+
+STOP_WORDS = frozenset((
+    'и', 'в', 'во', 'на', 'с', 'со', 'по', 'для', 'о', 'об', 'от', 'к', 'ко', 'из',
+    'а', 'или', 'за', 'при', 'до', 'не', 'что', 'как', 'т', 'д', 'т.д', 'тд', 'др',
+))
+NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+# ============================================================
+# Нормализация и подписи
+# ============================================================
+
+def normalize_name(text):
+    """Ключ сравнения названия задачи: основы значимых слов через пробел ('' — нечего сравнивать)."""
+    if not text:
+        return ''
+    text = fix_confusables(normalize_text(text)).casefold().replace('ё', 'е')
+    words = [word[:STEM_LENGTH] for word in NON_WORD_RE.split(text)
+             if word and word not in STOP_WORDS]
+    # Названия из одних чисел («29») не сравниваются
+    if not any(word.isalpha() for word in words):
+        return ''
+    return ' '.join(words)
+
+
+def shingles(key):
+    """Множество символьных шинглов нормализованного текста (байты UTF-8)."""
+    if len(key) <= SHINGLE_SIZE:
+        return {key.encode('utf-8')} if key else set()
+    return {key[i:i + SHINGLE_SIZE].encode('utf-8')
+            for i in range(len(key) - SHINGLE_SIZE + 1)}
+
+
+def hash_salts(count=NUM_HASHES, seed=HASH_SEED):
+    """Соли blake2b: по одной на каждые 16 хэшей подписи."""
+    return [f'{seed}:{i}'.encode()[:hashlib.blake2b.SALT_SIZE]
+            for i in range(-(-count // HASHES_PER_DIGEST))]
+
+
+def hash_vector(shingle, salts):
+    """Вектор 32-битных хэшей шингла (len(salts) × 16 значений)."""
+    return array('I', b''.join(hashlib.blake2b(shingle, salt=salt).digest() for salt in salts))
+
+
+def minhash(items, salts, cache=None):
+    """MinHash-подпись множества шинглов (кортеж из len(salts) × 16 чисел).
+
+    cache — словарь шингл → вектор хэшей: шинглы повторяются между
+    задачами, и подпись сводится к поэлементному min по готовым векторам.
+    """
+    if cache is None:
+        cache = {}
+    vectors = []
+    for shingle in items:
+        vector = cache.get(shingle)
+        if vector is None:
+            vector = cache[shingle] = hash_vector(shingle, salts)
+        vectors.append(vector)
+    return tuple(map(min, zip(*vectors)))
+
+
+def jaccard(left, right):
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+class DisjointSet:
+    """Union-find с сжатием путей."""
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, item):
+        parent = self.parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    def union(self, left, right):
+        left, right = self.find(left), self.find(right)
+        if left != right:
+            # Корень — меньший индекс: кластеры не зависят от порядка объединений
+            if right < left:
+                left, right = right, left
+            self.parent[right] = left
+
+
+# ============================================================
+# Индекс LSH
+# ============================================================
+
+class LSHIndex:
+    """Индекс MinHash/LSH по нормализованным текстам (одинаковые тексты — одна запись)."""
+
+    def __init__(self, bands=BANDS, rows=ROWS, seed=HASH_SEED):
+        self.bands = bands
+        self.rows = rows
+        self.salts = hash_salts(bands * rows, seed)
+        self.keys = []          # нормализованные тексты
+        self.key_ids = {}       # текст → номер
+        self.shingles = []
+        self._vectors = {}      # шингл → вектор хэшей
+        self.buckets = {}       # (полоса, хэши полосы) → номера текстов
+
+    def add(self, key):
+        """Добавить текст; вернуть его номер (повторный текст не хэшируется)."""
+        kid = self.key_ids.get(key)
+        if kid is not None:
+            return kid
+        kid = len(self.keys)
+        self.key_ids[key] = kid
+        self.keys.append(key)
+        items = shingles(key)
+        self.shingles.append(items)
+        if items:
+            signature = minhash(items, self.salts, self._vectors)
+            for band in range(self.bands):
+                part = signature[band * self.rows:(band + 1) * self.rows]
+                self.buckets.setdefault((band, part), []).append(kid)
+        return kid
+
+    def candidate_pairs(self):
+        """Пары текстов с хотя бы одной общей полосой."""
+        pairs = set()
+        for members in self.buckets.values():
+            if len(members) < 2 or len(members) > MAX_BUCKET:
+                continue
+            for i, left in enumerate(members):
+                for right in members[i + 1:]:
+                    pairs.add((left, right))
+        return pairs
+
+    def groups(self, threshold=DEFAULT_THRESHOLD):
+        """Union-find по кандидатам с Жаккаром ≥ threshold. Вернуть (DisjointSet, проверено пар)."""
+        groups = DisjointSet(len(self.keys))
+        pairs = self.candidate_pairs()
+        for left, right in pairs:
+            if jaccard(self.shingles[left], self.shingles[right]) >= threshold:
+                groups.union(left, right)
+        return groups, len(pairs)
+
+
+# ============================================================
+# Кластеры задач
+# ============================================================
+
+def display_name(text):
+    """Название для отчёта: без лишних пробелов, КАПС → с заглавной буквы."""
+    text = normalize_text(text.strip())
+    return text.capitalize() if text.isupper() else text
+
+
+def cluster_tasks(data, threshold=DEFAULT_THRESHOLD):
+    """Сгруппировать задачи L3 корпуса. Вернуть (кластеры, задача → ID кластера, статистика)."""
+    index = LSHIndex()
+    task_keys = []
+    for task in data.tasks:
+        key = normalize_name(task.name)
+        task_keys.append(index.add(key) if key else None)
+    groups, compared = index.groups(threshold)
+
+    members = {}
+    for task, kid in zip(data.tasks, task_keys):
+        if kid is not None:
+            members.setdefault(groups.find(kid), []).append(task)
+
+    clusters = []
+    for tasks in members.values():
+        hours = [workload.task_hours(task.time_minutes, task.regularity) for task in tasks]
+        respondents = {task.respondent for task in tasks}
+        # Представитель — самая частая формулировка, из равных — самая короткая
+        keys = Counter(index.keys[index.key_ids[normalize_name(t.name)]] for t in tasks)
+        top_key = min(keys, key=lambda key: (-keys[key], len(key), key))
+        name = next(t.name for t in tasks if normalize_name(t.name) == top_key)
+        routine = Counter(task.routine_level or workload.NOT_SPECIFIED for task in tasks)
+        savings = sum(h * workload.AUTOMATION_COEFFICIENTS.get(task.routine_level, workload.DEFAULT_COEFFICIENT)
+                      for task, h in zip(tasks, hours))
+        clusters.append({
+            'name': display_name(name),
+            'tasks': len(tasks),
+            'respondents': len(respondents),
+            'departments': sorted({data.respondents[r].department or workload.NOT_SPECIFIED
+                                   for r in respondents}),
+            'divisions': sorted({data.respondents[r].division for r in respondents
+                                 if data.respondents[r].division}),
+            'hours': round(sum(hours), 1),
+            'potential_savings_hours': round(savings, 1),
+            'routine_levels': dict(routine.most_common()),
+            'task_ids': [task.id for task in tasks],
+        })
+
+    # Канонические ID: по убыванию часов, затем размера и названия
+    clusters.sort(key=lambda c: (-c['hours'], -c['tasks'], c['name']))
+    task_cluster = {}
+    for number, cluster in enumerate(clusters, 1):
+        cluster['id'] = f'TC-{number:03d}'
+        for tid in cluster['task_ids']:
+            task_cluster[tid] = cluster['id']
+    stats = {
+        'tasks': len(data.tasks),
+        'named_tasks': sum(1 for kid in task_keys if kid is not None),
+        'distinct_texts': len(index.keys),
+        'candidate_pairs': compared,
+        'clusters': len(clusters),
+        'multi_task_clusters': sum(1 for c in clusters if c['tasks'] > 1),
+    }
+    return clusters, task_cluster, stats
+
+
+def cluster_json(clusters, task_cluster, stats, data, min_size=1):
+    """Отчёт: кластеры (с ID первым полем) и соответствие задача → кластер."""
+    ordered = [{'id': c['id'], **{k: v for k, v in c.items() if k != 'id'}}
+               for c in clusters if c['tasks'] >= min_size]
+    return {
+        'summary': stats,
+        'clusters': ordered,
+        'tasks': [{'task_id': task.id, 'respondent': data.respondents[task.respondent].key,
+                   'number': task.number, 'cluster': task_cluster.get(task.id)}
+                  for task in data.tasks],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Кластеры похожих задач L3 (Space Travel)")
+    parser.add_argument('--root', default=str(corpus.REPO_ROOT), help="корень репозитория")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"порог сходства Жаккара (по умолчанию {DEFAULT_THRESHOLD})")
+    parser.add_argument('--min-size', type=int, default=2,
+                        help="минимум задач в кластере для вывода (по умолчанию 2)")
+    parser.add_argument('--top', type=int, default=20, help="сколько кластеров показать")
+    parser.add_argument('-o', '--output', help="записать кластеры в JSON ('-' — stdout)")
+    args = parser.parse_args()
+
+    if not 0 < args.threshold <= 1:
+        print("Ошибка: порог должен быть в диапазоне (0, 1]")
+        sys.exit(1)
+
+    data = corpus.load_corpus(args.root)
+    start = time.perf_counter()
+    clusters, task_cluster, stats = cluster_tasks(data, args.threshold)
+    stats['seconds'] = round(time.perf_counter() - start, 3)
+
+    if args.output:
+        text = json.dumps(cluster_json(clusters, task_cluster, stats, data, args.min_size),
+                          ensure_ascii=False, indent=2)
+        if args.output == '-':
+            print(text)
+            return
+        Path(args.output).write_text(text, encoding='utf-8')
+        print(f"Сохранение: {args.output}")
+
+    print(f"Задач: {stats['tasks']} (с названием {stats['named_tasks']}, "
+          f"разных текстов {stats['distinct_texts']}), пар-кандидатов: {stats['candidate_pairs']}")
+    print(f"Кластеров: {stats['clusters']}, из них с повторами: {stats['multi_task_clusters']} "
+          f"({stats['seconds'] * 1000:.0f} мс)")
+    shown = [c for c in clusters if c['tasks'] >= args.min_size][:args.top]
+    for cluster in shown:
+        print(f"  {cluster['id']}  {cluster['hours']:8.1f} ч  задач {cluster['tasks']:3d}  "
+              f"сотр. {cluster['respondents']:3d}  {cluster['name'][:70]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Нормализация текста для форматирования документов Space Travel.
+
+Общие правила для обоих движков (format_docx и format_docx_xml):
+- неразрывные и прочие Unicode-пробелы → обычный пробел
+- zero-width space удаляется
+- несколько пробелов подряд → один
+- пробелы перед . , ; : ! ? ) ] } удаляются
+- после . , ; : ! ? перед буквой добавляется пробел (А–я и A–z; Ё/ё в
+  этот класс не входят — результат совпадает с прежней remove_extra_spaces)
+
+Пробелы заменяются одной таблицей str.translate, остальные правила —
+одним проходом скомпилированного регулярного выражения. normalize_runs()
+применяет правила к абзацу целиком, поэтому учитывает пробелы и
+пунктуацию на границах run.
+
+Микро-бенчмарк на текстах задач из L3_json:
+    python text_normalize.py --bench
+"""
+
+import argparse
+import bisect
+import glob
+import json
+import re
+import time
+from pathlib import Path
+
+
+# Unicode-пробелы → обычный пробел, zero-width space → удалить
+SPACE_TABLE = str.maketrans(
+    {**{chr(code): ' ' for code in (0x00A0, *range(0x2000, 0x200B), 0x202F, 0x205F, 0x3000)},
+     '\u200B': None}
+)
+# Быстрая проверка перед str.translate: в большинстве текстов таких символов нет
+SPECIAL_SPACES_RE = re.compile(r'[\u00A0\u2000-\u200B\u202F\u205F\u3000]')
+
+# Одно выражение на все правила; группа определяет замену:
+#   before — пробелы перед закрывающей пунктуацией (удалить)
+#   spaces — два и более пробела (один пробел)
+#   after  — знак препинания вплотную к букве (добавить пробел)
+NORMALIZE_RE = re.compile(
+    r'(?P<before> +(?=[.,;:!?)\]}]))'
+    r'|(?P<spaces> {2,})'
+    r'|(?P<after>[.,;:!?])(?=[А-Яа-яA-Za-z])'
+)
+# Те же правила в виде дешёвого условия: текст без совпадений не трогаем
+NEEDS_FIX_RE = re.compile(r' (?=[ .,;:!?)\]}])|[.,;:!?](?=[А-Яа-яA-Za-z])')
+
+
+def _replace(match):
+    kind = match.lastgroup
+    if kind == 'after':
+        return match.group() + ' '
+    return '' if kind == 'before' else ' '
+
+
+def normalize_text(text):
+    """Удалить лишние пробелы, оставив ровно 1 пробел между словами."""
+    if not text:
+        return text
+    if SPECIAL_SPACES_RE.search(text):
+        text = text.translate(SPACE_TABLE)
+    if NEEDS_FIX_RE.search(text):
+        text = NORMALIZE_RE.sub(_replace, text)
+    return text
+
+
+def normalize_runs(texts):
+    """Нормализовать тексты run одного абзаца с учётом границ между ними.
+
+    Правила применяются к склеенному тексту абзаца, результат раскладывается
+    обратно по run: удалённые символы исчезают из своего run, вставленный
+    пробел попадает в run со знаком препинания. Вернуть список той же длины.
+    """
+    if len(texts) < 2:
+        return [normalize_text(text) for text in texts]
+
+    texts = [text.translate(SPACE_TABLE) if text and SPECIAL_SPACES_RE.search(text) else (text or '')
+             for text in texts]
+    joined = ''.join(texts)
+    if not NEEDS_FIX_RE.search(joined):
+        return texts
+    # starts[i] — позиция начала i-го run в склеенном тексте
+    starts = []
+    position = 0
+    for text in texts:
+        starts.append(position)
+        position += len(text)
+
+    pieces = [[] for _ in texts]
+
+    def copy_span(begin, end):
+        """Скопировать joined[begin:end] в соответствующие run."""
+        while begin < end:
+            idx = bisect.bisect_right(starts, begin) - 1
+            while idx + 1 < len(starts) and starts[idx + 1] == begin:
+                idx += 1  # пустые run пропускаем
+            run_end = starts[idx + 1] if idx + 1 < len(starts) else len(joined)
+            stop = min(end, run_end)
+            pieces[idx].append(joined[begin:stop])
+            begin = stop
+
+    def owner(index):
+        idx = bisect.bisect_right(starts, index) - 1
+        while idx > 0 and not texts[idx]:
+            idx -= 1
+        return idx
+
+    position = 0
+    for match in NORMALIZE_RE.finditer(joined):
+        copy_span(position, match.start())
+        kind = match.lastgroup
+        if kind == 'spaces':
+            pieces[owner(match.start())].append(' ')
+        elif kind == 'after':
+            copy_span(match.start(), match.end())
+            pieces[owner(match.start())].append(' ')
+        position = match.end()
+    copy_span(position, len(joined))
+
+    return [''.join(parts) for parts in pieces]
+
+
+def remove_extra_spaces_legacy(text):
+    """Прежняя реализация из format_docx.py (пять проходов re.sub) — для сравнения."""
+    if not text:
+        return text
+    text = re.sub(r'[\u00A0\u2000-\u200A\u202F\u205F\u3000]+', ' ', text)
+    text = re.sub(r'\u200B', '', text)
+    text = re.sub(r' {2,}', ' ', text)
+    text = re.sub(r' +([.,;:!?)\]}])', r'\1', text)
+    text = re.sub(r'([.,;:!?])([А-Яа-яA-Za-z])', r'\1 \2', text)
+    return text
+
+
+def load_task_texts(pattern):
+    """Тексты задач (название, проблема, описания взаимодействий) из анкет L3."""
+    texts = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        for task in data.get('tasks', []):
+            for key in ('task_name', 'problem', 'problem_cause', 'expected_results', 'risks'):
+                if isinstance(task.get(key), str):
+                    texts.append(task[key])
+            for item in task.get('interactions') or []:
+                if isinstance(item, dict) and isinstance(item.get('description'), str):
+                    texts.append(item['description'])
+    return texts
+
+
+def _measure(func, texts, repeat):
+    """Лучшее время из repeat прогонов func по всем текстам."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(texts, repeat=5):
+    """Сравнить прежнюю и новую нормализацию. Вернуть словарь с результатами."""
+    total_chars = sum(len(text) for text in texts)
+    # Абзацы, разбитые на run по словам — худший случай для межрановой обработки
+    runs = [text.split(' ') for text in texts]
+    runs = [[word + ' ' for word in words[:-1]] + words[-1:] for words in runs]
+
+    results = {'texts': len(texts), 'chars': total_chars}
+    for name, func, data in (
+        ('legacy', remove_extra_spaces_legacy, texts),
+        ('normalize_text', normalize_text, texts),
+        ('normalize_runs', normalize_runs, runs),
+    ):
+        seconds = _measure(func, data, repeat)
+        results[name] = {
+            'seconds': round(seconds, 4),
+            'mchars_per_sec': round(total_chars / seconds / 1e6, 2) if seconds else None,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нормализация текста (Space Travel)")
+    parser.add_argument('--bench', action='store_true', help="микро-бенчмарк на текстах L3")
+    parser.add_argument('--corpus', default=str(Path(__file__).resolve().parent.parent / 'L3_json' / '*.json'),
+                        help="glob-шаблон JSON-анкет для бенчмарка")
+    parser.add_argument('--repeat', type=int, default=5, help="число повторов")
+    parser.add_argument('--scale', type=int, default=1, help="размножить корпус в N раз")
+    parser.add_argument('text', nargs='?', help="текст для нормализации")
+    args = parser.parse_args()
+
+    if not args.bench:
+        if args.text is None:
+            parser.error("укажите текст или --bench")
+        print(normalize_text(args.text))
+        return
+
+    texts = load_task_texts(args.corpus) * args.scale
+    if not texts:
+        print(f"Ошибка: тексты не найдены: {args.corpus}")
+        return
+
+    mismatches = sum(1 for text in texts if normalize_text(text) != remove_extra_spaces_legacy(text))
+    results = run_benchmark(texts, args.repeat)
+    results['differs_from_legacy'] = mismatches
+    print(json.dumps(results, ensure_ascii=False, indent=1))
+
+
+if __name__ == "__main__":
+    main()
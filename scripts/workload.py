@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Расчёт нагрузки и FTE по анкетам L3 Space Travel.
+
+Воспроизводит automation/4.2_L3_objective_calculation.json:
+- часы в месяц на задачу = минуты × коэффициент регулярности ÷ 60
+  (ежедневно 22, еженедельно 4.33, ежемесячно 1, ежеквартально 0.33,
+  по запросу и прочее — 5); учитываются задачи с целым time_minutes
+- выбросы: задачи больше 200 ч/мес ограничиваются 200 ч
+- FTE = часы ÷ 176 (22 дня × 8 часов)
+- группировки по уровню рутинности, типу задачи, департаменту
+  (и при --extended — по характеру задачи и отделу)
+- потенциал автоматизации: часы уровня × коэффициент (очень высокий 0.8,
+  высокий 0.6, средний 0.3, низкий 0.1, прочее 0.2), 500 ₽/ч × 12 мес.
+
+Категории приводятся справочником categories.py («Bысокий» с латинской B
+считается «Высоким», свободный текст характера задачи — по основному
+варианту). Опубликованный JSON посчитан по значениям как в анкетах
+(только регистр первой буквы): --raw воспроизводит его без изменений.
+Опубликованный JSON по умолчанию пишется только при --raw (без
+--extended); остальные варианты расчёта — в отдельный файл
+automation/4.2_L3_workload_calculation.json, перезаписать опубликованный
+ими можно только явным -o.
+
+Расчёт колоночный: задачи хранятся массивами (array) часов и кодов
+категорий, группировки — суммирование по кодам за один проход. Каждая
+анкета разбирается в свой блок столбцов; блоки кэшируются по mtime и
+размеру файла, поэтому после правки одной анкеты перечитывается только
+она, а пересчёт по столбцам занимает миллисекунды.
+
+Использование:
+    python workload.py                  — расчёт по справочнику → 4.2_L3_workload_calculation.json
+    python workload.py --raw            — пересчитать опубликованный 4.2_L3_objective_calculation.json
+    python workload.py --raw --check    — сравнить с опубликованным JSON (код 1, если отличается)
+    python workload.py --extended -o -  — с группировками по характеру и отделу, в stdout
+    python workload.py --bench 100      — время расчёта на корпусе ×100
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+import corpus
+from categories import Categories
+
+
+REPO_ROOT = corpus.REPO_ROOT
+OUTPUT_FILE = REPO_ROOT / 'automation' / '4.2_L3_objective_calculation.json'
+# Расчёт по справочнику категорий (и --extended) не совпадает с опубликованным
+DERIVED_FILE = REPO_ROOT / 'automation' / '4.2_L3_workload_calculation.json'
+CACHE_FILE = '.workload_cache.pickle'
+CACHE_VERSION = 2
+
+# Часов в месяц на задачу: минуты × коэффициент ÷ 60
+REGULARITY_MULTIPLIERS = {
+    'ежедневно': 22,
+    'еженедельно': 4.33,
+    'ежемесячно': 1,
+    'ежеквартально': 0.33,
+}
+DEFAULT_MULTIPLIER = 5  # по запросу, выходные, не указано
+
+HOURS_CAP = 200             # ч/мес на одну задачу, больше — выброс
+WORK_HOURS_PER_MONTH = 176  # 22 дня × 8 часов
+OUTLIER_TASK_CHARS = 60
+
+AUTOMATION_COEFFICIENTS = {
+    'Очень высокий': 0.8,
+    'Высокий': 0.6,
+    'Средний': 0.3,
+    'Низкий': 0.1,
+}
+DEFAULT_COEFFICIENT = 0.2
+HIGH_ROUTINE_LEVELS = ('Очень высокий', 'Высокий')
+HOURLY_RATE_RUB = 500
+MONTHS_PER_YEAR = 12
+
+NOT_SPECIFIED = 'Не указано'
+
+# Категориальные столбцы: имя → поле задачи в анкете
+CATEGORY_FIELDS = {
+    'routine_level': 'routine_level',
+    'task_type': 'task_type',
+    'task_character': 'task_character',
+}
+
+
+def category_label(value):
+    """Значение категории без справочника: с заглавной буквы, пустое — «Не указано»."""
+    if not isinstance(value, str) or not value.strip():
+        return NOT_SPECIFIED
+    return value.strip().capitalize()
+
+
+def regularity_multiplier(value):
+    """Коэффициент перевода минут на выполнение в минуты в месяц."""
+    if not isinstance(value, str):
+        return DEFAULT_MULTIPLIER
+    return REGULARITY_MULTIPLIERS.get(value.strip().lower(), DEFAULT_MULTIPLIER)
+
+
+def task_hours(minutes, regularity):
+    """Часы в месяц на одну задачу с ограничением выбросов (без минут — 0)."""
+    if minutes is None:
+        return 0.0
+    return min(minutes * regularity_multiplier(regularity) / 60, HOURS_CAP)
+
+
+# ============================================================
+# Блоки столбцов
+# ============================================================
+
+def questionnaire_block(data):
+    """Столбцы одной анкеты L3: только задачи с целым time_minutes, значения как в анкете."""
+    info = data.get('respondent') or {}
+    block = {
+        'fio': info.get('fio'),
+        'department': info.get('department'),
+        'division': info.get('division'),
+        'minutes': array('d'),
+        'regularity': [],
+        'name': [],
+    }
+    for column in CATEGORY_FIELDS:
+        block[column] = []
+    for task in data.get('tasks') or ():
+        minutes = task.get('time_minutes')
+        if not isinstance(minutes, int) or isinstance(minutes, bool):
+            continue
+        block['minutes'].append(minutes)
+        block['regularity'].append(task.get('regularity'))
+        block['name'].append(task.get('task_name') or '')
+        for column, field in CATEGORY_FIELDS.items():
+            block[column].append(task.get(field))
+    return block
+
+
+class Columns:
+    """Все задачи корпуса в виде столбцов; категории — коды в словарях.
+
+    raw=True — значения категорий как в анкетах (category_label), без
+    справочника; так посчитан опубликованный 4.2_L3_objective_calculation.json.
+    """
+
+    def __init__(self, blocks, raw=False):
+        self.files = len(blocks)
+        self.categories = None if raw else Categories()
+        label = (lambda field, value: category_label(value)) if raw else self.categories.canonical
+        self.respondents = []  # (ФИО, департамент, отдел)
+        self.respondent = array('l')
+        self.minutes = array('d')
+        self.multiplier = array('d')
+        self.names = []
+        self.codes = {column: array('l') for column in (*CATEGORY_FIELDS, 'department', 'division')}
+        # Словари в порядке первого появления — от него зависит порядок равных групп
+        self.vocab = {column: {} for column in self.codes}
+
+        for block in blocks:
+            if not len(block['minutes']):
+                continue
+            rid = len(self.respondents)
+            self.respondents.append((block['fio'], block['department'], block['division']))
+            count = len(block['minutes'])
+            self.respondent.extend([rid] * count)
+            self.minutes.extend(block['minutes'])
+            self.multiplier.extend(regularity_multiplier(label('regularity', value))
+                                   for value in block['regularity'])
+            self.names.extend(block['name'])
+            for column, field in CATEGORY_FIELDS.items():
+                vocab = self.vocab[column]
+                self.codes[column].extend(vocab.setdefault(label(field, value), len(vocab))
+                                          for value in block[column])
+            for column in ('department', 'division'):
+                vocab = self.vocab[column]
+                name = block[column] if raw else self.categories.canonical(column, block[column])
+                code = vocab.setdefault(name or NOT_SPECIFIED, len(vocab))
+                self.codes[column].extend([code] * count)
+
+    def __len__(self):
+        return len(self.minutes)
+
+
+def hours_columns(columns):
+    """Часы в месяц до и после ограничения выбросов (два массива)."""
+    raw = array('d', [m * k / 60 for m, k in zip(columns.minutes, columns.multiplier)])
+    capped = array('d', [h if h <= HOURS_CAP else HOURS_CAP for h in raw])
+    return raw, capped
+
+
+def group_sums(codes, values, groups):
+    """Суммы и количества по кодам групп за один проход."""
+    sums = [0.0] * groups
+    counts = [0] * groups
+    for code, value in zip(codes, values):
+        sums[code] += value
+        counts[code] += 1
+    return sums, counts
+
+
+def _sorted_groups(names, key):
+    # Стабильная сортировка: равные значения остаются в порядке первого появления
+    return sorted(range(len(names)), key=lambda idx: -key(idx))
+
+
+def group_report(columns, column, hours, employees=False):
+    """Группировка по столбцу: {значение: {count, hours[, employee_count]}} по убыванию часов."""
+    names = list(columns.vocab[column])
+    sums, counts = group_sums(columns.codes[column], hours, len(names))
+    people = None
+    if employees:
+        people = [set() for _ in names]
+        for code, rid in zip(columns.codes[column], columns.respondent):
+            people[code].add(rid)
+    result = {}
+    for idx in _sorted_groups(names, lambda idx: sums[idx]):
+        entry = {'count': counts[idx], 'hours': float(round(sums[idx]))}
+        if employees:
+            entry['employee_count'] = len(people[idx])
+        result[names[idx]] = entry
+    return result
+
+
+def calculate(columns, files_total=None, extended=False):
+    """Рассчитать отчёт в схеме 4.2_L3_objective_calculation.json."""
+    raw, capped = hours_columns(columns)
+    total_raw = sum(raw)
+    total_clean = sum(capped)
+    outliers = [idx for idx, h in enumerate(raw) if h > HOURS_CAP]
+
+    report = {
+        'summary': {
+            'files_processed': f"{columns.files}/{files_total if files_total is not None else columns.files}",
+            'total_tasks': len(columns),
+            'total_hours_raw': float(round(total_raw)),
+            'total_hours_clean': float(round(total_clean)),
+            'fte_equivalent': round(total_clean / WORK_HOURS_PER_MONTH, 1),
+            'outliers_count': len(outliers),
+            'outliers_hours_removed': float(round(total_raw - total_clean)),
+        },
+        'by_routine_level': group_report(columns, 'routine_level', capped),
+        'by_task_type': group_report(columns, 'task_type', capped),
+        'by_department': group_report(columns, 'department', capped, employees=True),
+    }
+    if extended:
+        report['by_task_character'] = group_report(columns, 'task_character', capped)
+        report['by_division'] = group_report(columns, 'division', capped, employees=True)
+
+    # Потенциал автоматизации по уровням рутинности
+    levels = list(columns.vocab['routine_level'])
+    sums, counts = group_sums(columns.codes['routine_level'], capped, len(levels))
+    savings = [sums[idx] * AUTOMATION_COEFFICIENTS.get(level, DEFAULT_COEFFICIENT)
+               for idx, level in enumerate(levels)]
+    by_level = {}
+    # Уровни упорядочены по округлённой экономии (как в исходном отчёте)
+    for idx in _sorted_groups(levels, lambda idx: round(savings[idx])):
+        by_level[levels[idx]] = {
+            'hours': float(round(sums[idx])),
+            'tasks': counts[idx],
+            'coefficient': AUTOMATION_COEFFICIENTS.get(levels[idx], DEFAULT_COEFFICIENT),
+            'potential_savings': float(round(savings[idx])),
+        }
+    total_savings = sum(savings)
+    report['automation_potential'] = {
+        'by_level': by_level,
+        'total_high_routine_hours': float(round(sum(
+            sums[idx] for idx, level in enumerate(levels) if level in HIGH_ROUTINE_LEVELS))),
+        'total_potential_savings_hours': float(round(total_savings)),
+        'total_potential_savings_fte': round(total_savings / WORK_HOURS_PER_MONTH, 1),
+        'annual_savings_rub': float(round(total_savings * MONTHS_PER_YEAR * HOURLY_RATE_RUB)),
+    }
+
+    report['outliers'] = [{
+        'employee': columns.respondents[columns.respondent[idx]][0],
+        'task': columns.names[idx][:OUTLIER_TASK_CHARS],
+        'raw_hours': float(round(raw[idx])),
+        'capped_hours': HOURS_CAP,
+        'department': columns.respondents[columns.respondent[idx]][1],
+    } for idx in outliers]
+    return report
+
+
+# ============================================================
+# Загрузка с инкрементальным кэшем
+# ============================================================
+
+def _load_cache(path):
+    try:
+        with open(path, 'rb') as f:
+            cache = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return {}
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache.get('blocks', {})
+
+
+def _save_cache(path, blocks):
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix='.workload_', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'version': CACHE_VERSION, 'blocks': blocks}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+def load_blocks(root=REPO_ROOT, use_cache=True):
+    """Блоки столбцов всех анкет L3. Вернуть (блоки, число файлов, перечитано)."""
+    root = Path(root)
+    files = [(path, level) for path, level in corpus.source_files(root) if level == 'L3']
+    stamps = corpus.source_stamps(files, root)
+    cache_path = root / CACHE_FILE
+    cached = _load_cache(cache_path) if use_cache else {}
+
+    blocks = {}
+    reparsed = 0
+    for path, _ in files:
+        key = str(path.relative_to(root))
+        entry = cached.get(key)
+        if entry is not None and entry[0] == stamps[key]:
+            blocks[key] = entry
+            continue
+        blocks[key] = (stamps[key], questionnaire_block(corpus._read_json(path)))
+        reparsed += 1
+
+    if use_cache and (reparsed or len(blocks) != len(cached)):
+        try:
+            _save_cache(cache_path, blocks)
+        except OSError as exc:
+            print(f"Предупреждение: кэш не сохранён ({exc})", file=sys.stderr)
+    return [blocks[key][1] for key in sorted(blocks)], len(files), reparsed
+
+
+def compute(root=REPO_ROOT, use_cache=True, extended=False, raw=False):
+    """Загрузить анкеты (с кэшем) и рассчитать отчёт."""
+    blocks, files_total, _ = load_blocks(root, use_cache)
+    return calculate(Columns(blocks, raw), files_total, extended)
+
+
+def dumps(report):
+    """JSON в формате файла отчёта (отступ 2, кириллица как есть)."""
+    return json.dumps(report, ensure_ascii=False, indent=2)
+
+
+def run_benchmark(root, scale):
+    """Время загрузки и расчёта на корпусе, размноженном в scale раз."""
+    blocks, files_total, _ = load_blocks(root)
+    blocks = blocks * scale
+    start = time.perf_counter()
+    columns = Columns(blocks)
+    built = time.perf_counter()
+    calculate(columns, files_total * scale)
+    done = time.perf_counter()
+    return {
+        'scale': scale,
+        'respondents': len(columns.respondents),
+        'tasks': len(columns),
+        'columns_ms': round((built - start) * 1000, 1),
+        'calculate_ms': round((done - built) * 1000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузка и FTE по анкетам L3 (Space Travel)")
+    parser.add_argument('--root', default=str(REPO_ROOT), help="корень репозитория")
+    parser.add_argument('-o', '--output', default=None,
+                        help="файл результата ('-' — stdout); по умолчанию при --raw — "
+                             "automation/4.2_L3_objective_calculation.json, "
+                             "иначе automation/4.2_L3_workload_calculation.json")
+    parser.add_argument('--check', action='store_true',
+                        help="не записывать, сравнить с существующим файлом")
+    parser.add_argument('--extended', action='store_true',
+                        help="добавить группировки по характеру задачи и отделу")
+    parser.add_argument('--raw', action='store_true',
+                        help="категории как в анкетах, без справочника (как в опубликованном JSON)")
+    parser.add_argument('--no-cache', action='store_true', help="перечитать все анкеты")
+    parser.add_argument('--bench', type=int, metavar='N', help="замер на корпусе ×N")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    if args.bench:
+        print(json.dumps(run_benchmark(root, args.bench), ensure_ascii=False, indent=1))
+        return
+
+    start = time.perf_counter()
+    blocks, files_total, reparsed = load_blocks(root, not args.no_cache)
+    columns = Columns(blocks, args.raw)
+    report = calculate(columns, files_total, args.extended)
+    seconds = time.perf_counter() - start
+    text = dumps(report)
+
+    # Опубликованный JSON — только для совместимого с ним расчёта (--raw без --extended)
+    default = OUTPUT_FILE if args.raw and not args.extended else DERIVED_FILE
+    output = Path(args.output) if args.output and args.output != '-' else \
+        root / default.relative_to(REPO_ROOT)
+    if args.check:
+        current = output.read_text(encoding='utf-8') if output.exists() else None
+        if current != text:
+            print(f"Отличается: {output}")
+            sys.exit(1)
+        print(f"Совпадает: {output} ({seconds * 1000:.0f} мс, перечитано анкет: {reparsed})")
+        return
+    if args.output == '-':
+        print(text)
+        return
+
+    output.write_text(text, encoding='utf-8')
+    summary = report['summary']
+    print(f"Задач: {summary['total_tasks']}, часов: {summary['total_hours_clean']:.0f} "
+          f"({summary['fte_equivalent']} FTE), выбросов: {summary['outliers_count']}")
+    print(f"Сохранение: {output} ({seconds * 1000:.0f} мс, перечитано анкет: {reparsed})")
+    print("Готово!")
+
+
+if __name__ == "__main__":
+    main()
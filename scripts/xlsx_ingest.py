@@ -0,0 +1,755 @@
+#!/usr/bin/env python3
+"""
+Загрузка анкет L1/L2/L3 из XLSX в JSON корпуса (L1_json/, L2_json/, L3_json/).
+
+Книга читается потоково, прямо из XML внутри ZIP (как DOCX в
+format_docx_xml.py): sharedStrings и нужный лист разбираются через
+iterparse, строки отдаются по одной, книга целиком в память не грузится.
+
+Лист и уровень определяются по шапке, а не по имени листа:
+- L3 — «ОПРОСНИК»: ФИО/департамент/отдел/должность над таблицей,
+  строка шапки начинается с «№»; столбцы задач → tasks[]
+- L2 — строка шапки с «ФИО» и «Выберите процесс…»: цели отдела →
+  division_goals, задачи → division_tasks[].task_processes[].process_steps[]
+- L1 — строка шапки с «ФИО» и «Название процесса…»: goals, tasks,
+  processes со ссылками на строки (row, goal_row, task_row)
+Столбцы ищутся по началу заголовка, поэтому лишние столбцы (ID, Версия)
+и сдвиги между версиями шаблона не мешают.
+
+Результат:
+- JSON пишется в файл, у которого source_file совпадает с книгой;
+  новой книге даётся очищенное имя (без .xlsx..json, xlsх и т.п.)
+- новый JSON не пишется, если в каталоге уже есть анкета того же
+  респондента (фамилия) с теми же задачами — такая книга в отчёте «Дубликат»
+- книги обрабатываются параллельно в пуле процессов
+- .ingest_cache.json хранит хэш каждой книги: повторный запуск
+  конвертирует только изменённые и новые книги; JSON, у которых
+  ещё нет записи (собранные раньше вручную), не перезаписываются
+  без --force
+- .xls (старый двоичный формат) не читается — в отчёте «пересохранить
+  в .xlsx»
+
+Использование:
+    python xlsx_ingest.py                   — конвертировать изменённые книги
+    python xlsx_ingest.py L3/oprosnik_x.xlsx
+    python xlsx_ingest.py --force           — конвертировать все книги
+    python xlsx_ingest.py --check           — сравнить с текущими JSON, ничего не писать
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import unicodedata
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+import categories
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LEVEL_DIRS = {'L1': ('L1', 'L1_json'), 'L2': ('L2', 'L2_json'), 'L3': ('L3', 'L3_json')}
+CACHE_FILE = '.ingest_cache.json'
+CACHE_VERSION = 1
+MAX_HEADER_ROW = 20  # шапка ищется в первых строках листа
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+S = f'{{{MAIN_NS}}}'
+
+CELL_REF_RE = re.compile(r'([A-Z]+)(\d+)')
+PLACEHOLDERS = {'-', '—', '–'}  # «нет» в строках-продолжениях L1/L2
+NO_DIVISION = {'нет отделов'}
+MINUTES_RE = re.compile(r'^\s*(\d+(?:[.,]\d+)?)')
+LIST_SPLIT_RE = re.compile(r'\s*[,;]\s*')
+NUMBER_RE = re.compile(r'^\d+(?:[.,]\d+)?$')
+EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+# ============================================================
+# Потоковое чтение XLSX
+# ============================================================
+
+def column_index(letters):
+    """A → 0, B → 1, …, AA → 26."""
+    index = 0
+    for char in letters:
+        index = index * 26 + ord(char) - 64
+    return index - 1
+
+
+def _shared_strings(zf):
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+    strings = []
+    with zf.open('xl/sharedStrings.xml') as f:
+        for _, el in ET.iterparse(f):
+            if el.tag == S + 'si':
+                # Текст — <t> или прогоны <r><t>; фонетические подсказки (rPh) не входят
+                texts = [el.find(S + 't')] + [run.find(S + 't') for run in el.findall(S + 'r')]
+                strings.append(''.join(t.text or '' for t in texts if t is not None))
+                el.clear()
+    return strings
+
+
+def _sheet_parts(zf):
+    """[(имя листа, путь части)] в порядке книги."""
+    rels = {}
+    with zf.open('xl/_rels/workbook.xml.rels') as f:
+        for rel in ET.parse(f).getroot():
+            target = rel.get('Target', '')
+            target = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+            rels[rel.get('Id')] = target
+    with zf.open('xl/workbook.xml') as f:
+        workbook = ET.parse(f).getroot()
+    return [(sheet.get('name'), rels.get(sheet.get(f'{{{REL_NS}}}id')))
+            for sheet in workbook.iter(S + 'sheet')]
+
+
+def _cell_value(cell, strings):
+    kind = cell.get('t')
+    if kind == 'inlineStr':
+        return ''.join(t.text or '' for t in cell.iter(S + 't'))
+    value = cell.find(S + 'v')
+    if value is None or value.text is None:
+        return None
+    if kind == 's':
+        return strings[int(value.text)]
+    if kind == 'b':
+        return 'да' if value.text == '1' else 'нет'
+    if kind in ('str', 'e'):  # формула: текст или ошибка (#NAME? и т.п.)
+        return value.text
+    # Число: целые без «.0»
+    text = value.text
+    try:
+        number = float(text)
+    except ValueError:
+        return text
+    return str(int(number)) if number.is_integer() else text
+
+
+def iter_rows(zf, part, strings):
+    """Строки листа по одной: (номер строки, {номер столбца: текст})."""
+    with zf.open(part) as f:
+        for _, el in ET.iterparse(f):
+            if el.tag != S + 'row':
+                continue
+            cells = {}
+            for position, cell in enumerate(el.iter(S + 'c')):
+                value = _cell_value(cell, strings)
+                if value is None or not value.strip():
+                    continue
+                ref = CELL_REF_RE.match(cell.get('r') or '')
+                cells[column_index(ref.group(1)) if ref else position] = value
+            number = int(el.get('r') or 0)
+            el.clear()
+            yield number, cells
+
+
+# ============================================================
+# Шапки анкет
+# ============================================================
+
+def header_key(text):
+    """Заголовок столбца для сравнения: без переносов и регистра."""
+    return ' '.join(re.sub(r'-\s+', '', str(text)).split()).casefold()
+
+
+# Поле → начала заголовка (первый подходящий столбец)
+L3_COLUMNS = (
+    ('task_number', ('№',)),
+    ('task_name', ('название',)),
+    ('task_type', ('тип задачи',)),
+    ('routine_level', ('уровень',)),
+    ('regularity', ('регулярность',)),
+    ('time_minutes', ('время',)),
+    ('task_character', ('характер',)),
+    ('problem', ('проблема',)),
+    ('problem_cause', ('причина',)),
+    ('internal_resources', ('внутренние',)),
+    ('external_resources', ('внешние',)),
+    ('priority', ('приоритет',)),
+    ('expected_results', ('ожидаемые',)),
+    ('risks', ('риски',)),
+)
+L3_INTERACTION_RE = re.compile(r'^взаимодействие (\d+)')
+L3_DESCRIPTION_RE = re.compile(r'^описание взаимодействия (\d+)')
+L3_RESPONDENT = (('fio', 'фио'), ('department', 'департамент'), ('division', 'отдел'),
+                 ('position', 'должность'))
+
+COMMON_COLUMNS = (
+    ('fio', ('фио',)),
+    ('date', ('дата',)),
+    ('department', ('ваш департамент', 'департамент')),
+    ('division', ('отдел',)),
+    ('position', ('должность',)),
+    ('division_size', ('численность', 'общая численность')),
+    ('goal', ('опишите цели',)),
+    ('task', ('опишите задачи',)),
+)
+L2_COLUMNS = COMMON_COLUMNS + (
+    ('process_name', ('выберите процесс',)),
+    ('process_description', ('кратко опишите процесс',)),
+    ('process_trigger', ('что запускает',)),
+    ('process_result', ('что является результатом',)),
+    ('process_systems', ('какие системы',)),
+    ('process_databases', ('используемые базы',)),
+    ('process_steps_count', ('сколько этапов',)),
+    ('step_description', ('далее все этапы',)),
+    ('step_delays', ('возникают ли задержки',)),
+    ('step_errors', ('возникают ли ошибки',)),
+    ('step_involved_departments', ('какие отделы вовлечены',)),
+    ('step_department_roles', ('опишите как каждый отдел',)),
+    ('step_needs_automation', ('нужна ли автоматизация',)),
+)
+L1_COLUMNS = COMMON_COLUMNS + (
+    ('name', ('название процесса',)),
+    ('criticality', ('критичность',)),
+    ('employees_involved', ('количество сотрудников',)),
+    ('departments_involved', ('какие отделы участвуют',)),
+    ('has_regulation', ('есть ли регламент',)),
+    ('problems', ('какие проблемы',)),
+    ('causes', ('основная причина',)),
+    ('needs_automation', ('нужно ли автоматизировать',)),
+    ('why', ('почему',)),
+    ('expected_effect', ('ожидаемый эффект',)),
+)
+PROCESS_FIELDS = ('process_name', 'process_description', 'process_trigger', 'process_result',
+                  'process_systems', 'process_databases', 'process_steps_count')
+STEP_FIELDS = ('step_description', 'step_delays', 'step_errors', 'step_involved_departments',
+               'step_department_roles', 'step_needs_automation')
+L1_PROCESS_FIELDS = ('name', 'criticality', 'employees_involved', 'departments_involved',
+                     'has_regulation', 'problems', 'causes', 'needs_automation', 'why',
+                     'expected_effect')
+LIST_FIELDS = {'internal_resources', 'external_resources', 'process_systems', 'process_databases'}
+
+
+def match_columns(header, spec):
+    """{поле: номер столбца} по шапке."""
+    keys = {col: header_key(text) for col, text in header.items()}
+    columns = {}
+    for field, prefixes in spec:
+        for col in sorted(keys):
+            if col not in columns.values() and keys[col].startswith(prefixes):
+                columns[field] = col
+                break
+    return columns
+
+
+def detect_level(cells):
+    """Уровень анкеты по строке шапки или None."""
+    keys = [header_key(text) for text in cells.values()]
+    if header_key(cells.get(0, '')) == '№' and any(k.startswith('название') for k in keys):
+        return 'L3'
+    if any(k.startswith('фио') for k in keys):
+        if any(k.startswith('выберите процесс') for k in keys):
+            return 'L2'
+        if any(k.startswith('название процесса') for k in keys):
+            return 'L1'
+    return None
+
+
+# ============================================================
+# Значения
+# ============================================================
+
+def clean_value(value):
+    """Текст ячейки без пробелов по краям или None."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def nfc(name):
+    """Имя файла в NFC: в выгрузках с macOS буква «й» бывает разложена (NFD)."""
+    return unicodedata.normalize('NFC', name)
+
+
+def list_value(text):
+    """«А, Б, В» → ['А', 'Б', 'В']; одно значение остаётся строкой."""
+    items = [item for item in LIST_SPLIT_RE.split(text) if item]
+    return items if len(items) > 1 else (items[0] if items else None)
+
+
+def minutes_value(text):
+    """Минуты: число в начале ячейки («45», «5 мин»)."""
+    match = MINUTES_RE.match(text) if text is not None else None
+    return round(float(match.group(1).replace(',', '.'))) if match else None
+
+
+def date_value(text):
+    """Серийная дата Excel → ISO; текст остаётся как есть."""
+    if text is None or not NUMBER_RE.match(text):
+        return text
+    moment = EXCEL_EPOCH + datetime.timedelta(days=float(text.replace(',', '.')))
+    return moment.date().isoformat() if moment.time() == datetime.time() else moment.isoformat(sep=' ')
+
+
+def _field(cells, columns, field):
+    col = columns.get(field)
+    value = clean_value(cells.get(col)) if col is not None else None
+    if value is not None and field in LIST_FIELDS:
+        return list_value(value)
+    return value
+
+
+def _text(cells, columns, field):
+    """Значение-текст (цель, задача, название); заглушка «-» → None."""
+    value = _field(cells, columns, field)
+    return None if value in PLACEHOLDERS else value
+
+
+def _put(target, key, value):
+    if value is not None:
+        target[key] = value
+
+
+# ============================================================
+# Разбор уровней
+# ============================================================
+
+def parse_l3(above, header, rows):
+    """Анкета L3: above — строки над шапкой (ФИО, департамент…)."""
+    respondent = {}
+    for cells in above:
+        ordered = sorted(cells.items())
+        for i, (_, text) in enumerate(ordered):
+            key = header_key(text).rstrip(':')
+            for field, prefix in L3_RESPONDENT:
+                if field not in respondent and key.startswith(prefix) and i + 1 < len(ordered):
+                    respondent[field] = clean_value(ordered[i + 1][1])
+    respondent = {field: respondent.get(field) for field, _ in L3_RESPONDENT}
+    if (respondent['division'] or '').casefold() in NO_DIVISION:
+        respondent['division'] = None
+
+    columns = match_columns(header, L3_COLUMNS)
+    pairs = {}
+    for col, text in header.items():
+        key = header_key(text)
+        match = L3_INTERACTION_RE.match(key) or L3_DESCRIPTION_RE.match(key)
+        if match:
+            slot = 'description' if key.startswith('описание') else 'department'
+            pairs.setdefault(int(match.group(1)), {})[slot] = col
+
+    tasks = []
+    for _, cells in rows:
+        name = _field(cells, columns, 'task_name')
+        number = _field(cells, columns, 'task_number')
+        if name is None or (number and number.casefold().startswith('примеч')):
+            continue
+        task = {}
+        for field, _ in L3_COLUMNS:
+            if field == 'internal_resources':
+                # Взаимодействия — перед ресурсами, как в выгруженных JSON
+                interactions = []
+                for slot in sorted(pairs):
+                    interaction = {}
+                    for key, col in sorted(pairs[slot].items()):
+                        _put(interaction, key, clean_value(cells.get(col)))
+                    if interaction:
+                        interactions.append({key: interaction[key] for key in ('department', 'description')
+                                             if key in interaction})
+                _put(task, 'interactions', interactions or None)
+            if field == 'time_minutes':
+                _put(task, field, minutes_value(_field(cells, columns, field)))
+            else:
+                _put(task, field, _field(cells, columns, field))
+        tasks.append(task)
+    return {'respondent': respondent, 'tasks': tasks}
+
+
+def _respondent(first, columns, fields):
+    return {field: _field(first, columns, field) for field in fields}
+
+
+def parse_l2(header, rows):
+    columns = match_columns(header, L2_COLUMNS)
+    respondent = None
+    goals = []
+    tasks = []
+    process = None
+    for _, cells in rows:
+        if not any(clean_value(cells.get(col)) for col in columns.values()):
+            continue
+        if respondent is None:
+            respondent = _respondent(cells, columns,
+                                     ('fio', 'department', 'division', 'position', 'division_size'))
+        goal = _text(cells, columns, 'goal')
+        if goal is not None and goal not in goals:
+            goals.append(goal)
+        task_name = _text(cells, columns, 'task')
+        if task_name is not None and (not tasks or tasks[-1]['task_name'] != task_name):
+            tasks.append({'task_name': task_name, 'task_processes': []})
+            process = None
+        values = {field: _field(cells, columns, field) for field in PROCESS_FIELDS}
+        if values['process_name'] is not None or process is None:
+            if not any(value is not None for value in values.values()):
+                continue
+            if not tasks:
+                tasks.append({'task_name': None, 'task_processes': []})
+            process = {field: value for field, value in values.items() if value is not None}
+            tasks[-1]['task_processes'].append(process)
+        step = {field: _field(cells, columns, field) or '' for field in STEP_FIELDS}
+        if any(step.values()):
+            process.setdefault('process_steps', []).append(step)
+    return {'respondent': respondent or {}, 'division_goals': goals, 'division_tasks': tasks}
+
+
+def parse_l1(header, rows):
+    columns = match_columns(header, L1_COLUMNS)
+    respondent = None
+    goals, tasks, processes = [], [], []
+    goal_row = task_row = None
+    for number, cells in rows:
+        if not any(clean_value(cells.get(col)) for col in columns.values()):
+            continue
+        if respondent is None:
+            respondent = _respondent(cells, columns, ('fio', 'date', 'department', 'division',
+                                                      'position', 'division_size'))
+            respondent['date'] = date_value(respondent['date'])
+        goal = _text(cells, columns, 'goal')
+        if goal is not None:
+            goal_row = number
+            goals.append({'row': number, 'text': goal})
+        task = _text(cells, columns, 'task')
+        if task is not None:
+            task_row = number
+            tasks.append({'row': number, 'goal_row': goal_row, 'text': task})
+        if _text(cells, columns, 'name') is not None:
+            # Пустые поля процесса — '' (как в выгруженных JSON)
+            process = {field: _field(cells, columns, field) or '' for field in L1_PROCESS_FIELDS}
+            processes.append({'row': number, 'task_row': task_row, **process})
+    return {'respondent': respondent or {}, 'goals': goals, 'tasks': tasks, 'processes': processes}
+
+
+PARSERS = {'L1': parse_l1, 'L2': parse_l2}
+
+
+def _parse_sheet(zf, part, strings, expected):
+    """Найти шапку в первых строках листа и разобрать лист.
+
+    Вернуть (уровень, данные), (уровень, None) — шапка другого уровня,
+    или None — шапки нет.
+    """
+    rows = iter_rows(zf, part, strings)
+    above = []
+    for number, cells in rows:
+        if number > MAX_HEADER_ROW:
+            break
+        level = detect_level(cells)
+        if level is None:
+            above.append(cells)
+            continue
+        if expected is not None and level != expected:
+            return level, None
+        if level == 'L3':
+            return level, parse_l3(above, cells, rows)
+        return level, PARSERS[level](cells, rows)
+    return None
+
+
+def read_workbook(path, expected=None):
+    """Разобрать анкету. Вернуть (уровень, данные без source_file/level).
+
+    expected — уровень по каталогу книги: лист этого уровня берётся первым
+    (в книге L2 бывает и старый лист в формате L1).
+    """
+    if not zipfile.is_zipfile(path):
+        raise ValueError("не XLSX (возможно, .xls) — пересохранить в .xlsx")
+    with zipfile.ZipFile(path) as zf:
+        strings = _shared_strings(zf)
+        parts = [part for _, part in _sheet_parts(zf) if part in zf.namelist()]
+        fallback = None
+        for part in parts:
+            found = _parse_sheet(zf, part, strings, expected)
+            if found is None:
+                continue
+            if found[1] is not None:
+                return found
+            fallback = fallback or part
+        if fallback is not None:
+            return _parse_sheet(zf, fallback, strings, None)
+    raise ValueError("не найдена шапка анкеты L1/L2/L3")
+
+
+def convert(path, expected=None):
+    """Книга → JSON анкеты (как в L*_json)."""
+    level, data = read_workbook(path, expected)
+    return {'source_file': nfc(Path(path).name), 'level': level, **data}
+
+
+def _convert_one(job):
+    path, level = job
+    start = time.perf_counter()
+    try:
+        return str(path), convert(path, level), None, time.perf_counter() - start
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile, ET.ParseError) as exc:
+        return str(path), None, str(exc), time.perf_counter() - start
+
+
+# ============================================================
+# Файлы и кэш
+# ============================================================
+
+def workbook_files(root=REPO_ROOT):
+    """[(путь книги, уровень)] из L1/, L2/, L3/."""
+    files = []
+    for level, (source_dir, _) in LEVEL_DIRS.items():
+        directory = Path(root) / source_dir
+        if directory.is_dir():
+            for path in sorted(directory.iterdir()):
+                if path.is_file() and '.xls' in path.name.lower() and not path.name.startswith('~$'):
+                    files.append((path, level))
+    return files
+
+
+def output_name(file_name):
+    """Имя JSON для новой книги: oprosnik_x.xlsx..xlsx → oprosnik_x.json."""
+    key = file_name
+    while True:
+        cleaned = categories.source_key(key)
+        cleaned = re.sub(r'\.xlsx?$', '', cleaned, flags=re.IGNORECASE).rstrip('._ ')
+        if cleaned == key:
+            break
+        key = cleaned
+    return re.sub(r'\s+', '_', key.strip()) + '.json'
+
+
+def existing_outputs(output_dir):
+    """{source_file: путь JSON} по уже выгруженным файлам."""
+    outputs = {}
+    for path in sorted(Path(output_dir).glob('*.json')):
+        try:
+            with open(path, encoding='utf-8') as f:
+                source = json.load(f).get('source_file')
+        except (OSError, ValueError, AttributeError):
+            continue
+        if source:
+            outputs.setdefault(nfc(source), path)
+    return outputs
+
+
+# Список задач и поле с текстом задачи по уровням (для поиска дубликатов)
+TASK_TEXT_FIELDS = {'L1': ('tasks', 'text'), 'L2': ('division_tasks', 'task_name'),
+                    'L3': ('tasks', 'task_name')}
+
+
+def _signature_text(value):
+    return ' '.join(nfc(str(value)).casefold().replace('ё', 'е').split())
+
+
+def respondent_signature(data):
+    """(фамилия, тексты задач) анкеты для поиска дубликатов; None, если ФИО нет.
+
+    Только фамилия: в копиях одной анкеты ФИО бывает то полным, то нет.
+    """
+    fio = _signature_text((data.get('respondent') or {}).get('fio') or '').split()
+    if not fio:
+        return None
+    key, field = TASK_TEXT_FIELDS.get(data.get('level'), TASK_TEXT_FIELDS['L3'])
+    tasks = data.get(key) or []
+    return fio[0], tuple(sorted(_signature_text(task.get(field) or '')
+                             for task in tasks if isinstance(task, dict)))
+
+
+def existing_signatures(output_dir):
+    """{подпись респондента: путь JSON} по уже выгруженным файлам."""
+    signatures = {}
+    for path in sorted(Path(output_dir).glob('*.json')):
+        try:
+            with open(path, encoding='utf-8') as f:
+                signature = respondent_signature(json.load(f))
+        except (OSError, ValueError, AttributeError):
+            continue
+        if signature is not None:
+            signatures.setdefault(signature, path)
+    return signatures
+
+
+def _code_version():
+    digest = hashlib.sha256(Path(__file__).read_bytes()
+                            + Path(categories.__file__).read_bytes()).hexdigest()[:16]
+    return f'{CACHE_VERSION}:{digest}'
+
+
+def file_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def load_cache(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = None
+    if not cache or cache.get('version') != _code_version():
+        cache = {'version': _code_version(), 'entries': {}}
+    return cache
+
+
+def write_json_atomic(path, data, indent=2):
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix='.ingest_', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+            f.write('\n')
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+def plan(files, root, cache, force=False):
+    """Какие книги конвертировать. Вернуть (задания, принятые как есть)."""
+    jobs = []
+    adopted = []
+    outputs = {}
+    for path, level in files:
+        output_dir = Path(root) / LEVEL_DIRS[level][1]
+        if output_dir not in outputs:
+            outputs[output_dir] = existing_outputs(output_dir)
+        output = outputs[output_dir].get(nfc(path.name)) or output_dir / output_name(nfc(path.name))
+        rel = path.relative_to(root).as_posix()
+        st = path.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = cache['entries'].get(rel)
+        if not force and entry and entry['stamp'] == stamp and Path(root, entry['output']).exists():
+            continue
+        digest = file_hash(path)
+        if not force and entry and entry['sha256'] == digest and Path(root, entry['output']).exists():
+            entry['stamp'] = stamp  # файл «тронут», содержимое то же
+            continue
+        record = {'stamp': stamp, 'sha256': digest, 'output': output.relative_to(root).as_posix()}
+        if not force and entry is None and output.exists():
+            # JSON собран раньше (вне этого скрипта): запоминаем книгу, не перезаписываем
+            cache['entries'][rel] = record
+            adopted.append(rel)
+            continue
+        jobs.append((path, level, output, rel, record))
+    return jobs, adopted
+
+
+def compare(old, new, prefix=''):
+    """Различия двух JSON: список путей."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        diffs = []
+        for key in list(old) + [k for k in new if k not in old]:
+            diffs += compare(old.get(key), new.get(key), f'{prefix}.{key}' if prefix else key)
+        return diffs
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        diffs = []
+        for i, (a, b) in enumerate(zip(old, new)):
+            diffs += compare(a, b, f'{prefix}[{i}]')
+        return diffs
+    return [] if old == new else [prefix]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Анкеты L1/L2/L3: XLSX → JSON (потоково, параллельно)")
+    parser.add_argument('files', nargs='*', help="книги (по умолчанию все из L1/, L2/, L3/)")
+    parser.add_argument('--root', default=str(REPO_ROOT), help="корень репозитория")
+    parser.add_argument('--force', action='store_true', help="конвертировать все книги, перезаписать JSON")
+    parser.add_argument('--check', action='store_true', help="сравнить с текущими JSON, ничего не писать")
+    parser.add_argument('--workers', type=int, default=None, help="число процессов (1 — без пула)")
+    parser.add_argument('--limit', type=int, default=5, help="сколько различий показать на файл (--check)")
+    args = parser.parse_args()
+
+    root = Path(args.root).resolve()
+    if args.files:
+        files = []
+        for name in args.files:
+            path = Path(name).resolve()
+            level = next((lvl for lvl, (src, _) in LEVEL_DIRS.items() if path.parent == root / src), None)
+            if level is None:
+                print(f"Ошибка: {name} — не в L1/, L2/ или L3/")
+                sys.exit(1)
+            files.append((path, level))
+    else:
+        files = workbook_files(root)
+
+    cache_path = root / CACHE_FILE
+    cache = load_cache(cache_path)
+    force = args.force or args.check or bool(args.files)
+    jobs, adopted = plan(files, root, cache, force=force)
+    if adopted:
+        print(f"Приняты как есть (JSON уже был): {len(adopted)}")
+    if not jobs:
+        if not args.check:
+            write_json_atomic(cache_path, cache, indent=1)
+        print("Изменённых книг нет")
+        return
+
+    start = time.perf_counter()
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(jobs)))
+    tasks = [(path, level) for path, level, _, _, _ in jobs]
+    if workers == 1:
+        results = list(map(_convert_one, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_convert_one, tasks, chunksize=4))
+    wall = time.perf_counter() - start
+
+    written = failed = same = duplicates = 0
+    signatures = {}
+    for (_, _, output, rel, record), (_, data, error, _) in zip(jobs, results):
+        if error is not None:
+            failed += 1
+            print(f"Ошибка: {rel}: {error}")
+            continue
+        # Новый JSON: тот же респондент с теми же задачами уже может быть выгружен
+        # из другой копии книги (oprosnik_x.xlsx_.xlsx и oprosnik_x.xlsx..xlsx)
+        signature = None
+        if not output.exists():
+            if output.parent not in signatures:
+                signatures[output.parent] = existing_signatures(output.parent)
+            signature = respondent_signature(data)
+            duplicate = signatures[output.parent].get(signature)
+            if duplicate is not None:
+                duplicates += 1
+                print(f"Дубликат: {rel} — тот же респондент и задачи, что в "
+                      f"{duplicate.name}; не записано")
+                if not args.check:
+                    record['output'] = duplicate.relative_to(root).as_posix()
+                    cache['entries'][rel] = record
+                continue
+        if args.check:
+            old = None
+            if output.exists():
+                with open(output, encoding='utf-8') as f:
+                    old = json.load(f)
+            diffs = compare(old, data) if old is not None else ['(новый файл)']
+            if diffs:
+                print(f"{rel} → {output.name}: различий {len(diffs)}: {', '.join(diffs[:args.limit])}")
+            else:
+                same += 1
+            continue
+        write_json_atomic(output, data)
+        if signature is not None:
+            signatures[output.parent][signature] = output
+        cache['entries'][rel] = record
+        written += 1
+        print(f"Сохранение: {rel} → {record['output']}")
+
+    if args.check:
+        print(f"Книг: {len(jobs)}, совпадает с JSON: {same}, дубликатов: {duplicates}, "
+              f"ошибок: {failed} ({wall:.2f} с)")
+        return
+    write_json_atomic(cache_path, cache, indent=1)
+    print(f"Книг: {len(jobs)}, записано: {written}, дубликатов: {duplicates}, ошибок: {failed} "
+          f"({wall:.2f} с, процессов: {workers})")
+    print("Готово!")
+
+
+if __name__ == "__main__":
+    main()
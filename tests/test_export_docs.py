@@ -0,0 +1,57 @@
+"""export_docs: части docs/data совпадают с docs_data.js и ex_data.js."""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import export_docs  # noqa: E402
+
+
+def read_lines(path):
+    return Path(path).read_text(encoding='utf-8').splitlines()
+
+
+class ExportDocsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sources = export_docs.process_sources()
+        cls.docs = export_docs.read_legacy(export_docs.LEGACY_DOCS, 'DOCS')
+        cls.ex = export_docs.read_legacy(export_docs.LEGACY_EX, 'EX')
+
+    def test_docs_data_matches_shards(self):
+        # docs_data.js (file://) и части (http) — один и тот же документ
+        self.assertEqual(sorted(self.docs), sorted(self.sources))
+        for process_id, source in self.sources.items():
+            with self.subTest(process=process_id):
+                self.assertEqual(export_docs.render_html(read_lines(source)), self.docs[process_id])
+
+    def test_field_lines_are_separate_paragraphs(self):
+        html = export_docs.render_html(['# BP', '', '**Код:** BP-07', '**Владелец:** Иванов'])
+        self.assertEqual(html, '<h2 class="doch1">BP</h2>\n'
+                               '<p class="docp">Код: BP-07</p>\n<p class="docp">Владелец: Иванов</p>')
+
+    def test_missing_ex_tables_fall_back_to_curated(self):
+        for process_id, source in self.sources.items():
+            text, _ = export_docs.build_shard(process_id, source, self.ex.get(process_id))
+            ex = json.loads(text)['ex']
+            for field in export_docs.EX_TABLES:
+                with self.subTest(process=process_id, field=field):
+                    if self.ex.get(process_id, {}).get(field):
+                        self.assertTrue(ex[field])
+
+    def test_export_writes_ex_shard(self):
+        output = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, output)
+        manifest, rebuilt = export_docs.export(output_dir=output)
+        self.assertEqual(sorted(rebuilt), sorted(self.sources))
+        self.assertEqual(json.loads((output / manifest['ex']).read_text(encoding='utf-8')), self.ex)
+        self.assertEqual(export_docs.export(output_dir=output)[1], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
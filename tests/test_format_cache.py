@@ -0,0 +1,65 @@
+"""Регрессия format_cache.is_up_to_date: форматирование на месте."""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import format_cache  # noqa: E402
+
+
+FINGERPRINT = 'test'
+ORIGINAL = b'original document'
+FORMATTED = b'formatted document'
+
+
+class InPlaceCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        self.manifest = format_cache.load_manifest(self.root / 'cache.json')
+        (self.root / 'a').mkdir()
+        self.doc = self.root / 'a' / 'X.docx'
+        self.doc.write_bytes(ORIGINAL)
+
+    def format_in_place(self, path):
+        fresh, input_hash = format_cache.is_up_to_date(self.manifest, path, path, FINGERPRINT)
+        self.assertFalse(fresh)
+        path.write_bytes(FORMATTED)
+        format_cache.record(self.manifest, input_hash, path, FINGERPRINT)
+
+    def is_fresh(self, path):
+        return format_cache.is_up_to_date(self.manifest, path, path, FINGERPRINT)[0]
+
+    def test_formatted_file_is_fresh(self):
+        self.format_in_place(self.doc)
+        self.assertTrue(self.is_fresh(self.doc))
+
+    def test_revert_in_place_then_rerun(self):
+        self.format_in_place(self.doc)
+        self.doc.write_bytes(ORIGINAL)
+        self.assertFalse(self.is_fresh(self.doc))
+
+    def test_original_copied_to_other_folder(self):
+        self.format_in_place(self.doc)
+        (self.root / 'b').mkdir()
+        copy = self.root / 'b' / 'X.docx'
+        copy.write_bytes(ORIGINAL)
+        self.assertFalse(self.is_fresh(copy))
+
+    def test_separate_output(self):
+        output = self.root / 'out.docx'
+        fresh, input_hash = format_cache.is_up_to_date(self.manifest, self.doc, output, FINGERPRINT)
+        self.assertFalse(fresh)
+        output.write_bytes(FORMATTED)
+        format_cache.record(self.manifest, input_hash, output, FINGERPRINT)
+        self.assertTrue(format_cache.is_up_to_date(self.manifest, self.doc, output, FINGERPRINT)[0])
+        output.write_bytes(b'edited by hand')
+        self.assertFalse(format_cache.is_up_to_date(self.manifest, self.doc, output, FINGERPRINT)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""InteractionGraph.add_corpus: респонденты без департамента."""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from corpus import Respondent, Task  # noqa: E402
+from interaction_graph import MANAGEMENT, InteractionGraph  # noqa: E402
+
+
+def corpus_of(respondents, tasks):
+    return SimpleNamespace(respondents=respondents, tasks=tasks)
+
+
+class AddCorpusTest(unittest.TestCase):
+    def test_division_without_department(self):
+        respondents = [
+            Respondent(id=0, department='Операционный департамент', division='Отдел бронирования',
+                       source='L3_json/a.json'),
+            Respondent(id=1, department=None, division='Отдел продаж', source='L3_json/b.json'),
+        ]
+        tasks = [Task(id=0, respondent=1, time_minutes=60, regularity='Ежедневно',
+                      interactions=(('Отдел бронирования', 'Передаём заявку'),))]
+        graph = InteractionGraph().add_corpus(corpus_of(respondents, tasks))
+
+        src = graph.node('Отдел продаж')
+        self.assertEqual(graph.department[src], MANAGEMENT)
+        self.assertEqual([graph.nodes[dst] for dst, *_ in graph.top_partners(src, direction='out')],
+                         ['Отдел бронирования'])
+
+    def test_no_division_and_no_department(self):
+        respondents = [Respondent(id=0, source='L3_json/a.json')]
+        tasks = [Task(id=0, respondent=0, interactions=(('Отдел продаж', ''),))]
+        graph = InteractionGraph().add_corpus(corpus_of(respondents, tasks))
+        self.assertEqual(graph.stats['no_source'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""normalize_text и normalize_runs дают тот же результат, что прежняя remove_extra_spaces."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from text_normalize import normalize_runs, normalize_text, remove_extra_spaces_legacy  # noqa: E402
+
+
+SAMPLES = [
+    ',Ёлка',
+    'ёж,ёлка.Ёж',
+    'Текст  ,с ошибками.Здесь',
+    'a  b​c ;d',
+    '( скобки )и [ещё ] ',
+    'Итог:ok!Да?нет',
+]
+
+
+class LegacyEquivalenceTest(unittest.TestCase):
+    def test_normalize_text(self):
+        for text in SAMPLES:
+            with self.subTest(text=text):
+                self.assertEqual(normalize_text(text), remove_extra_spaces_legacy(text))
+
+    def test_normalize_runs(self):
+        for text in SAMPLES:
+            for cut in range(1, len(text)):
+                with self.subTest(text=text, cut=cut):
+                    runs = normalize_runs([text[:cut], text[cut:]])
+                    self.assertEqual(''.join(runs), remove_extra_spaces_legacy(text))
+
+
+if __name__ == '__main__':
+    unittest.main()